@@ -116,6 +116,7 @@ class TranscriptionConfig:
     # Chunked configs
     chunk_len_in_secs: float = 1.6  # Chunk length in seconds
     total_buffer_in_secs: float = 4.0  # Length of buffer (chunk + left and right padding) in seconds
+    use_ring_buffer: bool = False  # Build the buffers of all the samples in a single preallocated ring buffer
 
     # Set `cuda` to int to define CUDA device. If 'None', will look for CUDA
     # device anyway, and do inference on CPU only if CUDA device is not found.
@@ -270,6 +271,7 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
             batch_size=cfg.batch_size,
             max_steps_per_timestep=cfg.max_steps_per_timestep,
             stateful_decoding=cfg.stateful_decoding,
+            use_ring_buffer=cfg.use_ring_buffer,
         )
 
     elif cfg.merge_algo == 'lcs':
@@ -280,6 +282,7 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
             batch_size=cfg.batch_size,
             max_steps_per_timestep=cfg.max_steps_per_timestep,
             stateful_decoding=cfg.stateful_decoding,
+            use_ring_buffer=cfg.use_ring_buffer,
             alignment_basepath=cfg.lcs_alignment_dir,
         )
         # Set the LCS algorithm delay.
@@ -293,6 +296,7 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
             batch_size=cfg.batch_size,
             max_steps_per_timestep=cfg.max_steps_per_timestep,
             stateful_decoding=cfg.stateful_decoding,
+            use_ring_buffer=cfg.use_ring_buffer,
         )
 
     else:
@@ -61,6 +61,7 @@ Transcribe audio file on a single CPU/GPU. Useful for transcription of moderate
   output_filename: Output filename where the transcriptions will be written
   batch_size: batch size during inference
   presort_manifest: sorts the provided manifest by audio length for faster inference (default: True)
+  manifest_num_workers: number of processes used to parse the dataset_manifest (default: 1)
 
   cuda: Optional int to enable or disable execution of model on certain CUDA device.
   allow_mps: Bool to allow using MPS (Apple Silicon M-series GPU) device if available
@@ -130,6 +131,7 @@ class TranscriptionConfig:
     audio_key: str = 'audio_filepath'  # Used to override the default audio key in dataset_manifest
     eval_config_yaml: Optional[str] = None  # Path to a yaml file of config of evaluation
     presort_manifest: bool = True  # Significant inference speedup on short-form data due to padding reduction
+    manifest_num_workers: int = 1  # Number of processes used to parse large dataset manifests
 
     # General configs
     output_filename: Optional[str] = None
@@ -448,7 +450,9 @@ def main(cfg: TranscriptionConfig) -> Union[TranscriptionConfig, List[Hypothesis
     if cfg.dataset_manifest is not None:
         logging.info(f"Finished transcribing from manifest file: {cfg.dataset_manifest}")
         if cfg.presort_manifest:
-            transcriptions = restore_transcription_order(cfg.dataset_manifest, transcriptions)
+            transcriptions = restore_transcription_order(
+                cfg.dataset_manifest, transcriptions, num_workers=cfg.manifest_num_workers
+            )
     else:
         logging.info(f"Finished transcribing {len(filepaths)} files !")
     logging.info(f"Writing transcriptions into file: {cfg.output_filename}")
@@ -35,6 +35,10 @@ python $BASEPATH/neural_diarizer/e2e_diarize_speech.py \
     batch_size=1 \
     dataset_manifest=/path/to/diarization_manifest.json
 
+For streaming models, `continuous_batching=True` diarizes the recordings with continuous batching:
+up to `batch_size` recordings are streamed concurrently, and the slot of a finished recording is refilled
+with the next one, instead of waiting for the longest recording of the batch.
+
 """
 import json
 import logging
@@ -52,7 +56,9 @@ from pytorch_lightning import seed_everything
 
 from nemo.collections.asr.metrics.der import score_labels
 from nemo.collections.asr.models import SortformerEncLabelModel
+from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
 from nemo.collections.asr.parts.utils.diarization_utils import convert_pred_mat_to_segments
+from nemo.collections.asr.parts.utils.sortformer_streaming_utils import ContinuousBatchedDiarizationStreamer
 from nemo.collections.asr.parts.utils.sortformer_utils import (
     InferenceProfiler,
     configure_output_subsampling_factor,
@@ -115,6 +121,9 @@ class DiarizationConfig:
     compile_encoder: bool = False
     # Emulate production streams arriving independently; offline batches otherwise update in lockstep.
     async_desync_updates: bool = False
+    # Stream up to `batch_size` recordings concurrently and refill the slots of finished ones (enables async_streaming)
+    continuous_batching: bool = False
+    log_stream_latency: bool = False  # If True, log the chunk latency and RTFx of each recording
     spkcache_len: Optional[int] = None
     spkcache_update_period: int = 144
     fifo_len: int = 188
@@ -180,6 +189,38 @@ def get_tensor_path(cfg: DiarizationConfig) -> tuple[Optional[str], str, str]:
     return None if tensor_path is None else str(tensor_path), model_id, tensor_filename
 
 
+def run_continuous_batching(
+    cfg: DiarizationConfig, diar_model: SortformerEncLabelModel, infer_audio_rttm_dict: Dict[str, Dict[str, str]]
+) -> List[torch.Tensor]:
+    """
+    Diarize the recordings with the continuous-batching streaming driver.
+
+    Args:
+        cfg (DiarizationConfig): The configuration object containing model and dataset details.
+        diar_model (SortformerEncLabelModel): Streaming Sortformer model with asynchronous streaming enabled.
+        infer_audio_rttm_dict (Dict[str, Dict[str, str]]): Dictionary containing audio file paths,
+            offsets and durations.
+
+    Returns:
+        preds_list (List[torch.Tensor]): Prediction matrices in the order of `infer_audio_rttm_dict`.
+            Dimension: [(1, num_frames, num_speakers), ..., (1, num_frames, num_speakers)]
+    """
+    streamer = ContinuousBatchedDiarizationStreamer(diar_model, batch_size=cfg.batch_size)
+    stream_ids = []
+    for meta in infer_audio_rttm_dict.values():
+        segment = AudioSegment.from_file(
+            meta['audio_filepath'],
+            target_sr=diar_model._cfg.sample_rate,
+            offset=meta['offset'] or 0,
+            duration=meta['duration'] or 0,
+        )
+        stream_ids.append(streamer.add_stream(torch.as_tensor(segment.samples)))
+    while streamer.has_streams():
+        streamer.step()
+    streamer.log_summary(log_streams=cfg.log_stream_latency)
+    return [streamer.results[stream_id].preds.unsqueeze(0) for stream_id in stream_ids]
+
+
 def diarization_objective(
     trial,
     postprocessing_cfg: PostProcessingParams,
@@ -362,8 +403,10 @@ def main(cfg: DiarizationConfig) -> Union[DiarizationConfig]:
     diar_model.setup_test_data(test_data_config=diar_model._cfg.test_ds)
 
     # Streaming mode setup (only if enabled)
+    if cfg.continuous_batching and not diar_model.streaming_mode:
+        raise ValueError("continuous_batching requires a streaming diarization model")
     if diar_model.streaming_mode:
-        diar_model.async_streaming = cfg.async_streaming
+        diar_model.async_streaming = cfg.async_streaming or cfg.continuous_batching
         diar_model.async_pad_to_max = cfg.async_pad_to_max
         diar_model.sortformer_modules.async_desync_updates = cfg.async_desync_updates
         diar_model.sortformer_modules.chunk_len = cfg.chunk_len
@@ -405,14 +448,16 @@ def main(cfg: DiarizationConfig) -> Union[DiarizationConfig]:
     else:
         logging.info("No saved prediction tensors found. Running inference on the dataset...")
         with torch.inference_mode(), torch.autocast(device_type=diar_model.device.type, dtype=diar_model.dtype):
-            diar_model.test_batch()
-
-        diar_model_preds_total_list = diar_model.preds_total_list
+            if cfg.continuous_batching:
+                diar_model_preds_total_list = run_continuous_batching(cfg, diar_model, infer_audio_rttm_dict)
+            else:
+                diar_model.test_batch()
+                diar_model_preds_total_list = diar_model.preds_total_list
         if inference_profiler is not None:
             audio_duration = sum(float(item['duration']) for item in infer_audio_rttm_dict.values())
             inference_profiler.log_summary(audio_duration)
         if tensor_path is not None:
-            save_prediction_tensors(tensor_path, diar_model.preds_total_list, prediction_cache_metadata)
+            save_prediction_tensors(tensor_path, diar_model_preds_total_list, prediction_cache_metadata)
             logging.info(f"Prediction tensors saved to {tensor_path}")
 
     if cfg.launch_pp_optim:
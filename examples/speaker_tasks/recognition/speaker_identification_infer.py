@@ -22,6 +22,7 @@ from omegaconf import OmegaConf
 from nemo.collections.asr.data.audio_to_label import AudioToSpeechLabelDataset
 from nemo.collections.asr.models import EncDecSpeakerLabelModel
 from nemo.collections.asr.parts.features import WaveformFeaturizer
+from nemo.collections.asr.parts.utils.speaker_embedding_store import IVFPQIndex
 from nemo.core.config import hydra_runner
 from nemo.utils import logging
 
@@ -72,18 +73,27 @@ def main(cfg):
         enroll_embs = enroll_embs / (np.linalg.norm(enroll_embs, ord=2, axis=-1, keepdims=True))
         test_embs = test_embs / (np.linalg.norm(test_embs, ord=2, axis=-1, keepdims=True))
 
-        # reference embedding
-        reference_embs = []
+        # reference embedding: sum of the enrollment embeddings of every speaker
         keyslist = list(enroll_id2label.values())
-        for label_id in keyslist:
-            indices = np.where(enroll_truelabels == label_id)
-            embedding = (enroll_embs[indices].sum(axis=0).squeeze()) / len(indices)
-            reference_embs.append(embedding)
-
-        reference_embs = np.asarray(reference_embs)
-
-        scores = np.matmul(test_embs, reference_embs.T)
-        matched_labels = scores.argmax(axis=-1)
+        label2row = {label: row for row, label in enumerate(keyslist)}
+        enroll_rows = np.array([label2row[label] for label in enroll_truelabels], dtype=np.int64)
+        reference_embs = np.zeros((len(keyslist), enroll_embs.shape[1]), dtype=enroll_embs.dtype)
+        np.add.at(reference_embs, enroll_rows, enroll_embs)
+
+        ann_cfg = cfg.backend.cosine_similarity.get('ann_index', None)
+        if ann_cfg is not None and ann_cfg.use_ann_index:
+            # approximate cosine search over the enrolled speakers, for a very large number of speakers
+            index = IVFPQIndex(
+                num_lists=ann_cfg.num_lists,
+                num_subquantizers=ann_cfg.num_subquantizers,
+                num_iters=ann_cfg.num_iters,
+            )
+            index.add(reference_embs)
+            _, matched_labels = index.search(test_embs, k=1, num_probes=ann_cfg.num_probes)
+            matched_labels = matched_labels[:, 0]
+        else:
+            scores = np.matmul(test_embs, reference_embs.T)
+            matched_labels = scores.argmax(axis=-1)
 
     elif backend == 'neural_classifier':
         model_path = cfg.backend.neural_classifier.model_path
@@ -13,10 +13,13 @@
 # limitations under the License.
 # NOTE: This file will be deprecated in the future, as the new inference pipeline will replace it.
 
+import asyncio
 import math
+import threading
 import time
-from dataclasses import dataclass
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
 
 import numpy as np
 import torch
@@ -24,6 +27,7 @@ from omegaconf import open_dict
 
 import nemo.collections.asr as nemo_asr
 from nemo.agents.voice_agent.pipecat.services.nemo.utils import CacheFeatureBufferer
+from nemo.collections.asr.inference.utils.context_manager import CacheAwareContext, CacheAwareContextManager
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
 from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer
 
@@ -39,7 +43,25 @@ class ASRResult:
     processing_time: Optional[float] = None
 
 
+@dataclass
+class _ASRStreamState:
+    """Per-stream state of NemoStreamingASRService; the encoder cache lives in the shared cache slots."""
+
+    audio_buffer: CacheFeatureBufferer
+    previous_hypotheses: List[Hypothesis]
+    last_transcript_timestamp: float = field(default_factory=time.time)
+
+
 class NemoStreamingASRService:
+    """
+    Cache-aware streaming ASR with EOU/EOB detection.
+
+    The service can serve up to `max_sessions` concurrent streams identified by `stream_id`. Each stream has its own
+    audio/feature buffer and decoder hypothesis, and its encoder cache lives in a slot of a shared
+    CacheAwareContextManager, so chunks of several streams can be run through the encoder in one batch with
+    `transcribe_batch`. Use StreamingASRBatchScheduler to gather the chunks of concurrent sessions into batches.
+    """
+
     def __init__(
         self,
         model: str = "nvidia/parakeet_realtime_eou_120m-v1",
@@ -55,7 +77,10 @@ class NemoStreamingASRService:
         frame_len_in_secs: float = 0.08,
         use_amp: bool = False,
         chunk_size_in_secs: float = 0.08,
+        max_sessions: int = 1,
     ):
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be a positive integer, got {max_sessions}")
         self.model = model
         self.eou_string = eou_string
         self.eob_string = eob_string
@@ -99,27 +124,48 @@ class NemoStreamingASRService:
         model_chunk_size_in_secs = self.model_chunk_size * window_stride_in_secs
 
         self.buffer_size_in_secs = self.pre_encode_cache_size_in_secs + model_chunk_size_in_secs
-
-        self._audio_buffer = CacheFeatureBufferer(
-            sample_rate=sample_rate,
-            buffer_size_in_secs=self.buffer_size_in_secs,
-            chunk_size_in_secs=self.chunk_size_in_secs,
-            preprocessor_cfg=self.asr_model.cfg.preprocessor,
-            device=self.device,
+        self.sample_rate = sample_rate
+        self.max_sessions = max_sessions
+
+        # one encoder cache slot per live stream
+        self._context_manager = CacheAwareContextManager(self.asr_model.encoder, num_slots=max_sessions)
+        self._streams: Dict[str, _ASRStreamState] = {}
+        self._preprocessor = None
+        # transcribe_batch may run in a worker thread (see StreamingASRBatchScheduler) while the streams are reset
+        self._lock = threading.RLock()
+        # resets and closes requested while a batch is running, applied before the next batch (see `reset_state`)
+        self._pending_resets = set()
+        self._pending_closes = set()
+        self._pending_lock = threading.Lock()
+        print(
+            f"NemoStreamingASRService initialized with model `{model}` on device `{self.device}` "
+            f"for up to {max_sessions} concurrent session(s)"
         )
-        self._reset_cache()
-        self._previous_hypotheses = self._get_blank_hypothesis()
-        self._last_transcript_timestamp = time.time()
-        print(f"NemoStreamingASRService initialized with model `{model}` on device `{self.device}`")
-
-    def _reset_cache(self):
-        (
-            self._cache_last_channel,  # [17, B, 70, 512]
-            self._cache_last_time,  # [17, B, 512, 8]
-            self._cache_last_channel_len,  # B
-        ) = self.asr_model.encoder.get_initial_cache_state(
-            1
-        )  # batch size is 1
+
+    def _get_stream_state(self, stream_id: str) -> _ASRStreamState:
+        state = self._streams.get(stream_id)
+        if state is None:
+            if len(self._streams) >= self.max_sessions:
+                raise RuntimeError(
+                    f"Cannot open stream `{stream_id}`: all {self.max_sessions} sessions are in use. "
+                    f"Close finished streams with `close_stream` or increase `max_sessions`."
+                )
+            audio_buffer = CacheFeatureBufferer(
+                sample_rate=self.sample_rate,
+                buffer_size_in_secs=self.buffer_size_in_secs,
+                chunk_size_in_secs=self.chunk_size_in_secs,
+                preprocessor_cfg=self.asr_model.cfg.preprocessor,
+                device=self.device,
+                preprocessor=self._preprocessor,
+            )
+            self._preprocessor = audio_buffer.preprocessor
+            state = _ASRStreamState(audio_buffer=audio_buffer, previous_hypotheses=self._get_blank_hypothesis())
+            self._streams[stream_id] = state
+        return state
+
+    def _release_cache_slot(self, stream_id: str):
+        if stream_id in self._context_manager.streamidx2slotidx:
+            self._context_manager.reset_slots([stream_id], [True])
 
     def _get_blank_hypothesis(self) -> List[Hypothesis]:
         blank_hypothesis = Hypothesis(score=0.0, y_sequence=[], dec_state=None, timestamp=[], last_token=None)
@@ -235,17 +281,73 @@ class NemoStreamingASRService:
         return tokens, probs
 
     def transcribe(self, audio: bytes, stream_id: str = "default") -> ASRResult:
+        return self.transcribe_batch([audio], [stream_id])[0]
+
+    def transcribe_batch(
+        self, audios: List[bytes], stream_ids: List[str], skip_unavailable: bool = False
+    ) -> List[Optional[ASRResult]]:
+        """
+        Run one cache-aware streaming step for a chunk of each of the given streams, as a single encoder batch.
+        Args:
+            audios (List[bytes]): 16-bit PCM audio chunks, one per stream
+            stream_ids (List[str]): ids of the streams the chunks belong to, without duplicates
+            skip_unavailable (bool): if True, new streams that cannot get a session because all sessions are in use
+                are left out of the batch and get a None result. Otherwise a RuntimeError is raised and no stream
+                of the batch is processed.
+        Returns:
+            List[Optional[ASRResult]]: transcription results, in the order of `stream_ids`
+        """
+        if len(audios) != len(stream_ids):
+            raise ValueError(f"Got {len(audios)} audio chunks but {len(stream_ids)} stream ids")
+        if len(set(stream_ids)) != len(stream_ids):
+            raise ValueError("A batch may contain at most one chunk per stream")
+        if not stream_ids:
+            return []
+
+        with self._lock:
+            self._apply_pending_requests()
+            # check the capacity for the whole batch before a session is opened for any of its streams
+            admitted = self._get_admitted_streams(stream_ids)
+            if len(admitted) < len(stream_ids) and not skip_unavailable:
+                rejected = [stream_id for stream_id in stream_ids if stream_id not in admitted]
+                raise RuntimeError(
+                    f"Cannot open streams {rejected}: all {self.max_sessions} sessions are in use. "
+                    f"Close finished streams with `close_stream` or increase `max_sessions`."
+                )
+            indices = [idx for idx, stream_id in enumerate(stream_ids) if stream_id in admitted]
+            results = [None] * len(stream_ids)
+            if indices:
+                batch_results = self._transcribe_batch(
+                    [audios[idx] for idx in indices], [stream_ids[idx] for idx in indices]
+                )
+                for idx, result in zip(indices, batch_results):
+                    results[idx] = result
+            return results
+
+    def _get_admitted_streams(self, stream_ids: List[str]) -> Set[str]:
+        """Streams that have a session, and new streams in order as long as there are free sessions."""
+        num_free_sessions = self.max_sessions - len(self._streams)
+        admitted = set()
+        for stream_id in stream_ids:
+            if stream_id in self._streams:
+                admitted.add(stream_id)
+            elif num_free_sessions > 0:
+                admitted.add(stream_id)
+                num_free_sessions -= 1
+        return admitted
+
+    def _transcribe_batch(self, audios: List[bytes], stream_ids: List[str]) -> List[ASRResult]:
         start_time = time.time()
+        states = [self._get_stream_state(stream_id) for stream_id in stream_ids]
 
-        # Convert bytes to numpy array
-        audio_array = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        # Convert bytes to numpy arrays
+        audio_arrays = [np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0 for audio in audios]
+        CacheFeatureBufferer.batch_update([state.audio_buffer for state in states], audio_arrays)
 
-        self._audio_buffer.update(audio_array)
-
-        features = self._audio_buffer.get_feature_buffer()
-        feature_lengths = torch.tensor([features.shape[1]], device=self.device)
-        features = features.unsqueeze(0)  # Add batch dimension
+        features = torch.stack([state.audio_buffer.get_feature_buffer() for state in states])
+        feature_lengths = torch.full([len(states)], features.shape[2], device=self.device)
 
+        context, mapping = self._context_manager.get_context(stream_ids)
         with torch.no_grad():
             (
                 encoded,
@@ -256,21 +358,37 @@ class NemoStreamingASRService:
             ) = self.asr_model.encoder.cache_aware_stream_step(
                 processed_signal=features,
                 processed_signal_length=feature_lengths,
-                cache_last_channel=self._cache_last_channel,
-                cache_last_time=self._cache_last_time,
-                cache_last_channel_len=self._cache_last_channel_len,
+                cache_last_channel=context.cache_last_channel,
+                cache_last_time=context.cache_last_time,
+                cache_last_channel_len=context.cache_last_channel_len,
                 keep_all_outputs=False,
                 drop_extra_pre_encoded=self.drop_extra_pre_encoded,
             )
 
-        best_hyp = self._get_best_hypothesis(encoded, encoded_len, partial_hypotheses=self._previous_hypotheses)
+        previous_hypotheses = [state.previous_hypotheses[0] for state in states]
+        best_hyp = self._get_best_hypothesis(encoded, encoded_len, partial_hypotheses=previous_hypotheses)
 
-        self._previous_hypotheses = best_hyp
-        self._cache_last_channel = cache_last_channel
-        self._cache_last_time = cache_last_time
-        self._cache_last_channel_len = cache_last_channel_len
+        self._context_manager.update_cache(
+            stream_ids,
+            CacheAwareContext(cache_last_channel, cache_last_time, cache_last_channel_len),
+            mapping,
+        )
 
-        tokens, probs = self._get_tokens_and_probs_from_alignments(best_hyp[0].alignments)
+        current_timestamp = time.time()
+        results = []
+        for stream_id, state, hyp in zip(stream_ids, states, best_hyp):
+            state.previous_hypotheses = [hyp]
+            results.append(self._make_result(stream_id, state, hyp, current_timestamp))
+
+        processing_time = time.time() - start_time
+        for result in results:
+            result.processing_time = processing_time
+        return results
+
+    def _make_result(
+        self, stream_id: str, state: _ASRStreamState, hyp: Hypothesis, current_timestamp: float
+    ) -> ASRResult:
+        tokens, probs = self._get_tokens_and_probs_from_alignments(hyp.alignments)
 
         text = self.get_text_from_tokens(tokens)
 
@@ -279,24 +397,22 @@ class NemoStreamingASRService:
         eob_latency = None
         eou_prob = None
         eob_prob = None
-        current_timestamp = time.time()
         if self.eou_string in text or self.eob_string in text:
             is_final = True
             if self.eou_string in text:
                 eou_latency = (
-                    current_timestamp - self._last_transcript_timestamp if text.strip() == self.eou_string else 0.0
+                    current_timestamp - state.last_transcript_timestamp if text.strip() == self.eou_string else 0.0
                 )
                 eou_prob = self.get_eou_probability(tokens, probs, self.eou_string)
             if self.eob_string in text:
                 eob_latency = (
-                    current_timestamp - self._last_transcript_timestamp if text.strip() == self.eob_string else 0.0
+                    current_timestamp - state.last_transcript_timestamp if text.strip() == self.eob_string else 0.0
                 )
                 eob_prob = self.get_eou_probability(tokens, probs, self.eob_string)
             self.reset_state(stream_id=stream_id)
         if text.strip():
-            self._last_transcript_timestamp = current_timestamp
+            state.last_transcript_timestamp = current_timestamp
 
-        processing_time = time.time() - start_time
         return ASRResult(
             text=text,
             is_final=is_final,
@@ -304,16 +420,191 @@ class NemoStreamingASRService:
             eob_latency=eob_latency,
             eou_prob=eou_prob,
             eob_prob=eob_prob,
-            processing_time=processing_time,
         )
 
     def reset_state(self, stream_id: str = "default"):
-        self._audio_buffer.reset()
-        self._reset_cache()
-        self._previous_hypotheses = self._get_blank_hypothesis()
-        self._last_transcript_timestamp = time.time()
+        """
+        Resets the buffers, encoder cache and hypothesis of a stream, keeping the stream open.
+
+        This is called from the event loop, so it never waits for a running batch: if a batch holds the lock
+        (e.g., in the worker thread of StreamingASRBatchScheduler), the reset is applied before the next batch.
+        """
+        if not self._lock.acquire(blocking=False):
+            with self._pending_lock:
+                self._pending_resets.add(stream_id)
+            return
+        try:
+            self._reset_stream(stream_id)
+        finally:
+            self._lock.release()
+
+    def _reset_stream(self, stream_id: str):
+        state = self._streams.get(stream_id)
+        if state is None:
+            return
+        state.audio_buffer.reset()
+        self._release_cache_slot(stream_id)
+        state.previous_hypotheses = self._get_blank_hypothesis()
+        state.last_transcript_timestamp = time.time()
+
+    def _close_stream(self, stream_id: str):
+        if self._streams.pop(stream_id, None) is not None:
+            self._release_cache_slot(stream_id)
+
+    def _apply_pending_requests(self):
+        with self._pending_lock:
+            resets, self._pending_resets = self._pending_resets, set()
+            closes, self._pending_closes = self._pending_closes, set()
+        for stream_id in resets:
+            self._reset_stream(stream_id)
+        for stream_id in closes:
+            self._close_stream(stream_id)
+
+    def close_stream(self, stream_id: str = "default"):
+        """
+        Drops the state of a finished stream and frees its session. Like `reset_state`, it never waits for a
+        running batch and is applied before the next batch instead.
+        """
+        if not self._lock.acquire(blocking=False):
+            with self._pending_lock:
+                self._pending_closes.add(stream_id)
+            return
+        try:
+            self._close_stream(stream_id)
+        finally:
+            self._lock.release()
 
     def get_eou_probability(self, tokens: List[int], probs: List[float], eou_string: str = "<EOU>") -> float:
         text_tokens = self.tokenizer.ids_to_tokens(tokens)
         eou_index = text_tokens.index(eou_string)
         return probs[eou_index]
+
+
+@dataclass
+class _ASRRequest:
+    audio: bytes
+    stream_id: str
+    future: asyncio.Future
+
+
+class StreamingASRBatchScheduler:
+    """
+    Micro-batching scheduler for a multi-session NemoStreamingASRService.
+
+    Chunks submitted by concurrent sessions with `transcribe` are queued. A background task waits for the first
+    pending chunk, keeps collecting chunks for up to `max_wait_in_secs` (or until `max_batch_size` chunks are
+    gathered), and runs them through the service as one encoder batch in a worker thread. Chunks of the same stream
+    are never put in the same batch, so every stream is processed in order. A chunk of a new stream that cannot get a
+    session because all of them are in use fails with a RuntimeError, without failing the rest of its batch.
+    """
+
+    def __init__(
+        self,
+        asr_service: NemoStreamingASRService,
+        max_batch_size: Optional[int] = None,
+        max_wait_in_secs: float = 0.01,
+    ):
+        """
+        Args:
+            asr_service (NemoStreamingASRService): service to run the batches with
+            max_batch_size (Optional[int]): maximum number of chunks in a batch, defaults to `asr_service.max_sessions`
+            max_wait_in_secs (float): latency budget for gathering a batch after its first chunk has arrived
+        """
+        self.asr_service = asr_service
+        self.max_batch_size = max_batch_size or asr_service.max_sessions
+        self.max_wait_in_secs = max_wait_in_secs
+        self._queue: Optional[asyncio.Queue] = None
+        self._deferred: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    async def transcribe(self, audio: bytes, stream_id: str = "default") -> ASRResult:
+        """Queues a chunk of a stream and waits for its transcription result."""
+        if self._task is None or self._task.done():
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_ASRRequest(audio=audio, stream_id=stream_id, future=future))
+        return await future
+
+    def start(self):
+        """Starts the batching task in the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stops the batching task and fails the chunks that are still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        pending = list(self._deferred)
+        self._deferred.clear()
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for request in pending:
+            if not request.future.done():
+                request.future.cancel()
+
+    async def _next_batch(self) -> List[_ASRRequest]:
+        batch, batch_stream_ids = [], set()
+        deferred = []
+
+        def add(request: _ASRRequest):
+            if request.stream_id in batch_stream_ids:
+                deferred.append(request)
+            else:
+                batch.append(request)
+                batch_stream_ids.add(request.stream_id)
+
+        while self._deferred and len(batch) < self.max_batch_size:
+            add(self._deferred.popleft())
+        if not batch:
+            add(await self._queue.get())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_in_secs
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                add(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # deferred chunks go before the remaining ones to keep the order within every stream
+        self._deferred.extendleft(reversed(deferred))
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                # new streams that cannot get a session are left out, so they do not fail the whole batch
+                results = await asyncio.to_thread(
+                    self.asr_service.transcribe_batch,
+                    [request.audio for request in batch],
+                    [request.stream_id for request in batch],
+                    skip_unavailable=True,
+                )
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            for request, result in zip(batch, results):
+                if request.future.done():
+                    continue
+                if result is None:
+                    request.future.set_exception(
+                        RuntimeError(
+                            f"Cannot open stream `{request.stream_id}`: all {self.asr_service.max_sessions} "
+                            f"sessions are in use. Close finished streams with `close_stream` or increase "
+                            f"`max_sessions`."
+                        )
+                    )
+                else:
+                    request.future.set_result(result)
@@ -36,7 +36,10 @@ from pipecat.utils.tracing.service_decorators import traced_stt
 from pydantic import BaseModel
 
 from nemo.agents.voice_agent.pipecat.services.nemo.audio_logger import AudioLogger
-from nemo.agents.voice_agent.pipecat.services.nemo.streaming_asr import NemoStreamingASRService
+from nemo.agents.voice_agent.pipecat.services.nemo.streaming_asr import (
+    NemoStreamingASRService,
+    StreamingASRBatchScheduler,
+)
 
 ASR_EOU_MODELS = ["nvidia/parakeet_realtime_eou_120m-v1"]
 
@@ -79,8 +82,17 @@ class NemoSTTService(STTService):
         backend: Optional[str] = "legacy",
         decoder_type: Optional[str] = "rnnt",
         audio_logger: Optional[AudioLogger] = None,
+        asr_scheduler: Optional[StreamingASRBatchScheduler] = None,
+        stream_id: Optional[str] = None,
         **kwargs,
     ):
+        """
+        Args:
+            asr_scheduler: scheduler of a multi-session NemoStreamingASRService shared by several pipelines.
+                If given, no model is loaded and the audio of this service is transcribed in batches together
+                with the other sessions of the scheduler.
+            stream_id: id of the session of this service in the shared ASR service, defaults to the service name.
+        """
         super().__init__(**kwargs)
         self._queue = asyncio.Queue()
         self._sample_rate = sample_rate
@@ -94,6 +106,8 @@ class NemoSTTService(STTService):
         self._decoder_type = decoder_type
         self._audio_logger = audio_logger
         self._is_vad_active = False
+        self._asr_scheduler = asr_scheduler
+        self._stream_id = stream_id or self.name
         logger.info(f"NeMoSTTInputParams: {self._params}")
 
         self._device = device
@@ -104,7 +118,9 @@ class NemoSTTService(STTService):
         self.user_is_speaking = False
 
     def _load_model(self):
-        if self._backend == "legacy":
+        if self._asr_scheduler is not None:
+            self._model = self._asr_scheduler.asr_service
+        elif self._backend == "legacy":
             self._model = NemoStreamingASRService(
                 self._model_name,
                 self._params.att_context_size,
@@ -144,6 +160,8 @@ class NemoSTTService(STTService):
         await super().stop(frame)
         # Clear any internal state if needed
         await self._queue.put(None)  # Signal to stop processing
+        if self._asr_scheduler is not None:
+            self._model.close_stream(self._stream_id)
 
     async def cancel(self, frame: CancelFrame):
         """Handle service cancellation.
@@ -155,6 +173,8 @@ class NemoSTTService(STTService):
         # Clear any internal state
         await self._queue.put(None)  # Signal to stop processing
         self._queue = asyncio.Queue()  # Reset the queue
+        if self._asr_scheduler is not None:
+            self._model.close_stream(self._stream_id)
 
     async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
         """Process audio data and generate transcription frames.
@@ -184,7 +204,10 @@ class NemoSTTService(STTService):
                 if self._audio_logger is not None:
                     self._audio_logger.append_continuous_user_audio(audio)
 
-                asr_result = self._model.transcribe(audio)
+                if self._asr_scheduler is not None:
+                    asr_result = await self._asr_scheduler.transcribe(audio, stream_id=self._stream_id)
+                else:
+                    asr_result = self._model.transcribe(audio, stream_id=self._stream_id)
                 transcription = asr_result.text
                 is_final = asr_result.is_final
                 if self._audio_logger is not None:
@@ -308,7 +331,7 @@ class NemoSTTService(STTService):
                 logger.debug(
                     "[EOU missing] STT failed to detect end of utterance before VAD detected user stopped speaking"
                 )
-            self._model.reset_state()
+            self._model.reset_state(stream_id=self._stream_id)
             self._is_vad_active = False
         elif isinstance(frame, VADUserStartedSpeakingFrame):
             self._is_vad_active = True
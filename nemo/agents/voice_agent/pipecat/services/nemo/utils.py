@@ -14,6 +14,7 @@
 # NOTE: This file will be deprecated in the future, as the new inference pipeline will replace it.
 
 import math
+from typing import List
 
 import numpy as np
 import torch
@@ -78,6 +79,7 @@ class CacheFeatureBufferer:
         preprocessor_cfg: DictConfig,
         device: torch.device,
         fill_value: float = LOG_MEL_ZERO,
+        preprocessor: torch.nn.Module = None,
     ):
 
         if buffer_size_in_secs < chunk_size_in_secs:
@@ -110,8 +112,11 @@ class CacheFeatureBufferer:
             device=self.device,
         )
 
-        self.preprocessor = nemo_asr.models.ASRModel.from_config_dict(preprocessor_cfg)
-        self.preprocessor.to(self.device)
+        if preprocessor is None:
+            preprocessor = nemo_asr.models.ASRModel.from_config_dict(preprocessor_cfg)
+            preprocessor.to(self.device)
+        # the preprocessor is stateless, so it can be shared between bufferers of different streams
+        self.preprocessor = preprocessor
 
     def is_buffer_empty(self) -> bool:
         """
@@ -152,26 +157,22 @@ class CacheFeatureBufferer:
         features = features.squeeze()
         return features
 
-    def update(self, audio: np.ndarray) -> None:
+    def _push_samples(self, audio: np.ndarray) -> torch.Tensor:
         """
-        Update the sample anf feature buffers with the new frame
-        Args:
-            frame (Frame): frame to update the buffer with
+        Update the sample buffer with the new frame and return the samples to extract the new features from
         """
-
-        # Update the sample buffer with the new frame
         self.sample_buffer.update(audio)
 
         if math.isclose(self.buffer_size_in_secs, self.chunk_size_in_secs):
             # If the buffer size is equal to the chunk size, just take the whole buffer
-            samples = self.sample_buffer.sample_buffer.clone()
-        else:
-            # Add look_back to have context for the first feature
-            samples = self.sample_buffer.sample_buffer[-(self.n_chunk_look_back + self.chunk_size) :]
-
-        # Get the mel spectrogram
-        features = self.preprocess(samples)
+            return self.sample_buffer.sample_buffer.clone()
+        # Add look_back to have context for the first feature
+        return self.sample_buffer.sample_buffer[-(self.n_chunk_look_back + self.chunk_size) :]
 
+    def _push_features(self, features: torch.Tensor) -> None:
+        """
+        Update the feature buffer with the features extracted from the samples returned by `_push_samples`
+        """
         # If the features are longer than supposed to be, drop the last frames
         # Drop the last diff frames because they might be incomplete
         if (diff := features.shape[1] - self.feature_chunk_len - 1) > 0:
@@ -180,6 +181,40 @@ class CacheFeatureBufferer:
         # Update the feature buffer with the new features
         self._update_feature_buffer(features[:, -self.feature_chunk_len :])
 
+    def update(self, audio: np.ndarray) -> None:
+        """
+        Update the sample anf feature buffers with the new frame
+        Args:
+            frame (Frame): frame to update the buffer with
+        """
+        samples = self._push_samples(audio)
+
+        # Get the mel spectrogram
+        features = self.preprocess(samples)
+
+        self._push_features(features)
+
+    @staticmethod
+    def batch_update(bufferers: List["CacheFeatureBufferer"], audios: List[np.ndarray]) -> None:
+        """
+        Update the buffers of several streams at once, running the preprocessor of the first bufferer
+        on the whole batch. All bufferers must have been created with the same configuration.
+        Args:
+            bufferers (List[CacheFeatureBufferer]): bufferers to update, one per stream
+            audios (List[np.ndarray]): new frames, one per bufferer
+        """
+        if len(bufferers) != len(audios):
+            raise ValueError(f"Got {len(bufferers)} bufferers but {len(audios)} audio frames")
+        if not bufferers:
+            return
+
+        samples = torch.stack([bufferer._push_samples(audio) for bufferer, audio in zip(bufferers, audios)])
+        samples = samples.to(bufferers[0].device)
+        samples_len = torch.full([samples.shape[0]], samples.shape[1], device=samples.device)
+        features, _ = bufferers[0].preprocessor(input_signal=samples, length=samples_len)
+        for bufferer, feature in zip(bufferers, features):
+            bufferer._push_features(feature)
+
     def get_buffer(self) -> torch.Tensor:
         """
         Get the current sample buffer
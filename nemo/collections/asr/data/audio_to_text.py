@@ -127,6 +127,8 @@ class ASRManifestProcessor:
         bos_id: Id of beginning of sequence symbol to append if not None.
         eos_id: Id of end of sequence symbol to append if not None.
         pad_id: Id of pad symbol. Defaults to 0.
+        columnar_manifest: If True, keep the parsed manifest in a memory-compact columnar collection that is
+            shared between forked DataLoader workers. Defaults to False.
     """
 
     def __init__(
@@ -141,6 +143,7 @@ class ASRManifestProcessor:
         pad_id: int = 0,
         index_by_file_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        columnar_manifest: bool = False,
     ):
         self.parser = parser
 
@@ -152,6 +155,7 @@ class ASRManifestProcessor:
             max_number=max_utts,
             index_by_file_id=index_by_file_id,
             parse_func=manifest_parse_func,
+            columnar=columnar_manifest,
         )
 
         self.eos_id = eos_id
@@ -414,6 +418,8 @@ class _AudioTextDataset(Dataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        columnar_manifest (bool): If True, keep the parsed manifest in a memory-compact columnar collection that is
+            shared between forked DataLoader workers. Defaults to False.
     """
 
     @property
@@ -444,6 +450,7 @@ class _AudioTextDataset(Dataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        columnar_manifest: bool = False,
     ):
         if type(manifest_filepath) == str:
             manifest_filepath = manifest_filepath.split(",")
@@ -461,6 +468,7 @@ class _AudioTextDataset(Dataset):
             eos_id=eos_id,
             pad_id=pad_id,
             manifest_parse_func=manifest_parse_func,
+            columnar_manifest=columnar_manifest,
         )
         self.featurizer = WaveformFeaturizer(sample_rate=sample_rate, int_values=int_values, augmentor=augmentor)
         self.trim = trim
@@ -541,6 +549,8 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        columnar_manifest (bool): If True, keep the parsed manifest in a memory-compact columnar collection that is
+            shared between forked DataLoader workers. Defaults to False.
     """
 
     @property
@@ -575,6 +585,7 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        columnar_manifest: bool = False,
     ):
         self.labels = labels
 
@@ -598,6 +609,7 @@ class AudioToCharDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            columnar_manifest=columnar_manifest,
         )
 
 
@@ -637,6 +649,8 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        columnar_manifest (bool): If True, keep the parsed manifest in a memory-compact columnar collection that is
+            shared between forked DataLoader workers. Defaults to False.
     """
 
     @property
@@ -665,6 +679,7 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        columnar_manifest: bool = False,
     ):
         if use_start_end_token and hasattr(tokenizer, "bos_id") and tokenizer.bos_id > 0:
             bos_id = tokenizer.bos_id
@@ -715,6 +730,7 @@ class AudioToBPEDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            columnar_manifest=columnar_manifest,
         )
 
 
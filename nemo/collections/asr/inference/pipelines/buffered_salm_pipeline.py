@@ -30,7 +30,7 @@ from nemo.collections.asr.inference.streaming.framing.request import FeatureBuff
 from nemo.collections.asr.inference.streaming.framing.request_options import ASRRequestOptions
 from nemo.collections.asr.inference.streaming.state.salm_state import SALMStreamingState
 from nemo.collections.asr.inference.utils.enums import ASROutputGranularity, MergingStrategy, RequestType
-from nemo.collections.asr.inference.utils.lcs_merge import lcs_merge
+from nemo.collections.asr.inference.utils.lcs_merge import batched_lcs_merge
 from nemo.utils.decorators import experimental
 
 if TYPE_CHECKING:
@@ -148,21 +148,28 @@ class BufferedSALMPipeline(BasePipeline):
             state: (SALMStreamingState) The state of the streaming pipeline.
             data: (list[int]) The new tokens to merge with the buffer.
         """
-        if len(state.tokens) == 0:
-            state.tokens.extend(data)
-            return
+        state.tokens = self.batched_lcs_merge([state.tokens], [data])[0]
 
+    def batched_lcs_merge(self, buffers: list[list[int]], data: list[list[int]]) -> list[list[int]]:
+        """
+        Merge the buffers and data of several streams using the LCS algorithm in a single batched call.
+        Args:
+            buffers: (list[list[int]]) The buffers of tokens, one per stream.
+            data: (list[list[int]]) The new tokens to merge with each buffer.
+        Returns:
+            (list[list[int]]) The merged tokens for each stream.
+        """
         # extra overlap tokens for better overlap detection
-        delay = int(self.overlap_ratio * len(data)) + self.extra_overlap_tokens
-        state.tokens = lcs_merge(
-            buffer=state.tokens,
-            data=data[:delay],
-            search_size=delay,
+        delays = [int(self.overlap_ratio * len(tokens)) + self.extra_overlap_tokens for tokens in data]
+        merged = batched_lcs_merge(
+            buffers=buffers,
+            data=[tokens[:delay] for tokens, delay in zip(data, delays)],
+            search_sizes=delays,
             sep_id=self.asr_model.word_separator_ids,
             min_lcs_length=1,
             merging_strategy=self.merging_strategy,
         )
-        state.tokens.extend(data[delay:])
+        return [merged_tokens + tokens[delay:] for merged_tokens, tokens, delay in zip(merged, data, delays)]
 
     def transcribe_step_for_frames(self, frames: list[Frame]) -> None:
         """
@@ -191,33 +198,43 @@ class BufferedSALMPipeline(BasePipeline):
             max_new_tokens=self.max_new_tokens,
         ).cpu()
 
-        for i, frame in enumerate(frames):
-            state = self.get_state(frame.stream_id)
+        states = [self.get_state(frame.stream_id) for frame in frames]
+
+        # Merge the completed segments of all streams in one batched call
+        completed_states, completed_tokens = [], []
+        for i, (frame, state) in enumerate(zip(frames, states)):
             new_tokens = parse_hyp(answer_ids[i], self.asr_model.eos_token_ids).tolist()
             state.incomplete_segment_tokens.clear()
             if self.audio_bufferer.is_full(frame.stream_id) or frame.is_last:
-                self.lcs_merge(state, new_tokens)
+                completed_states.append(state)
+                completed_tokens.append(new_tokens)
             else:
                 state.incomplete_segment_tokens.extend(new_tokens)
 
+        if len(completed_states) > 0:
+            merged = self.batched_lcs_merge([state.tokens for state in completed_states], completed_tokens)
+            for state, tokens in zip(completed_states, merged):
+                state.tokens = tokens
+
+        # Merge the incomplete segments for the partial transcripts, also in one batched call
+        partial_tokens = {}
+        partial_idx = [
+            i
+            for i, (frame, state) in enumerate(zip(frames, states))
+            if not frame.is_last and len(state.incomplete_segment_tokens) > 0
+        ]
+        if len(partial_idx) > 0:
+            merged = self.batched_lcs_merge(
+                [states[i].tokens for i in partial_idx], [states[i].incomplete_segment_tokens for i in partial_idx]
+            )
+            partial_tokens = dict(zip(partial_idx, merged))
+
+        for i, (frame, state) in enumerate(zip(frames, states)):
             if frame.is_last:
                 state.final_transcript = self.asr_model.tokenizer.ids_to_text(state.tokens)
                 state.partial_transcript = ""
             else:
-                all_tokens = state.tokens.copy()
-                if len(state.incomplete_segment_tokens) > 0:
-                    # extra overlap tokens for better overlap detection
-                    delay = int(self.overlap_ratio * len(state.incomplete_segment_tokens)) + self.extra_overlap_tokens
-                    all_tokens = lcs_merge(
-                        buffer=all_tokens,
-                        data=state.incomplete_segment_tokens[:delay],
-                        search_size=delay,
-                        sep_id=self.asr_model.word_separator_ids,
-                        min_lcs_length=1,
-                        merging_strategy=self.merging_strategy,
-                    )
-                    all_tokens.extend(state.incomplete_segment_tokens[delay:])
-
+                all_tokens = partial_tokens.get(i, state.tokens)
                 if len(all_tokens) > 0:
                     state.partial_transcript = self.asr_model.tokenizer.ids_to_text(all_tokens)
                 else:
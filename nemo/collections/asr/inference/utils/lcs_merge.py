@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 from nemo.collections.asr.inference.utils.enums import MergingStrategy
 from nemo.collections.asr.parts.utils.streaming_utils import longest_common_subsequence_merge
 
@@ -57,6 +59,66 @@ def longest_common_substring(buffer: list[int], data: list[int]) -> tuple[int, i
     return end_i - max_len, end_j - max_len, max_len
 
 
+def batched_longest_common_substring(buffers: list[list[int]], data: list[list[int]]) -> list[tuple[int, int, int]]:
+    """
+    Find the longest common substring for many (buffer, data) pairs at once.
+    The DP table of all pairs is filled with NumPy, one buffer row at a time vectorized over the
+    batch and the data positions. The results are identical to `longest_common_substring`,
+    including the rightmost tie-breaking.
+    Args:
+        buffers: (list[list[int]]) The buffers of tokens, one per stream.
+        data: (list[list[int]]) The new tokens to merge with each buffer, one per stream.
+    Returns:
+        (list[tuple[int, int, int]]) For each pair, the start index in the buffer, the start index in the data
+        and the length of the longest common substring. (-1, -1, 0) if there is no common substring.
+    """
+    if len(buffers) != len(data):
+        raise ValueError(f"Number of buffers ({len(buffers)}) and data ({len(data)}) must be the same")
+
+    batch_size = len(buffers)
+    n = max((len(b) for b in buffers), default=0)
+    m = max((len(d) for d in data), default=0)
+    if n == 0 or m == 0:
+        return [(-1, -1, 0)] * batch_size
+
+    buffer_arr = np.zeros((batch_size, n), dtype=np.int64)
+    buffer_valid = np.zeros((batch_size, n), dtype=bool)
+    data_arr = np.zeros((batch_size, m), dtype=np.int64)
+    data_valid = np.zeros((batch_size, m), dtype=bool)
+    for b, (buf, dat) in enumerate(zip(buffers, data)):
+        buffer_arr[b, : len(buf)] = buf
+        buffer_valid[b, : len(buf)] = True
+        data_arr[b, : len(dat)] = dat
+        data_valid[b, : len(dat)] = True
+
+    # matches[b, i, j] is True if buffer[b][i] == data[b][j] and both positions are not padding
+    matches = buffer_arr[:, :, None] == data_arr[:, None, :]
+    matches &= buffer_valid[:, :, None] & data_valid[:, None, :]
+
+    # dp[b, i, j] is the length of the common substring ending at buffer[b][i] and data[b][j]
+    dp = np.zeros((batch_size, n, m), dtype=np.int32)
+    dp[:, 0, :] = matches[:, 0, :]
+    for i in range(1, n):
+        dp[:, i, 0] = matches[:, i, 0]
+        dp[:, i, 1:] = (dp[:, i - 1, :-1] + 1) * matches[:, i, 1:]
+
+    dp = dp.reshape(batch_size, n * m)
+    max_len = dp.max(axis=1)
+    # Among the positions with the maximal length, take the rightmost one in the buffer (largest i),
+    # then the rightmost one in the data (largest j), which is the largest flattened index.
+    flat_idx = np.arange(n * m)
+    end_flat = np.where(dp == max_len[:, None], flat_idx[None, :], -1).max(axis=1)
+    end_i, end_j = np.divmod(end_flat, m)
+
+    results = []
+    for length, i, j in zip(max_len.tolist(), end_i.tolist(), end_j.tolist()):
+        if length == 0:
+            results.append((-1, -1, 0))
+        else:
+            results.append((i + 1 - length, j + 1 - length, length))
+    return results
+
+
 def lcs_merge(
     buffer: list[int],
     data: list[int],
@@ -111,3 +173,61 @@ def lcs_merge(
 
     merged = buffer[:i_abs_end] + data[j_after:]
     return merged
+
+
+def batched_lcs_merge(
+    buffers: list[list[int]],
+    data: list[list[int]],
+    search_sizes: list[int],
+    sep_id: list[int] | None = None,
+    min_lcs_length: int = 1,
+    merging_strategy: MergingStrategy = MergingStrategy.LCSUBSTR,
+) -> list[list[int]]:
+    """
+    Merge many buffers with their new data at once.
+    Equivalent to calling `lcs_merge` for every stream, but for `MergingStrategy.LCSUBSTR` the longest
+    common substrings of all streams are found in one vectorized call.
+    Args:
+        buffers: (list[list[int]]) The buffers of tokens, one per stream.
+        data: (list[list[int]]) The new tokens to merge with each buffer.
+        search_sizes: (list[int]) The size of the search window in each buffer.
+        sep_id: (list[int] | None) The separator token ids. If no LCS is found, separator token is used to merge the buffer and data.
+        min_lcs_length: (int) The minimum length of the LCS.
+        merging_strategy: (MergingStrategy) The merging strategy to use.
+    Returns:
+        (list[list[int]]) The merged tokens for each stream.
+    """
+    if not (len(buffers) == len(data) == len(search_sizes)):
+        raise ValueError(
+            f"Number of buffers ({len(buffers)}), data ({len(data)}) and search sizes ({len(search_sizes)}) must be the same"
+        )
+
+    if merging_strategy != MergingStrategy.LCSUBSTR:
+        return [
+            lcs_merge(buffer, dat, search_size, sep_id, min_lcs_length, merging_strategy)
+            for buffer, dat, search_size in zip(buffers, data, search_sizes)
+        ]
+
+    if sep_id is None:
+        sep_id = []
+
+    merged = [None] * len(buffers)
+    to_search = []
+    for idx, (buffer, dat, search_size) in enumerate(zip(buffers, data, search_sizes)):
+        if len(buffer) == 0:
+            merged[idx] = buffer + dat
+        elif search_size < 1:
+            merged[idx] = buffer + sep_id + dat
+        else:
+            to_search.append(idx)
+
+    buffer_slices = [buffers[idx][-search_sizes[idx] :] for idx in to_search]
+    matches = batched_longest_common_substring(buffer_slices, [data[idx] for idx in to_search])
+    for idx, buffer_slice, (i_rel, j_rel, length) in zip(to_search, buffer_slices, matches):
+        buffer, dat = buffers[idx], data[idx]
+        if length < min_lcs_length:
+            merged[idx] = buffer + sep_id + dat
+            continue
+        i_abs_end = len(buffer) - len(buffer_slice) + i_rel + length
+        merged[idx] = buffer[:i_abs_end] + dat[j_rel + length :]
+    return merged
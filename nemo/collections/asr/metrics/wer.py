@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import multiprocessing
+from collections import defaultdict
 from copy import deepcopy
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from kaldialign import edit_distance
 from torchmetrics import Metric
@@ -24,7 +28,12 @@ from nemo.collections.asr.parts.submodules.multitask_decoding import AbstractMul
 from nemo.collections.asr.parts.submodules.rnnt_decoding import AbstractRNNTDecoding
 from nemo.utils import logging
 
-__all__ = ['word_error_rate', 'word_error_rate_detail', 'WER']
+try:
+    from kaldialign import _kaldialign
+except ImportError:
+    _kaldialign = None
+
+__all__ = ['batch_edit_distance', 'word_error_rate', 'word_error_rate_detail', 'WER']
 
 
 def move_dimension_to_the_front(tensor, dim_index):
@@ -32,38 +41,105 @@ def move_dimension_to_the_front(tensor, dim_index):
     return tensor.permute(*([dim_index] + all_dims[:dim_index] + all_dims[dim_index + 1 :]))
 
 
-def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False) -> float:
+def _align_ids(ref: List[int], hyp: List[int]) -> dict:
+    """Aligns two sequences of integer token ids with the kaldialign C++ core, skipping its per-call symbol mapping."""
+    if _kaldialign is None:
+        return edit_distance(ref, hyp)
+    return _kaldialign.edit_distance(ref, hyp, False)
+
+
+def _align_chunk(pairs: List[Tuple[List[int], List[int]]]) -> np.ndarray:
+    """Aligns (reference, hypothesis) pairs of token ids, returns an array of (ins, del, sub) counts."""
+    ops = []
+    for ref, hyp in pairs:
+        measures = _align_ids(ref, hyp)
+        ops.append((measures['ins'], measures['del'], measures['sub']))
+    return np.array(ops, dtype=np.int64).reshape(-1, 3)
+
+
+def batch_edit_distance(
+    hypotheses: List[str], references: List[str], use_cer: bool = False, num_workers: int = 1
+) -> Dict[str, np.ndarray]:
     """
-    Computes Average Word Error rate between two texts represented as
-    corresponding lists of string.
+    Computes the edit distance of many hypothesis/reference pairs at once, with per-utterance
+    insertion, deletion and substitution counts.
 
-    Hypotheses and references must have same length.
+    Tokens are mapped to integer ids with a vocabulary shared by all the pairs, so that the alignment
+    runs directly on ids. Exact matches and pairs with an empty side are resolved without alignment,
+    and the remaining pairs can be aligned by a pool of processes for large evaluation sets.
+    The counts are identical to the ones of ``kaldialign.edit_distance``.
 
     Args:
         hypotheses (list): list of hypotheses
         references(list) : list of references
-        use_cer (bool): set True to enable cer
+        use_cer (bool): set True to compute the edit distance over characters instead of words
+        num_workers (int): number of processes aligning the pairs. Defaults to 1 (no multiprocessing).
 
     Returns:
-        wer (float): average word error rate
+        A dict (with the same keys as ``kaldialign.edit_distance``) of integer arrays of shape ``[N]``:
+        ``ins``, ``del``, ``sub``, ``total`` (number of errors) and ``ref_len`` (number of reference tokens).
     """
-    scores = 0
-    words = 0
     if len(hypotheses) != len(references):
         raise ValueError(
             "In word error rate calculation, hypotheses and reference"
             " lists must have the same number of elements. But I got:"
             "{0} and {1} correspondingly".format(len(hypotheses), len(references))
         )
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
+    tokenize = list if use_cer else str.split
+    ref_tokens = [tokenize(text) for text in references]
+    hyp_tokens = [tokenize(text) for text in hypotheses]
+    ref_lengths = np.fromiter(map(len, ref_tokens), dtype=np.int64, count=len(ref_tokens))
+    hyp_lengths = np.fromiter(map(len, hyp_tokens), dtype=np.int64, count=len(hyp_tokens))
+
+    ops = np.zeros((len(references), 3), dtype=np.int64)
+    # only insertions (resp. deletions) if the reference (resp. hypothesis) is empty
+    ops[:, 0] = np.where(ref_lengths == 0, hyp_lengths, 0)
+    ops[:, 1] = np.where((hyp_lengths == 0) & (ref_lengths > 0), ref_lengths, 0)
+
+    to_align = [idx for idx, (ref, hyp) in enumerate(zip(ref_tokens, hyp_tokens)) if ref and hyp and ref != hyp]
+    if to_align:
+        # vocabulary shared by all the pairs, ids are assigned on first occurrence
+        vocab = defaultdict(itertools.count().__next__)
+        pairs = [
+            (list(map(vocab.__getitem__, ref_tokens[idx])), list(map(vocab.__getitem__, hyp_tokens[idx])))
+            for idx in to_align
+        ]
+        num_chunks = min(len(pairs), max(1, num_workers * 4))
+        if num_workers > 1 and num_chunks > 1:
+            chunk_size = -(-len(pairs) // num_chunks)
+            chunks = [pairs[start : start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+            with multiprocessing.Pool(min(num_workers, len(chunks))) as pool:
+                ops[to_align] = np.concatenate(pool.map(_align_chunk, chunks))
         else:
-            h_list = h.split()
-            r_list = r.split()
-        words += len(r_list)
-        scores += edit_distance(r_list, h_list)['total']
+            ops[to_align] = _align_chunk(pairs)
+
+    return {
+        'ins': ops[:, 0],
+        'del': ops[:, 1],
+        'sub': ops[:, 2],
+        'total': ops.sum(axis=1),
+        'ref_len': ref_lengths,
+    }
+
+
+def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False) -> float:
+    """
+    Computes Average Word Error rate between two texts represented as
+    corresponding lists of string.
+
+    Hypotheses and references must have same length.
+
+    Args:
+        hypotheses (list): list of hypotheses
+        references(list) : list of references
+        use_cer (bool): set True to enable cer
+
+    Returns:
+        wer (float): average word error rate
+    """
+    measures = batch_edit_distance(hypotheses, references, use_cer=use_cer)
+    scores = int(measures['total'].sum())
+    words = int(measures['ref_len'].sum())
     if words != 0:
         wer = 1.0 * scores / words
     else:
@@ -92,33 +168,14 @@ def word_error_rate_detail(
         del_rate (float): average deletion error rate
         sub_rate (float): average substitution error rate
     """
-    scores = 0
-    words = 0
-    ops_count = {'substitutions': 0, 'insertions': 0, 'deletions': 0}
-
-    if len(hypotheses) != len(references):
-        raise ValueError(
-            "In word error rate calculation, hypotheses and reference"
-            " lists must have the same number of elements. But I got:"
-            "{0} and {1} correspondingly".format(len(hypotheses), len(references))
-        )
-
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
-        else:
-            h_list = h.split()
-            r_list = r.split()
-
-        measures = edit_distance(r_list, h_list)
-        errors = measures['total']
-        ops_count['insertions'] += measures['ins']
-        ops_count['deletions'] += measures['del']
-        ops_count['substitutions'] += measures['sub']
-
-        scores += errors
-        words += len(r_list)
+    measures = batch_edit_distance(hypotheses, references, use_cer=use_cer)
+    ops_count = {
+        'substitutions': int(measures['sub'].sum()),
+        'insertions': int(measures['ins'].sum()),
+        'deletions': int(measures['del'].sum()),
+    }
+    scores = int(measures['total'].sum())
+    words = int(measures['ref_len'].sum())
 
     if words != 0:
         wer = 1.0 * scores / words
@@ -147,34 +204,16 @@ def word_error_rate_per_utt(hypotheses: List[str], references: List[str], use_ce
         wer_per_utt (List[float]): word error rate per utterance
         avg_wer (float): average word error rate
     """
-    scores = 0
-    words = 0
     wer_per_utt = []
-
-    if len(hypotheses) != len(references):
-        raise ValueError(
-            "In word error rate calculation, hypotheses and reference"
-            " lists must have the same number of elements. But I got:"
-            "{0} and {1} correspondingly".format(len(hypotheses), len(references))
-        )
-
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
-        else:
-            h_list = h.split()
-            r_list = r.split()
-
-        measures = edit_distance(r_list, h_list)
-        errors = measures['total']
-        if len(r_list) == 0:
+    measures = batch_edit_distance(hypotheses, references, use_cer=use_cer)
+    for errors, ref_len in zip(measures['total'].tolist(), measures['ref_len'].tolist()):
+        if ref_len == 0:
             wer_per_utt.append(float('inf') if errors > 0 else 0.0)
         else:
-            wer_per_utt.append(errors / len(r_list))
+            wer_per_utt.append(errors / ref_len)
 
-        scores += errors
-        words += len(r_list)
+    scores = int(measures['total'].sum())
+    words = int(measures['ref_len'].sum())
 
     if words != 0:
         avg_wer = 1.0 * scores / words
@@ -292,8 +331,6 @@ class WER(Metric):
             target_lengths: an integer torch.Tensor of shape ``[Batch]``
             predictions_lengths: an integer torch.Tensor of shape ``[Batch]``
         """
-        words = 0
-        scores = 0
         references = []
 
         with torch.no_grad():
@@ -319,17 +356,11 @@ class WER(Metric):
             logging.info(f"WER reference:{references[0]}")
             logging.info(f"WER predicted:{hypotheses[0].text}")
 
-        for h, r in zip(hypotheses, references):
-            if isinstance(h, list):
-                h = h[0]
-            if self.use_cer:
-                h_list = list(h.text)
-                r_list = list(r)
-            else:
-                h_list = h.text.split()
-                r_list = r.split()
-            words += len(r_list)
-            scores += edit_distance(r_list, h_list)['total']
+        num_pairs = min(len(hypotheses), len(references))
+        hypotheses_text = [(h[0] if isinstance(h, list) else h).text for h in hypotheses[:num_pairs]]
+        measures = batch_edit_distance(hypotheses_text, references[:num_pairs], use_cer=self.use_cer)
+        scores = int(measures['total'].sum())
+        words = int(measures['ref_len'].sum())
 
         self.scores = torch.tensor(scores, device=self.scores.device, dtype=self.scores.dtype)
         self.words = torch.tensor(words, device=self.words.device, dtype=self.words.dtype)
@@ -208,6 +208,12 @@ class EncDecHybridRNNTCTCModel(EncDecRNNTModel, ASRBPEMixin, InterCTCMixin, ASRT
             return super()._transcribe_output_processing(outputs, trcfg)
 
         # CTC Path
+        if trcfg.columnar_output:
+            raise ValueError(
+                "`columnar_output=True` is only supported by the RNNT decoder of hybrid models, "
+                "use `change_decoding_strategy(decoder_type='rnnt')` or set `columnar_output=False`."
+            )
+
         logits = outputs.pop('logits')
         encoded_len = outputs.pop('encoded_len')
 
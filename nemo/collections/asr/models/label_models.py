@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import hashlib
 import itertools
 import os
 import tempfile
@@ -43,6 +44,7 @@ from nemo.collections.asr.models.asr_model import ExportableEncDecModel
 from nemo.collections.asr.parts.mixins.mixins import VerificationMixin
 from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
 from nemo.collections.asr.parts.preprocessing.perturb import process_augmentations
+from nemo.collections.asr.parts.utils.speaker_embedding_store import SpeakerEmbeddingCache, score_embedding_pairs
 from nemo.collections.common.metrics import TopKClassificationAccuracy
 from nemo.collections.common.parts.preprocessing.collections import ASRSpeechLabel
 from nemo.core.classes import ModelPT
@@ -725,9 +727,18 @@ class EncDecSpeakerLabelModel(ModelPT, ExportableEncDecModel, VerificationMixin)
             return False
 
     @torch.no_grad()
-    def verify_speakers_batch(self, audio_files_pairs, threshold=0.7, batch_size=32, sample_rate=16000, device='cuda'):
+    def verify_speakers_batch(
+        self,
+        audio_files_pairs,
+        threshold=0.7,
+        batch_size=32,
+        sample_rate=16000,
+        device='cuda',
+        embedding_cache_dir=None,
+    ):
         """
         Verify if audio files from the first and second manifests are from the same speaker or not.
+        Every distinct audio file is embedded once, even if it appears in several pairs.
 
         Args:
             audio_files_pairs: list of tuples with audio_files pairs to be verified
@@ -735,46 +746,55 @@ class EncDecSpeakerLabelModel(ModelPT, ExportableEncDecModel, VerificationMixin)
             batch_size: batch size to perform batch inference
             sample_rate: sample rate of audio files in manifest file
             device: compute device to perform operations.
+            embedding_cache_dir: optional directory of a `SpeakerEmbeddingCache`. If provided, embeddings are keyed
+                by the content hash of the audio files and reused across calls. The cache is tied to the weights of
+                this model and to `sample_rate`, and opening it with another model raises an error.
 
         Returns:
-            True if both audio pair is from same speaker, False otherwise
+            True if both audio pair is from same speaker, False otherwise (a 0-d array for a single pair)
         """
 
-        if type(audio_files_pairs) is list:
-            tmp_dir = tempfile.TemporaryDirectory()
-            manifest_filepath1 = os.path.join(tmp_dir.name, 'tmp_manifest1.json')
-            manifest_filepath2 = os.path.join(tmp_dir.name, 'tmp_manifest2.json')
-            self.path2audio_files_to_manifest([p[0] for p in audio_files_pairs], manifest_filepath1)
-            self.path2audio_files_to_manifest([p[1] for p in audio_files_pairs], manifest_filepath2)
-        else:
+        if type(audio_files_pairs) is not list:
             raise ValueError("audio_files_pairs must be of type list of tuples containing a pair of audio files")
 
-        embs1, _, _, _ = self.batch_inference(
-            manifest_filepath1, batch_size=batch_size, sample_rate=sample_rate, device=device
-        )
-        embs2, _, _, _ = self.batch_inference(
-            manifest_filepath2, batch_size=batch_size, sample_rate=sample_rate, device=device
-        )
+        audio_files = list(dict.fromkeys(audio_file for pair in audio_files_pairs for audio_file in pair))
+        file_to_idx = {audio_file: idx for idx, audio_file in enumerate(audio_files)}
 
-        embs1 = torch.Tensor(embs1).to(device)
-        embs2 = torch.Tensor(embs2).to(device)
-        # Length Normalize
-        embs1 = torch.div(embs1, torch.linalg.norm(embs1, dim=1).unsqueeze(dim=1))
-        embs2 = torch.div(embs2, torch.linalg.norm(embs2, dim=1).unsqueeze(dim=1))
+        def embed_files(paths2audio_files):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                manifest_filepath = os.path.join(tmp_dir, 'tmp_manifest.json')
+                self.path2audio_files_to_manifest(paths2audio_files, manifest_filepath)
+                embs, _, _, _ = self.batch_inference(
+                    manifest_filepath, batch_size=batch_size, sample_rate=sample_rate, device=device
+                )
+            return embs
 
-        X = embs1.unsqueeze(dim=1)
-        Y = embs2.unsqueeze(dim=2)
-        # Score
-        similarity_scores = torch.matmul(X, Y).squeeze() / (
-            (torch.matmul(X, X.permute(0, 2, 1)).squeeze() * torch.matmul(Y.permute(0, 2, 1), Y).squeeze()) ** 0.5
-        )
-        similarity_scores = (similarity_scores + 1) / 2
+        if embedding_cache_dir is not None:
+            embedding_cache = SpeakerEmbeddingCache(
+                embedding_cache_dir, model_id=self._get_embedding_cache_model_id(sample_rate)
+            )
+            embs = embedding_cache.get(embedding_cache.get_or_compute(audio_files, embed_files))
+        else:
+            embs = embed_files(audio_files)
 
-        # Decision
+        pairs = np.array([[file_to_idx[pair[0]], file_to_idx[pair[1]]] for pair in audio_files_pairs])
+        similarity_scores = score_embedding_pairs(embs, pairs)
+
+        # Decision, squeezed to a 0-d array for a single pair
         decision = similarity_scores >= threshold
+        return decision.squeeze()
 
-        tmp_dir.cleanup()
-        return decision.cpu().numpy()
+    def _get_embedding_cache_model_id(self, sample_rate: int) -> str:
+        """
+        Identity of the embeddings computed by this model for `SpeakerEmbeddingCache`: a hash of the model weights
+        (and buffers), the embedding sizes and the sample rate of the input audio.
+        """
+        sha1 = hashlib.sha1()
+        for name, tensor in self.state_dict().items():
+            sha1.update(name.encode('utf-8'))
+            sha1.update(tensor.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy().tobytes())
+        emb_sizes = self.cfg.decoder.get('emb_sizes', None) if 'decoder' in self.cfg else None
+        return f"{sha1.hexdigest()}-emb{emb_sizes}-sr{sample_rate}"
 
     @torch.no_grad()
     def batch_inference(self, manifest_filepath, batch_size=32, sample_rate=16000, device='cuda'):
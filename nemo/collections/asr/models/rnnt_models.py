@@ -40,7 +40,7 @@ from nemo.collections.asr.parts.mixins import (
 from nemo.collections.asr.parts.preprocessing.segment import ChannelSelectorType
 from nemo.collections.asr.parts.submodules.rnnt_decoding import RNNTDecoding, RNNTDecodingConfig
 from nemo.collections.asr.parts.utils.asr_batching import get_semi_sorted_batch_sampler
-from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
+from nemo.collections.asr.parts.utils.rnnt_utils import ColumnarHypotheses, Hypothesis
 from nemo.collections.asr.parts.utils.timestamp_utils import process_timestamp_outputs
 from nemo.collections.common.data.lhotse import get_lhotse_dataloader_from_config
 from nemo.collections.common.parts.preprocessing.parsers import make_parser
@@ -251,6 +251,7 @@ class EncDecRNNTModel(ASRModel, ASRModuleMixin, ExportableEncDecModel, ASRTransc
         verbose: bool = True,
         timestamps: Optional[bool] = None,
         override_config: Optional[TranscribeConfig] = None,
+        columnar_output: bool = False,
     ) -> TranscriptionReturnType:
         """
         Uses greedy decoding to transcribe audio files. Use this method for debugging and prototyping.
@@ -282,6 +283,9 @@ class EncDecRNNTModel(ASRModel, ASRModuleMixin, ExportableEncDecModel, ASRTransc
             override_config: (Optional[TranscribeConfig]) override transcription config pre-defined by the user.
                 **Note**: All other arguments in the function will be ignored if override_config is passed.
                 You should call this argument as `model.transcribe(audio, override_config=TranscribeConfig(...))`.
+            columnar_output: (bool) If True, returns the best hypotheses of all the audio as a single
+                ColumnarHypotheses (padded token ids, lengths, scores, timestamps and lazily decoded texts).
+                With greedy batched decoding, Hypothesis objects are only created when items are accessed.
 
         Returns:
             Returns a tuple of 2 items -
@@ -327,6 +331,7 @@ class EncDecRNNTModel(ASRModel, ASRModuleMixin, ExportableEncDecModel, ASRTransc
             override_config=override_config,
             # Additional arguments
             partial_hypothesis=partial_hypothesis,
+            columnar_output=columnar_output,
         )
 
     def change_vocabulary(self, new_vocabulary: List[str], decoding_cfg: Optional[DictConfig] = None):
@@ -949,10 +954,22 @@ class EncDecRNNTModel(ASRModel, ASRModuleMixin, ExportableEncDecModel, ASRTransc
 
     def _transcribe_output_processing(
         self, outputs, trcfg: TranscribeConfig
-    ) -> Union[List['Hypothesis'], List[List['Hypothesis']]]:
+    ) -> Union[List['Hypothesis'], List[List['Hypothesis']], ColumnarHypotheses]:
         encoded = outputs.pop('encoded')
         encoded_len = outputs.pop('encoded_len')
 
+        if trcfg.columnar_output:
+            hyp = self.decoding.rnnt_decoder_predictions_columnar(
+                encoded, encoded_len, partial_hypotheses=trcfg.partial_hypothesis
+            )
+            del encoded, encoded_len
+            if trcfg.timestamps:
+                # hypotheses are already materialized to compute timestamps, and are updated in place
+                process_timestamp_outputs(
+                    hyp.to_hypotheses(), self.encoder.subsampling_factor, self.cfg['preprocessor']['window_stride']
+                )
+            return hyp
+
         hyp = self.decoding.rnnt_decoder_predictions_tensor(
             encoded,
             encoded_len,
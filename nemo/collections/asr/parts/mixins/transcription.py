@@ -29,7 +29,7 @@ from tqdm import tqdm
 from nemo.collections.asr.parts.preprocessing.perturb import process_augmentations
 from nemo.collections.asr.parts.preprocessing.segment import AudioSegment, ChannelSelectorType
 from nemo.collections.asr.parts.utils import manifest_utils
-from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
+from nemo.collections.asr.parts.utils.rnnt_utils import ColumnarHypotheses, Hypothesis
 from nemo.collections.common.data.utils import move_data_to_device
 from nemo.utils import logging, logging_mode
 
@@ -64,6 +64,11 @@ class TranscribeConfig:
     augmentor: Optional[DictConfig] = None
     timestamps: Optional[bool] = None  # returns timestamps for each word and segments if model supports punctuations
     verbose: bool = True
+    # audio passed as numpy arrays / tensors shorter than pad_min_duration seconds is padded to that duration
+    pad_min_duration: float = 1.0
+    pad_direction: str = 'both'
+    # returns the best hypotheses as a single ColumnarHypotheses instead of a list (RNNT decoding only)
+    columnar_output: bool = False
 
     # Utility
     partial_hypothesis: Optional[List[Any]] = None
@@ -252,6 +257,8 @@ class TranscriptionMixin(ABC):
                 - Tuple[List[str/Hypothesis]]
 
                 - Dict[str, List[str/Hypothesis]]
+
+                - ColumnarHypotheses
         """
 
         if override_config is None:
@@ -304,6 +311,13 @@ class TranscriptionMixin(ABC):
 
                     results.extend(processed_outputs)
 
+                elif isinstance(processed_outputs, ColumnarHypotheses):
+                    # Batches are concatenated once all of them are transcribed
+                    if results is None:
+                        results = []
+
+                    results.append(processed_outputs)
+
                 elif isinstance(processed_outputs, dict):
                     # Create a results of the same type as each element in processed_outputs
                     if results is None:
@@ -342,6 +356,9 @@ class TranscriptionMixin(ABC):
         except StopIteration:
             pass
 
+        if isinstance(results, list) and len(results) > 0 and isinstance(results[0], ColumnarHypotheses):
+            results = ColumnarHypotheses.concatenate(results)
+
         return results
 
     def transcribe_generator(self, audio, override_config: Optional[TranscribeConfig]):
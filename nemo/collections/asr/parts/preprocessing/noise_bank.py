@@ -0,0 +1,240 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import random
+import shutil
+import tempfile
+from typing import List, Optional, Union
+
+import numpy as np
+
+from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
+from nemo.collections.common.parts.preprocessing import collections, parsers
+from nemo.utils import logging
+
+__all__ = ['NoiseBank']
+
+_SAMPLES_FILE = 'samples.npy'
+_OFFSETS_FILE = 'offsets.npy'
+_META_FILE = 'meta.json'
+_SPILL_FILE = 'samples.raw'
+_INT16_SCALE = 32767.0
+# number of samples copied at once from the spill file to the bank
+_COPY_CHUNK_SAMPLES = 1 << 22
+
+
+class NoiseBank:
+    """
+    Pre-decoded noise audio stored in a single memory-mapped array.
+
+    All the noise files of a manifest are decoded once at a fixed sample rate and concatenated into
+    `samples.npy` (float16 or int16, shape [num_samples, num_channels]), with the start of each file
+    in `offsets.npy`. The arrays are opened read-only with `np.load(mmap_mode='r')`, so all the dataloader
+    workers share the same pages of the OS cache, and a random crop of a noise file is a slice of the array.
+
+    Args:
+        bank_dir (str): directory with a noise bank created by `NoiseBank.build`
+    """
+
+    def __init__(self, bank_dir: str):
+        self._bank_dir = bank_dir
+        with open(os.path.join(bank_dir, _META_FILE), 'r') as f:
+            meta = json.load(f)
+        self._sample_rate = meta['sample_rate']
+        self._dtype = meta['dtype']
+        # opened lazily, so that the bank can be pickled to the dataloader workers without the arrays
+        self._samples = None
+        self._offsets = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_samples'] = None
+        state['_offsets'] = None
+        return state
+
+    def _open(self):
+        if self._samples is None:
+            self._samples = np.load(os.path.join(self._bank_dir, _SAMPLES_FILE), mmap_mode='r')
+            self._offsets = np.load(os.path.join(self._bank_dir, _OFFSETS_FILE))
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def __len__(self):
+        self._open()
+        return len(self._offsets) - 1
+
+    def get_samples(self, index: int, duration: Optional[float] = None) -> np.ndarray:
+        """
+        Returns the samples of the noise file `index` as float32, or a random crop of `duration` seconds
+        if the file is longer than that.
+        """
+        self._open()
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        if duration is not None:
+            num_samples = int(np.ceil(duration * self._sample_rate))
+            if end - start > num_samples:
+                start = random.randint(start, end - num_samples)
+                end = start + num_samples
+        samples = np.asarray(self._samples[start:end], dtype=np.float32)
+        if self._dtype == 'int16':
+            samples /= _INT16_SCALE
+        return samples[:, 0] if samples.shape[1] == 1 else samples
+
+    def sample(self, target_sr: int, duration: Optional[float] = None) -> AudioSegment:
+        """
+        Returns a random noise file as an AudioSegment at `target_sr`, cropped at a random position
+        to `duration` seconds if the file is longer than that.
+        """
+        index = random.randrange(len(self))
+        samples = self.get_samples(index, duration=duration)
+        return AudioSegment(samples, self._sample_rate, target_sr=target_sr)
+
+    @staticmethod
+    def exists(bank_dir: str) -> bool:
+        return os.path.exists(os.path.join(bank_dir, _META_FILE))
+
+    @classmethod
+    def build(
+        cls,
+        manifest_path: Union[str, List[str]],
+        bank_dir: str,
+        sample_rate: int,
+        dtype: str = 'float16',
+        audio_tar_filepaths: Optional[Union[str, List[str]]] = None,
+    ) -> 'NoiseBank':
+        """
+        Decodes the noise files of the manifest at `sample_rate` and writes them to `bank_dir`.
+        Each file is decoded once and streamed to disk, so the memory use does not grow with the size of the bank.
+        The files are written to a temporary directory first and moved in place, so that concurrent builds
+        (e.g., by several ranks) never expose a partially written bank.
+
+        Args:
+            manifest_path: manifest file(s) with the noise files
+            bank_dir: output directory
+            sample_rate: sample rate of the stored noise
+            dtype: storage type, 'float16' or 'int16'
+            audio_tar_filepaths: tar files, if noise audio files are tarred
+
+        Returns:
+            the created NoiseBank
+        """
+        if dtype not in ('float16', 'int16'):
+            raise ValueError(f"Unsupported noise bank dtype: {dtype}, expected 'float16' or 'int16'")
+
+        manifest = collections.ASRAudioText(manifest_path, parser=parsers.make_parser([]), index_by_file_id=True)
+        parent_dir = os.path.dirname(os.path.abspath(bank_dir))
+        os.makedirs(parent_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent_dir, prefix='.noise_bank_')
+        spill_path = os.path.join(tmp_dir, _SPILL_FILE)
+
+        # first pass: decode each file once and append it to a raw spill file, so that only one file
+        # is held in memory and the total size is known before the bank is allocated
+        lengths = []
+        num_channels = None
+        entries = cls._iterate_manifest(manifest, manifest_path, audio_tar_filepaths)
+        try:
+            with open(spill_path, 'wb') as spill:
+                for audio_file, offset, duration in entries:
+                    segment = AudioSegment.from_file(
+                        audio_file, target_sr=sample_rate, offset=offset, duration=duration
+                    )
+                    samples = segment.samples if segment.samples.ndim == 2 else segment.samples[:, None]
+                    if num_channels is not None and samples.shape[1] != num_channels:
+                        raise ValueError(
+                            f"All the noise files of a noise bank should have the same number of channels, "
+                            f"got {samples.shape[1]} and {num_channels}"
+                        )
+                    num_channels = samples.shape[1]
+                    if dtype == 'int16':
+                        samples = np.clip(np.round(samples * _INT16_SCALE), -_INT16_SCALE, _INT16_SCALE)
+                    spill.write(np.ascontiguousarray(samples, dtype=np.dtype(dtype)).tobytes())
+                    lengths.append(len(samples))
+            if not lengths:
+                raise ValueError(f"No noise files found in {manifest_path}")
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+
+        # second pass: allocate the bank and stream the spill file into it in chunks
+        shape = (int(offsets[-1]), num_channels)
+        bank = np.lib.format.open_memmap(
+            os.path.join(tmp_dir, _SAMPLES_FILE), mode='w+', dtype=np.dtype(dtype), shape=shape
+        )
+        if shape[0] > 0:
+            spill = np.memmap(spill_path, mode='r', dtype=np.dtype(dtype), shape=shape)
+            for start in range(0, shape[0], _COPY_CHUNK_SAMPLES):
+                bank[start : start + _COPY_CHUNK_SAMPLES] = spill[start : start + _COPY_CHUNK_SAMPLES]
+            del spill
+        bank.flush()
+        del bank
+        os.remove(spill_path)
+        np.save(os.path.join(tmp_dir, _OFFSETS_FILE), offsets)
+        with open(os.path.join(tmp_dir, _META_FILE), 'w') as f:
+            json.dump({'sample_rate': sample_rate, 'dtype': dtype, 'num_files': len(lengths)}, f)
+
+        try:
+            os.replace(tmp_dir, bank_dir)
+        except OSError:
+            # the bank was created concurrently
+            shutil.rmtree(tmp_dir)
+        logging.info(f"Created noise bank with {len(lengths)} files ({offsets[-1] / sample_rate:.1f} s) in {bank_dir}")
+        return cls(bank_dir)
+
+    @staticmethod
+    def _iterate_manifest(manifest, manifest_path, audio_tar_filepaths):
+        if audio_tar_filepaths:
+            # import here to avoid circular import error
+            from nemo.collections.asr.parts.preprocessing.perturb import AugmentationDataset
+
+            if isinstance(manifest_path, str):
+                manifest_path = [manifest_path]
+            if isinstance(audio_tar_filepaths, str):
+                audio_tar_filepaths = [audio_tar_filepaths]
+            for manifest_filepath, tar_filepaths in zip(manifest_path, audio_tar_filepaths):
+                dataset = AugmentationDataset(manifest_filepath, tar_filepaths, shuffle_n=0)
+                # the dataset cycles over the tar files, a single pass visits each manifest entry once
+                for _, (audio_file, _, entry) in zip(range(len(dataset)), dataset):
+                    yield audio_file, entry.offset or 0, entry.duration or 0
+        else:
+            for entry in manifest.data:
+                yield entry.audio_file, entry.offset or 0, entry.duration or 0
+
+    @classmethod
+    def from_manifest(
+        cls,
+        manifest_path: Union[str, List[str]],
+        bank_dir: str,
+        sample_rate: int = 16000,
+        dtype: str = 'float16',
+        audio_tar_filepaths: Optional[Union[str, List[str]]] = None,
+    ) -> 'NoiseBank':
+        """Opens the noise bank in `bank_dir`, building it from the manifest first if it does not exist"""
+        if not cls.exists(bank_dir):
+            return cls.build(
+                manifest_path, bank_dir, sample_rate=sample_rate, dtype=dtype, audio_tar_filepaths=audio_tar_filepaths
+            )
+        bank = cls(bank_dir)
+        if bank.sample_rate != sample_rate:
+            logging.warning(
+                f"Noise bank {bank_dir} is stored at {bank.sample_rate} Hz instead of {sample_rate} Hz, "
+                "noise will be resampled"
+            )
+        return bank
@@ -46,6 +46,7 @@ import numpy as np
 import soundfile as sf
 from scipy import signal
 
+from nemo.collections.asr.parts.preprocessing.noise_bank import NoiseBank
 from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
 from nemo.collections.common.parts.preprocessing import collections, parsers
 from nemo.core.classes import IterableDataset
@@ -466,6 +467,11 @@ class NoisePerturbation(Perturbation):
         shuffle_n (int): Shuffle parameter for shuffling buffered files from the tar files
         orig_sr (int): Original sampling rate of the noise files
         rng (int): Random seed. Default is None
+        noise_bank_dir (str): Directory of a memory-mapped noise bank (see `NoiseBank`). If set, noise files are
+            decoded once into the bank (created from the manifest if it does not exist yet) and random crops
+            are read from it instead of decoding a noise file for each sample
+        noise_bank_sr (int): Sampling rate of the noise stored in the bank, should match the sampling rate of the data
+        noise_bank_dtype (str): Storage type of the noise bank, 'float16' or 'int16'
     """
 
     def __init__(
@@ -478,14 +484,26 @@ class NoisePerturbation(Perturbation):
         audio_tar_filepaths=None,
         shuffle_n=100,
         orig_sr=16000,
+        noise_bank_dir=None,
+        noise_bank_sr=16000,
+        noise_bank_dtype='float16',
     ):
         self._manifest = collections.ASRAudioText(manifest_path, parser=parsers.make_parser([]), index_by_file_id=True)
         self._audiodataset = None
         self._tarred_audio = False
         self._orig_sr = orig_sr
         self._data_iterator = None
-
-        if audio_tar_filepaths:
+        self._noise_bank = None
+
+        if noise_bank_dir:
+            self._noise_bank = NoiseBank.from_manifest(
+                manifest_path,
+                noise_bank_dir,
+                sample_rate=noise_bank_sr,
+                dtype=noise_bank_dtype,
+                audio_tar_filepaths=audio_tar_filepaths,
+            )
+        elif audio_tar_filepaths:
             self._tarred_audio = True
             self._audiodataset = AugmentationDataset(manifest_path, audio_tar_filepaths, shuffle_n)
             self._data_iterator = iter(self._audiodataset)
@@ -501,7 +519,14 @@ class NoisePerturbation(Perturbation):
     def orig_sr(self):
         return self._orig_sr
 
-    def get_one_noise_sample(self, target_sr):
+    def get_one_noise_sample(self, target_sr, duration=None):
+        """
+        Args:
+            target_sr (int): sampling rate of the returned noise
+            duration (float): if set and the noise bank is used, noise is randomly cropped to this duration
+        """
+        if self._noise_bank is not None:
+            return self._noise_bank.sample(target_sr, duration=duration)
         return read_one_audiosegment(
             self._manifest, target_sr, tarred_audio=self._tarred_audio, audio_dataset=self._data_iterator
         )
@@ -512,12 +537,7 @@ class NoisePerturbation(Perturbation):
             data (AudioSegment): audio data
             ref_mic (int): reference mic index for scaling multi-channel audios
         """
-        noise = read_one_audiosegment(
-            self._manifest,
-            data.sample_rate,
-            tarred_audio=self._tarred_audio,
-            audio_dataset=self._data_iterator,
-        )
+        noise = self.get_one_noise_sample(data.sample_rate, duration=data.duration)
         self.perturb_with_input_noise(data, noise, ref_mic=ref_mic)
 
     def perturb_with_input_noise(self, data, noise, data_rms=None, ref_mic=0):
@@ -646,6 +666,9 @@ class NoisePerturbationWithNormalization(Perturbation):
         rng (int): Random seed. Default is None
         shard_strategy (str): if you're using tarred audio and wish to scatter instead of replicate, set this to 'scatter'
         epsilon (float): minimum value for RMS DB normalisation to avoid divide by zero
+        noise_bank_dir (str): Directory of a memory-mapped noise bank, see `NoisePerturbation`
+        noise_bank_sr (int): Sampling rate of the noise stored in the bank
+        noise_bank_dtype (str): Storage type of the noise bank, 'float16' or 'int16'
     """
 
     def __init__(
@@ -663,6 +686,9 @@ class NoisePerturbationWithNormalization(Perturbation):
         world_size=1,
         shard_strategy='replicate',
         epsilon=0.01,
+        noise_bank_dir=None,
+        noise_bank_sr=16000,
+        noise_bank_dtype='float16',
     ):
         # import here to avoid circular import error
         from nemo.collections.asr.data.audio_to_text import RandomizedChainDataset
@@ -672,11 +698,20 @@ class NoisePerturbationWithNormalization(Perturbation):
         self._tarred_audio = False
         self._orig_sr = orig_sr
         self._data_iterator = None
+        self._noise_bank = None
 
         random.seed(rng) if rng else None
         self._rng = rng
 
-        if audio_tar_filepaths:
+        if noise_bank_dir:
+            self._noise_bank = NoiseBank.from_manifest(
+                manifest_path,
+                noise_bank_dir,
+                sample_rate=noise_bank_sr,
+                dtype=noise_bank_dtype,
+                audio_tar_filepaths=audio_tar_filepaths,
+            )
+        elif audio_tar_filepaths:
             self._tarred_audio = True
             if isinstance(manifest_path, str):
                 manifest_path = [manifest_path]
@@ -712,7 +747,10 @@ class NoisePerturbationWithNormalization(Perturbation):
     def orig_sr(self):
         return self._orig_sr
 
-    def read_one_audiosegment(self, target_sr):
+    def read_one_audiosegment(self, target_sr, duration=None):
+        if self._noise_bank is not None:
+            return self._noise_bank.sample(target_sr, duration=duration)
+
         if self._tarred_audio:
             if self._data_iterator is None:
                 raise TypeError("Expected valid iterator but got None")
@@ -740,12 +778,14 @@ class NoisePerturbationWithNormalization(Perturbation):
             ref_mic (int): reference mic index for scaling multi-channel audios
         """
 
-        noise = self.read_one_audiosegment(data.sample_rate)
+        # noise from the bank is cropped to the duration of the data (at least 1 second, see below)
+        noise_duration = max(data.duration, 1.0)
+        noise = self.read_one_audiosegment(data.sample_rate, duration=noise_duration)
 
         # noise samples need to be at least 1 second long to avoid strange oddities
         # in the RMS SNR mixing, so we have a fail-safe here to ensure at least 1 sec duration
         while noise.duration < 1:
-            noise = self.read_one_audiosegment(data.sample_rate)
+            noise = self.read_one_audiosegment(data.sample_rate, duration=noise_duration)
 
         self.perturb_with_input_noise(data, noise, ref_mic=ref_mic, norm_to_db=self._norm_to_db)
 
@@ -896,6 +936,11 @@ class RirAndNoisePerturbation(Perturbation):
         bg_noise_tar_filepaths: Tar files, if noise files are tarred
         bg_orig_sample_rate: Original sampling rate of background noise audio
         rng: Random seed. Default is None
+        noise_bank_dirs: Directories of memory-mapped noise banks for the foreground noise manifests,
+            see `NoisePerturbation`
+        bg_noise_bank_dirs: Directories of memory-mapped noise banks for the background noise manifests
+        noise_bank_sr: Sampling rate of the noise stored in the banks
+        noise_bank_dtype: Storage type of the noise banks, 'float16' or 'int16'
 
     """
 
@@ -921,6 +966,10 @@ class RirAndNoisePerturbation(Perturbation):
         bg_noise_tar_filepaths=None,
         bg_orig_sample_rate=None,
         rng=None,
+        noise_bank_dirs=None,
+        bg_noise_bank_dirs=None,
+        noise_bank_sr=16000,
+        noise_bank_dtype='float16',
     ):
 
         self._rir_prob = rir_prob
@@ -948,6 +997,9 @@ class RirAndNoisePerturbation(Perturbation):
                     max_snr_db=max_snr_db[i],
                     audio_tar_filepaths=noise_tar_filepaths[i],
                     orig_sr=orig_sr,
+                    noise_bank_dir=noise_bank_dirs[i] if noise_bank_dirs else None,
+                    noise_bank_sr=noise_bank_sr,
+                    noise_bank_dtype=noise_bank_dtype,
                 )
         self._max_additions = max_additions
         self._max_duration = max_duration
@@ -964,6 +1016,9 @@ class RirAndNoisePerturbation(Perturbation):
                     max_snr_db=bg_max_snr_db[i],
                     audio_tar_filepaths=bg_noise_tar_filepaths[i],
                     orig_sr=orig_sr,
+                    noise_bank_dir=bg_noise_bank_dirs[i] if bg_noise_bank_dirs else None,
+                    noise_bank_sr=noise_bank_sr,
+                    noise_bank_dtype=noise_bank_dtype,
                 )
 
         self._apply_noise_rir = apply_noise_rir
@@ -994,7 +1049,7 @@ class RirAndNoisePerturbation(Perturbation):
                 orig_sr = max(self._bg_noise_perturbers.keys())
             bg_perturber = self._bg_noise_perturbers[orig_sr]
 
-            noise = bg_perturber.get_one_noise_sample(data.sample_rate)
+            noise = bg_perturber.get_one_noise_sample(data.sample_rate, duration=data.duration)
             bg_perturber.perturb_with_input_noise(data, noise, data_rms=data_rms)
 
 
@@ -19,6 +19,7 @@ import os
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 
 from nemo.collections.asr.parts.context_biasing import BoostingTreeModelConfig, GPUBoostingTreeModel
@@ -379,41 +380,45 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
 
         x = x.to('cpu')
 
+        out_len = out_len.tolist()
         with typecheck.disable_checks():
-            data = [x[sample_id, : out_len[sample_id], :].softmax(dim=-1) for sample_id in range(len(x))]
+            # a single softmax over the batch; the padded frames are not passed to the decoder
+            probs = x.softmax(dim=-1)
+            data = [probs[sample_id, : out_len[sample_id], :] for sample_id in range(len(x))]
             beams_batch = self.default_beam_scorer.forward(log_probs=data, log_probs_length=None)
 
         # For each sample in the batch
         nbest_hypotheses = []
         for beams_idx, beams in enumerate(beams_batch):
+            # If alignment must be preserved, we preserve a view of the output logprobs.
+            # Note this view is shared amongst all beams within the sample, be sure to clone it if you
+            # require specific processing for each sample in the beam.
+            # This is done to preserve memory.
+            alignments = x[beams_idx, : out_len[beams_idx]] if self.preserve_alignments else None
+
             # For each beam candidate / hypothesis in each sample
             hypotheses = []
-            for candidate_idx, candidate in enumerate(beams):
-                hypothesis = rnnt_utils.Hypothesis(
-                    score=0.0, y_sequence=[], dec_state=None, timestamp=[], last_token=None
-                )
-
+            for score, text in beams:
                 # For subword encoding, NeMo will double encode the subword (multiple tokens) into a
                 # singular unicode id. In doing so, we preserve the semantic of the unicode token, and
                 # compress the size of the final KenLM ARPA / Binary file.
                 # In order to do double encoding, we shift the subword by some token offset.
                 # This step is ignored for character based models.
                 if self.decoding_type == 'subword':
-                    pred_token_ids = [ord(c) - self.token_offset for c in candidate[1]]
+                    # all the code points of the text at once, instead of `ord` per character
+                    pred_token_ids = (
+                        np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64) - self.token_offset
+                    ).tolist()
                 else:
                     # Char models
-                    pred_token_ids = [self.vocab_index_map[c] for c in candidate[1]]
+                    pred_token_ids = [self.vocab_index_map[c] for c in text]
 
                 # We preserve the token ids and the score for this hypothesis
-                hypothesis.y_sequence = pred_token_ids
-                hypothesis.score = candidate[0]
-
-                # If alignment must be preserved, we preserve a view of the output logprobs.
-                # Note this view is shared amongst all beams within the sample, be sure to clone it if you
-                # require specific processing for each sample in the beam.
-                # This is done to preserve memory.
-                if self.preserve_alignments:
-                    hypothesis.alignments = x[beams_idx][: out_len[beams_idx]]
+                hypothesis = rnnt_utils.Hypothesis(
+                    score=score, y_sequence=pred_token_ids, dec_state=None, timestamp=[], last_token=None
+                )
+                if alignments is not None:
+                    hypothesis.alignments = alignments
 
                 hypotheses.append(hypothesis)
 
@@ -26,8 +26,12 @@ from nemo.collections.asr.parts.submodules import ctc_beam_decoding, ctc_greedy_
 from nemo.collections.asr.parts.utils.asr_confidence_utils import ConfidenceConfig, ConfidenceMixin
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis, NBestHypotheses
 from nemo.collections.asr.parts.utils.timestamp_utils import get_segment_offsets, get_words_offsets
-from nemo.collections.asr.parts.utils.tokenizer_utils import define_spe_tokenizer_type, extract_punctuation_from_vocab
-from nemo.collections.common.tokenizers.aggregate_tokenizer import DummyTokenizer
+from nemo.collections.asr.parts.utils.tokenizer_utils import (
+    define_spe_tokenizer_type,
+    extract_punctuation_from_vocab,
+    supports_batch_detokenization,
+)
+from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer, DummyTokenizer
 from nemo.collections.common.tokenizers.tokenizer_spec import TokenizerSpec
 from nemo.utils import logging, logging_mode
 
@@ -588,11 +592,17 @@ class AbstractCTCDecoding(ConfidenceMixin):
                 # in order to compute exact time stamps.
                 hypothesis = (decoded_prediction, token_lengths, token_repetitions)
             else:
-                hypothesis = self.decode_tokens_to_str_with_strip_punctuation(decoded_prediction)
+                # de-tokenized below, for the whole batch at once
+                hypothesis = decoded_prediction
 
             # Preserve this wrapped hypothesis or decoded text tokens.
             hypotheses_list[ind].text = hypothesis
 
+        if self.compute_timestamps is not True:
+            texts = self.decode_ids_to_str_batch([hyp.text for hyp in hypotheses_list])
+            for hyp, text in zip(hypotheses_list, texts):
+                hyp.text = self.strip_punctuation(text)
+
         return hypotheses_list
 
     def compute_confidence(self, hypotheses_list: List[Hypothesis]) -> List[Hypothesis]:
@@ -670,14 +680,30 @@ class AbstractCTCDecoding(ConfidenceMixin):
         """
         Decodes a list of tokens ids to a string.
         """
-        return self.decode_tokens_to_str(self.decode_ids_to_tokens(tokens))
+        if hasattr(self, 'tokenizer') and isinstance(self.tokenizer, AggregateTokenizer):
+            return self.tokenizer.ids_to_text(tokens)
+        else:
+            return self.decode_tokens_to_str(self.decode_ids_to_tokens(tokens))
+
+    def decode_ids_to_str_batch(self, tokens_batch: List[List[int]]) -> List[str]:
+        """
+        Decodes a batch of token id lists to strings, the same as `decode_ids_to_str` on every list.
+        The whole batch is detokenized with a single call for tokenizers supporting it.
+        """
+        if hasattr(self, 'tokenizer') and supports_batch_detokenization(self.tokenizer):
+            return self.tokenizer.batch_ids_to_text(tokens_batch)
+        return [self.decode_ids_to_str(tokens) for tokens in tokens_batch]
 
     def decode_tokens_to_str_with_strip_punctuation(self, tokens: List[int]) -> str:
         """
         Decodes a list of tokens to a string and removes a space before supported punctuation marks.
         """
-        text = self.decode_ids_to_str(tokens)
+        return self.strip_punctuation(self.decode_ids_to_str(tokens))
 
+    def strip_punctuation(self, text: str) -> str:
+        """
+        Removes a space before supported punctuation marks of a decoded string.
+        """
         if self.supported_punctuation:
             text = self.space_before_punct_pattern.sub(r'\2', text)
 
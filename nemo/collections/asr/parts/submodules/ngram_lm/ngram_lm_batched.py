@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import itertools
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterator
 from dataclasses import InitVar, dataclass, field
 from pathlib import Path
@@ -46,6 +48,12 @@ _BOS_ID = -1  # Begin-of-Sentence
 _EOS_ID = -2  # End-of-Sentence
 _UNK_ID = -3  # Unk
 _SPECIAL_SYMBOLS_MAP = {"<s>": _BOS_ID, "</s>": _EOS_ID, "<unk>": _UNK_ID}
+# lone surrogates cannot appear in text decoded from UTF-8, used as single-char placeholders for special symbols
+_SPECIAL_SYMBOLS_PLACEHOLDERS = {symbol: chr(0xD800 + i) for i, symbol in enumerate(_SPECIAL_SYMBOLS_MAP)}
+# number of ARPA lines parsed at once
+_ARPA_CHUNK_SIZE = 1_000_000
+
+NGRAM_LM_BINARY_SUFFIX = ".ngram_lm.pt"
 
 
 def _log_10_to_e(score):
@@ -59,7 +67,13 @@ class KenLMBatchedWrapper:
     """
 
     @kenlm_required
-    def __init__(self, lm_path: Path | str, vocab_size: int, token_offset: int = DEFAULT_TOKEN_OFFSET):
+    def __init__(
+        self,
+        lm_path: Path | str,
+        vocab_size: int,
+        token_offset: int = DEFAULT_TOKEN_OFFSET,
+        transitions_cache_size: int = 1024,
+    ):
         """
         Constructor from KenLM (binary) or ARPA (text) model
 
@@ -67,14 +81,26 @@ class KenLMBatchedWrapper:
             lm_path: path to the LM file (binary KenLM or text ARPA model)
             vocab_size: full vocabulary size for the LM
             token_offset: offset for the tokens used for building LM
+            transitions_cache_size: number of states for which the transitions computed by `advance` are cached
+                (0 disables the cache)
         """
         self.ngram_lm = kenlm.Model(str(lm_path))
         self.token_offset = token_offset
         self.vocab_size = vocab_size
+        self.transitions_cache_size = transitions_cache_size
+        # LM words of the labels, as used in `advance_single`
+        self._words = [self._label_to_word(label) for label in range(vocab_size)]
+        # LRU cache: state -> (scores [V], next states [V]) for the full vocabulary, shared by all the queries.
+        # In beam search, hypotheses often share their LM state, and keep it for several frames (blank, repeats).
+        self._transitions_cache: OrderedDict = OrderedDict()
 
     @classmethod
     def from_file(
-        cls, lm_path: Path | str, vocab_size: int, token_offset: int = DEFAULT_TOKEN_OFFSET
+        cls,
+        lm_path: Path | str,
+        vocab_size: int,
+        token_offset: int = DEFAULT_TOKEN_OFFSET,
+        transitions_cache_size: int = 1024,
     ) -> "KenLMBatchedWrapper":
         """
         Constructor from KenLM (binary) or ARPA (text) model (same as `__init__`).
@@ -84,11 +110,17 @@ class KenLMBatchedWrapper:
             lm_path: path to .nemo checkpoint or ARPA (text) file
             vocab_size: model vocabulary size:
             token_offset: offset for the tokens used for building ARPA LM
+            transitions_cache_size: number of states for which the transitions computed by `advance` are cached
 
         Returns:
             KenLMBatchedWrapper instance
         """
-        return cls(lm_path=lm_path, vocab_size=vocab_size, token_offset=token_offset)
+        return cls(
+            lm_path=lm_path,
+            vocab_size=vocab_size,
+            token_offset=token_offset,
+            transitions_cache_size=transitions_cache_size,
+        )
 
     def get_init_state(self, bos=True) -> "kenlm.State":
         """
@@ -130,16 +162,43 @@ class KenLMBatchedWrapper:
         Returns:
             tuple containing next states and scores
         """
-        batch_size = len(states)
-        new_states = [[] for _ in range(len(states))]
-        scores = torch.zeros(batch_size, self.vocab_size)
+        scores = np.empty([len(states), self.vocab_size], dtype=np.float32)
+        new_states = []
         for i, state in enumerate(states):
-            for label in range(self.vocab_size):
-                score, new_state = self.advance_single(state, label)
-                scores[i, label] = score
-                new_states[i].append(new_state)
+            state_scores, next_states = self._get_transitions(state)
+            scores[i] = state_scores
+            new_states.append(list(next_states))
 
-        return scores, new_states
+        return torch.from_numpy(scores), new_states
+
+    def _get_transitions(self, state: "kenlm.State") -> tuple[np.ndarray, list["kenlm.State"]]:
+        """
+        Scores [V] and next states [V] for all the labels given `state`, from the cache when possible.
+        """
+        transitions = self._transitions_cache.get(state)
+        if transitions is not None:
+            self._transitions_cache.move_to_end(state)
+            return transitions
+
+        next_states = [kenlm.State() for _ in range(self.vocab_size)]
+        base_score = self.ngram_lm.BaseScore
+        scores = np.fromiter(
+            (base_score(state, word, next_state) for word, next_state in zip(self._words, next_states)),
+            dtype=np.float64,
+            count=self.vocab_size,
+        )
+        transitions = (_log_10_to_e(scores), next_states)
+        if self.transitions_cache_size > 0:
+            # the key is a copy, so that the entry is not corrupted if the caller reuses the state object
+            self._transitions_cache[copy.copy(state)] = transitions
+            if len(self._transitions_cache) > self.transitions_cache_size:
+                self._transitions_cache.popitem(last=False)
+        return transitions
+
+    def _label_to_word(self, label: int) -> str:
+        if self.token_offset:
+            return chr(label + self.token_offset)
+        return str(label)
 
     def advance_single(self, state: "kenlm.State", label: int) -> tuple[float, "kenlm.State"]:
         """
@@ -151,13 +210,8 @@ class KenLMBatchedWrapper:
         Returns:
             tuple: score, next state
         """
-        if self.token_offset:
-            label = chr(label + self.token_offset)
-        else:
-            label = str(label)
-
         next_state = kenlm.State()
-        lm_score = self.ngram_lm.BaseScore(state, label, next_state)
+        lm_score = self.ngram_lm.BaseScore(state, self._label_to_word(label), next_state)
         lm_score /= np.log10(np.e)
 
         return lm_score, next_state
@@ -261,6 +315,8 @@ class SuffixTreeStorage:
     states: np.ndarray = field(init=False)
 
     _arc_cache: dict[tuple[int, ...], int] = field(default_factory=dict)
+    # order -> (sorted keys, states) for vectorized lookup of the states of the n-grams (see `_lookup_states`)
+    _state_tables: dict[int, tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
 
     unk_prob: float = float("-inf")
     normalize_unk: bool = True
@@ -482,6 +538,137 @@ class SuffixTreeStorage:
                 self.states[from_state]["arcs_start"] = arc_i
             self.states[from_state]["arcs_end"] = arc_i + 1
 
+    def _ngram_keys(self, prefix_states: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Unique keys of n-grams given the states of their prefixes and the last labels"""
+        return prefix_states.astype(np.int64) * (self.vocab_size + len(_SPECIAL_SYMBOLS_MAP)) + (
+            labels.astype(np.int64) + len(_SPECIAL_SYMBOLS_MAP)
+        )
+
+    def _lookup_states(self, symbols: np.ndarray, bos_id: int) -> np.ndarray:
+        """
+        Vectorized version of `_find_state`: find the states for a batch of n-grams of the same order
+
+        Args:
+            symbols: n-grams [N, order] with order less than the order of the last added n-grams
+            bos_id: ID of the Begin-of-Sentence symbol
+
+        Returns:
+            array [N] with the states in tree for the n-grams
+        """
+        first = symbols[:, 0]
+        if ((first < 0) & (first != bos_id)).any() or (first >= self.vocab_size).any():
+            raise ValueError("Invalid symbol at the start of n-gram")
+        states = np.where(first == bos_id, self.bos_state, self.arcs["to"][np.maximum(first, 0)])
+        for i in range(1, symbols.shape[1]):
+            table_keys, table_states = self._state_tables[i + 1]
+            keys = self._ngram_keys(states, symbols[:, i])
+            positions = np.minimum(np.searchsorted(table_keys, keys), len(table_keys) - 1)
+            if len(table_keys) == 0 or (table_keys[positions] != keys).any():
+                raise ValueError(f"N-grams of order {i + 1} are missing in the LM, the ARPA file is not consistent")
+            states = table_states[positions]
+        return states
+
+    def _set_arcs_ranges(self, from_states: np.ndarray, arc_ids: np.ndarray):
+        """Set `arcs_start`/`arcs_end` for the states given the added arcs, grouped by the source state"""
+        if len(from_states) == 0:
+            return
+        group_starts = np.concatenate([[True], from_states[1:] != from_states[:-1]])
+        group_ends = np.concatenate([from_states[1:] != from_states[:-1], [True]])
+        group_states = from_states[group_starts]
+        if len(np.unique(group_states)) != len(group_states):
+            raise ValueError("Arcs from the same state should be contiguous")
+        arcs_start = self.states["arcs_start"][group_states]
+        self.states["arcs_start"][group_states] = np.where(arcs_start == 0, arc_ids[group_starts], arcs_start)
+        self.states["arcs_end"][group_states] = arc_ids[group_ends] + 1
+
+    def _add_ngrams_next_order_np(self, symbols: np.ndarray, weights: np.ndarray, backoffs: np.ndarray, bos_id: int):
+        """
+        Vectorized version of `_add_ngrams_next_order`: add all ngrams for the order > 1 (except the maximum order).
+        Should be called after adding unigrams, using increasing order.
+
+        Args:
+            symbols: n-grams [N, order]
+            weights: n-gram weights [N]
+            backoffs: n-gram backoff weights [N]
+            bos_id: ID of the Begin-of-Sentence symbol
+        """
+        order = symbols.shape[1]
+        sort_indices = np.lexsort(symbols.T[::-1])
+        symbols, weights, backoffs = symbols[sort_indices], weights[sort_indices], backoffs[sort_indices]
+        from_states = self._lookup_states(symbols[:, :-1], bos_id=bos_id)
+        ilabels = symbols[:, -1]
+
+        is_final = ilabels < 0
+        if (ilabels[is_final] != _EOS_ID).any():
+            raise ValueError("Only End-of-Sentence special symbol is allowed at the end of n-gram")
+        self.states["final"][from_states[is_final]] = weights[is_final]
+        is_arc = ~is_final
+        symbols, weights, backoffs = symbols[is_arc], weights[is_arc], backoffs[is_arc]
+        from_states, ilabels = from_states[is_arc], ilabels[is_arc]
+        assert (ilabels < self.vocab_size).all()
+        backoff_states = self._lookup_states(symbols[:, 1:], bos_id=bos_id)
+
+        num_ngrams = symbols.shape[0]
+        arc_ids = np.arange(self.num_arcs, self.num_arcs + num_ngrams)
+        next_states = np.arange(self.num_states, self.num_states + num_ngrams)
+        arcs = self.arcs[self.num_arcs : self.num_arcs + num_ngrams]
+        arcs["from"] = from_states
+        arcs["to"] = next_states
+        arcs["ilabel"] = ilabels
+        arcs["weight"] = weights
+        states = self.states[self.num_states : self.num_states + num_ngrams]
+        states["arcs_start"] = 0
+        states["arcs_end"] = 0
+        states["order"] = self.states["order"][from_states] + 1
+        states["backoff_to"] = backoff_states
+        states["backoff_w"] = backoffs
+        states["final"] = NEG_INF
+        self._set_arcs_ranges(from_states=from_states, arc_ids=arc_ids)
+        self.num_arcs += num_ngrams
+        self.num_states += num_ngrams
+
+        keys = self._ngram_keys(from_states, ilabels)
+        sort_indices = np.argsort(keys)
+        self._state_tables[order] = (keys[sort_indices], next_states[sort_indices])
+
+    def _add_ngrams_max_order_np(self, symbols: np.ndarray, weights: np.ndarray, bos_id: int):
+        """
+        Vectorized version of `_add_ngram_max_order`: add a batch of ngrams for the maximum order.
+        Should be called after `_start_adding_ngrams_for_order`, `_end_adding_ngrams_max_order` finalizes the arcs.
+
+        Args:
+            symbols: n-grams [N, max_order]
+            weights: n-gram weights [N]
+            bos_id: ID of the Begin-of-Sentence symbol
+        """
+        from_states = self._lookup_states(symbols[:, :-1], bos_id=bos_id)
+        ilabels = symbols[:, -1]
+
+        is_final = ilabels < 0
+        if (ilabels[is_final] != _EOS_ID).any():
+            raise ValueError("Only End-of-Sentence special symbol is allowed at the end of n-gram")
+        self.states["final"][from_states[is_final]] = weights[is_final]
+        is_arc = ~is_final
+        symbols, weights = symbols[is_arc], weights[is_arc]
+        from_states, ilabels = from_states[is_arc], ilabels[is_arc]
+        backoff_states = self._lookup_states(symbols[:, 1:], bos_id=bos_id)
+
+        num_ngrams = symbols.shape[0]
+        arcs = self.arcs[self.num_arcs : self.num_arcs + num_ngrams]
+        arcs["from"] = from_states
+        arcs["to"] = backoff_states
+        arcs["ilabel"] = ilabels
+        arcs["weight"] = weights
+        self.num_arcs += num_ngrams
+
+    def _end_adding_ngrams_max_order_np(self):
+        """Vectorized version of `_end_adding_ngrams_max_order`"""
+        arcs = self.arcs[self._start_arcs : self.num_arcs]
+        # same order as `arcs.sort(order=["from", "ilabel"])`, which breaks ties with the rest of the fields
+        arcs[:] = arcs[np.lexsort((arcs["weight"], arcs["to"], arcs["ilabel"], arcs["from"]))]
+        self._set_arcs_ranges(from_states=arcs["from"], arc_ids=np.arange(self._start_arcs, self.num_arcs))
+        self._state_tables = dict()
+
     def sanity_check(self):
         """Sanity check for the model"""
         assert (self.arcs["ilabel"][: self.num_arcs] < self.vocab_size).all()
@@ -621,9 +808,10 @@ class NGramGPULanguageModel(ModelPT):
         normalize_unk: bool = True,
         use_triton: bool | None = None,
         token_offset: int = DEFAULT_TOKEN_OFFSET,
+        cache_binary: bool = False,
     ) -> "NGramGPULanguageModel":
         """
-        Constructor from ARPA or Nemo (`.nemo`) checkpoint.
+        Constructor from ARPA, Nemo (`.nemo`) checkpoint or binary (`.ngram_lm.pt`, see `save_binary`) file.
 
         Args:
             lm_path: path to .nemo checkpoint or ARPA (text) file
@@ -632,6 +820,8 @@ class NGramGPULanguageModel(ModelPT):
                 all unigram probabilities sum to 1.0 (default: True)
             use_triton: allow using Triton implementation; None (default) means "auto" (used if available)
             token_offset: offset for the tokens used for building ARPA LM
+            cache_binary: for ARPA models, store the compiled LM in a binary file next to the ARPA file
+                (`<lm_path>.ngram_lm.pt`) and load it from there on the next calls (see `from_arpa`)
 
         Returns:
             NGramGPULanguageModel instance
@@ -640,12 +830,15 @@ class NGramGPULanguageModel(ModelPT):
             lm_path = Path(lm_path)
         if lm_path.suffix == ".nemo":
             return cls.from_nemo(lm_path=lm_path, vocab_size=vocab_size, use_triton=use_triton)
+        if lm_path.name.endswith(NGRAM_LM_BINARY_SUFFIX):
+            return cls.from_binary(lm_path=lm_path, vocab_size=vocab_size, use_triton=use_triton)
         return cls.from_arpa(
             lm_path=lm_path,
             vocab_size=vocab_size,
             normalize_unk=normalize_unk,
             token_offset=token_offset,
             use_triton=use_triton,
+            cache_binary=cache_binary,
         )
 
     @classmethod
@@ -656,9 +849,11 @@ class NGramGPULanguageModel(ModelPT):
         normalize_unk: bool = True,
         use_triton: bool | None = None,
         token_offset: int = DEFAULT_TOKEN_OFFSET,
+        cache_binary: bool = False,
     ) -> "NGramGPULanguageModel":
         """
         Constructor from ARPA LM (text format).
+        N-grams of each order are parsed in bulk and added to the suffix tree with vectorized NumPy operations.
 
         Args:
             lm_path: path to ARPA model (human-readable)
@@ -669,26 +864,110 @@ class NGramGPULanguageModel(ModelPT):
                 None (default) means "auto" (used if available), True means forced mode
                 (will crash if Triton is unavailable)
             token_offset: offset for the tokens used for building ARPA LM
+            cache_binary: store the compiled LM in a binary file `<lm_path>.ngram_lm.pt` and load it from there
+                (memory-mapped) on the next calls with the same ARPA file and parameters
 
         Returns:
             NGramGPULanguageModel instance
         """
+        lm_path = Path(lm_path)
+        if cache_binary:
+            cache_path = lm_path.with_name(lm_path.name + NGRAM_LM_BINARY_SUFFIX)
+            source_metadata = cls._get_arpa_metadata(
+                lm_path=lm_path, vocab_size=vocab_size, normalize_unk=normalize_unk, token_offset=token_offset
+            )
+            if cache_path.exists():
+                model = cls.from_binary(
+                    lm_path=cache_path, vocab_size=vocab_size, use_triton=use_triton, expected_metadata=source_metadata
+                )
+                if model is not None:
+                    return model
+
         logging.info(f"{cls.__name__}: reading LM from {lm_path}")
         with open(lm_path, "r", encoding="utf-8") as f:
             order2cnt = cls._read_header(f=f)
-            # init suffix tree storage
-            max_order = max(order2cnt.keys())
-            total_ngrams = sum(order2cnt.values())
-            max_states = 2 + vocab_size + sum(order2cnt[o] for o in range(2, max_order))  # without last!
-            suffix_tree_np = SuffixTreeStorage(
-                num_states_max=max_states,
-                num_states=0,
-                num_arcs=0,
-                num_arcs_max=total_ngrams + vocab_size * 2 + 1,
-                normalize_unk=normalize_unk,
-                vocab_size=vocab_size,
-                max_order=max_order,
+            suffix_tree_np = cls._init_suffix_tree(
+                order2cnt=order2cnt, vocab_size=vocab_size, normalize_unk=normalize_unk
             )
+            for order in range(1, suffix_tree_np.max_order + 1):
+                cls._add_ngrams_for_order(
+                    f=f,
+                    suffix_tree_np=suffix_tree_np,
+                    order=order,
+                    num_ngrams=order2cnt[order],
+                    token_offset=token_offset,
+                )
+                logging.debug(f"Processed {order2cnt[order]} n-grams of order {order}")
+            suffix_tree_np.sanity_check()
+        model = NGramGPULanguageModel.from_suffix_tree(suffix_tree_np=suffix_tree_np, use_triton=use_triton)
+
+        if cache_binary:
+            try:
+                model.save_binary(cache_path, metadata=source_metadata)
+            except OSError as e:
+                logging.warning(f"{cls.__name__}: unable to save the compiled LM to {cache_path}: {e}")
+        return model
+
+    @classmethod
+    def _init_suffix_tree(cls, order2cnt: dict[int, int], vocab_size: int, normalize_unk: bool) -> SuffixTreeStorage:
+        """Allocate suffix tree storage for the ARPA model with the given n-gram counts"""
+        max_order = max(order2cnt.keys())
+        total_ngrams = sum(order2cnt.values())
+        max_states = 2 + vocab_size + sum(order2cnt[o] for o in range(2, max_order))  # without last!
+        return SuffixTreeStorage(
+            num_states_max=max_states,
+            num_states=0,
+            num_arcs=0,
+            num_arcs_max=total_ngrams + vocab_size * 2 + 1,
+            normalize_unk=normalize_unk,
+            vocab_size=vocab_size,
+            max_order=max_order,
+        )
+
+    @classmethod
+    def _add_ngrams_for_order(
+        cls, f, suffix_tree_np: SuffixTreeStorage, order: int, num_ngrams: int, token_offset: int
+    ):
+        """Read all n-grams of the given order from the ARPA file and add them to the suffix tree"""
+        if order == suffix_tree_np.max_order and order > 1:
+            suffix_tree_np._start_adding_ngrams_for_order(order=order, max_ngrams=num_ngrams)
+            for symbols, weights, _ in cls._read_ngrams_np(
+                f=f, order=order, num_ngrams=num_ngrams, token_offset=token_offset
+            ):
+                suffix_tree_np._add_ngrams_max_order_np(symbols=symbols, weights=weights, bos_id=_BOS_ID)
+            suffix_tree_np._end_adding_ngrams_max_order_np()
+            return
+
+        chunks = list(cls._read_ngrams_np(f=f, order=order, num_ngrams=num_ngrams, token_offset=token_offset))
+        symbols, weights, backoffs = (np.concatenate(arrays) for arrays in zip(*chunks))
+        if order == 1:
+            ngrams = np.zeros(
+                [num_ngrams],
+                dtype=[("symbols", [("0", np.int32)]), ("weight", np.float32), ("backoff", np.float32)],
+            )
+            ngrams["symbols"]["0"] = symbols[:, 0]
+            ngrams["weight"] = weights
+            ngrams["backoff"] = backoffs
+            suffix_tree_np._add_unigrams(ngrams=ngrams, bos_id=_BOS_ID, unk_id=_UNK_ID)
+        else:
+            suffix_tree_np._add_ngrams_next_order_np(
+                symbols=symbols, weights=weights, backoffs=backoffs, bos_id=_BOS_ID
+            )
+
+    @classmethod
+    def _build_suffix_tree_iterative(
+        cls, lm_path: Path | str, vocab_size: int, normalize_unk: bool = True, token_offset: int = DEFAULT_TOKEN_OFFSET
+    ) -> SuffixTreeStorage:
+        """
+        Reference (slow) construction of the suffix tree, adding n-grams one by one.
+        Used to verify the vectorized construction in `from_arpa`.
+        """
+        with open(lm_path, "r", encoding="utf-8") as f:
+            order2cnt = cls._read_header(f=f)
+            suffix_tree_np = cls._init_suffix_tree(
+                order2cnt=order2cnt, vocab_size=vocab_size, normalize_unk=normalize_unk
+            )
+            total_ngrams = sum(order2cnt.values())
             # add ngrams to suffix tree
             ngram_cur_order_i = 0
             cur_order = 1
@@ -700,13 +979,87 @@ class NGramGPULanguageModel(ModelPT):
 
                 if ngram_cur_order_i == order2cnt[cur_order]:
                     suffix_tree_np._end_adding_ngrams_for_order(order=cur_order, bos_id=_BOS_ID, unk_id=_UNK_ID)
-                    logging.debug(f"Processed {order2cnt[cur_order]} n-grams of order {cur_order}")
                     cur_order += 1
                     ngram_cur_order_i = 0
 
             assert ngram_cur_order_i == 0
             suffix_tree_np.sanity_check()
-        return NGramGPULanguageModel.from_suffix_tree(suffix_tree_np=suffix_tree_np, use_triton=use_triton)
+        return suffix_tree_np
+
+    @staticmethod
+    def _get_arpa_metadata(lm_path: Path, vocab_size: int, normalize_unk: bool, token_offset: int) -> dict:
+        """Metadata identifying the ARPA file and the parameters used to compile it"""
+        stat = lm_path.stat()
+        return {
+            "source_name": lm_path.name,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "vocab_size": vocab_size,
+            "normalize_unk": normalize_unk,
+            "token_offset": token_offset,
+        }
+
+    def save_binary(self, lm_path: Path | str, metadata: Optional[dict] = None):
+        """
+        Save the LM to a binary file, which can be loaded (memory-mapped) with `from_binary`.
+        Unlike `.nemo` checkpoints, the file is not an archive, so the loading does not need extraction or copying.
+
+        Args:
+            lm_path: path to the file, should end with `.ngram_lm.pt` to be recognized by `from_file`
+            metadata: optional metadata to store with the model (used to validate ARPA caches)
+        """
+        # `from_binary` marks the loaded model as resolved, so the stored final weights must be resolved
+        self._resolve_final()
+        lm_path = Path(lm_path)
+        tmp_path = lm_path.with_name(lm_path.name + ".tmp")
+        torch.save(
+            {
+                "config": OmegaConf.to_container(self.cfg, resolve=True),
+                "state_dict": self.state_dict(),
+                "metadata": metadata or {},
+            },
+            tmp_path,
+        )
+        # atomic replace: concurrent jobs never see a partially written file
+        tmp_path.replace(lm_path)
+
+    @classmethod
+    def from_binary(
+        cls,
+        lm_path: Path | str,
+        vocab_size: Optional[int] = None,
+        use_triton: bool | None = None,
+        expected_metadata: Optional[dict] = None,
+    ) -> Optional["NGramGPULanguageModel"]:
+        """
+        Constructor from the binary file saved with `save_binary`.
+        The weights are memory-mapped: loading is almost instant, and the pages are shared (read-only)
+        between the processes loading the same file.
+
+        Args:
+            lm_path: path to the binary file
+            vocab_size: model vocabulary size (optional, checked if provided)
+            use_triton: allow using Triton implementation; None (default) means "auto" (used if available)
+            expected_metadata: if provided, None is returned when the metadata stored in the file does not match
+
+        Returns:
+            NGramGPULanguageModel instance (or None if `expected_metadata` does not match)
+        """
+        data = torch.load(lm_path, map_location="cpu", mmap=True, weights_only=True)
+        if expected_metadata is not None and data["metadata"] != expected_metadata:
+            logging.info(f"{cls.__name__}: {lm_path} is outdated, ignoring it")
+            return None
+        cfg = OmegaConf.create(data["config"])
+        cfg.use_triton = use_triton
+        if vocab_size is not None:
+            assert cfg.vocab_size == vocab_size
+        # do not allocate the weights, they are replaced with memory-mapped tensors
+        with torch.device("meta"):
+            model = cls(cfg=cfg)
+        model.load_state_dict(data["state_dict"], assign=True)
+        model._final_resolved = True
+        logging.info(f"{cls.__name__}: loaded LM from {lm_path}")
+        return model
 
     @classmethod
     def dummy_unigram_lm(
@@ -841,6 +1194,117 @@ class NGramGPULanguageModel(ModelPT):
             ngram = cls._line_to_ngram(line=line, pattern=pattern, token_offset=token_offset)
             yield ngram
 
+    @classmethod
+    def _read_ngrams_np(
+        cls, f, order: int, num_ngrams: int, token_offset: int
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Read n-grams of the given order (section `\\<order>-grams:`) in chunks
+
+        Args:
+            f: file object, positioned before the section
+            order: order of n-grams
+            num_ngrams: number of n-grams in the section
+            token_offset: offset for the tokens used for building ARPA LM
+
+        Returns:
+            iterator over chunks: symbols [N, order] (int32), weights [N] and backoffs [N] (float32)
+        """
+        for line in f:
+            line = line.strip()
+            if line == f"\\{order}-grams:":
+                break
+            assert not line, f"Expected start of {order}-grams, got {line}"
+
+        num_read = 0
+        while num_read < num_ngrams:
+            lines = list(itertools.islice(f, min(_ARPA_CHUNK_SIZE, num_ngrams - num_read)))
+            if not lines:
+                raise ValueError(f"Expected {num_ngrams} {order}-grams, found only {num_read}")
+            lines = [line for line in lines if line.strip()]
+            num_read += len(lines)
+            yield cls._parse_ngrams_np(lines=lines, order=order, token_offset=token_offset)
+
+    @classmethod
+    def _parse_ngrams_np(
+        cls, lines: list[str], order: int, token_offset: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parse ARPA lines with n-grams of the same order in bulk
+
+        Args:
+            lines: ARPA lines
+            order: order of n-grams
+            token_offset: offset for the tokens used for building ARPA LM
+
+        Returns:
+            tuple of symbols [N, order] (int32), weights [N] and backoffs [N] (float32)
+        """
+        num_lines = len(lines)
+        text = "".join(lines)
+        if not text.endswith("\n"):
+            text += "\n"
+        # each token is a single character, tokens are separated with spaces:
+        # replace special symbols with single characters and work with an array of code points
+        for symbol, placeholder in _SPECIAL_SYMBOLS_PLACEHOLDERS.items():
+            text = text.replace(symbol, placeholder)
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).copy()
+
+        # line format: "<weight>\t<symbol_1> <symbol_2> ... <symbol_order>[\t<backoff>]\n"
+        line_ends = np.flatnonzero(codes == ord("\n"))
+        tabs = np.flatnonzero(codes == ord("\t"))
+        if len(line_ends) != num_lines or len(tabs) < num_lines:
+            return cls._parse_ngrams_by_line(lines=lines, order=order, token_offset=token_offset)
+        line_starts = np.concatenate([[0], line_ends[:-1] + 1])
+        first_tabs = tabs[np.minimum(np.searchsorted(tabs, line_starts), len(tabs) - 1)]
+        symbols_end = first_tabs + 2 * order
+        if (first_tabs < line_starts).any() or (symbols_end > line_ends).any():
+            return cls._parse_ngrams_by_line(lines=lines, order=order, token_offset=token_offset)
+        symbols_codes = codes[first_tabs[:, None] + np.arange(1, 2 * order)]
+        has_backoff = codes[symbols_end] == ord("\t")
+        if (
+            not (symbols_codes[:, 1::2] == ord(" ")).all()
+            or not (has_backoff | (codes[symbols_end] == ord("\n"))).all()
+        ):
+            return cls._parse_ngrams_by_line(lines=lines, order=order, token_offset=token_offset)
+
+        symbols_codes = symbols_codes[:, ::2]
+        symbols = symbols_codes.astype(np.int64) - token_offset
+        for symbol, placeholder in _SPECIAL_SYMBOLS_PLACEHOLDERS.items():
+            symbols[symbols_codes == ord(placeholder)] = _SPECIAL_SYMBOLS_MAP[symbol]
+
+        # keep only numbers in the text (replace symbols and separators with spaces) and parse them at once
+        is_symbol = np.zeros(codes.shape[0] + 1, dtype=np.int8)
+        is_symbol[first_tabs] = 1
+        is_symbol[symbols_end] = -1
+        codes[np.cumsum(is_symbol[:-1], dtype=np.int8) > 0] = ord(" ")
+        codes[tabs] = ord(" ")
+        codes[line_ends] = ord(" ")
+        numbers = np.array(codes.tobytes().decode("utf-32-le", "surrogatepass").split(), dtype=np.float64)
+        if numbers.shape[0] != num_lines + has_backoff.sum():
+            return cls._parse_ngrams_by_line(lines=lines, order=order, token_offset=token_offset)
+        # numbers: weight_1, [backoff_1], weight_2, [backoff_2], ...
+        weight_indices = np.arange(num_lines) + np.concatenate([[0], np.cumsum(has_backoff)[:-1]])
+        weights = _log_10_to_e(numbers[weight_indices])
+        backoffs = np.zeros(num_lines, dtype=np.float64)
+        backoffs[has_backoff] = _log_10_to_e(numbers[weight_indices[has_backoff] + 1])
+        return symbols.astype(np.int32), weights.astype(np.float32), backoffs.astype(np.float32)
+
+    @classmethod
+    def _parse_ngrams_by_line(
+        cls, lines: list[str], order: int, token_offset: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse ARPA lines with n-grams of the same order line by line (slow fallback for `_parse_ngrams_np`)"""
+        special_words_pattern = '|'.join(re.escape(symbol) for symbol in _SPECIAL_SYMBOLS_MAP)
+        pattern = re.compile(rf'({special_words_pattern}|.)\s?')
+        ngrams = [
+            cls._line_to_ngram(line=line.rstrip("\n"), pattern=pattern, token_offset=token_offset) for line in lines
+        ]
+        symbols = np.array([ngram.symbols for ngram in ngrams], dtype=np.int32).reshape(len(lines), order)
+        weights = np.array([ngram.weight for ngram in ngrams], dtype=np.float32)
+        backoffs = np.array([ngram.backoff for ngram in ngrams], dtype=np.float32)
+        return symbols, weights, backoffs
+
     @staticmethod
     def _line_to_ngram(line: str, pattern: re.Pattern, token_offset: int) -> NGram:
         """Parse ARPA line to N-Gram structure"""
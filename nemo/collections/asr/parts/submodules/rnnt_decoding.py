@@ -26,9 +26,13 @@ from nemo.collections.asr.parts.submodules import rnnt_beam_decoding, rnnt_greed
 from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
 from nemo.collections.asr.parts.utils.asr_confidence_utils import ConfidenceConfig, ConfidenceMixin
 from nemo.collections.asr.parts.utils.batched_beam_decoding_utils import BlankLMScoreMode, PruningMode
-from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis, NBestHypotheses
+from nemo.collections.asr.parts.utils.rnnt_utils import ColumnarHypotheses, Hypothesis, NBestHypotheses
 from nemo.collections.asr.parts.utils.timestamp_utils import get_segment_offsets, get_words_offsets
-from nemo.collections.asr.parts.utils.tokenizer_utils import define_spe_tokenizer_type, extract_punctuation_from_vocab
+from nemo.collections.asr.parts.utils.tokenizer_utils import (
+    define_spe_tokenizer_type,
+    extract_punctuation_from_vocab,
+    supports_batch_detokenization,
+)
 from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
 from nemo.collections.common.tokenizers.tokenizer_spec import TokenizerSpec
 from nemo.utils import logging
@@ -799,6 +803,50 @@ class AbstractRNNTDecoding(ConfidenceMixin):
 
             return [Hypothesis(h.score, h.y_sequence, h.text) for h in hypotheses]
 
+    def rnnt_decoder_predictions_columnar(
+        self,
+        encoder_output: torch.Tensor,
+        encoded_lengths: torch.Tensor,
+        partial_hypotheses: Optional[List[Hypothesis]] = None,
+    ) -> ColumnarHypotheses:
+        """
+        Decode an encoder output like `rnnt_decoder_predictions_tensor`, returning the best hypotheses of the batch
+        in columnar form.
+
+        With greedy batched (label-looping) decoding, the columns are taken directly from the batched decoding
+        results: texts are de-tokenized for the whole batch when first accessed, and Hypothesis objects are only
+        created for the items that are accessed. Other configurations (beam search, partial hypotheses, timestamps,
+        alignments, confidence, token sets or languages) decode with `rnnt_decoder_predictions_tensor` and wrap its
+        hypotheses.
+
+        Args:
+            encoder_output: torch.Tensor of shape [B, D, T].
+            encoded_lengths: torch.Tensor containing lengths of the padded encoder outputs. Shape [B].
+            partial_hypotheses: Optional list of partial hypotheses to continue decoding from.
+
+        Returns:
+            rnnt_utils.ColumnarHypotheses of the best hypotheses.
+        """
+        if (
+            partial_hypotheses is None
+            and not self.compute_timestamps
+            and not self.compute_hypothesis_token_set
+            and not getattr(self, 'compute_langs', False)
+            and hasattr(self.decoding, 'supports_columnar_output')
+            and self.decoding.supports_columnar_output()
+        ):
+            return self.decoding.decode_columnar(
+                encoder_output, encoded_lengths, text_decoder=self.decode_ids_to_texts_batch
+            )
+
+        hypotheses = self.rnnt_decoder_predictions_tensor(
+            encoder_output, encoded_lengths, return_hypotheses=True, partial_hypotheses=partial_hypotheses
+        )
+        if len(hypotheses) > 0 and isinstance(hypotheses[0], list):
+            # beam search returning all hypotheses, keep the best ones
+            hypotheses = [nbest_hyps[0] for nbest_hyps in hypotheses]
+        return ColumnarHypotheses.from_hypotheses(hypotheses)
+
     def decode_hypothesis(self, hypotheses_list: List[Hypothesis]) -> List[Union[Hypothesis, NBestHypotheses]]:
         """
         Decode a list of hypotheses into a list of strings.
@@ -809,6 +857,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
         Returns:
             A list of strings.
         """
+        predictions = []
         for hyp in hypotheses_list:
             # Extract the integer encoded hypothesis
             prediction = hyp.y_sequence
@@ -825,9 +874,12 @@ class AbstractRNNTDecoding(ConfidenceMixin):
                 prediction = [p for p in prediction if p < self.blank_id]
             else:  # standard RNN-T
                 prediction = [p for p in prediction if p != self.blank_id]
+            predictions.append(prediction)
 
-            # De-tokenize the integer tokens;
-            hyp.text = self.decode_tokens_to_str_with_strip_punctuation(prediction)
+        # De-tokenize the integer tokens of the whole batch at once;
+        texts = self.decode_ids_to_texts_batch(predictions)
+        for hyp, prediction, text in zip(hypotheses_list, predictions, texts):
+            hyp.text = text
 
             if self.compute_hypothesis_token_set:
                 hyp.tokens = self.decode_ids_to_tokens(prediction)
@@ -993,18 +1045,38 @@ class AbstractRNNTDecoding(ConfidenceMixin):
         else:
             return self.decode_tokens_to_str(self.decode_ids_to_tokens(tokens))
 
+    def decode_ids_to_str_batch(self, tokens_batch: List[List[int]]) -> List[str]:
+        """
+        Decodes a batch of token id lists to strings, the same as `decode_ids_to_str` on every list.
+        The whole batch is detokenized with a single call for tokenizers supporting it.
+        """
+        if hasattr(self, 'tokenizer') and supports_batch_detokenization(self.tokenizer):
+            return self.tokenizer.batch_ids_to_text(tokens_batch)
+        return [self.decode_ids_to_str(tokens) for tokens in tokens_batch]
+
     def decode_tokens_to_str_with_strip_punctuation(self, tokens: List[int]) -> str:
         """
         Decodes a list of tokens to a string and removes a space before supported punctuation marks.
         Optionally strips language-ID tags (e.g. ``<en-US>``) when ``strip_lang_tags`` is enabled.
         """
-        text = self.decode_ids_to_str(tokens)
+        return self.strip_punctuation_and_lang_tags(self.decode_ids_to_str(tokens))
+
+    def strip_punctuation_and_lang_tags(self, text: str) -> str:
+        """
+        Removes a space before supported punctuation marks of a decoded string, and optionally its language-ID tags.
+        """
         if self.supported_punctuation:
             text = self.space_before_punct_pattern.sub(r'\2', text)
         if self.strip_lang_tags:
             text = self.lang_tag_pattern.sub('', text).strip()
         return text
 
+    def decode_ids_to_texts_batch(self, tokens_batch: List[List[int]]) -> List[str]:
+        """
+        Decodes a batch of token id lists to the texts `decode_hypothesis` assigns to hypotheses.
+        """
+        return [self.strip_punctuation_and_lang_tags(text) for text in self.decode_ids_to_str_batch(tokens_batch)]
+
     def update_joint_fused_batch_size(self):
         """ "
         Updates the fused batch size for the joint module if applicable.
@@ -27,7 +27,7 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
@@ -287,6 +287,66 @@ class _GreedyRNNTInfer(Typing, ConfidenceMethodMixin):
 
         return logits
 
+    def supports_columnar_output(self) -> bool:
+        """
+        Whether `decode_columnar` can be used: requires the batched label-looping algorithm,
+        without alignments or frame confidence, which are only stored in Hypothesis objects.
+        """
+        loop_labels_decode = getattr(self, '_greedy_decode_blank_as_pad_loop_labels', None)
+        return (
+            loop_labels_decode is not None
+            and getattr(self, '_greedy_decode', None) == loop_labels_decode
+            and not self.preserve_alignments
+            and not self.preserve_frame_confidence
+        )
+
+    def decode_columnar(
+        self,
+        encoder_output: torch.Tensor,
+        encoded_lengths: torch.Tensor,
+        text_decoder: Optional[Callable[[List[List[int]]], List[str]]] = None,
+    ) -> rnnt_utils.ColumnarHypotheses:
+        """
+        Decodes a batch with the label-looping algorithm, returning columnar hypotheses instead of
+        a list of Hypothesis objects. Partial hypotheses are not supported.
+        Check `supports_columnar_output` before use.
+
+        Args:
+            encoder_output: A tensor of size (batch, features, timesteps).
+            encoded_lengths: list of int representing the length of each sequence
+                output sequence.
+            text_decoder: callable converting a list of token id lists to a list of texts.
+
+        Returns:
+            rnnt_utils.ColumnarHypotheses for the batch.
+        """
+        if not self.supports_columnar_output():
+            raise NotImplementedError(f"Columnar output is not supported by {self.__class__.__name__}")
+        # Preserve decoder and joint training state
+        decoder_training_state = self.decoder.training
+        joint_training_state = self.joint.training
+
+        with torch.inference_mode():
+            x = encoder_output.transpose(1, 2)  # (B, T, D)
+
+            self.decoder.eval()
+            self.joint.eval()
+
+            if self.decoding_computer.per_stream_biasing_enabled:
+                # no biasing requests without partial hypotheses
+                multi_biasing_ids = torch.full([x.shape[0]], fill_value=-1, dtype=torch.long, device=x.device)
+            else:
+                multi_biasing_ids = None
+            batched_hyps, _ = self.decoding_computer(x=x, out_len=encoded_lengths, multi_biasing_ids=multi_biasing_ids)
+            result = rnnt_utils.batched_hyps_to_columnar(
+                batched_hyps, batch_size=x.shape[0], text_decoder=text_decoder
+            )
+
+        self.decoder.train(decoder_training_state)
+        self.joint.train(joint_training_state)
+
+        return result
+
 
 class GreedyRNNTInfer(_GreedyRNNTInfer):
     """A greedy transducer decoder.
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis, NBestHypotheses
+from nemo.collections.asr.parts.utils.rnnt_utils import ColumnarHypotheses, Hypothesis, NBestHypotheses
 
 __all__ = [
+    "ColumnarHypotheses",
     "Hypothesis",
     "NBestHypotheses",
 ]
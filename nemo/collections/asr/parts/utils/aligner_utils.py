@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Union
@@ -27,6 +28,7 @@ from nemo.utils import logging
 
 BLANK_TOKEN = "<b>"
 SPACE_TOKEN = "<space>"
+EMISSIONS_CHUNK_SIZE = 256  # number of timesteps for which log probs are gathered at once in viterbi_decoding
 
 
 @dataclass
@@ -729,9 +731,17 @@ def viterbi_decoding(
     U_batch: torch.Tensor,
     viterbi_device: Optional[torch.device] = None,
     padding_value: float = -3.4e38,
+    checkpoint_interval: Optional[int] = None,
 ):
     """
     Do Viterbi decoding with an efficient algorithm (the only for-loop in the 'forward pass' is over the time dimension).
+
+    By default, the backpointers of every timestep are kept, which takes B x T_max x U_max bytes. If `checkpoint_interval`
+    is set, only the Viterbi probabilities of every `checkpoint_interval`-th timestep are kept during the forward pass,
+    and the backpointers of each block of timesteps are recomputed from its checkpoint during the traceback. With
+    checkpoint_interval ~ sqrt(T_max) the memory is O(sqrt(T_max) x U_max) per utterance, at the cost of running the
+    forward pass twice, which makes it possible to align hour-long audio.
+
     Args:
         log_probs_batch: tensor of shape (B, T_max, V). The parts of log_probs_batch which are 'padding' are filled
             with 'padding_value'
@@ -744,6 +754,8 @@ def viterbi_decoding(
             which are padding).
         viterbi_device: the torch device on which Viterbi decoding will be done.
         padding_value: - a large negative number which represents a very low probability. Default to -3.4e38, the smallest number in torch.float32.
+        checkpoint_interval: None to keep the backpointers of all timesteps, a positive number of timesteps between
+            checkpoints of the Viterbi probabilities, or 0 to use ceil(sqrt(T_max)) timesteps.
 
     Returns:
         alignments_batch: list of lists containing locations for the tokens we align to at each timestep.
@@ -754,29 +766,26 @@ def viterbi_decoding(
     if viterbi_device is None:
         viterbi_device = "cuda" if torch.cuda.is_available() else "cpu"
 
-    B, T_max, _ = log_probs_batch.shape
+    B, T_max, V = log_probs_batch.shape
     U_max = y_batch.shape[1]
 
+    if checkpoint_interval is None:
+        checkpoint_interval = max(T_max - 1, 1)
+    elif checkpoint_interval == 0:
+        checkpoint_interval = max(math.ceil(math.sqrt(T_max)), 1)
+    elif checkpoint_interval < 0:
+        raise ValueError(f"checkpoint_interval must be None or a non-negative integer, got {checkpoint_interval}")
+
     # transfer all tensors to viterbi_device
     log_probs_batch = log_probs_batch.to(viterbi_device)
     y_batch = y_batch.to(viterbi_device)
     T_batch = T_batch.to(viterbi_device)
     U_batch = U_batch.to(viterbi_device)
 
-    # make tensor that we will put at timesteps beyond the duration of the audio
-    padding_for_log_probs = padding_value * torch.ones((B, T_max, 1), device=viterbi_device)
-    # make log_probs_padded tensor of shape (B, T_max, V +1 ) where all of
-    # log_probs_padded[:,:,-1] is the 'padding_value'
-    log_probs_padded = torch.cat((log_probs_batch, padding_for_log_probs), dim=2)
-
-    # initialize v_prev - tensor of previous timestep's viterbi probabilies, of shape (B, U_max)
-    v_prev = padding_value * torch.ones((B, U_max), device=viterbi_device)
-
-    v_prev[:, :2] = torch.gather(input=log_probs_padded[:, 0, :], dim=1, index=y_batch[:, :2])
-
-    # initialize backpointers_rel - which contains values like 0 to indicate the backpointer is to the same u index,
-    # 1 to indicate the backpointer pointing to the u-1 index and 2 to indicate the backpointer is pointing to the u-2 index
-    backpointers_rel = -99 * torch.ones((B, T_max, U_max), dtype=torch.int8, device=viterbi_device)
+    # the padding token ID 'V' has the log prob 'padding_value' at every timestep. Instead of appending a padding
+    # column to log_probs_batch, we gather any valid ID and overwrite the padding positions.
+    y_is_padding = y_batch >= V
+    y_gather_index = y_batch.masked_fill(y_is_padding, 0)
 
     # Make a letter_repetition_mask the same shape as y_batch
     # the letter_repetition_mask will have 'True' where the token (including blanks) is the same
@@ -788,79 +797,94 @@ def viterbi_decoding(
     letter_repetition_mask[:, :2] = 1  # make sure dont apply mask to first 2 tokens
     letter_repetition_mask = letter_repetition_mask == 0
 
-    for t in range(1, T_max):
-
-        # e_current is a tensor of shape (B, U_max) of the log probs of every possible token at the current timestep
-        e_current = torch.gather(input=log_probs_padded[:, t, :], dim=1, index=y_batch)
+    # the token positions that can be final. At timesteps beyond the duration of the audio, their log probs are set
+    # to 0 so that we can keep calculating viterbi probabilities during these 'padding' timesteps
+    u_range = torch.arange(0, U_max, device=viterbi_device).unsqueeze(0)
+    U_can_be_final = torch.logical_or(u_range == U_batch.unsqueeze(1), u_range == (U_batch.unsqueeze(1) - 1))
 
-        # apply a mask to e_current to cope with the fact that we do not keep the whole v_matrix and continue
-        # calculating viterbi probabilities during some 'padding' timesteps
-        t_exceeded_T_batch = t >= T_batch
-
-        U_can_be_final = torch.logical_or(
-            torch.arange(0, U_max, device=viterbi_device).unsqueeze(0) == (U_batch.unsqueeze(1) - 0),
-            torch.arange(0, U_max, device=viterbi_device).unsqueeze(0) == (U_batch.unsqueeze(1) - 1),
-        )
-
-        mask = torch.logical_not(
-            torch.logical_and(
-                t_exceeded_T_batch.unsqueeze(1),
-                U_can_be_final,
-            )
-        ).long()
-
-        e_current = e_current * mask
-
-        # v_prev_shifted is a tensor of shape (B, U_max) of the viterbi probabilities 1 timestep back and 1 token position back
-        v_prev_shifted = torch.roll(v_prev, shifts=1, dims=1)
-        # by doing a roll shift of size 1, we have brought the viterbi probability in the final token position to the
-        # first token position - let's overcome this by 'zeroing out' the probabilities in the firest token position
-        v_prev_shifted[:, 0] = padding_value
-
-        # v_prev_shifted2 is a tensor of shape (B, U_max) of the viterbi probabilities 1 timestep back and 2 token position back
-        v_prev_shifted2 = torch.roll(v_prev, shifts=2, dims=1)
-        v_prev_shifted2[:, :2] = padding_value  # zero out as we did for v_prev_shifted
-        # use our letter_repetition_mask to remove the connections between 2 blanks (so we don't skip over a letter)
-        # and to remove the connections between 2 consective letters (so we don't skip over a blank)
-        v_prev_shifted2.masked_fill_(letter_repetition_mask, padding_value)
-
-        # we need this v_prev_dup tensor so we can calculated the viterbi probability of every possible
-        # token position simultaneously
-        v_prev_dup = torch.cat(
-            (
-                v_prev.unsqueeze(2),
-                v_prev_shifted.unsqueeze(2),
-                v_prev_shifted2.unsqueeze(2),
-            ),
+    def get_emissions(t_start: int, t_end: int) -> torch.Tensor:
+        """log probs of every token position for timesteps [t_start, t_end), of shape (B, t_end - t_start, U_max)"""
+        num_steps = t_end - t_start
+        emissions = torch.gather(
+            input=log_probs_batch[:, t_start:t_end, :],
             dim=2,
+            index=y_gather_index.unsqueeze(1).expand(-1, num_steps, -1),
         )
+        emissions.masked_fill_(y_is_padding.unsqueeze(1), padding_value)
+        t_exceeded_T_batch = torch.arange(t_start, t_end, device=viterbi_device).unsqueeze(0) >= T_batch.unsqueeze(1)
+        emissions.masked_fill_(t_exceeded_T_batch.unsqueeze(2) & U_can_be_final.unsqueeze(1), 0.0)
+        return emissions
+
+    # preallocated buffers for the forward steps. candidates_v_current[:, u, k] is the candidate viterbi probability of
+    # token position u coming from token position u-k at the previous timestep.
+    candidates_v_current = torch.empty((B, U_max, 3), device=viterbi_device)
+    v_buffers = [torch.empty((B, U_max), device=viterbi_device) for _ in range(2)]
+    bp_relative = torch.empty((B, U_max), dtype=torch.long, device=viterbi_device)
+    # backpointers_rel - contains values like 0 to indicate the backpointer is to the same u index,
+    # 1 to indicate the backpointer pointing to the u-1 index and 2 to indicate the backpointer is pointing to the u-2 index
+    backpointers_rel = torch.empty((B, checkpoint_interval, U_max), dtype=torch.int8, device=viterbi_device)
+
+    def forward_block(v_prev: torch.Tensor, t_start: int, t_end: int) -> torch.Tensor:
+        """
+        Update the viterbi probabilities v_prev (of timestep t_start - 1) over timesteps [t_start, t_end),
+        storing the backpointers in backpointers_rel. Returns the viterbi probabilities of timestep t_end - 1.
+        """
+        for step in range(t_end - t_start):
+            # gather the log probs for a limited number of timesteps at once to bound the memory
+            if step % EMISSIONS_CHUNK_SIZE == 0:
+                emissions = get_emissions(t_start + step, min(t_start + step + EMISSIONS_CHUNK_SIZE, t_end))
+            v_current = v_buffers[0] if v_prev is v_buffers[1] else v_buffers[1]
+            candidates_v_current[:, :, 0] = v_prev
+            candidates_v_current[:, 1:, 1] = v_prev[:, :-1]
+            candidates_v_current[:, :1, 1] = padding_value
+            candidates_v_current[:, 2:, 2] = v_prev[:, :-2]
+            candidates_v_current[:, :2, 2] = padding_value
+            # use our letter_repetition_mask to remove the connections between 2 blanks (so we don't skip over a letter)
+            # and to remove the connections between 2 consective letters (so we don't skip over a blank)
+            candidates_v_current[:, :, 2].masked_fill_(letter_repetition_mask, padding_value)
+            candidates_v_current.add_(emissions[:, step % EMISSIONS_CHUNK_SIZE].unsqueeze(2))
+            torch.max(candidates_v_current, dim=2, out=(v_current, bp_relative))
+            backpointers_rel[:, step].copy_(bp_relative)
+            v_prev = v_current
+        return v_prev
 
-        # candidates_v_current are our candidate viterbi probabilities for every token position, from which
-        # we will pick the max and record the argmax
-        candidates_v_current = v_prev_dup + e_current.unsqueeze(2)
-        # we straight away save results in v_prev instead of v_current, so that the variable v_prev will be ready for the
-        # next iteration of the for-loop
-        v_prev, bp_relative = torch.max(candidates_v_current, dim=2)
-
-        backpointers_rel[:, t, :] = bp_relative
-
-    # trace backpointers
-    alignments_batch = []
-    for b in range(B):
-        T_b = int(T_batch[b])
-        U_b = int(U_batch[b])
-
-        if U_b == 1:  # i.e. we put only a blank token in the reference text because the reference text is empty
-            current_u = 0  # set initial u to 0 and let the rest of the code block run as usual
-        else:
-            current_u = int(torch.argmax(v_prev[b, U_b - 2 : U_b])) + U_b - 2
-        alignment_b = [current_u]
-        for t in range(T_max - 1, 0, -1):
-            current_u = current_u - int(backpointers_rel[b, t, current_u])
-            alignment_b.insert(0, current_u)
-        alignment_b = alignment_b[:T_b]
-        alignments_batch.append(alignment_b)
-
+    # initialize v_prev - tensor of previous timestep's viterbi probabilies, of shape (B, U_max)
+    v_prev = v_buffers[0].fill_(padding_value)
+    v_prev[:, :2] = torch.gather(input=log_probs_batch[:, 0, :], dim=1, index=y_gather_index[:, :2])
+    v_prev[:, :2].masked_fill_(y_is_padding[:, :2], padding_value)
+
+    # forward pass over blocks of `checkpoint_interval` timesteps, keeping the viterbi probabilities at the start of
+    # every block. The backpointers of the last block remain in backpointers_rel.
+    block_starts = list(range(1, T_max, checkpoint_interval))
+    checkpoints = torch.empty((max(len(block_starts) - 1, 0), B, U_max), device=viterbi_device)
+    for block_idx, t_start in enumerate(block_starts):
+        if block_idx < len(block_starts) - 1:
+            checkpoints[block_idx].copy_(v_prev)
+        v_prev = forward_block(v_prev, t_start, min(t_start + checkpoint_interval, T_max))
+
+    # trace backpointers for the whole batch at once
+    batch_range = torch.arange(B, device=viterbi_device)
+    last_u = torch.clamp(U_batch - 1, min=0)
+    second_last_u = torch.clamp(U_batch - 2, min=0)
+    # take the last token position only if it is strictly more likely, and u = 0 if the reference text is empty
+    # (i.e. we put only a blank token in the reference text)
+    current_u = torch.where(
+        v_prev[batch_range, last_u] > v_prev[batch_range, second_last_u], last_u, second_last_u
+    ).long()
+    alignments = torch.empty((B, T_max), dtype=torch.long, device=viterbi_device)
+    alignments[:, T_max - 1] = current_u
+    for block_idx in range(len(block_starts) - 1, -1, -1):
+        t_start = block_starts[block_idx]
+        t_end = min(t_start + checkpoint_interval, T_max)
+        if block_idx < len(block_starts) - 1:
+            # recompute the backpointers of this block from its checkpoint
+            forward_block(checkpoints[block_idx], t_start, t_end)
+        for t in range(t_end - 1, t_start - 1, -1):
+            current_u = current_u - backpointers_rel[batch_range, t - t_start, current_u]
+            alignments[:, t - 1] = current_u
+
+    alignments = alignments.cpu()
+    alignments_batch = [alignments[b, : int(T_batch[b])].tolist() for b in range(B)]
     return alignments_batch
 
 
@@ -879,6 +903,7 @@ def get_batch_variables(
     padding_value: float = -3.4e38,
     has_hypotheses: bool = False,
     verbose: bool = True,
+    audio_filepaths: Optional[List[str]] = None,
 ):
     """
     Args:
@@ -895,6 +920,8 @@ def get_batch_variables(
         buffered_chunk_params: a dictionary, containing the parameters for the buffered chunked streaming.
         padding_value: a float, the value to use for padding the log_probs tensor.
         has_hypotheses: a boolean, if True, the audio has already been processed and hypotheses are provided.
+        audio_filepaths: an optional list of audio filepaths, one per utterance, used for the audio_filepath and
+            utt_id of the Utterance objects when `audio` contains already decoded audio (e.g. numpy arrays).
 
     Returns:
         log_probs_batch: a tensor of shape (B, T_max, V) - contains the log probabilities of the tokens for each utterance in the batch.
@@ -933,6 +960,9 @@ def get_batch_variables(
         if len(gt_text_batch) != len(audio):
             raise ValueError("`gt_text_batch` must be the same length as `audio` for performing alignment.")
 
+    if audio_filepaths is not None and len(audio_filepaths) != len(audio):
+        raise ValueError("`audio_filepaths` must be the same length as `audio`.")
+
     # get hypotheses by calling 'transcribe'
     # we will use the output log_probs, the duration of the log_probs,
     # and (optionally) the predicted ASR text from the hypotheses
@@ -947,6 +977,23 @@ def get_batch_variables(
             with torch.no_grad():
                 if has_hypotheses:
                     hypotheses = audio
+                elif isinstance(audio, (np.ndarray, torch.Tensor)) or (
+                    isinstance(audio, list) and any(isinstance(sample, (np.ndarray, torch.Tensor)) for sample in audio)
+                ):
+                    # imported here to avoid a circular import through the decoding modules
+                    from nemo.collections.asr.parts.mixins.transcription import TranscribeConfig
+
+                    # do not pad short audio arrays, so that the output timesteps line up with the input audio
+                    hypotheses = model.transcribe(
+                        audio,
+                        override_config=TranscribeConfig(
+                            batch_size=batch_size,
+                            return_hypotheses=True,
+                            num_workers=0,
+                            verbose=verbose,
+                            pad_min_duration=0.0,
+                        ),
+                    )
                 else:
                     hypotheses = model.transcribe(
                         audio, return_hypotheses=True, batch_size=batch_size, verbose=verbose
@@ -998,14 +1045,19 @@ def get_batch_variables(
 
         gt_text_for_alignment = " ".join(gt_text_for_alignment.split())
 
+        if audio_filepaths is not None:
+            sample_filepath = audio_filepaths[idx]
+        else:
+            sample_filepath = sample if isinstance(sample, str) else f"audio_{idx}"
+
         utt_obj = get_utt_obj(
             text=gt_text_for_alignment,
             model=model,
             segment_separators=segment_separators,
             word_separator=word_separator,
             T=T_list_batch[idx],
-            audio_filepath=sample if isinstance(sample, str) else f"audio_{idx}",
-            utt_id=_get_utt_id(sample if isinstance(sample, str) else f"audio_{idx}", audio_filepath_parts_in_utt_id),
+            audio_filepath=sample_filepath,
+            utt_id=_get_utt_id(sample_filepath, audio_filepath_parts_in_utt_id),
         )
 
         if len(gt_text_for_alignment) == 0:
@@ -19,7 +19,7 @@ from typing import Optional, Tuple, Union
 from torchmetrics.text import SacreBLEUScore
 from torchmetrics.text.rouge import ROUGEScore
 
-from nemo.collections.asr.metrics.wer import word_error_rate_detail
+from nemo.collections.asr.metrics.wer import batch_edit_distance
 from nemo.utils import logging
 from nemo.utils.nemo_logging import LogMode
 
@@ -166,10 +166,12 @@ def cal_write_wer(
     ignore_punctuation: bool = False,
     punctuations: Optional[list] = None,
     strip_punc_space: bool = False,
+    num_workers: int = 1,
 ) -> Tuple[str, dict, str]:
     """
     Calculate wer, inserion, deletion and substitution rate based on groundtruth text and pred_text_attr_name (pred_text)
     We use WER in function name as a convention, but Error Rate (ER) currently support Word Error Rate (WER) and Character Error Rate (CER)
+    The alignment of all the samples is done at once, optionally by `num_workers` processes.
     """
     samples = []
     hyps = []
@@ -209,22 +211,33 @@ def cal_write_wer(
                 ref = ref.lower()
                 hyp = hyp.lower()
 
-            wer, tokens, ins_rate, del_rate, sub_rate = word_error_rate_detail(
-                hypotheses=[hyp], references=[ref], use_cer=use_cer
-            )
-            sample[eval_metric] = wer  # evaluatin metric, could be word error rate of character error rate
-            sample['tokens'] = tokens  # number of word/characters/tokens
-            sample['ins_rate'] = ins_rate  # insertion error rate
-            sample['del_rate'] = del_rate  # deletion error rate
-            sample['sub_rate'] = sub_rate  # substitution error rate
-
             samples.append(sample)
             hyps.append(hyp)
             refs.append(ref)
 
-    total_wer, total_tokens, total_ins_rate, total_del_rate, total_sub_rate = word_error_rate_detail(
-        hypotheses=hyps, references=refs, use_cer=use_cer
-    )
+    # per-sample alignment stats of all the samples at once
+    measures = batch_edit_distance(hypotheses=hyps, references=refs, use_cer=use_cer, num_workers=num_workers)
+    for idx, sample in enumerate(samples):
+        tokens = int(measures['ref_len'][idx])
+        if tokens != 0:
+            wer = measures['total'][idx] / tokens
+            ins_rate, del_rate, sub_rate = (measures[op][idx] / tokens for op in ('ins', 'del', 'sub'))
+        else:
+            wer, ins_rate, del_rate, sub_rate = float('inf'), float('inf'), float('inf'), float('inf')
+        sample[eval_metric] = float(wer)  # evaluatin metric, could be word error rate of character error rate
+        sample['tokens'] = tokens  # number of word/characters/tokens
+        sample['ins_rate'] = float(ins_rate)  # insertion error rate
+        sample['del_rate'] = float(del_rate)  # deletion error rate
+        sample['sub_rate'] = float(sub_rate)  # substitution error rate
+
+    total_tokens = int(measures['ref_len'].sum())
+    if total_tokens != 0:
+        total_wer = float(measures['total'].sum()) / total_tokens
+        total_ins_rate, total_del_rate, total_sub_rate = (
+            float(measures[op].sum()) / total_tokens for op in ('ins', 'del', 'sub')
+        )
+    else:
+        total_wer = total_ins_rate = total_del_rate = total_sub_rate = float('inf')
 
     if not output_filename:
         output_manifest_w_wer = pred_manifest
@@ -25,7 +25,7 @@ from nemo.collections.asr.parts.utils.online_clustering import get_merge_quantit
 
 
 class LongFormSpeakerClustering(torch.nn.Module):
-    def __init__(self, cuda: bool = False):
+    def __init__(self, cuda: bool = False, use_sparse_affinity: bool = False, sparse_max_neighbors: int = 256):
         """
         Initializes a speaker clustering class tailored for long-form audio, leveraging methods from the `SpeakerClustering` class.
         The clustering algorithm for long-form content is executed via the `forward_infer` function (not shown here). Input embedding
@@ -38,9 +38,17 @@ class LongFormSpeakerClustering(torch.nn.Module):
         Args:
             cuda (bool):
                 Flag indicating whether CUDA is available for computation.
+            use_sparse_affinity (bool):
+                If True, sessions are clustered at once on a sparse k-NN affinity graph instead of being divided
+                into chunks. See `SpeakerClustering` for details.
+            sparse_max_neighbors (int):
+                The upper bound of the p-value in the sparse affinity mode.
         """
         super().__init__()
-        self.speaker_clustering = SpeakerClustering(cuda=cuda)
+        self.speaker_clustering = SpeakerClustering(
+            cuda=cuda, use_sparse_affinity=use_sparse_affinity, sparse_max_neighbors=sparse_max_neighbors
+        )
+        self.use_sparse_affinity = use_sparse_affinity
         self.embeddings_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.cuda = cuda
@@ -397,7 +405,11 @@ class LongFormSpeakerClustering(torch.nn.Module):
         NOTE: `torch.jit.script` currently does not support `**kwargs` in the function signature therefore,
         we need to use a wrapper function to handle the arguments.
         """
-        if embeddings_per_chunk is not None and torch.max(multiscale_segment_counts) > embeddings_per_chunk:
+        if (
+            not self.use_sparse_affinity
+            and embeddings_per_chunk is not None
+            and torch.max(multiscale_segment_counts) > embeddings_per_chunk
+        ):
             return self.long_forward_infer(
                 embeddings_in_scales=embeddings_in_scales,
                 timestamps_in_scales=timestamps_in_scales,
@@ -16,8 +16,9 @@ import json
 import os
 from collections import Counter
 from collections import OrderedDict as od
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import librosa
 import numpy as np
@@ -30,6 +31,7 @@ from nemo.collections.asr.parts.utils.speaker_utils import (
     segments_manifest_to_subsegments_manifest,
     write_rttm2manifest,
 )
+from nemo.collections.common.parts.preprocessing.manifest import iter_manifest_chunks
 from nemo.utils import logging
 from nemo.utils.data_utils import DataStoreObject
 
@@ -470,15 +472,42 @@ def create_manifest(
     write_file(manifest_filepath, lines, range(len(lines)))
 
 
-def read_manifest(manifest: Union[Path, str]) -> List[dict]:
+def _parse_json_line(line: str, manifest_file: Optional[str] = None) -> dict:
+    return json.loads(line)
+
+
+def _parse_json_columns(line: str, manifest_file: Optional[str] = None, keys: Tuple[str, ...] = ()) -> tuple:
+    item = json.loads(line)
+    return tuple(item.get(key) for key in keys)
+
+
+def _raise_manifest_errors(manifest: Union[Path, str], errors: List[str]):
+    if errors:
+        logging.error(f"{len(errors)} Errors encountered while reading manifest file: {manifest}")
+        for error in errors:
+            logging.error(f"-- Failed to parse line: `{error}`")
+        raise RuntimeError(f"Errors encountered while reading manifest file: {manifest}")
+
+
+def read_manifest(manifest: Union[Path, str], num_workers: int = 1) -> List[dict]:
     """
     Read manifest file
 
     Args:
         manifest (str or Path): Path to manifest file
+        num_workers (int): Number of processes used to parse the manifest. If greater than 1, the manifest is
+            split into chunks along its byte-offset index and the chunks are parsed in parallel.
     Returns:
         data (list): List of JSON items
     """
+    if num_workers > 1:
+        data, errors = [], []
+        for items, chunk_errors in iter_manifest_chunks(str(manifest), _parse_json_line, num_workers=num_workers):
+            data.extend(items)
+            errors.extend(chunk_errors)
+        _raise_manifest_errors(manifest, errors)
+        return data
+
     manifest = DataStoreObject(str(manifest))
 
     data = []
@@ -488,7 +517,7 @@ def read_manifest(manifest: Union[Path, str]) -> List[dict]:
         raise Exception(f"Manifest file could not be opened: {manifest}")
 
     errors = []
-    for line in f.readlines():
+    for line in f:
         line = line.strip()
         if not line:
             continue
@@ -499,14 +528,73 @@ def read_manifest(manifest: Union[Path, str]) -> List[dict]:
             continue
         data.append(item)
     f.close()
-    if errors:
-        logging.error(f"{len(errors)} Errors encountered while reading manifest file: {manifest}")
-        for error in errors:
-            logging.error(f"-- Failed to parse line: `{error}`")
-        raise RuntimeError(f"Errors encountered while reading manifest file: {manifest}")
+    _raise_manifest_errors(manifest, errors)
     return data
 
 
+def iter_manifest(manifest: Union[Path, str]) -> Iterator[dict]:
+    """
+    Lazily iterate over the JSON items of a manifest file, one line at a time.
+
+    Args:
+        manifest (str or Path): Path to manifest file
+    Yields:
+        JSON items of the manifest
+    """
+    manifest = DataStoreObject(str(manifest))
+    errors = []
+    with open(manifest.get(), 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                errors.append(line)
+                continue
+            yield item
+    _raise_manifest_errors(manifest, errors)
+
+
+def read_manifest_columns(
+    manifest: Union[Path, str], keys: Sequence[str] = ('audio_filepath', 'duration'), num_workers: int = 1
+) -> Dict[str, np.ndarray]:
+    """
+    Read selected fields of a manifest file into NumPy arrays, without keeping one dict per entry.
+
+    Fields whose values are all numbers (or missing) are returned as float64 arrays with NaN for missing values,
+    e.g. durations. Other fields, e.g. audio paths, are returned as object arrays with None for missing values.
+
+    Args:
+        manifest (str or Path): Path to manifest file
+        keys (Sequence[str]): Fields to read
+        num_workers (int): Number of processes used to parse the manifest
+    Returns:
+        Dictionary mapping each key to an array with one value per manifest entry
+    """
+    keys = tuple(keys)
+    rows, errors = [], []
+    parse_func = partial(_parse_json_columns, keys=keys)
+    for items, chunk_errors in iter_manifest_chunks(str(manifest), parse_func, num_workers=num_workers):
+        rows.extend(items)
+        errors.extend(chunk_errors)
+    _raise_manifest_errors(manifest, errors)
+
+    columns = {}
+    for key, values in zip(keys, zip(*rows) if rows else [()] * len(keys)):
+        is_numeric = all(
+            value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values
+        )
+        if is_numeric:
+            columns[key] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[key] = column
+    return columns
+
+
 def write_manifest(output_path: Union[Path, str], target_manifest: List[dict], ensure_ascii: bool = True):
     """
     Write to manifest file
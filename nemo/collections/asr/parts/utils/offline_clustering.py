@@ -756,6 +756,173 @@ def estimateNumofSpeakers(
     return num_of_spk, lambdas, lambda_gap
 
 
+def getMultiScaleNormalizedEmbs(embeddings_in_scales: List[torch.Tensor], device: torch.device) -> List[torch.Tensor]:
+    """
+    L2-normalize the embeddings of each scale as in `getMultiScaleCosAffinityMatrix` (half-precision embeddings,
+    `cos_similarity` normalization), so that a dot product of two normalized embeddings is their cosine similarity.
+    """
+    eps = 3.5e-4
+    norm_embs: List[torch.Tensor] = []
+    for emb in embeddings_in_scales:
+        emb = emb.half().float().to(device)
+        norm_embs.append(emb / (torch.norm(emb, dim=1).unsqueeze(1) + eps))
+    return norm_embs
+
+
+def getCosSimilarityMin(norm_emb: torch.Tensor, chunk_size: int = 4096) -> torch.Tensor:
+    """
+    Calculate the minimum value of the cosine similarity matrix of the normalized embeddings without instantiating
+    the whole matrix. The maximum value is 1, the diagonal value set by `cos_similarity`.
+    """
+    if norm_emb.shape[0] == 1:
+        # `getCosAffinityMatrix` does not min-max normalize a single embedding
+        return torch.tensor(0.0, device=norm_emb.device)
+    v_min = torch.tensor(1.0, device=norm_emb.device)
+    for start in range(0, norm_emb.shape[0], chunk_size):
+        v_min = torch.min(v_min, torch.mm(norm_emb[start : start + chunk_size], norm_emb.t()).min())
+    return v_min
+
+
+def getMultiScaleCosAffinityRows(
+    norm_embs: List[torch.Tensor],
+    session_scale_mapping_list: List[torch.Tensor],
+    scale_min_values: List[torch.Tensor],
+    multiscale_weights: torch.Tensor,
+    row_index: torch.Tensor,
+    col_index: torch.Tensor,
+) -> torch.Tensor:
+    """
+    Calculate the rows `row_index` and columns `col_index` of the fused multiscale affinity matrix of
+    `getMultiScaleCosAffinityMatrix`, without instantiating the whole matrix.
+
+    Args:
+        norm_embs (list):
+            L2-normalized embeddings of each scale from `getMultiScaleNormalizedEmbs`
+        session_scale_mapping_list (list):
+            Mapping from the base-scale segments to the segments of each scale from `get_argmin_mat`
+        scale_min_values (list):
+            Minimum cosine similarity value of each scale from `getCosSimilarityMin`
+        multiscale_weights (Tensor):
+            Multiscale weights. Dimensions: (Number of scales)
+        row_index (Tensor):
+            Indices of the base-scale segments for the rows
+        col_index (Tensor):
+            Indices of the base-scale segments for the columns
+
+    Returns:
+        fused_sim_d (Tensor):
+            The fused affinity values. Dimensions: (Number of rows) x (Number of columns)
+    """
+    fused_sim_d = torch.zeros(row_index.shape[0], col_index.shape[0], device=norm_embs[0].device)
+    for scale_idx in range(len(norm_embs)):
+        norm_emb = norm_embs[scale_idx]
+        scale_rows = session_scale_mapping_list[scale_idx][row_index]
+        sim = torch.mm(norm_emb[scale_rows], norm_emb.t())
+        # `cos_similarity` sets the diagonal to 1
+        sim.scatter_(1, scale_rows.unsqueeze(1), 1.0)
+        v_min = scale_min_values[scale_idx]
+        sim = (sim - v_min) / (1.0 - v_min)
+        fused_sim_d += multiscale_weights[scale_idx] * sim[:, session_scale_mapping_list[scale_idx][col_index]]
+    return fused_sim_d
+
+
+def getSparseKneighborsAffinityMat(
+    norm_embs: List[torch.Tensor],
+    session_scale_mapping_list: List[torch.Tensor],
+    scale_min_values: List[torch.Tensor],
+    multiscale_weights: torch.Tensor,
+    p_value: int,
+    chunk_size: int = 4096,
+) -> torch.Tensor:
+    """
+    Build the sparse equivalent of `getAffinityGraphMat(mat, p_value)` for the fused multiscale affinity matrix:
+    the top-p values of each row are binarized and the graph is symmetrized. The rows of the affinity matrix are
+    calculated in chunks, so the memory grows with N x p_value instead of N x N.
+
+    Args:
+        norm_embs (list):
+            L2-normalized embeddings of each scale from `getMultiScaleNormalizedEmbs`
+        session_scale_mapping_list (list):
+            Mapping from the base-scale segments to the segments of each scale from `get_argmin_mat`
+        scale_min_values (list):
+            Minimum cosine similarity value of each scale from `getCosSimilarityMin`
+        multiscale_weights (Tensor):
+            Multiscale weights. Dimensions: (Number of scales)
+        p_value (int):
+            The number of top values that are selected from each row.
+        chunk_size (int):
+            Number of rows of the affinity matrix calculated at once.
+
+    Returns:
+        sparse_affinity_mat (Tensor):
+            Symmetric sparse COO affinity matrix without self-connections. Values are 1 for mutual neighbors and
+            0.5 for one-sided neighbors. Dimensions: N x N
+    """
+    n_segments = session_scale_mapping_list[-1].shape[0]
+    device = norm_embs[0].device
+    col_index = torch.arange(n_segments, device=device)
+    neighbor_list: List[torch.Tensor] = []
+    for start in range(0, n_segments, chunk_size):
+        row_index = col_index[start : start + chunk_size]
+        rows = getMultiScaleCosAffinityRows(
+            norm_embs, session_scale_mapping_list, scale_min_values, multiscale_weights, row_index, col_index
+        )
+        neighbor_list.append(torch.topk(rows, p_value, dim=1)[1])
+    neighbors = torch.cat(neighbor_list).flatten()
+    rows = col_index.repeat_interleave(p_value)
+    not_self = rows != neighbors
+    rows, neighbors = rows[not_self], neighbors[not_self]
+    indices = torch.cat([torch.stack([rows, neighbors]), torch.stack([neighbors, rows])], dim=1)
+    values = torch.full((indices.shape[1],), 0.5, device=device)
+    return torch.sparse_coo_tensor(indices, values, (n_segments, n_segments)).coalesce()
+
+
+def eigDecomposeSparse(
+    affinity_mat: torch.Tensor, n_eigs: int, seed: int = 0, tol: float = 1e-4
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Calculate the `n_eigs` smallest eigenvalues and eigenvectors of the Laplacian of a sparse affinity matrix
+    with LOBPCG. The solver finds the largest eigenpairs of `c * I - L`, where `c` is an upper bound of the
+    eigenvalues of the Laplacian `L` (twice the maximum degree), which converges much faster than searching the
+    smallest eigenpairs of `L` directly. The matrix is stored in CSR format and double precision.
+
+    Args:
+        affinity_mat (Tensor):
+            Symmetric sparse COO affinity matrix without self-connections
+        n_eigs (int):
+            Number of eigenpairs to calculate
+        seed (int):
+            Seed of the random initial eigenvectors, for reproducible clustering results
+        tol (float):
+            Residual tolerance of LOBPCG
+
+    Returns:
+        lambdas (Tensor):
+            The smallest eigenvalues of the Laplacian in ascending order
+        diffusion_map (Tensor):
+            The corresponding eigenvectors. Dimensions: N x n_eigs
+    """
+    n_segments = affinity_mat.shape[0]
+    device = affinity_mat.device
+    affinity_mat = affinity_mat.double().coalesce()
+    degree = torch.zeros(n_segments, dtype=torch.float64, device=device)
+    degree.index_add_(0, affinity_mat.indices()[0], affinity_mat.values())
+    shift = 2 * degree.max() + 1.0
+    diag_index = torch.arange(n_segments, device=device)
+    shifted_mat = torch.sparse_coo_tensor(
+        torch.cat([affinity_mat.indices(), torch.stack([diag_index, diag_index])], dim=1),
+        torch.cat([affinity_mat.values(), shift - degree]),
+        (n_segments, n_segments),
+    ).coalesce()
+    generator = torch.Generator(device=device)
+    generator.manual_seed(seed)
+    init_vecs = torch.randn(n_segments, n_eigs, dtype=torch.float64, device=device, generator=generator)
+    shifted_lambdas, diffusion_map = torch.lobpcg(shifted_mat.to_sparse_csr(), X=init_vecs, largest=True, tol=tol)
+    lambdas = shift - shifted_lambdas
+    sorted_idx = torch.argsort(lambdas)
+    return lambdas[sorted_idx].float(), diffusion_map[:, sorted_idx].float()
+
+
 class SpectralClustering:
     """
     Perform spectral clustering by calculating spectral embeddings then run k-means clustering
@@ -833,6 +1000,23 @@ class SpectralClustering:
 
         """
         spectral_emb = self.getSpectralEmbeddings(affinity, n_spks=self.n_clusters, cuda=cuda)
+        return self.getKmeansLabels(spectral_emb, device=device)
+
+    def getKmeansLabels(self, spectral_emb: torch.Tensor, device: torch.device = torch.device('cpu')) -> torch.Tensor:
+        """
+        Run k-means clustering on the given spectral embeddings for (self.n_random_trials) times and take a
+        majority vote on the labels.
+
+        Args:
+            spectral_emb (Tensor):
+                Spectral embeddings. Dimensions: (Number of segments) x (Number of clusters)
+            device (torch.device):
+                Torch device variable
+
+        Returns:
+            labels (Tensor):
+                clustering label output
+        """
         labels_set = []
 
         for random_state_seed in range(self.random_state, self.random_state + self.n_random_trials):
@@ -1144,6 +1328,9 @@ class SpeakerClustering(torch.nn.Module):
         maj_vote_spk_count: bool = False,
         parallelism: bool = False,
         cuda: bool = False,
+        use_sparse_affinity: bool = False,
+        sparse_chunk_size: int = 4096,
+        sparse_max_neighbors: int = 256,
     ):
         """
         Clustering method for speaker diarization based on cosine similarity.
@@ -1166,6 +1353,14 @@ class SpeakerClustering(torch.nn.Module):
                 Use dynamic parallelism feature in torch.jit compiler to accelerate the p-value search.
             cuda (bool):
                 Boolean variable for toggling cuda availability.
+            use_sparse_affinity (bool):
+                If True, sessions with more than `nme_mat_size` base-scale segments are clustered on a sparse k-NN
+                affinity graph with a partial eigendecomposition (LOBPCG), instead of the dense N x N affinity matrix
+                and full eigendecomposition. The memory grows linearly with the number of segments.
+            sparse_chunk_size (int):
+                Number of affinity matrix rows calculated at once in the sparse affinity mode.
+            sparse_max_neighbors (int):
+                The upper bound of the p-value (number of neighbors per segment) in the sparse affinity mode.
         """
         super().__init__()
         self.min_samples_for_nmesc: int = min_samples_for_nmesc
@@ -1174,6 +1369,9 @@ class SpeakerClustering(torch.nn.Module):
         self.parallelism: bool = parallelism
         self.cuda: bool = cuda
         self.maj_vote_spk_count: bool = maj_vote_spk_count
+        self.use_sparse_affinity: bool = use_sparse_affinity
+        self.sparse_chunk_size: int = sparse_chunk_size
+        self.sparse_max_neighbors: int = sparse_max_neighbors
         self.embeddings_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
         self.device = torch.device("cuda") if self.cuda else torch.device("cpu")
@@ -1384,6 +1582,18 @@ class SpeakerClustering(torch.nn.Module):
         if oracle_num_speakers > 0:
             max_num_speakers = oracle_num_speakers
 
+        if self.use_sparse_affinity and emb.shape[0] > self.nme_mat_size:
+            return self.forward_sparse_infer(
+                multiscale_weights=multiscale_weights,
+                oracle_num_speakers=oracle_num_speakers,
+                max_rp_threshold=max_rp_threshold,
+                max_num_speakers=max_num_speakers,
+                sparse_search_volume=sparse_search_volume,
+                est_num_of_spk_enhanced=est_num_of_spk_enhanced,
+                kmeans_random_trials=kmeans_random_trials,
+                fixed_thres=fixed_thres,
+            )
+
         mat = getMultiScaleCosAffinityMatrix(
             multiscale_weights=multiscale_weights,
             embeddings_in_scales=self.embeddings_in_scales,
@@ -1401,3 +1611,106 @@ class SpeakerClustering(torch.nn.Module):
             kmeans_random_trials=kmeans_random_trials,
             fixed_thres=fixed_thres,
         )
+
+    def forward_sparse_infer(
+        self,
+        multiscale_weights: torch.Tensor,
+        oracle_num_speakers: int = -1,
+        max_num_speakers: int = 8,
+        max_rp_threshold: float = 0.15,
+        sparse_search_volume: int = 30,
+        est_num_of_spk_enhanced: torch.Tensor = torch.tensor(-1),
+        fixed_thres: float = -1.0,
+        kmeans_random_trials: int = 1,
+    ) -> torch.LongTensor:
+        """
+        Sparse counterpart of `forward_unit_infer` for the embeddings and timestamps stored by `forward_infer`.
+        The p-value is estimated by NME analysis on the subsampled affinity matrix, which is the only dense matrix
+        that is calculated. The full affinity graph is built as a sparse k-NN graph with the estimated p-value, and
+        both the number of speakers (eigengap) and the spectral embeddings are obtained from a partial
+        eigendecomposition of its Laplacian.
+
+        Args:
+            multiscale_weights (Tensor):
+                Multi-scale weights used when merging affinity scores.
+            oracle_num_speakers (int):
+                The number of speakers in a session as given by the reference transcript.
+            max_num_speakers (int):
+                The upper bound for the number of speakers in each session.
+            max_rp_threshold (float):
+                Limits the range of parameter search.
+            sparse_search_volume (int):
+                The number of p_values considered during NME analysis.
+            est_num_of_spk_enhanced (Tensor):
+                The number of speakers estimated from enhanced speaker counting.
+                If the value is -1, the enhanced speaker counting is skipped.
+            fixed_thres (float):
+                If a `fixed_thres` value is provided, the NME-analysis process will be skipped.
+            kmeans_random_trials (int):
+                The number of random trials for initializing k-means clustering.
+
+        Returns:
+            Y (LongTensor):
+                Speaker labels (clustering output) in integer format for the segments in the given input embeddings.
+        """
+        multiscale_weights = torch.squeeze(multiscale_weights, dim=0).to(self.device)
+        session_scale_mapping_list = [mapping.to(self.device) for mapping in get_argmin_mat(self.timestamps_in_scales)]
+        norm_embs = getMultiScaleNormalizedEmbs(self.embeddings_in_scales, device=self.device)
+        scale_min_values = [getCosSimilarityMin(norm_emb, chunk_size=self.sparse_chunk_size) for norm_emb in norm_embs]
+
+        # NME analysis on the subsampled affinity matrix, same as `NMESC.subsampleAffinityMat`
+        n_segments = session_scale_mapping_list[-1].shape[0]
+        subsample_ratio = max(1, int(n_segments / self.nme_mat_size))
+        subsample_index = torch.arange(0, n_segments, subsample_ratio, device=self.device)
+        sub_mat = getMultiScaleCosAffinityRows(
+            norm_embs,
+            session_scale_mapping_list,
+            scale_min_values,
+            multiscale_weights,
+            row_index=subsample_index,
+            col_index=subsample_index,
+        )
+        nmesc = NMESC(
+            sub_mat,
+            max_num_speakers=max_num_speakers,
+            max_rp_threshold=max_rp_threshold,
+            sparse_search=self.sparse_search,
+            sparse_search_volume=sparse_search_volume,
+            fixed_thres=fixed_thres,
+            nme_mat_size=self.nme_mat_size,
+            use_subsampling_for_nme=False,
+            maj_vote_spk_count=self.maj_vote_spk_count,
+            parallelism=self.parallelism,
+            cuda=self.cuda,
+            device=self.device,
+        )
+        _, p_value = nmesc.forward()
+        p_hat_value = min(max(subsample_ratio * int(p_value.item()), 1), self.sparse_max_neighbors)
+
+        affinity_mat = getSparseKneighborsAffinityMat(
+            norm_embs,
+            session_scale_mapping_list,
+            scale_min_values,
+            multiscale_weights,
+            p_value=p_hat_value,
+            chunk_size=self.sparse_chunk_size,
+        )
+        # The eigengap of the (max_num_speakers + 1) smallest eigenvalues estimates the number of speakers
+        lambdas, diffusion_map = eigDecomposeSparse(affinity_mat, n_eigs=max_num_speakers + 1)
+        lambda_gap = getLamdaGaplist(lambdas)
+        est_num_of_spk = torch.argmax(lambda_gap[:max_num_speakers]) + 1
+
+        # `n_clusters` is number of speakers estimated from spectral clustering.
+        if oracle_num_speakers > 0:
+            n_clusters = int(oracle_num_speakers)
+        elif est_num_of_spk_enhanced > 0:
+            n_clusters = int(est_num_of_spk_enhanced.item())
+        else:
+            n_clusters = int(est_num_of_spk.item())
+        spectral_emb = diffusion_map[:, :n_clusters].flip(1)
+
+        spectral_model = SpectralClustering(
+            n_clusters=n_clusters, n_random_trials=kmeans_random_trials, cuda=self.cuda, device=self.device
+        )
+        Y = spectral_model.getKmeansLabels(spectral_emb, device=self.device)
+        return Y
@@ -27,12 +27,14 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import torch
+import torch.nn.functional as F
 
 from nemo.collections.asr.parts.context_biasing.biasing_multi_model import BiasingRequestItemConfig
 from nemo.collections.asr.parts.submodules.transducer_decoding import BatchedHyps
+from nemo.collections.common.tokenizers.tokenizer_spec import batch_ids_to_lists
 
 
 @dataclass
@@ -227,6 +229,130 @@ class HATJointOutput:
     ilm_logprobs: Optional[torch.Tensor] = None
 
 
+class ColumnarHypotheses:
+    """
+    Best hypotheses of a batch in columnar form: padded tensors instead of a list of Hypothesis objects.
+
+    Texts of the whole batch are de-tokenized at once on the first access of `text`, and Hypothesis objects are only
+    created for the items that are accessed (indexing, iteration or `to_hypotheses()`).
+
+    Args:
+        y_sequence: non-blank token ids, padded, of shape [B, U].
+        lengths: number of tokens of every hypothesis, of shape [B].
+        scores: scores of the hypotheses, of shape [B].
+        timestamps: (Optional) frame index of every token, padded, of shape [B, U].
+        token_durations: (Optional) duration of every token (TDT models), padded, of shape [B, U].
+        text_decoder: (Optional) callable converting a list of token id lists to a list of texts.
+        text: (Optional) texts of the hypotheses, if already known.
+        hypotheses: (Optional) Hypothesis objects the columns were built from, returned as is on item access.
+    """
+
+    def __init__(
+        self,
+        y_sequence: torch.Tensor,
+        lengths: torch.Tensor,
+        scores: torch.Tensor,
+        timestamps: Optional[torch.Tensor] = None,
+        token_durations: Optional[torch.Tensor] = None,
+        text_decoder: Optional[Callable[[List[List[int]]], List[str]]] = None,
+        text: Optional[List[str]] = None,
+        hypotheses: Optional[List[Optional[Hypothesis]]] = None,
+    ):
+        self.y_sequence = y_sequence
+        self.lengths = lengths
+        self.scores = scores
+        self.timestamps = timestamps
+        self.token_durations = token_durations
+        self.text_decoder = text_decoder
+        self._text = text
+        self._hypotheses = hypotheses if hypotheses is not None else [None] * len(self)
+
+    def __len__(self) -> int:
+        return self.lengths.shape[0]
+
+    @property
+    def text(self) -> List[Optional[str]]:
+        """Texts of the hypotheses, de-tokenized for the whole batch on first access"""
+        if self._text is None:
+            if self.text_decoder is None:
+                return [None] * len(self)
+            self._text = self.text_decoder(batch_ids_to_lists(self.y_sequence, self.lengths))
+        return self._text
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Hypothesis, List[Hypothesis]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(len(self))[idx]]
+        if self._hypotheses[idx] is None:
+            length = int(self.lengths[idx])
+            self._hypotheses[idx] = Hypothesis(
+                score=float(self.scores[idx]),
+                y_sequence=self.y_sequence[idx, :length],
+                text=self.text[idx],
+                timestamp=self.timestamps[idx, :length] if self.timestamps is not None else [],
+                token_duration=(
+                    self.token_durations[idx, :length] if self.token_durations is not None else torch.empty(0)
+                ),
+            )
+        return self._hypotheses[idx]
+
+    def __iter__(self) -> Iterator[Hypothesis]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def to_hypotheses(self) -> List[Hypothesis]:
+        """Materializes all the hypotheses as a list of Hypothesis objects"""
+        return list(self)
+
+    @classmethod
+    def from_hypotheses(cls, hypotheses: List[Hypothesis]) -> "ColumnarHypotheses":
+        """
+        Builds columns from already decoded Hypothesis objects, which are kept and returned on item access.
+        Used when the decoding strategy does not produce batched hypotheses.
+        """
+        lengths = torch.tensor([len(hyp.y_sequence) for hyp in hypotheses], dtype=torch.long)
+        y_sequence = torch.zeros(len(hypotheses), int(lengths.max()) if len(hypotheses) else 0, dtype=torch.long)
+        for idx, hyp in enumerate(hypotheses):
+            y_sequence[idx, : lengths[idx]] = torch.as_tensor(hyp.y_sequence, dtype=torch.long)
+        scores = torch.tensor([float(hyp.score) for hyp in hypotheses], dtype=torch.float32)
+        return cls(
+            y_sequence=y_sequence,
+            lengths=lengths,
+            scores=scores,
+            text=[hyp.text for hyp in hypotheses],
+            hypotheses=list(hypotheses),
+        )
+
+    @classmethod
+    def concatenate(cls, batches: List["ColumnarHypotheses"]) -> "ColumnarHypotheses":
+        """Concatenates the hypotheses of several batches, keeping texts lazy if possible"""
+        if len(batches) == 0:
+            raise ValueError("Nothing to concatenate")
+        if len(batches) == 1:
+            return batches[0]
+
+        def _cat_padded(tensors: List[Optional[torch.Tensor]]) -> Optional[torch.Tensor]:
+            if any(tensor is None for tensor in tensors):
+                return None
+            max_len = max(tensor.shape[1] for tensor in tensors)
+            return torch.cat([F.pad(tensor, (0, max_len - tensor.shape[1])) for tensor in tensors], dim=0)
+
+        text_decoder = batches[0].text_decoder
+        if any(batch._text is None for batch in batches) and all(batch.text_decoder is not None for batch in batches):
+            text = None
+        else:
+            text = [item for batch in batches for item in batch.text]
+        return cls(
+            y_sequence=_cat_padded([batch.y_sequence for batch in batches]),
+            lengths=torch.cat([batch.lengths for batch in batches]),
+            scores=torch.cat([batch.scores for batch in batches]),
+            timestamps=_cat_padded([batch.timestamps for batch in batches]),
+            token_durations=_cat_padded([batch.token_durations for batch in batches]),
+            text_decoder=text_decoder,
+            text=text,
+            hypotheses=[hyp for batch in batches for hyp in batch._hypotheses],
+        )
+
+
 def is_prefix(x: List[int], pref: List[int]) -> bool:
     """
     Obtained from https://github.com/espnet/espnet.
@@ -364,3 +490,38 @@ def batched_hyps_to_hypotheses(batched_hyps: BatchedHyps, batch_size=None) -> li
                     )
                 start += timestamp_cnt
     return hypotheses
+
+
+def batched_hyps_to_columnar(
+    batched_hyps: BatchedHyps,
+    batch_size=None,
+    text_decoder: Optional[Callable[[List[List[int]]], List[str]]] = None,
+) -> ColumnarHypotheses:
+    """
+    Convert batched hypotheses to columnar hypotheses, without creating Hypothesis objects.
+    Alignments and frame confidence are not supported, use `batched_hyps_to_hypotheses` for them.
+
+    Args:
+        batched_hyps: BatchedHyps object
+        batch_size: Batch Size to retrieve hypotheses. When working with CUDA graphs the batch size for all tensors
+            is constant, thus we need here the real batch size to return only necessary hypotheses
+        text_decoder: callable converting a list of token id lists to a list of texts
+
+    Returns:
+        ColumnarHypotheses object
+    """
+    assert batch_size is None or batch_size <= batched_hyps.scores.shape[0]
+    num_hyps = batched_hyps.scores.shape[0] if batch_size is None else batch_size
+
+    lengths_nb, transcript_nb, timestamps_nb, durations_nb, _ = batched_hyps.get_data_without_blank()
+    lengths_nb = lengths_nb[:num_hyps].cpu()
+    # drop the unused capacity of the storage
+    max_length = int(lengths_nb.max()) if num_hyps > 0 else 0
+    return ColumnarHypotheses(
+        y_sequence=transcript_nb[:num_hyps, :max_length].cpu(),
+        lengths=lengths_nb,
+        scores=batched_hyps.scores[:num_hyps].cpu(),
+        timestamps=timestamps_nb[:num_hyps, :max_length].cpu(),
+        token_durations=durations_nb[:num_hyps, :max_length].cpu() if durations_nb is not None else None,
+        text_decoder=text_decoder,
+    )
@@ -0,0 +1,399 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+from nemo.collections.asr.modules.sortformer_modules import StreamingSortformerState
+from nemo.utils import logging
+
+if TYPE_CHECKING:
+    from nemo.collections.asr.models import SortformerEncLabelModel
+
+__all__ = ['DiarizationStreamResult', 'ContinuousBatchedDiarizationStreamer']
+
+# Per-row tensors of an asynchronous StreamingSortformerState, all batched along the first dimension.
+_STATE_FIELDS = (
+    'spkcache',
+    'spkcache_lengths',
+    'spkcache_preds',
+    'spkcache_compressed',
+    'fifo',
+    'fifo_lengths',
+    'fifo_preds',
+    'mean_sil_emb',
+    'n_sil_frames',
+)
+
+
+@dataclass
+class DiarizationStreamResult:
+    """
+    Output of one recording diarized by `ContinuousBatchedDiarizationStreamer`.
+
+    Attributes:
+        stream_id (int): Id returned by `ContinuousBatchedDiarizationStreamer.add_stream`.
+        preds (torch.Tensor): Speaker activity probabilities on CPU.
+            Shape: (num_frames, num_speakers)
+        audio_duration (float): Duration of the recording in seconds.
+        chunk_latencies (List[float]): Wall time in seconds from the start of each streaming step to the moment the
+            predictions of the chunk of this stream were available.
+        start_time (float): `time.perf_counter()` value when the stream entered a batch slot.
+        end_time (float): `time.perf_counter()` value when the last chunk of the stream was processed.
+    """
+
+    stream_id: int
+    preds: torch.Tensor
+    audio_duration: float
+    chunk_latencies: List[float] = field(default_factory=list)
+    start_time: float = 0.0
+    end_time: float = 0.0
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self.chunk_latencies)
+
+    @property
+    def mean_latency(self) -> float:
+        return float(np.mean(self.chunk_latencies)) if self.chunk_latencies else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return max(self.chunk_latencies, default=0.0)
+
+    @property
+    def rtfx(self) -> float:
+        """Inverse real-time factor of the stream, from entering a slot to its last chunk"""
+        wall_time = self.end_time - self.start_time
+        return self.audio_duration / wall_time if wall_time > 0 else math.inf
+
+
+class _ActiveStream:
+    """Features and progress of a recording occupying a batch slot"""
+
+    def __init__(
+        self, stream_id: int, features: torch.Tensor, feat_length: int, audio_duration: float, start_time: float
+    ):
+        self.stream_id = stream_id
+        # (num_frames, feat_dim), padded by the preprocessor beyond `feat_length` as in `forward_streaming`
+        self.features = features
+        self.feat_length = feat_length
+        self.feat_offset = 0
+        self.audio_duration = audio_duration
+        self.start_time = start_time
+        self.preds = []
+        self.chunk_latencies = []
+
+    @property
+    def num_frames(self) -> int:
+        return self.features.shape[0]
+
+
+class ContinuousBatchedDiarizationStreamer:
+    """
+    Continuous-batching streaming diarization with a Sortformer model.
+
+    Recordings are queued with `add_stream` and occupy up to `batch_size` batch slots. Each slot holds the speaker
+    cache and FIFO of its recording as a row of an asynchronous `StreamingSortformerState`. Every call to `step`
+    fills free slots with queued recordings, advances all the active recordings by one chunk with a batched
+    `forward_streaming_step`, and releases the slots of finished recordings, so that short and long recordings
+    can share the batch without waiting for each other.
+
+    Rows are only split across several model calls when their left contexts differ, i.e., for recordings entering
+    the batch when `chunk_left_context > 0`, so the predictions of each recording are the same as with
+    `forward_streaming` on that recording alone.
+
+    Example:
+        streamer = ContinuousBatchedDiarizationStreamer(diar_model, batch_size=16)
+        results = streamer.run(audio_signals)
+        streamer.log_summary()
+
+    Args:
+        diar_model (SortformerEncLabelModel): Sortformer model in streaming mode with `async_streaming=True`.
+        batch_size (int): Maximum number of recordings processed concurrently.
+    """
+
+    def __init__(self, diar_model: "SortformerEncLabelModel", batch_size: int):
+        if not diar_model.streaming_mode:
+            raise ValueError("Continuous batching requires a Sortformer model with `streaming_mode=True`")
+        if not diar_model.async_streaming:
+            raise ValueError(
+                "Continuous batching requires asynchronous streaming (per-stream speaker cache and FIFO lengths), "
+                "set `async_streaming=True` on the model"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        self.diar_model = diar_model
+        self.batch_size = batch_size
+        self.sample_rate = diar_model._cfg.sample_rate
+        self.reset()
+
+    def reset(self):
+        """Drops all queued and active recordings and the accumulated statistics."""
+        self._pending = deque()
+        self._active: List[_ActiveStream] = []
+        self._state: Optional[StreamingSortformerState] = None
+        self._next_stream_id = 0
+        self._num_steps = 0
+        self._num_model_calls = 0
+        self._num_active_rows = 0
+        self._wall_time = 0.0
+        self.results: Dict[int, DiarizationStreamResult] = {}
+
+    def add_stream(self, audio_signal: torch.Tensor) -> int:
+        """
+        Queues a recording for diarization.
+
+        Args:
+            audio_signal (torch.Tensor): Mono audio samples at the sample rate of the model.
+                Shape: (num_samples,)
+
+        Returns:
+            stream_id (int): Id of the recording in the results.
+        """
+        audio_signal = torch.as_tensor(audio_signal, dtype=torch.float32)
+        if audio_signal.dim() != 1 or audio_signal.shape[0] == 0:
+            raise ValueError(f"Expected a non-empty 1-D audio signal, got shape {tuple(audio_signal.shape)}")
+        stream_id = self._next_stream_id
+        self._next_stream_id += 1
+        self._pending.append((stream_id, audio_signal))
+        return stream_id
+
+    @property
+    def num_active_streams(self) -> int:
+        return len(self._active)
+
+    @property
+    def num_pending_streams(self) -> int:
+        return len(self._pending)
+
+    def has_streams(self) -> bool:
+        return bool(self._active or self._pending)
+
+    def _synchronize(self):
+        if self.diar_model.device.type == 'cuda':
+            torch.cuda.synchronize(self.diar_model.device)
+
+    def _init_state_rows(self, num_rows: int) -> StreamingSortformerState:
+        modules = self.diar_model.sortformer_modules
+        state = modules.init_streaming_state(batch_size=num_rows, async_streaming=True, device=self.diar_model.device)
+        # `fifo_preds` is only created by the first update, keep every field batched for row selection
+        state.fifo_preds = torch.zeros((num_rows, state.fifo.shape[1], modules.n_spk), device=state.fifo.device)
+        return state
+
+    @staticmethod
+    def _select_state_rows(state: StreamingSortformerState, rows: torch.Tensor) -> StreamingSortformerState:
+        selected = StreamingSortformerState()
+        for name in _STATE_FIELDS:
+            setattr(selected, name, getattr(state, name)[rows])
+        return selected
+
+    @staticmethod
+    def _assign_state_rows(state: StreamingSortformerState, rows: torch.Tensor, rows_state: StreamingSortformerState):
+        for name in _STATE_FIELDS:
+            getattr(state, name)[rows] = getattr(rows_state, name)
+
+    @staticmethod
+    def _concat_states(states: Sequence[StreamingSortformerState]) -> StreamingSortformerState:
+        concatenated = StreamingSortformerState()
+        for name in _STATE_FIELDS:
+            setattr(concatenated, name, torch.cat([getattr(state, name) for state in states], dim=0))
+        return concatenated
+
+    def _admit_pending_streams(self):
+        num_new = min(self.batch_size - len(self._active), len(self._pending))
+        if num_new <= 0:
+            return
+        for _ in range(num_new):
+            stream_id, audio_signal = self._pending.popleft()
+            features, feat_lengths = self.diar_model.process_signal(
+                audio_signal=audio_signal.unsqueeze(0),
+                audio_signal_length=torch.tensor([audio_signal.shape[0]]),
+            )
+            self._active.append(
+                _ActiveStream(
+                    stream_id=stream_id,
+                    features=features[0].transpose(0, 1),
+                    feat_length=int(feat_lengths[0]),
+                    audio_duration=audio_signal.shape[0] / self.sample_rate,
+                    start_time=time.perf_counter(),
+                )
+            )
+        new_rows = self._init_state_rows(num_new)
+        self._state = new_rows if self._state is None else self._concat_states([self._state, new_rows])
+
+    def _get_chunk_bounds(self, stream: _ActiveStream):
+        modules = self.diar_model.sortformer_modules
+        subsampling_factor = modules.subsampling_factor
+        start = stream.feat_offset
+        left_offset = min(modules.chunk_left_context * subsampling_factor, start)
+        end = min(start + modules.chunk_len * subsampling_factor, stream.num_frames)
+        right_offset = min(modules.chunk_right_context * subsampling_factor, stream.num_frames - end)
+        return left_offset, end, right_offset
+
+    def _forward_rows(self, rows: List[int], left_offset: int, streaming_state: StreamingSortformerState):
+        """Runs one batched streaming step for the active streams in `rows`, which share `left_offset`"""
+        bounds = [self._get_chunk_bounds(self._active[row]) for row in rows]
+        right_offset = max(right for _, _, right in bounds)
+        chunk_widths = [
+            left_offset + end - self._active[row].feat_offset + right for row, (_, end, right) in zip(rows, bounds)
+        ]
+        feat_dim = self._active[rows[0]].features.shape[1]
+        chunks = self._active[rows[0]].features.new_zeros((len(rows), max(chunk_widths), feat_dim))
+        chunk_lengths = []
+        for idx, (row, (_, end, right)) in enumerate(zip(rows, bounds)):
+            stream = self._active[row]
+            chunks[idx, : chunk_widths[idx]] = stream.features[stream.feat_offset - left_offset : end + right]
+            valid_length = stream.feat_length - stream.feat_offset + left_offset
+            chunk_lengths.append(min(max(valid_length, 0), chunk_widths[idx]))
+
+        n_spk = self.diar_model.sortformer_modules.n_spk
+        streaming_state, chunk_preds = self.diar_model.forward_streaming_step(
+            processed_signal=chunks,
+            processed_signal_length=torch.tensor(chunk_lengths, device=chunks.device),
+            streaming_state=streaming_state,
+            total_preds=chunks.new_zeros((len(rows), 0, n_spk)),
+            left_offset=left_offset,
+            right_offset=right_offset,
+        )
+        chunk_preds = chunk_preds.detach().to('cpu')
+        for idx, (row, (_, end, _)) in enumerate(zip(rows, bounds)):
+            self._active[row].preds.append(chunk_preds[idx])
+            self._active[row].feat_offset = end
+        return streaming_state
+
+    def step(self) -> List[DiarizationStreamResult]:
+        """
+        Fills the free batch slots with queued recordings and advances all the active recordings by one chunk.
+
+        Returns:
+            finished (List[DiarizationStreamResult]): Results of the recordings finished in this step.
+        """
+        with torch.inference_mode():
+            self._admit_pending_streams()
+            if not self._active:
+                return []
+
+            step_start = time.perf_counter()
+            groups = {}
+            for row, stream in enumerate(self._active):
+                groups.setdefault(self._get_chunk_bounds(stream)[0], []).append(row)
+            for left_offset, rows in groups.items():
+                if len(rows) == len(self._active):
+                    self._state = self._forward_rows(rows, left_offset, self._state)
+                else:
+                    row_indices = torch.tensor(rows, device=self._state.fifo.device)
+                    rows_state = self._forward_rows(
+                        rows, left_offset, self._select_state_rows(self._state, row_indices)
+                    )
+                    self._assign_state_rows(self._state, row_indices, rows_state)
+                self._synchronize()
+                latency = time.perf_counter() - step_start
+                for row in rows:
+                    self._active[row].chunk_latencies.append(latency)
+            step_end = time.perf_counter()
+
+            self._num_steps += 1
+            self._num_model_calls += len(groups)
+            self._num_active_rows += len(self._active)
+            self._wall_time += step_end - step_start
+
+            finished, keep = [], []
+            for row, stream in enumerate(self._active):
+                if stream.feat_offset < stream.num_frames:
+                    keep.append(row)
+                    continue
+                output_frames = math.ceil(stream.num_frames / self.diar_model.output_subsampling_factor)
+                result = DiarizationStreamResult(
+                    stream_id=stream.stream_id,
+                    preds=torch.cat(stream.preds, dim=0)[:output_frames],
+                    audio_duration=stream.audio_duration,
+                    chunk_latencies=stream.chunk_latencies,
+                    start_time=stream.start_time,
+                    end_time=step_end,
+                )
+                self.results[stream.stream_id] = result
+                finished.append(result)
+
+            if len(keep) < len(self._active):
+                self._active = [self._active[row] for row in keep]
+                if keep:
+                    self._state = self._select_state_rows(
+                        self._state, torch.tensor(keep, device=self._state.fifo.device)
+                    )
+                else:
+                    self._state = None
+        return finished
+
+    def run(self, audio_signals: Sequence[torch.Tensor]) -> List[DiarizationStreamResult]:
+        """
+        Diarizes the recordings with continuous batching.
+
+        Args:
+            audio_signals (Sequence[torch.Tensor]): Mono audio signals at the sample rate of the model.
+
+        Returns:
+            results (List[DiarizationStreamResult]): Results in the order of `audio_signals`.
+        """
+        stream_ids = [self.add_stream(audio_signal) for audio_signal in audio_signals]
+        while self.has_streams():
+            self.step()
+        return [self.results[stream_id] for stream_id in stream_ids]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Aggregate statistics of the recordings finished so far.
+
+        Returns:
+            stats (Dict[str, float]): total audio duration and wall time of the streaming steps in seconds,
+                aggregate RTFx, mean/max chunk latency in seconds, mean number of active streams per step,
+                and mean number of model calls per step.
+        """
+        latencies = [latency for result in self.results.values() for latency in result.chunk_latencies]
+        audio_duration = sum(result.audio_duration for result in self.results.values())
+        return {
+            'num_streams': len(self.results),
+            'audio_duration': audio_duration,
+            'wall_time': self._wall_time,
+            'rtfx': audio_duration / self._wall_time if self._wall_time > 0 else 0.0,
+            'mean_chunk_latency': float(np.mean(latencies)) if latencies else 0.0,
+            'max_chunk_latency': max(latencies, default=0.0),
+            'mean_active_streams': self._num_active_rows / max(self._num_steps, 1),
+            'mean_model_calls_per_step': self._num_model_calls / max(self._num_steps, 1),
+        }
+
+    def log_summary(self, log_streams: bool = False):
+        """Logs the aggregate statistics and, optionally, the latency of each recording."""
+        if log_streams:
+            for stream_id in sorted(self.results):
+                result = self.results[stream_id]
+                logging.info(
+                    f"Stream {stream_id}: {result.audio_duration:.2f}s audio, {result.num_chunks} chunks, "
+                    f"latency mean {result.mean_latency * 1000:.1f}ms / max {result.max_latency * 1000:.1f}ms, "
+                    f"RTFx {result.rtfx:.2f}"
+                )
+        stats = self.get_stats()
+        logging.info(
+            f"Continuous batching: {stats['num_streams']} streams, {stats['audio_duration']:.2f}s audio in "
+            f"{stats['wall_time']:.2f}s, RTFx {stats['rtfx']:.2f}, chunk latency mean "
+            f"{stats['mean_chunk_latency'] * 1000:.1f}ms / max {stats['max_chunk_latency'] * 1000:.1f}ms, "
+            f"{stats['mean_active_streams']:.2f} active streams and {stats['mean_model_calls_per_step']:.2f} "
+            f"model calls per step"
+        )
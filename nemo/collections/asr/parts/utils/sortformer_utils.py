@@ -298,7 +298,8 @@ def get_prediction_cache_metadata(cfg, diar_model, infer_audio_rttm_dict) -> Dic
         "precision": str(cfg.precision),
         "presort_manifest": bool(cfg.presort_manifest),
         "streaming_mode": bool(diar_model.streaming_mode),
-        "async_streaming": bool(cfg.async_streaming),
+        # continuous batching streams with asynchronous updates and matches per-recording async streaming
+        "async_streaming": bool(cfg.async_streaming or getattr(cfg, "continuous_batching", False)),
         "async_pad_to_max": bool(cfg.async_pad_to_max),
         "async_desync_updates": bool(cfg.async_desync_updates),
         "chunk_len": int(cfg.chunk_len),
@@ -0,0 +1,513 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Storage, scoring and search utilities for speaker embeddings.
+
+- `SpeakerEmbeddingCache`: an on-disk, memory-mapped cache of embeddings keyed by the content hash of the audio file,
+  so that every file is embedded once across verification trials and runs.
+- `score_embedding_pairs`: batched cosine scoring of trial pairs gathered from an embedding matrix.
+- `IVFPQIndex`: a NumPy inverted-file index with product-quantized residuals for approximate nearest-neighbor
+  search over a large number of enrolled speakers.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from nemo.utils import logging
+
+__all__ = ['get_audio_content_hash', 'SpeakerEmbeddingCache', 'score_embedding_pairs', 'IVFPQIndex']
+
+
+def get_audio_content_hash(audio_filepath: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-1 hash of the content of an audio file, so that copies of a file at different paths share a key.
+
+    Args:
+        audio_filepath (str): Path to the audio file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        (str): Hexadecimal digest of the file content.
+    """
+    sha1 = hashlib.sha1()
+    with open(audio_filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+class SpeakerEmbeddingCache:
+    """
+    On-disk cache of speaker embeddings keyed by the content hash of the audio files.
+
+    The embeddings are stored in a memory-mapped `embeddings.npy` array which is grown geometrically, and the keys in
+    `keys.json`, where the position of a key is the row of its embedding. `keys.json` also records the `model_id`
+    the embeddings were computed with, and opening a non-empty cache with a different `model_id` raises an error,
+    so that embeddings of different speaker models are never mixed. A cache directory must only be used by a single
+    writer at a time.
+
+    Args:
+        cache_dir (str): Directory of the cache. Created if it does not exist.
+        initial_capacity (int): Number of rows allocated when the embedding array is created.
+        model_id (str): Identity of the model computing the embeddings (e.g., a hash of its weights and
+            inference settings).
+    """
+
+    EMBEDDINGS_FILENAME = 'embeddings.npy'
+    KEYS_FILENAME = 'keys.json'
+
+    def __init__(self, cache_dir: str, initial_capacity: int = 1024, model_id: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.initial_capacity = max(1, initial_capacity)
+        self.model_id = model_id
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._keys: List[str] = []
+        self._key_to_row = {}
+        self._embs: Optional[np.memmap] = None
+
+        keys_filepath = os.path.join(cache_dir, self.KEYS_FILENAME)
+        if os.path.exists(keys_filepath):
+            with open(keys_filepath, 'r', encoding='utf-8') as f:
+                header = json.load(f)
+            self._keys = header['keys']
+            if self._keys and header.get('model_id') != model_id:
+                raise ValueError(
+                    f"Speaker embedding cache {cache_dir} was created for model_id={header.get('model_id')}, "
+                    f"but model_id={model_id} was requested. Use a separate cache directory for each model."
+                )
+            self._key_to_row = {key: row for row, key in enumerate(self._keys)}
+            if self._keys:
+                self._embs = np.load(os.path.join(cache_dir, self.EMBEDDINGS_FILENAME), mmap_mode='r+')
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_to_row
+
+    @property
+    def emb_dim(self) -> Optional[int]:
+        """Dimension of the cached embeddings, or None if the cache is empty."""
+        return None if self._embs is None else self._embs.shape[1]
+
+    def lookup(self, keys: Iterable[str]) -> np.ndarray:
+        """
+        Get the rows of the given keys, with -1 for the keys which are not in the cache.
+        """
+        return np.array([self._key_to_row.get(key, -1) for key in keys], dtype=np.int64)
+
+    def get(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Gather the embeddings of the given rows into an in-memory array of shape (len(rows), emb_dim).
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if self._embs is None:
+            if rows.size:
+                raise KeyError("Cannot gather embeddings from an empty cache")
+            return np.zeros((0, 0), dtype=np.float32)
+        if rows.size and (rows.min() < 0 or rows.max() >= len(self)):
+            raise KeyError(f"Rows must be in [0, {len(self)}) but got rows in [{rows.min()}, {rows.max()}]")
+        return np.asarray(self._embs[rows])
+
+    def add(self, keys: List[str], embs: np.ndarray) -> np.ndarray:
+        """
+        Add embeddings to the cache. Keys which are already in the cache keep their existing embedding.
+
+        Args:
+            keys (list): Content hashes of the audio files.
+            embs (np.ndarray): Embeddings of shape (len(keys), emb_dim).
+
+        Returns:
+            rows (np.ndarray): Rows of the keys in the cache.
+        """
+        embs = np.asarray(embs, dtype=np.float32)
+        if embs.ndim != 2 or embs.shape[0] != len(keys):
+            raise ValueError(f"Expected embeddings of shape ({len(keys)}, emb_dim) but got {embs.shape}")
+        if self.emb_dim is not None and embs.shape[1] != self.emb_dim:
+            raise ValueError(f"Embedding dimension {embs.shape[1]} does not match the cache dimension {self.emb_dim}")
+
+        new_indices = []
+        for idx, key in enumerate(keys):
+            if key not in self._key_to_row:
+                self._key_to_row[key] = len(self._keys)
+                self._keys.append(key)
+                new_indices.append(idx)
+
+        if new_indices:
+            num_old = len(self._keys) - len(new_indices)
+            self._reserve(len(self._keys), embs.shape[1])
+            self._embs[num_old : len(self._keys)] = embs[new_indices]
+        return self.lookup(keys)
+
+    def get_or_compute(
+        self, audio_files: List[str], embed_fn: Callable[[List[str]], np.ndarray], flush: bool = True
+    ) -> np.ndarray:
+        """
+        Get the cache rows of the given audio files, embedding only the files whose content is not cached yet.
+        Files with identical content are embedded once.
+
+        Args:
+            audio_files (list): Paths to audio files. May contain duplicates.
+            embed_fn (Callable): Function mapping a list of audio filepaths to an array of embeddings of shape
+                (num_files, emb_dim).
+            flush (bool): Whether to write the keys of the new embeddings to disk.
+
+        Returns:
+            rows (np.ndarray): Rows of the audio files in the cache, in the order of `audio_files`.
+        """
+        path_to_key = {path: get_audio_content_hash(path) for path in dict.fromkeys(audio_files)}
+        keys = [path_to_key[path] for path in audio_files]
+
+        missing = {}
+        for path, key in path_to_key.items():
+            if key not in self._key_to_row and key not in missing:
+                missing[key] = path
+
+        if missing:
+            logging.info(f"Computing {len(missing)} speaker embeddings ({len(path_to_key) - len(missing)} cached)")
+            self.add(list(missing.keys()), embed_fn(list(missing.values())))
+            if flush:
+                self.flush()
+        return self.lookup(keys)
+
+    def flush(self):
+        """
+        Write the embeddings and keys of the cache to disk.
+        """
+        if self._embs is not None:
+            self._embs.flush()
+        tmp_filepath = os.path.join(self.cache_dir, self.KEYS_FILENAME + '.tmp')
+        with open(tmp_filepath, 'w', encoding='utf-8') as f:
+            json.dump({'model_id': self.model_id, 'keys': self._keys}, f)
+        os.replace(tmp_filepath, os.path.join(self.cache_dir, self.KEYS_FILENAME))
+
+    def _reserve(self, num_rows: int, emb_dim: int):
+        """
+        Make sure the memory-mapped embedding array has at least `num_rows` rows, doubling its capacity if needed.
+        """
+        capacity = 0 if self._embs is None else self._embs.shape[0]
+        if num_rows <= capacity:
+            return
+
+        new_capacity = max(self.initial_capacity, capacity)
+        while new_capacity < num_rows:
+            new_capacity *= 2
+
+        embs_filepath = os.path.join(self.cache_dir, self.EMBEDDINGS_FILENAME)
+        tmp_filepath = os.path.join(self.cache_dir, 'embeddings.tmp.npy')
+        new_embs = np.lib.format.open_memmap(tmp_filepath, mode='w+', dtype=np.float32, shape=(new_capacity, emb_dim))
+        if self._embs is not None:
+            new_embs[:capacity] = self._embs
+            del self._embs
+        new_embs.flush()
+        del new_embs
+        os.replace(tmp_filepath, embs_filepath)
+        self._embs = np.load(embs_filepath, mmap_mode='r+')
+
+
+def score_embedding_pairs(embs: np.ndarray, pairs: np.ndarray, batch_size: int = 65536) -> np.ndarray:
+    """
+    Score trial pairs with the cosine similarity of their embeddings, mapped to [0, 1] as (cos + 1) / 2.
+    Every embedding is normalized once and the pairs are scored in batches, so repeated files are not recomputed.
+
+    Args:
+        embs (np.ndarray): Embeddings of shape (num_embs, emb_dim).
+        pairs (np.ndarray): Integer array of shape (num_pairs, 2) with the rows of the two embeddings of each pair.
+        batch_size (int): Number of pairs scored at a time.
+
+    Returns:
+        scores (np.ndarray): Scores of shape (num_pairs,).
+    """
+    embs = np.asarray(embs, dtype=np.float32)
+    embs = embs / np.linalg.norm(embs, axis=1, keepdims=True)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+    scores = np.empty(pairs.shape[0], dtype=np.float32)
+    for start in range(0, pairs.shape[0], batch_size):
+        batch = pairs[start : start + batch_size]
+        scores[start : start + batch_size] = np.einsum('ij,ij->i', embs[batch[:, 0]], embs[batch[:, 1]])
+    return (scores + 1) / 2
+
+
+def _kmeans(x: np.ndarray, num_clusters: int, num_iters: int, rng: np.random.Generator, chunk_size: int = 8192):
+    """
+    Lloyd's k-means with squared Euclidean distance. Empty clusters are re-seeded with random points.
+    """
+    centroids = x[rng.choice(x.shape[0], size=num_clusters, replace=False)].copy()
+    for _ in range(num_iters):
+        labels = _nearest_centroids(x, centroids, chunk_size)
+        counts = np.bincount(labels, minlength=num_clusters)
+        nonempty = counts > 0
+        # sum the points of every cluster as contiguous segments of the points sorted by label
+        order = np.argsort(labels, kind='stable')
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+        sums = np.add.reduceat(x[order], starts, axis=0, dtype=np.float64)
+        centroids[nonempty] = (sums / counts[nonempty, None]).astype(np.float32)
+        num_empty = int((~nonempty).sum())
+        if num_empty:
+            centroids[~nonempty] = x[rng.choice(x.shape[0], size=num_empty, replace=False)]
+    return centroids
+
+
+def _nearest_centroids(x: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    """
+    Get the index of the nearest centroid (in squared Euclidean distance) of every row of x, in chunks of rows.
+    """
+    centroid_sq_norms = (centroids**2).sum(axis=1)
+    labels = np.empty(x.shape[0], dtype=np.int64)
+    for start in range(0, x.shape[0], chunk_size):
+        dists = centroid_sq_norms[None, :] - 2 * (x[start : start + chunk_size] @ centroids.T)
+        labels[start : start + chunk_size] = dists.argmin(axis=1)
+    return labels
+
+
+class IVFPQIndex:
+    """
+    Approximate nearest-neighbor index for inner-product (cosine) search over speaker embeddings, implemented in
+    NumPy.
+
+    The embeddings are assigned to `num_lists` coarse k-means centroids (inverted file, IVF), and the residuals to
+    their centroid are compressed with product quantization (PQ) into `num_subquantizers` one-byte codes. A query
+    only scans the `num_probes` lists with the closest centroids, and the inner product with every candidate is
+    approximated as <q, centroid> + sum_m <q_m, codeword_m>, where the <q_m, codeword_m> tables are computed once per
+    query. Memory per enrolled embedding is `num_subquantizers` bytes plus its id.
+
+    Args:
+        num_lists (int): Number of coarse clusters (inverted lists). Clamped to the number of training embeddings.
+        num_subquantizers (int): Number of PQ sub-vectors. Must divide the embedding dimension.
+        num_codewords (int): Number of codewords per sub-quantizer, at most 256. Clamped to the number of training
+            embeddings.
+        num_iters (int): Number of k-means iterations for training the coarse and PQ codebooks.
+        max_train_size (int): Maximum number of embeddings sampled for training.
+        normalize (bool): Whether to length-normalize embeddings and queries, so that inner product is cosine
+            similarity.
+        seed (int): Seed of the random number generator used for training.
+    """
+
+    def __init__(
+        self,
+        num_lists: int = 1024,
+        num_subquantizers: int = 16,
+        num_codewords: int = 256,
+        num_iters: int = 20,
+        max_train_size: int = 65536,
+        normalize: bool = True,
+        seed: int = 0,
+    ):
+        if not 1 <= num_codewords <= 256:
+            raise ValueError(f"num_codewords must be in [1, 256] but got {num_codewords}")
+        self.num_lists = num_lists
+        self.num_subquantizers = num_subquantizers
+        self.num_codewords = num_codewords
+        self.num_iters = num_iters
+        self.max_train_size = max_train_size
+        self.normalize = normalize
+        self.seed = seed
+
+        self.coarse_centroids: Optional[np.ndarray] = None  # (num_lists, emb_dim)
+        self.codebooks: Optional[np.ndarray] = None  # (num_subquantizers, num_codewords, sub_dim)
+
+        self._codes = np.zeros((0, num_subquantizers), dtype=np.uint8)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._list_ids = np.zeros(0, dtype=np.int64)
+        self._list_offsets: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._ids.shape[0]
+
+    @property
+    def is_trained(self) -> bool:
+        return self.coarse_centroids is not None
+
+    def _preprocess(self, embs: np.ndarray) -> np.ndarray:
+        embs = np.asarray(embs, dtype=np.float32)
+        if embs.ndim == 1:
+            embs = embs[None, :]
+        if self.normalize:
+            embs = embs / np.maximum(np.linalg.norm(embs, axis=1, keepdims=True), 1e-12)
+        return embs
+
+    def train(self, embs: np.ndarray):
+        """
+        Train the coarse centroids and the PQ codebooks on (a random sample of) the given embeddings.
+        """
+        embs = self._preprocess(embs)
+        emb_dim = embs.shape[1]
+        if emb_dim % self.num_subquantizers != 0:
+            raise ValueError(
+                f"Embedding dimension {emb_dim} is not divisible by num_subquantizers={self.num_subquantizers}"
+            )
+        rng = np.random.default_rng(self.seed)
+        if embs.shape[0] > self.max_train_size:
+            embs = embs[rng.choice(embs.shape[0], size=self.max_train_size, replace=False)]
+
+        num_lists = min(self.num_lists, embs.shape[0])
+        num_codewords = min(self.num_codewords, embs.shape[0])
+        if num_lists < self.num_lists or num_codewords < self.num_codewords:
+            logging.warning(
+                f"Only {embs.shape[0]} training embeddings: using {num_lists} lists and {num_codewords} codewords"
+            )
+
+        self.coarse_centroids = _kmeans(embs, num_lists, self.num_iters, rng)
+        residuals = embs - self.coarse_centroids[_nearest_centroids(embs, self.coarse_centroids)]
+
+        sub_dim = emb_dim // self.num_subquantizers
+        codebooks = []
+        for m in range(self.num_subquantizers):
+            sub_residuals = np.ascontiguousarray(residuals[:, m * sub_dim : (m + 1) * sub_dim])
+            codebooks.append(_kmeans(sub_residuals, num_codewords, self.num_iters, rng))
+        self.codebooks = np.stack(codebooks)
+
+    def _encode(self, residuals: np.ndarray) -> np.ndarray:
+        sub_dim = self.codebooks.shape[2]
+        codes = np.empty((residuals.shape[0], self.num_subquantizers), dtype=np.uint8)
+        for m in range(self.num_subquantizers):
+            codes[:, m] = _nearest_centroids(
+                np.ascontiguousarray(residuals[:, m * sub_dim : (m + 1) * sub_dim]), self.codebooks[m]
+            )
+        return codes
+
+    def add(self, embs: np.ndarray, ids: Optional[np.ndarray] = None):
+        """
+        Encode and add embeddings to the index. Trains the index on these embeddings if it is not trained yet.
+
+        Args:
+            embs (np.ndarray): Embeddings of shape (num_embs, emb_dim).
+            ids (np.ndarray): Integer ids of the embeddings returned by `search`. Defaults to consecutive ids
+                starting at the current size of the index.
+        """
+        embs = self._preprocess(embs)
+        if not self.is_trained:
+            self.train(embs)
+        if ids is None:
+            ids = np.arange(len(self), len(self) + embs.shape[0], dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.shape[0] != embs.shape[0]:
+            raise ValueError(f"Got {ids.shape[0]} ids for {embs.shape[0]} embeddings")
+
+        list_ids = _nearest_centroids(embs, self.coarse_centroids)
+        codes = self._encode(embs - self.coarse_centroids[list_ids])
+
+        self._codes = np.concatenate([self._codes, codes])
+        self._ids = np.concatenate([self._ids, ids])
+        self._list_ids = np.concatenate([self._list_ids, list_ids])
+        self._list_offsets = None
+
+    def _build_lists(self):
+        """
+        Sort the encoded embeddings by inverted list, so that every list is a contiguous slice.
+        """
+        order = np.argsort(self._list_ids, kind='stable')
+        self._codes, self._ids, self._list_ids = self._codes[order], self._ids[order], self._list_ids[order]
+        self._list_offsets = np.searchsorted(self._list_ids, np.arange(self.coarse_centroids.shape[0] + 1))
+
+    def search(self, queries: np.ndarray, k: int = 1, num_probes: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the approximate k nearest neighbors (largest inner product) of the queries.
+
+        Args:
+            queries (np.ndarray): Query embeddings of shape (num_queries, emb_dim).
+            k (int): Number of neighbors to return.
+            num_probes (int): Number of inverted lists scanned per query. Larger is more accurate and slower.
+
+        Returns:
+            scores (np.ndarray): Approximate inner products of shape (num_queries, k), in decreasing order. Padded
+                with -inf when fewer than k candidates are found.
+            ids (np.ndarray): Ids of the neighbors of shape (num_queries, k), padded with -1.
+        """
+        if not self.is_trained:
+            raise RuntimeError("IVFPQIndex must be trained (or have embeddings added) before searching")
+        if self._list_offsets is None:
+            self._build_lists()
+
+        queries = self._preprocess(queries)
+        num_lists = self.coarse_centroids.shape[0]
+        num_probes = min(num_probes, num_lists)
+        sub_dim = self.codebooks.shape[2]
+        subquantizer_offsets = np.arange(self.num_subquantizers) * self.codebooks.shape[1]
+
+        coarse_scores = queries @ self.coarse_centroids.T
+        probes = np.argpartition(-coarse_scores, num_probes - 1, axis=1)[:, :num_probes]
+        # (num_queries, num_subquantizers, num_codewords) tables of <q_m, codeword_m>
+        lookup_tables = np.einsum(
+            'qmd,mcd->qmc', queries.reshape(queries.shape[0], self.num_subquantizers, sub_dim), self.codebooks
+        )
+
+        out_scores = np.full((queries.shape[0], k), -np.inf, dtype=np.float32)
+        out_ids = np.full((queries.shape[0], k), -1, dtype=np.int64)
+        for q in range(queries.shape[0]):
+            slices = [np.arange(self._list_offsets[list_id], self._list_offsets[list_id + 1]) for list_id in probes[q]]
+            candidates = np.concatenate(slices)
+            if candidates.size == 0:
+                continue
+            flat_table = lookup_tables[q].reshape(-1)
+            scores = coarse_scores[q, self._list_ids[candidates]] + flat_table[
+                self._codes[candidates].astype(np.int64) + subquantizer_offsets
+            ].sum(axis=1)
+
+            top = min(k, candidates.size)
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind='stable')]
+            out_scores[q, :top] = scores[best]
+            out_ids[q, :top] = self._ids[candidates[best]]
+        return out_scores, out_ids
+
+    def save(self, filepath: str):
+        """
+        Save the trained codebooks and the encoded embeddings to a `.npz` file.
+        """
+        if not self.is_trained:
+            raise RuntimeError("Cannot save an untrained IVFPQIndex")
+        np.savez(
+            filepath,
+            coarse_centroids=self.coarse_centroids,
+            codebooks=self.codebooks,
+            codes=self._codes,
+            ids=self._ids,
+            list_ids=self._list_ids,
+            config=np.array(
+                [self.num_lists, self.num_subquantizers, self.num_codewords, self.num_iters, self.max_train_size]
+                + [int(self.normalize), self.seed],
+                dtype=np.int64,
+            ),
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> 'IVFPQIndex':
+        """
+        Load an index saved with `save`.
+        """
+        with np.load(filepath) as data:
+            num_lists, num_subquantizers, num_codewords, num_iters, max_train_size, normalize, seed = data['config']
+            index = cls(
+                num_lists=int(num_lists),
+                num_subquantizers=int(num_subquantizers),
+                num_codewords=int(num_codewords),
+                num_iters=int(num_iters),
+                max_train_size=int(max_train_size),
+                normalize=bool(normalize),
+                seed=int(seed),
+            )
+            index.coarse_centroids = data['coarse_centroids']
+            index.codebooks = data['codebooks']
+            index._codes = data['codes']
+            index._ids = data['ids']
+            index._list_ids = data['list_ids']
+        return index
@@ -483,7 +483,11 @@ def perform_clustering(
         logging.warning("cuda=False, using CPU for eigen decomposition. This might slow down the clustering process.")
         cuda = False
 
-    speaker_clustering = LongFormSpeakerClustering(cuda=cuda)
+    speaker_clustering = LongFormSpeakerClustering(
+        cuda=cuda,
+        use_sparse_affinity=clustering_params.get('use_sparse_affinity', False),
+        sparse_max_neighbors=clustering_params.get('sparse_max_neighbors', 256),
+    )
 
     if clustering_params.get('export_script_module', False):
         speaker_clustering = torch.jit.script(speaker_clustering)
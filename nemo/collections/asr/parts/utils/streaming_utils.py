@@ -729,6 +729,155 @@ class FeatureFrameBufferer:
         return []
 
 
+class FeatureRingBuffer:
+    """
+    Ring buffer of features for a batch of streams, stored in a single preallocated tensor of shape [B, D, T].
+    Appending a frame writes only its columns (instead of shifting the whole buffer), and the buffers
+    in time order are produced with a single gather.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        n_feat: int,
+        buffer_len: int,
+        fill_value: float = 0.0,
+        dtype: torch.dtype = torch.float32,
+        device: torch.device | str = "cpu",
+    ):
+        """
+        Args:
+            batch_size: number of streams
+            n_feat: number of features
+            buffer_len: length of the buffer in frames
+            fill_value: initial value of the features
+            dtype: features dtype
+            device: features device
+        """
+        self.buffer_len = buffer_len
+        self.fill_value = fill_value
+        self.buffer = torch.full([batch_size, n_feat, buffer_len], fill_value, dtype=dtype, device=device)
+        # position of the oldest frame of the buffer, where the next frame will be written
+        self.head = 0
+        self._positions = torch.arange(buffer_len, device=device)
+
+    def reset(self):
+        self.buffer.fill_(self.fill_value)
+        self.head = 0
+
+    def append_(self, frames: torch.Tensor):
+        """
+        Appends the frames to the buffers of all the streams, dropping the oldest frames.
+
+        Args:
+            frames: tensor of shape [B, D, L]
+        """
+        num_frames = frames.shape[-1]
+        if num_frames >= self.buffer_len:
+            self.buffer.copy_(frames[..., num_frames - self.buffer_len :])
+            self.head = 0
+            return
+        end = self.head + num_frames
+        if end <= self.buffer_len:
+            self.buffer[..., self.head : end].copy_(frames)
+        else:
+            split = self.buffer_len - self.head
+            self.buffer[..., self.head :].copy_(frames[..., :split])
+            self.buffer[..., : end - self.buffer_len].copy_(frames[..., split:])
+        self.head = end % self.buffer_len
+
+    def get_ordered(self, out: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """
+        Returns the buffers in time order (oldest frame first) as a tensor of shape [B, D, T],
+        written to `out` if provided.
+        """
+        index = self._positions + self.head
+        index = torch.where(index >= self.buffer_len, index - self.buffer_len, index)
+        return torch.index_select(self.buffer, 2, index, out=out)
+
+
+class RingFeatureFrameBufferer(FeatureFrameBufferer):
+    """
+    FeatureFrameBufferer which keeps the features in a FeatureRingBuffer. Buffers of the consecutive frames of a
+    batch are strided views of the features (no copy per frame), normalized directly into a preallocated
+    (pinned, if CUDA is available) batch tensor of shape [batch_size, n_feat, T].
+
+    `get_buffers_batch` returns this tensor instead of a list of arrays, and it is overwritten by the next call.
+    """
+
+    def __init__(self, asr_model, frame_len=1.6, batch_size=4, total_buffer=4.0, pad_to_buffer_len=True):
+        if not pad_to_buffer_len:
+            raise ValueError("RingFeatureFrameBufferer only supports `pad_to_buffer_len=True`")
+        self.ring_buffer = None
+        super().__init__(
+            asr_model, frame_len=frame_len, batch_size=batch_size, total_buffer=total_buffer, pad_to_buffer_len=True
+        )
+        # the buffers are built from the ring buffer, the arrays of the base class are not used
+        self.buffer = None
+        self.feature_buffer = None
+        self.ring_buffer = FeatureRingBuffer(
+            1, self.n_feat, self.feature_buffer_len, fill_value=self.ZERO_LEVEL_SPEC_DB_VAL
+        )
+        # previous buffer followed by the frames of the batch
+        self._frames = torch.empty([self.n_feat, self.feature_buffer_len + batch_size * self.n_frame_len])
+        # cumulative sums of the features and of their squares, with a leading zero
+        self._sums = torch.zeros(
+            [2, self.n_feat, self.feature_buffer_len + (batch_size - 1) * self.n_frame_len + 1], dtype=torch.float64
+        )
+        self._batch = torch.empty(
+            [batch_size, self.n_feat, self.feature_buffer_len], pin_memory=torch.cuda.is_available()
+        )
+
+    def reset(self):
+        '''
+        Reset frame_history and decoder's state
+        '''
+        self.prev_char = ''
+        self.unmerged = []
+        self.frame_buffers = []
+        self.buffered_len = 0
+        if self.ring_buffer is not None:
+            self.ring_buffer.reset()
+
+    def get_buffers_batch(self):
+        batch_frames = self.get_batch_frames()
+        if len(batch_frames) == 0:
+            return []
+
+        num_frames = len(batch_frames)
+        frame_len, buffer_len = self.n_frame_len, self.feature_buffer_len
+        self.buffered_len += num_frames * frame_len
+
+        frames = self._frames[:, : buffer_len + num_frames * frame_len]
+        self.ring_buffer.get_ordered(out=frames[None, :, :buffer_len])
+        for idx, frame in enumerate(batch_frames):
+            if frame.shape[1] != frame_len:
+                raise ValueError(f"Expected frames with {frame_len} features, got {frame.shape[1]}")
+            start = buffer_len + idx * frame_len
+            frames[:, start : start + frame_len] = torch.as_tensor(frame)
+        self.ring_buffer.append_(frames[None, :, buffer_len:])
+
+        # buffer of the i-th frame is the window of T features ending with it: strided views [num_frames, D, T]
+        features = frames[:, frame_len:]
+        buffers = features.unfold(1, buffer_len, frame_len).transpose(0, 1)
+
+        # mean and std of all the windows from cumulative sums of the features
+        num_features = features.shape[1]
+        sums, squares_sums = self._sums[0, :, : num_features + 1], self._sums[1, :, : num_features + 1]
+        torch.cumsum(features, dim=1, dtype=torch.float64, out=sums[:, 1:])
+        torch.cumsum(features.square(), dim=1, dtype=torch.float64, out=squares_sums[:, 1:])
+        starts = torch.arange(num_frames) * frame_len
+        mean = (sums[:, starts + buffer_len] - sums[:, starts]) / buffer_len
+        var = (squares_sums[:, starts + buffer_len] - squares_sums[:, starts]) / buffer_len - mean * mean
+        mean = mean.t().unsqueeze(-1).float()
+        std = var.clamp_min_(0.0).sqrt_().t().unsqueeze(-1).float()
+
+        batch = self._batch[:num_frames]
+        torch.sub(buffers, mean, out=batch)
+        batch.div_(std + 1e-5)
+        return batch
+
+
 # class for streaming frame-based ASR
 # 1) use reset() method to reset FrameASR's state
 # 2) call transcribe(frame) to do ASR on
@@ -746,14 +895,19 @@ class FrameBatchASR:
         total_buffer=4.0,
         batch_size=4,
         pad_to_buffer_len=True,
+        use_ring_buffer=False,
     ):
         '''
         Args:
           frame_len: frame's duration, seconds
           frame_overlap: duration of overlaps before and after current frame, seconds
           offset: number of symbols to drop for smooth streaming
+          use_ring_buffer: build the buffers with RingFeatureFrameBufferer, without copying the whole buffer
+            for every frame
         '''
-        self.frame_bufferer = FeatureFrameBufferer(
+        self.use_ring_buffer = use_ring_buffer
+        frame_bufferer_cls = RingFeatureFrameBufferer if use_ring_buffer else FeatureFrameBufferer
+        self.frame_bufferer = frame_bufferer_cls(
             asr_model=asr_model,
             frame_len=frame_len,
             batch_size=batch_size,
@@ -824,38 +978,49 @@ class FrameBatchASR:
         frame_buffers = self.frame_bufferer.get_buffers_batch()
 
         while len(frame_buffers) > 0:
-            self.frame_buffers += frame_buffers[:]
-            self.data_layer.set_signal(frame_buffers[:])
-            self._get_batch_preds(keep_logits)
+            if isinstance(frame_buffers, torch.Tensor):
+                # batch of buffers from the ring bufferer, which is overwritten by the next batch
+                feat_signal = frame_buffers.to(self.asr_model.device, non_blocking=True)
+                feat_signal_len = torch.full(
+                    [feat_signal.shape[0]], feat_signal.shape[2], dtype=torch.int64, device=feat_signal.device
+                )
+                self._infer_feature_batch(feat_signal, feat_signal_len, keep_logits)
+            else:
+                self.frame_buffers += frame_buffers[:]
+                self.data_layer.set_signal(frame_buffers[:])
+                self._get_batch_preds(keep_logits)
             frame_buffers = self.frame_bufferer.get_buffers_batch()
 
     @torch.no_grad()
     def _get_batch_preds(self, keep_logits=False):
         device = self.asr_model.device
         for batch in iter(self.data_loader):
-
             feat_signal, feat_signal_len = batch
             feat_signal, feat_signal_len = feat_signal.to(device), feat_signal_len.to(device)
-            forward_outs = self.asr_model(processed_signal=feat_signal, processed_signal_length=feat_signal_len)
+            self._infer_feature_batch(feat_signal, feat_signal_len, keep_logits)
 
-            if len(forward_outs) == 2:  # hybrid ctc rnnt model
-                encoded, encoded_len = forward_outs
-                log_probs = self.asr_model.ctc_decoder(encoder_output=encoded)
-                predictions = log_probs.argmax(dim=-1, keepdim=False)
-            else:
-                log_probs, encoded_len, predictions = forward_outs
-
-            preds = torch.unbind(predictions)
-            for pred in preds:
-                self.all_preds.append(pred.cpu().numpy())
-            if keep_logits:
-                log_probs = torch.unbind(log_probs)
-                for log_prob in log_probs:
-                    self.all_logits.append(log_prob.cpu())
-            else:
-                del log_probs
-            del encoded_len
-            del predictions
+    @torch.no_grad()
+    def _infer_feature_batch(self, feat_signal, feat_signal_len, keep_logits=False):
+        forward_outs = self.asr_model(processed_signal=feat_signal, processed_signal_length=feat_signal_len)
+
+        if len(forward_outs) == 2:  # hybrid ctc rnnt model
+            encoded, encoded_len = forward_outs
+            log_probs = self.asr_model.ctc_decoder(encoder_output=encoded)
+            predictions = log_probs.argmax(dim=-1, keepdim=False)
+        else:
+            log_probs, encoded_len, predictions = forward_outs
+
+        preds = torch.unbind(predictions)
+        for pred in preds:
+            self.all_preds.append(pred.cpu().numpy())
+        if keep_logits:
+            log_probs = torch.unbind(log_probs)
+            for log_prob in log_probs:
+                self.all_logits.append(log_prob.cpu())
+        else:
+            del log_probs
+        del encoded_len
+        del predictions
 
     def transcribe(self, tokens_per_chunk: int, delay: int, keep_logits: bool = False):
         self.infer_logits(keep_logits)
@@ -1021,6 +1186,69 @@ class BatchedFeatureFrameBufferer(FeatureFrameBufferer):
         return []
 
 
+class BatchedRingFeatureFrameBufferer(BatchedFeatureFrameBufferer):
+    """
+    BatchedFeatureFrameBufferer which keeps the features of all the samples in a single FeatureRingBuffer.
+    The buffers are gathered and normalized directly into a preallocated (pinned, if CUDA is available)
+    batch tensor of shape [batch_size, n_feat, T].
+
+    `get_buffers_batch` returns this tensor instead of a list of arrays, and it is overwritten by the next call.
+    """
+
+    def __init__(self, asr_model, frame_len=1.6, batch_size=4, total_buffer=4.0):
+        self.ring_buffer = None
+        super().__init__(asr_model, frame_len=frame_len, batch_size=batch_size, total_buffer=total_buffer)
+        # the buffers are built from the ring buffer, the arrays of the base class are not used
+        self.buffer = None
+        self.feature_buffer = None
+        self.ring_buffer = FeatureRingBuffer(
+            batch_size, self.n_feat, self.feature_buffer_len, fill_value=self.ZERO_LEVEL_SPEC_DB_VAL
+        )
+        self._frames = torch.empty([batch_size, self.n_feat, self.n_frame_len])
+        self._batch = torch.empty(
+            [batch_size, self.n_feat, self.feature_buffer_len], pin_memory=torch.cuda.is_available()
+        )
+
+    def reset(self):
+        '''
+        Reset frame_history and decoder's state
+        '''
+        self.prev_char = ''
+        self.unmerged = []
+        self.frame_buffers = []
+        self.all_frame_reader = [None for _ in range(self.batch_size)]
+        self.signal_end = [False for _ in range(self.batch_size)]
+        self.signal_end_index = [None for _ in range(self.batch_size)]
+        self.buffer_number = 0
+        if self.ring_buffer is not None:
+            self.ring_buffer.reset()
+
+    def get_buffers_batch(self):
+        batch_frames = self.get_batch_frames()
+        if len(batch_frames) == 0:
+            return []
+
+        finished = []
+        for idx, frame in enumerate(batch_frames):
+            if frame is None:
+                finished.append(idx)
+                self._frames[idx].zero_()
+            else:
+                self._frames[idx] = torch.as_tensor(frame)
+        self.ring_buffer.append_(self._frames)
+        if finished:
+            # the buffers of the finished samples are set to zero
+            self.ring_buffer.buffer[finished] = 0.0
+
+        # normalization constants do not depend on the order of the frames in the buffer
+        batch = self.ring_buffer.get_ordered(out=self._batch)
+        mean = batch.mean(dim=2, keepdim=True)
+        batch.sub_(mean)
+        std = batch.square().mean(dim=2, keepdim=True).sqrt_()
+        batch.div_(std + 1e-8)
+        return batch
+
+
 class BatchedFrameASRRNNT(FrameBatchASR):
     """
     Batched implementation of FrameBatchASR for RNNT models, where the batch dimension is independent audio samples.
@@ -1035,6 +1263,7 @@ class BatchedFrameASRRNNT(FrameBatchASR):
         max_steps_per_timestep: int = 5,
         stateful_decoding: bool = False,
         target_lang_id=None,
+        use_ring_buffer: bool = False,
     ):
         '''
         Args:
@@ -1045,6 +1274,8 @@ class BatchedFrameASRRNNT(FrameBatchASR):
             max_steps_per_timestep: Maximum number of tokens (u) to process per acoustic timestep (t).
             stateful_decoding: Boolean whether to enable stateful decoding for preservation of state across buffers.
             target_lang_id: Optional target language ID for multilingual AST models.
+            use_ring_buffer: Boolean whether to build the buffers of all samples with BatchedRingFeatureFrameBufferer,
+                without copying the whole buffers for every frame.
         '''
         super().__init__(asr_model, frame_len=frame_len, total_buffer=total_buffer, batch_size=batch_size)
 
@@ -1071,9 +1302,12 @@ class BatchedFrameASRRNNT(FrameBatchASR):
         if self.target_lang_id is not None:
             logging.info("Using target language ID")
         # OVERRIDES
-        self.frame_bufferer = BatchedFeatureFrameBufferer(
+        self.use_ring_buffer = use_ring_buffer
+        frame_bufferer_cls = BatchedRingFeatureFrameBufferer if use_ring_buffer else BatchedFeatureFrameBufferer
+        self.frame_bufferer = frame_bufferer_cls(
             asr_model=asr_model, frame_len=frame_len, batch_size=batch_size, total_buffer=total_buffer
         )
+        self._feature_batch = None
 
         self.reset()
 
@@ -1092,6 +1326,7 @@ class BatchedFrameASRRNNT(FrameBatchASR):
         self.all_timestamps = [[] for _ in range(self.batch_size)]
         self.previous_hypotheses = None
         self.batch_index_map = {idx: idx for idx in range(self.batch_size)}
+        self._feature_batch = None
 
         self.data_layer = [AudioBuffersDataLayer() for _ in range(self.batch_size)]
         self.data_loader = [
@@ -1118,10 +1353,14 @@ class BatchedFrameASRRNNT(FrameBatchASR):
 
         while len(frame_buffers) > 0:
             # While at least 1 sample has a buffer left to process
-            self.frame_buffers += frame_buffers[:]
+            if isinstance(frame_buffers, torch.Tensor):
+                # batch of buffers of all samples from the ring bufferer
+                self._feature_batch = frame_buffers
+            else:
+                self.frame_buffers += frame_buffers[:]
 
-            for idx, buffer in enumerate(frame_buffers):
-                self.data_layer[idx].set_signal(buffer[:])
+                for idx, buffer in enumerate(frame_buffers):
+                    self.data_layer[idx].set_signal(buffer[:])
 
             self._get_batch_preds()
             frame_buffers = self.frame_bufferer.get_buffers_batch()
@@ -1151,34 +1390,47 @@ class BatchedFrameASRRNNT(FrameBatchASR):
         """
         device = self.asr_model.device
 
-        data_iters = [iter(data_loader) for data_loader in self.data_loader]
+        if self._feature_batch is not None:
+            # buffers of all samples are in a single tensor, select the samples which have not finished
+            new_batch_keys = [idx for idx in range(self.batch_size) if not self.frame_bufferer.signal_end[idx]]
+            if len(new_batch_keys) == 0:
+                return
+            if len(new_batch_keys) == self.batch_size:
+                feat_signal = self._feature_batch.to(device, non_blocking=True)
+            else:
+                feat_signal = self._feature_batch[new_batch_keys].to(device)
+            feat_signal_len = torch.full(
+                [feat_signal.shape[0]], feat_signal.shape[2], dtype=torch.int64, device=feat_signal.device
+            )
+        else:
+            data_iters = [iter(data_loader) for data_loader in self.data_loader]
 
-        feat_signals = []
-        feat_signal_lens = []
+            feat_signals = []
+            feat_signal_lens = []
 
-        new_batch_keys = []
-        # while not all(self.frame_bufferer.signal_end):
-        for idx in range(self.batch_size):
-            if self.frame_bufferer.signal_end[idx]:
-                continue
+            new_batch_keys = []
+            # while not all(self.frame_bufferer.signal_end):
+            for idx in range(self.batch_size):
+                if self.frame_bufferer.signal_end[idx]:
+                    continue
 
-            batch = next(data_iters[idx])
-            feat_signal, feat_signal_len = batch
-            feat_signal, feat_signal_len = feat_signal.to(device), feat_signal_len.to(device)
+                batch = next(data_iters[idx])
+                feat_signal, feat_signal_len = batch
+                feat_signal, feat_signal_len = feat_signal.to(device), feat_signal_len.to(device)
 
-            feat_signals.append(feat_signal)
-            feat_signal_lens.append(feat_signal_len)
+                feat_signals.append(feat_signal)
+                feat_signal_lens.append(feat_signal_len)
 
-            # preserve batch indices
-            new_batch_keys.append(idx)
+                # preserve batch indices
+                new_batch_keys.append(idx)
 
-        if len(feat_signals) == 0:
-            return
+            if len(feat_signals) == 0:
+                return
 
-        feat_signal = torch.cat(feat_signals, 0)
-        feat_signal_len = torch.cat(feat_signal_lens, 0)
+            feat_signal = torch.cat(feat_signals, 0)
+            feat_signal_len = torch.cat(feat_signal_lens, 0)
 
-        del feat_signals, feat_signal_lens
+            del feat_signals, feat_signal_lens
 
         # Handle prompt if needed - check if model supports prompts
         prompt_tensor = None
@@ -1368,6 +1620,7 @@ class BatchedFrameASRTDT(BatchedFrameASRRNNT):
         max_steps_per_timestep: int = 5,
         stateful_decoding: bool = False,
         tdt_search_boundary: int = 4,
+        use_ring_buffer: bool = False,
     ):
         '''
         Args:
@@ -1378,8 +1631,15 @@ class BatchedFrameASRTDT(BatchedFrameASRRNNT):
             max_steps_per_timestep: Maximum number of tokens (u) to process per acoustic timestep (t).
             stateful_decoding: Boolean whether to enable stateful decoding for preservation of state across buffers.
             tdt_search_boundary: The max number of frames that we search between chunks to match the token at boundary.
+            use_ring_buffer: Boolean whether to build the buffers with BatchedRingFeatureFrameBufferer.
         '''
-        super().__init__(asr_model, frame_len=frame_len, total_buffer=total_buffer, batch_size=batch_size)
+        super().__init__(
+            asr_model,
+            frame_len=frame_len,
+            total_buffer=total_buffer,
+            batch_size=batch_size,
+            use_ring_buffer=use_ring_buffer,
+        )
         self.tdt_search_boundary = tdt_search_boundary
 
     def transcribe(
@@ -1470,6 +1730,7 @@ class LongestCommonSubsequenceBatchedFrameASRRNNT(BatchedFrameASRRNNT):
         max_steps_per_timestep: int = 5,
         stateful_decoding: bool = False,
         alignment_basepath: str = None,
+        use_ring_buffer: bool = False,
     ):
         '''
         Args:
@@ -1480,8 +1741,17 @@ class LongestCommonSubsequenceBatchedFrameASRRNNT(BatchedFrameASRRNNT):
             max_steps_per_timestep: Maximum number of tokens (u) to process per acoustic timestep (t).
             stateful_decoding: Boolean whether to enable stateful decoding for preservation of state across buffers.
             alignment_basepath: Str path to a directory where alignments from LCS will be preserved for later analysis.
+            use_ring_buffer: Boolean whether to build the buffers with BatchedRingFeatureFrameBufferer.
         '''
-        super().__init__(asr_model, frame_len, total_buffer, batch_size, max_steps_per_timestep, stateful_decoding)
+        super().__init__(
+            asr_model,
+            frame_len,
+            total_buffer,
+            batch_size,
+            max_steps_per_timestep,
+            stateful_decoding,
+            use_ring_buffer=use_ring_buffer,
+        )
         self.sample_offset = 0
         self.lcs_delay = -1
 
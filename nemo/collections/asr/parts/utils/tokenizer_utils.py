@@ -69,3 +69,17 @@ def define_spe_tokenizer_type(vocabulary: List[str]) -> str:
     if any(token.startswith("##") for token in vocabulary):
         return "wpe"
     return "bpe"
+
+
+def supports_batch_detokenization(tokenizer) -> bool:
+    """
+    Whether `tokenizer.batch_ids_to_text` gives the same texts as the per-hypothesis detokenization of the BPE
+    decoding classes, so that a whole batch of hypotheses can be detokenized with a single call.
+    Holds for aggregate tokenizers and for SentencePiece tokenizers without legacy special tokens.
+    """
+    from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
+    from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer
+
+    if isinstance(tokenizer, AggregateTokenizer):
+        return True
+    return isinstance(tokenizer, SentencePieceTokenizer) and not tokenizer.legacy
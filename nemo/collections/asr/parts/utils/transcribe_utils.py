@@ -20,11 +20,12 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from omegaconf import DictConfig, open_dict
 from tqdm.auto import tqdm
 
-from nemo.collections.asr.metrics.wer import word_error_rate
+from nemo.collections.asr.metrics.wer import batch_edit_distance
 from nemo.collections.asr.models import ASRModel, EncDecMultiTaskModel
 from nemo.collections.asr.parts.utils import manifest_utils, rnnt_utils
 from nemo.collections.asr.parts.utils.streaming_utils import FrameBatchASR, FrameBatchMultiTaskAED
@@ -377,22 +378,20 @@ def prepare_audio_data(cfg: DictConfig) -> Tuple[List[str], bool]:
             return None
 
         audio_key = cfg.get('audio_key', 'audio_filepath')
+        num_workers = cfg.get('manifest_num_workers', 1)
 
-        with open(cfg.dataset_manifest, "rt") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                item = json.loads(line)
-                item[audio_key] = get_full_path(item[audio_key], cfg.dataset_manifest)
-                if item.get("duration") is None and cfg.presort_manifest:
+        # The manifest is parsed once and validated, sorted and rewritten from memory.
+        items = manifest_utils.read_manifest(cfg.dataset_manifest, num_workers=num_workers)
+        if cfg.presort_manifest:
+            for item in items:
+                if item.get("duration") is None:
                     raise ValueError(
-                        f"Requested presort_manifest=True, but line {line} in manifest {cfg.dataset_manifest} \
+                        f"Requested presort_manifest=True, but line {json.dumps(item)} in manifest {cfg.dataset_manifest} \
                             lacks a 'duration' field."
                     )
 
         with NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            for item in read_and_maybe_sort_manifest(cfg.dataset_manifest, try_sort=cfg.presort_manifest):
+            for item in sort_manifest_items(items, try_sort=cfg.presort_manifest):
                 audio_file = get_full_path(audio_file=item[audio_key], manifest_file=cfg.dataset_manifest)
                 item['audio_filepath'] = audio_file
                 filepaths.append(audio_file)
@@ -402,21 +401,31 @@ def prepare_audio_data(cfg: DictConfig) -> Tuple[List[str], bool]:
     return filepaths, sorted_manifest_path
 
 
-def read_and_maybe_sort_manifest(path: str, try_sort: bool = False) -> List[dict]:
+def sort_manifest_items(items: List[dict], try_sort: bool = False) -> List[dict]:
+    """Sorts the manifest items by decreasing duration if duration key is available for every utterance."""
+    if not try_sort or len(items) == 0:
+        return items
+    durations = [item.get("duration") for item in items]
+    if any(duration is None for duration in durations):
+        return items
+    # stable sort, same order as sorted(..., reverse=True)
+    order = np.argsort(-np.asarray(durations, dtype=np.float64), kind='stable')
+    return [items[idx] for idx in order]
+
+
+def read_and_maybe_sort_manifest(path: str, try_sort: bool = False, num_workers: int = 1) -> List[dict]:
     """Sorts the manifest if duration key is available for every utterance."""
-    items = manifest_utils.read_manifest(path)
-    if try_sort and all("duration" in item and item["duration"] is not None for item in items):
-        items = sorted(items, reverse=True, key=lambda item: item["duration"])
-    return items
+    items = manifest_utils.read_manifest(path, num_workers=num_workers)
+    return sort_manifest_items(items, try_sort=try_sort)
 
 
-def restore_transcription_order(manifest_path: str, transcriptions: list) -> list:
-    with open(manifest_path, encoding='utf-8') as f:
-        items = [(idx, json.loads(l)) for idx, l in enumerate(f) if l.strip() != ""]
-    if not all("duration" in item[1] and item[1]["duration"] is not None for item in items):
+def restore_transcription_order(manifest_path: str, transcriptions: list, num_workers: int = 1) -> list:
+    durations = manifest_utils.read_manifest_columns(manifest_path, keys=["duration"], num_workers=num_workers)[
+        "duration"
+    ]
+    if durations.dtype != np.float64 or np.isnan(durations).any():
         return transcriptions
-    new2old = [item[0] for item in sorted(items, reverse=True, key=lambda it: it[1]["duration"])]
-    del items  # free up some memory
+    new2old = np.argsort(-durations, kind='stable').tolist()
     is_list = isinstance(transcriptions[0], list)
     if is_list:
         transcriptions = list(zip(*transcriptions))
@@ -585,6 +594,7 @@ def compute_metrics_per_sample(
     metrics: List[str] = ["wer"],
     punctuation_marks: List[str] = [".", ",", "?"],
     output_manifest_path: str = None,
+    num_workers: int = 1,
 ) -> dict:
     '''
     Computes metrics per sample for given manifest
@@ -600,6 +610,7 @@ def compute_metrics_per_sample(
         punctuation_marks: list[str], Optional - list of punctuation marks for computing
             punctuation error rate ([".", ",", "?"] by default).
         output_manifest_path: str, Optional - path where .json manifest with calculated metrics will be saved.
+        num_workers: int, Optional - number of processes used to align hypotheses with references (1 by default).
 
     Returns:
         samples: dict - Dict of samples with calculated metrics
@@ -637,17 +648,26 @@ def compute_metrics_per_sample(
 
         logging.info(f"Computing {', '.join(metrics)} per sample")
 
-        for sample in tqdm(samples):
-            reference = sample[reference_field]
-            hypothesis = sample[hypothesis_field]
+        references = [sample[reference_field] for sample in samples]
+        hypotheses = [sample[hypothesis_field] for sample in samples]
+        # error rates of all the samples are computed at once, inf if the reference is empty
+        error_rates = {}
+        for metric, enabled in (("wer", use_wer), ("cer", use_cer)):
+            if enabled:
+                measures = batch_edit_distance(
+                    hypotheses, references, use_cer=metric == "cer", num_workers=num_workers
+                )
+                ref_len = measures['ref_len']
+                error_rates[metric] = np.where(
+                    ref_len > 0, measures['total'] / np.maximum(ref_len, 1), float('inf')
+                ).tolist()
 
-            if use_wer:
-                sample_wer = word_error_rate(hypotheses=[hypothesis], references=[reference], use_cer=False)
-                sample["wer"] = round(100 * sample_wer, 2)
+        for idx, sample in enumerate(tqdm(samples)):
+            reference = references[idx]
+            hypothesis = hypotheses[idx]
 
-            if use_cer:
-                sample_cer = word_error_rate(hypotheses=[hypothesis], references=[reference], use_cer=True)
-                sample["cer"] = round(100 * sample_cer, 2)
+            for metric, rates in error_rates.items():
+                sample[metric] = round(100 * rates[idx], 2)
 
             if use_punct_er:
                 operation_amounts, substitution_amounts, punctuation_rates = oper_obj.compute(
@@ -17,12 +17,11 @@ import json
 import math
 import multiprocessing
 import os
-import shutil
 from dataclasses import dataclass
 from itertools import repeat
 from math import ceil, floor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import librosa
 import numpy as np
@@ -53,6 +52,9 @@ from nemo.utils.dependency import import_optional_dependency
 This file contains all the utility functions required for voice activity detection.
 """
 
+# Upper bound of padded frames per batch for the batched VAD post-processing of prediction files.
+VAD_BATCH_MAX_FRAMES = 1_000_000
+
 
 @dataclass
 class PostProcessingParams:
@@ -306,7 +308,7 @@ def generate_overlap_vad_seq(
     Generate predictions with overlapping input windows/segments.
     Then a smoothing filter is applied to decide the label for a frame spanned by multiple windows.
     Two common smoothing filters are supported: majority vote (median) and average (mean).
-    This function uses multiprocessing to speed up.
+    The files are smoothed in length-sorted batches with generate_overlap_vad_seq_batch.
     Args:
         frame_pred_dir (str): Directory of frame prediction file to be processed.
         smoothing_method (str): median or mean smoothing filter.
@@ -314,7 +316,7 @@ def generate_overlap_vad_seq(
         window_length_in_sec (float): length of window for generating the frame.
         shift_length_in_sec (float): amount of shift of window for generating the frame.
         out_dir (str): directory of generated predictions.
-        num_workers(float): number of process for multiprocessing
+        num_workers(float): number of processes for loading the frame prediction files
     Returns:
         overlap_out_dir(str): directory of the generated predictions.
     """
@@ -334,25 +336,16 @@ def generate_overlap_vad_seq(
         "overlap": overlap,
         "window_length_in_sec": window_length_in_sec,
         "shift_length_in_sec": shift_length_in_sec,
-        "out_dir": overlap_out_dir,
-        "smoothing_method": smoothing_method,
     }
-    if num_workers is not None and num_workers > 1:
-        with multiprocessing.Pool(processes=num_workers) as p:
-            inputs = zip(frame_filepathlist, repeat(per_args))
-            # Force-consume ``imap`` so the worker pool actually runs each task;
-            # the per-file results are written to disk by the worker, not returned.
-            for _ in tqdm(
-                p.imap(generate_overlap_vad_seq_per_file_star, inputs),
-                total=len(frame_filepathlist),
-                desc='generating preds',
-                leave=True,
-            ):
-                pass
-
-    else:
-        for frame_filepath in tqdm(frame_filepathlist, desc='generating preds', leave=False):
-            generate_overlap_vad_seq_per_file(frame_filepath, per_args)
+    names, frame_list = load_vad_frame_pred_list(frame_filepathlist, num_workers=num_workers)
+    for frames, lengths, batch_names in tqdm(
+        iter_vad_frame_pred_batches(names, frame_list), desc='generating preds', leave=False
+    ):
+        preds, pred_lengths = generate_overlap_vad_seq_batch(frames, lengths, per_args, smoothing_method)
+        for name, pred, pred_length in zip(batch_names, preds, pred_lengths.tolist()):
+            overlap_filepath = os.path.join(overlap_out_dir, name + "." + smoothing_method)
+            with open(overlap_filepath, "w", encoding='utf-8') as f:
+                f.write("".join(f"{value:.4f}\n" for value in pred[:pred_length].tolist()))
 
     return overlap_out_dir
 
@@ -460,6 +453,138 @@ def generate_overlap_vad_seq_per_file(frame_filepath: str, per_args: dict) -> st
     return overlap_filepath
 
 
+def load_vad_frame_pred_list(
+    pred_filepaths: List[str], num_workers: Optional[int] = None
+) -> Tuple[List[str], List[torch.Tensor]]:
+    """
+    Load frame level prediction files.
+
+    Args:
+        pred_filepaths (list): paths of the prediction files (one prediction per line).
+        num_workers (int): number of processes for parsing the files, loaded in the calling process if not > 1.
+    Returns:
+        names (list): file names without extension.
+        frame_list (list): predictions of each file.
+    """
+    if num_workers is not None and num_workers > 1 and len(pred_filepaths) > 1:
+        with multiprocessing.Pool(processes=num_workers) as p:
+            loaded = p.map(load_tensor_from_file, pred_filepaths)
+    else:
+        loaded = [load_tensor_from_file(filepath) for filepath in pred_filepaths]
+    return [name for _, name in loaded], [frame for frame, _ in loaded]
+
+
+def iter_vad_frame_pred_batches(
+    names: List[str], frame_list: List[torch.Tensor], max_frames_per_batch: int = VAD_BATCH_MAX_FRAMES
+) -> Iterator[Tuple[torch.Tensor, torch.Tensor, List[str]]]:
+    """
+    Group frame predictions sorted by length into padded batches of at most `max_frames_per_batch` frames
+    (padding included), so that the batched post-processing of many long files runs in bounded memory.
+
+    Yields:
+        frames (torch.Tensor): padded predictions (batch_size, max_num_frames).
+        lengths (torch.Tensor): number of predictions of each file (batch_size,).
+        names (list): file names of the batch.
+    """
+    order = sorted(range(len(frame_list)), key=lambda idx: len(frame_list[idx]))
+    batch: List[int] = []
+    for idx in order + [None]:
+        # files are sorted by length, so the current one sets the padded length of the batch
+        if batch and (idx is None or (len(batch) + 1) * len(frame_list[idx]) > max_frames_per_batch):
+            frames = torch.nn.utils.rnn.pad_sequence([frame_list[i] for i in batch], batch_first=True)
+            lengths = torch.tensor([len(frame_list[i]) for i in batch], dtype=torch.long)
+            yield frames, lengths, [names[i] for i in batch]
+            batch = []
+        if idx is not None:
+            batch.append(idx)
+
+
+def load_vad_frame_preds(
+    pred_filepaths: List[str], num_workers: Optional[int] = None
+) -> Tuple[List[str], torch.Tensor, torch.Tensor]:
+    """
+    Load frame level prediction files into one padded tensor batch.
+
+    Args:
+        pred_filepaths (list): paths of the prediction files (one prediction per line).
+        num_workers (int): number of processes for parsing the files, loaded in the calling process if not > 1.
+    Returns:
+        names (list): file names without extension, in the order of the batch.
+        frames (torch.Tensor): padded predictions (num_files, max_num_frames).
+        lengths (torch.Tensor): number of predictions of each file (num_files,).
+    """
+    names, frame_list = load_vad_frame_pred_list(pred_filepaths, num_workers=num_workers)
+    if len(frame_list) == 0:
+        return names, torch.empty(0, 0), torch.empty(0, dtype=torch.long)
+    lengths = torch.tensor([len(frame) for frame in frame_list], dtype=torch.long)
+    frames = torch.nn.utils.rnn.pad_sequence(frame_list, batch_first=True)
+    return names, frames, lengths
+
+
+def generate_overlap_vad_seq_batch(
+    frames: torch.Tensor, lengths: torch.Tensor, per_args: Dict[str, float], smoothing_method: str
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched in-memory counterpart of generate_overlap_vad_seq_per_tensor. All files are smoothed at once:
+    the predictions of the overlapping windows spanning each output frame are gathered into a
+    (num_files, num_output_frames, max_windows_per_frame) tensor and reduced with mean or median.
+
+    Args:
+        frames (torch.Tensor): padded frame predictions (num_files, max_num_frames).
+        lengths (torch.Tensor): number of frame predictions of each file (num_files,).
+        per_args (dict): overlap, window_length_in_sec, shift_length_in_sec and optional frame_len.
+        smoothing_method (str): median or mean smoothing filter.
+    Returns:
+        preds (torch.Tensor): padded smoothed predictions (num_files, max_num_frames * shift).
+        pred_lengths (torch.Tensor): number of smoothed predictions of each file (num_files,).
+    """
+    if smoothing_method not in ('mean', 'median'):
+        raise ValueError("smoothing_method should be either mean or median")
+
+    overlap = per_args['overlap']
+    frame_len = per_args.get('frame_len', 0.01)
+    shift = int(per_args['shift_length_in_sec'] / frame_len)  # number of units of shift
+    seg = int((per_args['window_length_in_sec'] / frame_len + 1))  # number of units of each window/segment
+    jump_on_target = int(seg * (1 - overlap))  # jump on target generated sequence
+    jump_on_frame = int(jump_on_target / shift)  # jump on input frame sequence
+    if jump_on_frame < 1:
+        raise ValueError(
+            f"Your input makes jump_on_frame={jump_on_frame} < 1 which is invalid because it cannot jump and will "
+            "stuck. Please try different window_length_in_sec, shift_length_in_sec and overlap choices."
+        )
+
+    device = frames.device
+    window_step = jump_on_frame * shift  # distance between the targets of two consecutive windows
+    max_windows = (seg + window_step - 1) // window_step
+    pred_lengths = lengths * shift
+    window_preds = frames[:, ::jump_on_frame]
+    num_windows = (lengths + jump_on_frame - 1) // jump_on_frame
+
+    # Candidate windows of each target position, ordered from the latest to the earliest one
+    positions = torch.arange(frames.shape[1] * shift, device=device)
+    window_idx = (positions // window_step).unsqueeze(1) - torch.arange(max_windows, device=device).unsqueeze(0)
+    valid = (window_idx >= 0) & (window_idx * window_step + seg > positions.unsqueeze(1))
+    valid = valid.unsqueeze(0) & (window_idx.unsqueeze(0) < num_windows.view(-1, 1, 1))
+    valid = valid & (positions.view(1, -1, 1) < pred_lengths.view(-1, 1, 1))
+    window_idx = window_idx.clamp(min=0, max=max(window_preds.shape[1] - 1, 0))
+    gathered = window_preds[:, window_idx].masked_fill(~valid, float('nan'))
+
+    if smoothing_method == 'mean':
+        preds = gathered.nansum(dim=-1) / valid.sum(dim=-1)
+    else:
+        preds = torch.nanquantile(gathered, q=0.5, dim=-1)
+
+    # The positions covered by at least one window form a prefix of each sequence, the rest of the sequence
+    # takes the last smoothed prediction.
+    in_sequence = positions.unsqueeze(0) < pred_lengths.unsqueeze(1)
+    covered = valid.any(dim=-1)
+    last_covered = (covered.sum(dim=1) - 1).clamp(min=0)
+    last_preds = preds.gather(1, last_covered.unsqueeze(1))
+    preds = torch.where(covered, preds, last_preds)
+    preds = preds.masked_fill(~in_sequence, 0.0)
+    return preds, pred_lengths
+
+
 @torch.jit.script
 def merge_overlap_segment(segments: torch.Tensor) -> torch.Tensor:
     """
@@ -745,20 +870,27 @@ def generate_vad_segment_table_per_file(pred_filepath: str, per_args: dict) -> s
     out_dir, per_args_float = prepare_gen_segment_table(sequence, per_args)
 
     preds = generate_vad_segment_table_per_tensor(sequence, per_args_float)
-    ext = ".rttm" if per_args.get("use_rttm", False) else ".txt"
+    return write_vad_segment_table(preds, name, out_dir, use_rttm=per_args.get("use_rttm", False))
+
+
+def write_vad_segment_table(preds: torch.Tensor, name: str, out_dir: str, use_rttm: bool = False) -> str:
+    """
+    Write a speech segment table [start, end, duration] to `out_dir`, as a rttm file or a rttm-like table.
+    """
+    ext = ".rttm" if use_rttm else ".txt"
     save_name = name + ext
     save_path = os.path.join(out_dir, save_name)
 
     if preds.shape[0] == 0:
         with open(save_path, "w", encoding='utf-8') as fp:
-            if per_args.get("use_rttm", False):
+            if use_rttm:
                 fp.write("SPEAKER <NA> 1 0 0 <NA> <NA> speech <NA> <NA>\n")
             else:
                 fp.write("0 0 speech\n")
     else:
         with open(save_path, "w", encoding='utf-8') as fp:
             for i in preds:
-                if per_args.get("use_rttm", False):
+                if use_rttm:
                     fp.write(f"SPEAKER {name} 1 {i[0]:.4f} {i[2]:.4f} <NA> <NA> speech <NA> <NA>\n")
                 else:
                     fp.write(f"{i[0]:.4f} {i[2]:.4f} speech\n")
@@ -785,9 +917,11 @@ def generate_vad_segment_table(
         See details in binarization and filtering.
         frame_length_in_sec (float): frame length.
         out_dir (str): output dir of generated table/csv file.
-        num_workers(float): number of process for multiprocessing
+        num_workers(float): number of processes for loading the prediction files
     Returns:
         out_dir(str): directory of the generated table.
+
+    The files are post-processed in length-sorted batches with generate_vad_segment_table_batch.
     """
 
     suffixes = ("frame", "mean", "median")
@@ -803,27 +937,14 @@ def generate_vad_segment_table(
     if not os.path.exists(out_dir):
         os.mkdir(out_dir)
 
-    per_args = {
-        "frame_length_in_sec": frame_length_in_sec,
-        "out_dir": out_dir,
-        "use_rttm": use_rttm,
-    }
-    per_args = {**per_args, **postprocessing_params}
-    num_workers = None
-    if num_workers is not None and num_workers > 1:
-        with multiprocessing.Pool(num_workers) as p:
-            inputs = zip(vad_pred_filepath_list, repeat(per_args))
-            list(
-                tqdm(
-                    p.imap(generate_vad_segment_table_per_file_star, inputs),
-                    total=len(vad_pred_filepath_list),
-                    desc='creating speech segments',
-                    leave=True,
-                )
-            )
-    else:
-        for vad_pred_filepath in tqdm(vad_pred_filepath_list, desc='creating speech segments', leave=True):
-            generate_vad_segment_table_per_file(vad_pred_filepath, per_args)
+    per_args = {"frame_length_in_sec": frame_length_in_sec, **postprocessing_params}
+    names, frame_list = load_vad_frame_pred_list(vad_pred_filepath_list, num_workers=num_workers)
+    for sequences, lengths, batch_names in tqdm(
+        iter_vad_frame_pred_batches(names, frame_list), desc='creating speech segments', leave=True
+    ):
+        tables = generate_vad_segment_table_batch(sequences, lengths, per_args)
+        for name, table in zip(batch_names, tables):
+            write_vad_segment_table(table, name, out_dir, use_rttm=use_rttm)
 
     return out_dir
 
@@ -835,6 +956,219 @@ def generate_vad_segment_table_per_file_star(args):
     return generate_vad_segment_table_per_file(*args)
 
 
+def cal_vad_onset_offset_batch(
+    scale: str, onset: float, offset: float, sequences: torch.Tensor, lengths: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched counterpart of cal_vad_onset_offset. Returns the onset and offset thresholds of each file.
+    """
+    num_files = sequences.shape[0]
+    if scale == "absolute":
+        onsets = torch.full((num_files,), onset, dtype=sequences.dtype, device=sequences.device)
+        offsets = torch.full((num_files,), offset, dtype=sequences.dtype, device=sequences.device)
+        return onsets, offsets
+
+    in_sequence = torch.arange(sequences.shape[1], device=sequences.device).unsqueeze(0) < lengths.unsqueeze(1)
+    if scale == "relative":
+        mini = sequences.masked_fill(~in_sequence, float('inf')).min(dim=1)[0]
+        maxi = sequences.masked_fill(~in_sequence, float('-inf')).max(dim=1)[0]
+    elif scale == "percentile":
+        sorted_sequences = sequences.masked_fill(~in_sequence, float('inf')).sort(dim=1)[0]
+        mini_idx = torch.ceil(lengths.double() * 1 / 100).long() - 1
+        maxi_idx = torch.ceil(lengths.double() * 99 / 100).long() - 1
+        mini = sorted_sequences.gather(1, mini_idx.unsqueeze(1)).squeeze(1)
+        maxi = sorted_sequences.gather(1, maxi_idx.unsqueeze(1)).squeeze(1)
+    else:
+        raise ValueError(f"Unknown scale {scale}, should be either absolute, relative or percentile")
+    return mini + onset * (maxi - mini), mini + offset * (maxi - mini)
+
+
+def merge_overlap_segment_batch(segments: torch.Tensor, file_idx: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched counterpart of merge_overlap_segment for the segments of multiple files.
+
+    Args:
+        segments (torch.Tensor): speech segments [start, end] of all files (num_segments, 2).
+        file_idx (torch.Tensor): index of the file each segment belongs to (num_segments,).
+    Returns:
+        segments (torch.Tensor): merged segments sorted by file and start time.
+        file_idx (torch.Tensor): index of the file each merged segment belongs to.
+    """
+    if segments.shape[0] < 2:
+        return segments, file_idx
+    order = torch.sort(segments[:, 0], stable=True)[1]
+    order = order[torch.sort(file_idx[order], stable=True)[1]]
+    segments, file_idx = segments[order], file_idx[order]
+    merge_boundary = (segments[:-1, 1] >= segments[1:, 0]) & (file_idx[:-1] == file_idx[1:])
+    head_padded = torch.nn.functional.pad(merge_boundary, [1, 0], mode='constant', value=False)
+    tail_padded = torch.nn.functional.pad(merge_boundary, [0, 1], mode='constant', value=False)
+    merged = torch.stack((segments[~head_padded, 0], segments[~tail_padded, 1]), dim=1)
+    return merged, file_idx[~head_padded]
+
+
+def binarization_batch(
+    sequences: torch.Tensor,
+    lengths: torch.Tensor,
+    onsets: torch.Tensor,
+    offsets: torch.Tensor,
+    per_args: Dict[str, float],
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched in-memory counterpart of binarization. The hysteresis state of all files is computed at once
+    and the resulting speech segments are returned as one flat tensor with the file index of each segment.
+
+    Args:
+        sequences (torch.Tensor): padded frame level predictions (num_files, max_num_frames).
+        lengths (torch.Tensor): number of predictions of each file (num_files,).
+        onsets (torch.Tensor): onset threshold of each file (num_files,), see cal_vad_onset_offset_batch.
+        offsets (torch.Tensor): offset threshold of each file (num_files,).
+        per_args:
+            pad_onset (float): adding durations before each speech segment
+            pad_offset (float): adding durations after each speech segment;
+            frame_length_in_sec (float): length of frame.
+    Returns:
+        speech_segments (torch.Tensor): speech segments [start, end] of all files (num_segments, 2).
+        file_idx (torch.Tensor): index of the file each segment belongs to (num_segments,).
+    """
+    frame_length_in_sec = per_args.get('frame_length_in_sec', 0.01)
+    pad_onset = per_args.get('pad_onset', 0.0)
+    pad_offset = per_args.get('pad_offset', 0.0)
+    device = sequences.device
+    num_files, num_frames = sequences.shape
+    onsets, offsets = onsets.unsqueeze(1), offsets.unsqueeze(1)
+
+    # Speech state of each frame: a frame above onset (below offset) switches a non-speech (speech) state.
+    # If onset >= offset, the state only depends on the last frame outside of [offset, onset].
+    # Otherwise, the frames within (onset, offset) toggle the state.
+    force_on = torch.where(onsets >= offsets, sequences > onsets, sequences >= offsets)
+    force_off = torch.where(onsets >= offsets, sequences < offsets, sequences <= onsets)
+    toggle = (onsets < offsets) & (sequences > onsets) & (sequences < offsets)
+    positions = torch.arange(1, num_frames + 1, device=device).expand(num_files, -1)
+    last_reset = torch.cummax(torch.where(force_on | force_off, positions, torch.zeros_like(positions)), dim=1)[0]
+    zeros = torch.zeros(num_files, 1, dtype=torch.long, device=device)
+    reset_states = torch.cat([zeros, force_on.long()], dim=1).gather(1, last_reset)
+    toggle_prefix = torch.cat([zeros, torch.cumsum(toggle.long(), dim=1)], dim=1)
+    toggles_since_reset = toggle_prefix.gather(1, positions) - toggle_prefix.gather(1, last_reset)
+    speech = torch.logical_xor(reset_states.bool(), toggles_since_reset.remainder(2).bool())
+    speech = speech & (positions <= lengths.unsqueeze(1))
+
+    changes = torch.diff(torch.nn.functional.pad(speech.long(), [1, 1]), dim=1)
+    file_idx, start_frames = torch.nonzero(changes > 0, as_tuple=True)
+    end_frames = torch.nonzero(changes < 0, as_tuple=True)[1]
+
+    # Follow the float64 arithmetic of `binarization`; a segment lasting until the end of the file ends at the
+    # last frame, and only segments closed by a non-speech frame are checked for a positive duration.
+    starts = torch.clamp(start_frames.double() * frame_length_in_sec - pad_onset, min=0.0)
+    until_end = end_frames == lengths[file_idx]
+    ends = torch.where(until_end, end_frames - 1, end_frames).double() * frame_length_in_sec + pad_offset
+    keep = until_end | (ends > starts)
+    speech_segments = torch.stack((starts[keep], ends[keep]), dim=1).float()
+    return merge_overlap_segment_batch(speech_segments, file_idx[keep])
+
+
+def filtering_batch(
+    speech_segments: torch.Tensor, file_idx: torch.Tensor, per_args: Dict[str, float]
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched counterpart of filtering for the speech segments of multiple files from binarization_batch.
+
+    Args:
+        speech_segments (torch.Tensor): speech segments [start, end] of all files sorted by file and start time.
+        file_idx (torch.Tensor): index of the file each segment belongs to.
+        per_args:
+            min_duration_on (float): Threshold for short speech segment deletion.
+            min_duration_off (float): Threshold for small non-speech deletion.
+            filter_speech_first (float): Whether to perform short speech segment deletion first. Use 1.0 to
+                represent True.
+    Returns:
+        speech_segments (torch.Tensor): filtered speech segments sorted by file and start time.
+        file_idx (torch.Tensor): index of the file each segment belongs to.
+    """
+    min_duration_on = per_args.get('min_duration_on', 0.0)
+    min_duration_off = per_args.get('min_duration_off', 0.0)
+    filter_speech_first = per_args.get('filter_speech_first', 1.0)
+
+    def _filter_speech(segments: torch.Tensor, idx: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        keep = segments[:, 1] - segments[:, 0] >= min_duration_on
+        return segments[keep], idx[keep]
+
+    def _fill_short_gaps(segments: torch.Tensor, idx: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        gaps = torch.stack((segments[:-1, 1], segments[1:, 0]), dim=1)
+        short_gaps = (idx[:-1] == idx[1:]) & (gaps[:, 1] - gaps[:, 0] < min_duration_off)
+        return merge_overlap_segment_batch(
+            torch.cat((segments, gaps[short_gaps])), torch.cat((idx, idx[:-1][short_gaps]))
+        )
+
+    if filter_speech_first == 1.0:
+        if min_duration_on > 0.0:
+            speech_segments, file_idx = _filter_speech(speech_segments, file_idx)
+        if min_duration_off > 0.0:
+            speech_segments, file_idx = _fill_short_gaps(speech_segments, file_idx)
+    else:
+        if min_duration_off > 0.0:
+            speech_segments, file_idx = _fill_short_gaps(speech_segments, file_idx)
+        if min_duration_on > 0.0:
+            speech_segments, file_idx = _filter_speech(speech_segments, file_idx)
+    return speech_segments, file_idx
+
+
+def segments_to_vad_tables(
+    speech_segments: torch.Tensor, file_idx: torch.Tensor, num_files: int
+) -> List[torch.Tensor]:
+    """
+    Split the speech segments of multiple files into per-file tables in the format of
+    generate_vad_segment_table_per_tensor, i.e. rows of [start, end, duration].
+    """
+    UNIT_FRAME_LEN = 0.01
+
+    tables = []
+    counts = torch.bincount(file_idx, minlength=num_files).tolist()
+    for segments in torch.split(speech_segments, counts):
+        if segments.shape[0] == 0:
+            tables.append(torch.empty(0))
+            continue
+        segments, _ = torch.sort(segments, 0)
+        dur = segments[:, 1:2] - segments[:, 0:1] + UNIT_FRAME_LEN
+        tables.append(torch.column_stack((segments, dur)))
+    return tables
+
+
+def generate_vad_segment_table_batch(
+    sequences: torch.Tensor, lengths: torch.Tensor, per_args: Dict[str, Any]
+) -> List[torch.Tensor]:
+    """
+    Batched in-memory counterpart of generate_vad_segment_table_per_file without reading and writing files:
+    binarization and filtering are applied to all files at once.
+
+    Args:
+        sequences (torch.Tensor): padded frame level predictions (num_files, max_num_frames).
+        lengths (torch.Tensor): number of predictions of each file (num_files,).
+        per_args (dict): postprocessing parameters and frame_length_in_sec, see binarization and filtering.
+    Returns:
+        tables (list): speech segment table [start, end, duration] of each file, empty tensor if no speech.
+    """
+    onsets, offsets = cal_vad_onset_offset_batch(
+        per_args.get('scale', 'absolute'), per_args['onset'], per_args['offset'], sequences, lengths
+    )
+    per_args_float = _get_float_postprocessing_params(per_args)
+    speech_segments, file_idx = binarization_batch(sequences, lengths, onsets, offsets, per_args_float)
+    speech_segments, file_idx = filtering_batch(speech_segments, file_idx, per_args_float)
+    return segments_to_vad_tables(speech_segments, file_idx, sequences.shape[0])
+
+
+def _get_float_postprocessing_params(per_args: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Keep the numerical postprocessing parameters, with `filter_speech_first` cast to 1.0/0.0.
+    """
+    per_args_float: Dict[str, float] = {}
+    for key, value in per_args.items():
+        if key == 'filter_speech_first':
+            per_args_float[key] = 1.0 if value else 0.0
+        elif type(value) in (float, int, np.float64, np.int64):
+            per_args_float[key] = float(value)
+    return per_args_float
+
+
 def vad_construct_supervisions_per_file(
     vad_table_filepath: str, groundtruth_RTTM_file: str
 ) -> Tuple[List[SupervisionSegment], List[SupervisionSegment]]:
@@ -852,6 +1186,21 @@ def vad_construct_supervisions_per_file(
     """
 
     pred = pd.read_csv(vad_table_filepath, sep=" ", header=None)
+    reference = load_vad_reference_supervisions(groundtruth_RTTM_file)
+    rec_id = os.path.splitext(os.path.basename(groundtruth_RTTM_file))[0]
+
+    hypothesis: List[SupervisionSegment] = []
+    for _index, row in pred.iterrows():
+        start = float(row[0])
+        end = start + float(row[1])
+        hypothesis.append(make_diar_segment(start, end, "Speech", recording_id=rec_id))
+    return reference, hypothesis
+
+
+def load_vad_reference_supervisions(groundtruth_RTTM_file: str) -> List[SupervisionSegment]:
+    """
+    Load the groundtruth rttm file as a list of :class:`lhotse.SupervisionSegment` for VAD evaluation.
+    """
     label = pd.read_csv(groundtruth_RTTM_file, sep=" ", delimiter=None, header=None)
     label = label.rename(columns={3: "start", 4: "dur", 7: "speaker"})
 
@@ -861,13 +1210,21 @@ def vad_construct_supervisions_per_file(
         start = float(row['start'])
         end = start + float(row['dur'])
         reference.append(make_diar_segment(start, end, str(row['speaker']), recording_id=rec_id))
+    return reference
 
+
+def vad_table_to_supervisions(table: torch.Tensor, rec_id: str) -> List[SupervisionSegment]:
+    """
+    Convert a speech segment table from generate_vad_segment_table_batch to VAD hypothesis supervisions,
+    with the same 4-decimal rounding as the table files read by vad_construct_supervisions_per_file.
+    """
+    if table.numel() == 0:
+        return [make_diar_segment(0.0, 0.0, "Speech", recording_id=rec_id)]
     hypothesis: List[SupervisionSegment] = []
-    for _index, row in pred.iterrows():
-        start = float(row[0])
-        end = start + float(row[1])
-        hypothesis.append(make_diar_segment(start, end, "Speech", recording_id=rec_id))
-    return reference, hypothesis
+    for start, _, dur in table.tolist():
+        start = round(start, 4)
+        hypothesis.append(make_diar_segment(start, start + round(dur, 4), "Speech", recording_id=rec_id))
+    return hypothesis
 
 
 def get_parameter_grid(params: dict) -> list:
@@ -1038,6 +1395,8 @@ def vad_tune_threshold_on_dev(
     """
     Tune thresholds on dev set. Return best thresholds which gives the lowest
     detection error rate (DetER) in thresholds.
+    The predictions are loaded once into a padded tensor batch and every parameter combination is
+    post-processed in memory for all files at once, see generate_vad_segment_table_batch.
 
     Args:
         params (dict): dictionary of parameters to be tuned on.
@@ -1046,7 +1405,7 @@ def vad_tune_threshold_on_dev(
         groundtruth_RTTM_dir (str): Directory of ground-truth rttm files or a file contains the paths of them.
         focus_metric (str): Metrics we care most when tuning threshold. Should be either in "DetER", "FA", "MISS"
         frame_length_in_sec (float): Frame length.
-        num_workers (int): Number of workers.
+        num_workers (int): Number of processes for loading the prediction files.
     Returns:
         best_threshold (float): Threshold that gives lowest DetER.
     """
@@ -1061,25 +1420,44 @@ def vad_tune_threshold_on_dev(
     metric = _DetectionErrorRateAccumulator()
     params_grid = get_parameter_grid(params)
 
+    # Load the predictions and the references once, then evaluate every parameter combination in memory
+    filenames = sorted(paired_filenames)
+    _, sequences, lengths = load_vad_frame_preds(
+        [vad_pred_dict[filename] for filename in filenames], num_workers=num_workers
+    )
+    references = [load_vad_reference_supervisions(groundtruth_RTTM_dict[filename]) for filename in filenames]
+    binarization_cache: Dict[Tuple[Any, ...], Tuple[torch.Tensor, torch.Tensor]] = {}
+
     for param in params_grid:
         for i in param:
             if type(param[i]) == np.float64 or type(param[i]) == np.int64:
                 param[i] = float(param[i])
         try:
             # Generate speech segments by performing binarization on the VAD prediction according to param.
-            # Filter speech segments according to param and write the result to rttm-like table.
-            vad_table_dir = generate_vad_segment_table(
-                vad_pred, param, frame_length_in_sec=frame_length_in_sec, num_workers=num_workers
+            # Binarization only depends on the thresholds and paddings, so it is shared across the filtering params.
+            per_args = _get_float_postprocessing_params({"frame_length_in_sec": frame_length_in_sec, **param})
+            scale = param.get('scale', 'absolute')
+            binarization_key = (
+                scale,
+                param['onset'],
+                param['offset'],
+                per_args.get('pad_onset', 0.0),
+                per_args.get('pad_offset', 0.0),
             )
+            if binarization_key not in binarization_cache:
+                onsets, offsets = cal_vad_onset_offset_batch(
+                    scale, param['onset'], param['offset'], sequences, lengths
+                )
+                binarization_cache[binarization_key] = binarization_batch(
+                    sequences, lengths, onsets, offsets, per_args
+                )
+            # Filter speech segments according to param.
+            speech_segments, file_idx = filtering_batch(*binarization_cache[binarization_key], per_args)
+            tables = segments_to_vad_tables(speech_segments, file_idx, len(filenames))
+
             # add reference and hypothesis to metrics
-            for filename in paired_filenames:
-                groundtruth_RTTM_file = groundtruth_RTTM_dict[filename]
-                vad_table_filepath = os.path.join(vad_table_dir, filename + ".txt")
-                reference, hypothesis = vad_construct_supervisions_per_file(vad_table_filepath, groundtruth_RTTM_file)
-                metric(reference, hypothesis)  # accumulation
-
-            # delete tmp table files
-            shutil.rmtree(vad_table_dir, ignore_errors=True)
+            for filename, reference, table in zip(filenames, references, tables):
+                metric(reference, vad_table_to_supervisions(table, filename))  # accumulation
 
             report = metric.report(display=False)
             DetER = report.iloc[[-1]][('detection error rate', '%')].item()
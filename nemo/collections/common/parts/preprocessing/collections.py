@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import collections
 import json
 import os
@@ -90,6 +91,122 @@ class FromFileText(Text):
         return texts
 
 
+class _ColumnarAudioTextData:
+    """Memory-compact, read-only storage of `AudioText` entities.
+
+    Instead of one namedtuple of Python objects per utterance, the entities are stored column-wise:
+    ids, durations and offsets in contiguous NumPy arrays, all token ids in one flat int32 buffer
+    indexed by per-utterance offsets, audio paths and raw texts as UTF-8 bytes in a single buffer,
+    and low-cardinality values (speakers, sample rates, languages) in interned tables.
+
+    Since the columns hold no per-utterance Python objects, indexing them does not touch reference
+    counts, so DataLoader workers forked from the main process keep sharing the same memory pages
+    instead of copying them. Entities are materialized as `output_type` on access.
+    """
+
+    def __init__(self, output_type):
+        self.output_type = output_type
+        self._ids = array.array('q')
+        self._durations = array.array('d')
+        self._offsets = array.array('d')
+        self._token_buffer = array.array('i')
+        self._token_ends = array.array('q')
+        self._string_buffer = bytearray()
+        self._audio_file_ends = array.array('q')
+        self._text_ends = array.array('q')
+        self._interned = {}
+        self._interned_values = []
+        self._speakers = array.array('i')
+        self._orig_srs = array.array('i')
+        self._langs = array.array('i')
+        self._order = None
+        self._finalized = False
+
+    def _intern(self, value) -> int:
+        if value not in self._interned:
+            self._interned[value] = len(self._interned_values)
+            self._interned_values.append(value)
+        return self._interned[value]
+
+    def append(self, id_, audio_file, duration, text_tokens, offset, text_raw, speaker, orig_sr, lang):
+        """Appends a single entity. Must not be called after `finalize`."""
+        if self._finalized:
+            raise RuntimeError("Cannot append to a finalized columnar collection")
+        if not isinstance(audio_file, str) or not isinstance(text_raw, str):
+            raise ValueError(
+                f"Columnar collection supports only string audio paths and transcripts, got {audio_file} and {text_raw}"
+            )
+        self._ids.append(id_)
+        self._durations.append(np.nan if duration is None else duration)
+        self._offsets.append(np.nan if offset is None else offset)
+        self._token_buffer.extend(text_tokens)
+        self._token_ends.append(len(self._token_buffer))
+        self._string_buffer += audio_file.encode('utf-8')
+        self._audio_file_ends.append(len(self._string_buffer))
+        self._string_buffer += text_raw.encode('utf-8')
+        self._text_ends.append(len(self._string_buffer))
+        self._speakers.append(self._intern(speaker))
+        self._orig_srs.append(self._intern(orig_sr))
+        self._langs.append(self._intern(lang))
+
+    def finalize(self, sort_by_duration: bool = False):
+        """Converts the columns to NumPy arrays and optionally sorts the entities by duration."""
+        self._ids = np.frombuffer(self._ids, dtype=np.int64)
+        self._durations = np.frombuffer(self._durations, dtype=np.float64)
+        self._offsets = np.frombuffer(self._offsets, dtype=np.float64)
+        self._token_buffer = np.frombuffer(self._token_buffer, dtype=np.int32)
+        self._token_ends = np.frombuffer(self._token_ends, dtype=np.int64)
+        self._string_buffer = np.frombuffer(bytes(self._string_buffer), dtype=np.uint8)
+        self._audio_file_ends = np.frombuffer(self._audio_file_ends, dtype=np.int64)
+        self._text_ends = np.frombuffer(self._text_ends, dtype=np.int64)
+        self._speakers = np.frombuffer(self._speakers, dtype=np.int32)
+        self._orig_srs = np.frombuffer(self._orig_srs, dtype=np.int32)
+        self._langs = np.frombuffer(self._langs, dtype=np.int32)
+        self._interned = None
+        if sort_by_duration:
+            self._order = np.argsort(self._durations, kind='stable')
+        self._finalized = True
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Durations of all entities in collection order, NaN where unknown."""
+        return self._durations if self._order is None else self._durations[self._order]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError(f"Index {idx} is out of range for collection with {len(self)} entries")
+        if self._order is not None:
+            idx = int(self._order[idx])
+
+        token_start = self._token_ends[idx - 1] if idx > 0 else 0
+        string_start = self._text_ends[idx - 1] if idx > 0 else 0
+        audio_file_end = self._audio_file_ends[idx]
+        duration = float(self._durations[idx])
+        offset = float(self._offsets[idx])
+        return self.output_type(
+            int(self._ids[idx]),
+            self._string_buffer[string_start:audio_file_end].tobytes().decode('utf-8'),
+            None if np.isnan(duration) else duration,
+            self._token_buffer[token_start : self._token_ends[idx]].tolist(),
+            None if np.isnan(offset) else offset,
+            self._string_buffer[audio_file_end : self._text_ends[idx]].tobytes().decode('utf-8'),
+            self._interned_values[self._speakers[idx]],
+            self._interned_values[self._orig_srs[idx]],
+            self._interned_values[self._langs[idx]],
+        )
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
 class AudioText(_Collection):
     """List of audio-transcript text correspondence with preprocessing."""
 
@@ -115,6 +232,7 @@ class AudioText(_Collection):
         max_number: Optional[int] = None,
         do_sort_by_duration: bool = False,
         index_by_file_id: bool = False,
+        columnar: bool = False,
     ):
         """Instantiates audio-text manifest with filters and preprocessing.
 
@@ -133,11 +251,16 @@ class AudioText(_Collection):
             max_number: Maximum number of samples to collect.
             do_sort_by_duration: True if sort samples list by duration. Not compatible with index_by_file_id.
             index_by_file_id: If True, saves a mapping from filename base (ID) to index in data.
+            columnar: If True, store the entities in a memory-compact columnar backend
+                (see `_ColumnarAudioTextData`) instead of a list of namedtuples. Indexing returns the
+                same entities, but the collection is read-only.
         """
 
         output_type = self.OUTPUT_TYPE
         all_has_duration = True
         data, duration_filtered, num_filtered, total_duration = [], 0.0, 0, 0.0
+        if columnar:
+            data = _ColumnarAudioTextData(output_type)
         if index_by_file_id:
             self.mapping = {}
 
@@ -181,7 +304,10 @@ class AudioText(_Collection):
 
             total_duration += duration if duration is not None else 0.0
 
-            data.append(output_type(id_, audio_file, duration, text_tokens, offset, text, speaker, orig_sr, lang))
+            if columnar:
+                data.append(id_, audio_file, duration, text_tokens, offset, text, speaker, orig_sr, lang)
+            else:
+                data.append(output_type(id_, audio_file, duration, text_tokens, offset, text, speaker, orig_sr, lang))
             if index_by_file_id:
                 file_id, _ = os.path.splitext(os.path.basename(audio_file))
                 if file_id not in self.mapping:
@@ -192,17 +318,25 @@ class AudioText(_Collection):
             if len(data) == max_number:
                 break
 
-        if do_sort_by_duration:
-            if index_by_file_id:
-                logging.warning("Tried to sort dataset by duration, but cannot since index_by_file_id is set.")
-            else:
-                data.sort(key=lambda entity: entity.duration)
+        if do_sort_by_duration and index_by_file_id:
+            logging.warning("Tried to sort dataset by duration, but cannot since index_by_file_id is set.")
+            do_sort_by_duration = False
+
+        if columnar:
+            data.finalize(sort_by_duration=do_sort_by_duration)
+        elif do_sort_by_duration:
+            data.sort(key=lambda entity: entity.duration)
 
         logging.info("Dataset loaded with %d files totalling %.2f hours", len(data), total_duration / 3600)
         logging.info("%d files were filtered totalling %.2f hours", num_filtered, duration_filtered / 3600)
         if not all_has_duration:
             logging.info("Not all audios have duration information, the total number of hours is inaccurate.")
-        super().__init__(data)
+        if columnar:
+            # UserList would copy the entities into a list, so the columnar storage is attached directly
+            super().__init__()
+            self.data = data
+        else:
+            super().__init__(data)
 
 
 class VideoText(_Collection):
@@ -316,13 +450,23 @@ class VideoText(_Collection):
 class ASRAudioText(AudioText):
     """`AudioText` collector from asr structured json files."""
 
-    def __init__(self, manifests_files: Union[str, List[str]], parse_func: Optional[Callable] = None, *args, **kwargs):
+    def __init__(
+        self,
+        manifests_files: Union[str, List[str]],
+        parse_func: Optional[Callable] = None,
+        *args,
+        manifest_num_workers: int = 1,
+        **kwargs,
+    ):
         """Parse lists of audio files, durations and transcripts texts.
 
         Args:
             manifests_files: Either single string file or list of such -
                 manifests to yield items from.
+            parse_func: Optional function to parse a single manifest line.
             *args: Args to pass to `AudioText` constructor.
+            manifest_num_workers: Number of processes used to parse each manifest. `parse_func`
+                must be picklable if greater than 1.
             **kwargs: Kwargs to pass to `AudioText` constructor.
         """
 
@@ -341,7 +485,7 @@ class ASRAudioText(AudioText):
         )
 
         speakers, orig_srs, token_labels, langs = [], [], [], []
-        for item in manifest.item_iter(manifests_files, parse_func=parse_func):
+        for item in manifest.item_iter(manifests_files, parse_func=parse_func, num_workers=manifest_num_workers):
             ids.append(item['id'])
             audio_files.append(item['audio_file'])
             durations.append(item['duration'])
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 from collections import defaultdict
 from os.path import expanduser
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from nemo.utils import logging
 from nemo.utils.data_utils import DataStoreObject, get_datastore_object, is_datastore_path
@@ -43,7 +47,9 @@ class ManifestEN:
 
 
 def item_iter(
-    manifests_files: Union[str, List[str]], parse_func: Callable[[str, Optional[str]], Dict[str, Any]] = None
+    manifests_files: Union[str, List[str]],
+    parse_func: Callable[[str, Optional[str]], Dict[str, Any]] = None,
+    num_workers: int = 1,
 ) -> Iterator[Dict[str, Any]]:
     """Iterate through json lines of provided manifests.
 
@@ -62,6 +68,11 @@ def item_iter(
             of a manifest and optionally the manifest file itself,
             and parses it, returning a dictionary mapping from str -> Any.
 
+        num_workers: Number of processes used to parse each manifest. If greater
+            than 1, the manifest is split into chunks of lines using its byte-offset
+            index (see `get_manifest_line_offsets`) and the chunks are parsed in
+            parallel. `parse_func` must be picklable in that case.
+
     Yields:
         Parsed key to value item dicts.
 
@@ -80,6 +91,15 @@ def item_iter(
     logging.debug('Manifest files: %s', str(manifests_files))
     for manifest_file in manifests_files:
         logging.debug('Using manifest file: %s', str(manifest_file))
+        if num_workers > 1:
+            for items, chunk_errors in iter_manifest_chunks(manifest_file, parse_func, num_workers=num_workers):
+                errors[str(manifest_file)].extend(chunk_errors)
+                for item in items:
+                    k += 1
+                    item['id'] = k
+                    yield item
+            continue
+
         cached_manifest_file = DataStoreObject(manifest_file).get()
         logging.debug('Cached at: %s', str(cached_manifest_file))
         with open(expanduser(cached_manifest_file), 'r') as f:
@@ -97,6 +117,7 @@ def item_iter(
 
                 yield item
 
+    errors = {filename: lines for filename, lines in errors.items() if len(lines) > 0}
     if len(errors) > 0:
         for filename, lines in errors.items():
             logging.error("=============================================")
@@ -106,6 +127,231 @@ def item_iter(
         raise RuntimeError("Failed to parse some lines from manifest files. See logs for more details.")
 
 
+_WHITESPACE_BYTES = np.frombuffer(b' \t\n\r\x0b\x0c', dtype=np.uint8)
+
+
+def _scan_line_offsets(manifest_file: str, block_size: int = 1 << 24) -> np.ndarray:
+    """Find the byte offsets of all non-blank lines of a file, processing it in memory-mapped blocks."""
+    if os.path.getsize(manifest_file) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    data = np.memmap(manifest_file, dtype=np.uint8, mode='r')
+    offsets = []
+    # start offset of the line that continues from the previous block, and whether it has content so far
+    line_start, line_has_content = 0, False
+    for block_start in range(0, len(data), block_size):
+        block = np.asarray(data[block_start : block_start + block_size])
+        is_content = ~np.isin(block, _WHITESPACE_BYTES)
+        content_cumsum = np.concatenate([[0], np.cumsum(is_content, dtype=np.int64)])
+        line_ends = np.flatnonzero(block == ord('\n')) + 1  # exclusive ends of lines completed in this block
+        if len(line_ends) == 0:
+            line_has_content = line_has_content or bool(content_cumsum[-1] > 0)
+            continue
+
+        starts = np.concatenate([[0], line_ends[:-1]])
+        has_content = (content_cumsum[line_ends] - content_cumsum[starts]) > 0
+        # the first line started in a previous block
+        if line_has_content or has_content[0]:
+            offsets.append(np.array([line_start], dtype=np.int64))
+        offsets.append(block_start + starts[1:][has_content[1:]])
+
+        line_start = block_start + int(line_ends[-1])
+        line_has_content = bool(content_cumsum[-1] - content_cumsum[line_ends[-1]] > 0)
+
+    if line_has_content:
+        offsets.append(np.array([line_start], dtype=np.int64))
+    return np.concatenate(offsets).astype(np.int64) if offsets else np.zeros(0, dtype=np.int64)
+
+
+def _manifest_fingerprint(manifest_file: str, num_bytes: int = 1 << 16) -> Dict[str, Any]:
+    """Size and modification time of the manifest and a hash of its first and last `num_bytes` bytes.
+
+    The modification time catches edits in the middle of the file that keep its size, which the hash
+    of its ends would miss, without reading the whole file.
+    """
+    stat = os.stat(manifest_file)
+    digest = hashlib.sha1()
+    with open(manifest_file, 'rb') as f:
+        digest.update(f.read(num_bytes))
+        if stat.st_size > num_bytes:
+            f.seek(max(num_bytes, stat.st_size - num_bytes))
+            digest.update(f.read())
+    return {'file_size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest.hexdigest()}
+
+
+def get_manifest_line_offsets(manifest_file: str, index_dir: Optional[str] = None) -> np.ndarray:
+    """Get the byte offsets of the non-blank lines of a JSON-lines manifest.
+
+    The offsets are computed with a vectorized scan of the file. If `index_dir` is set, they are
+    also stored there (never next to the manifest), together with the size and modification time
+    of the manifest and a hash of its first and last bytes. Later calls memory-map the stored index
+    as long as the manifest still has the same size, modification time and hash.
+
+    Args:
+        manifest_file: Path to a local manifest file.
+        index_dir: Optional directory where the index is persisted.
+
+    Returns:
+        Array of int64 byte offsets, one per manifest entry.
+    """
+    if index_dir is None:
+        return _scan_line_offsets(manifest_file)
+
+    abs_path = os.path.abspath(manifest_file)
+    name = f"{os.path.basename(abs_path)}.{hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:16]}"
+    index_file = os.path.join(index_dir, name + '.idx.npy')
+    meta_file = os.path.join(index_dir, name + '.idx.json')
+    fingerprint = _manifest_fingerprint(manifest_file)
+    if os.path.exists(index_file) and os.path.exists(meta_file):
+        try:
+            with open(meta_file, 'r') as f:
+                if json.load(f) == fingerprint:
+                    return np.load(index_file, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load the manifest index {index_file}: {e}")
+
+    offsets = _scan_line_offsets(manifest_file)
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+        # write to temporary files first, so that concurrent readers never see a partial index
+        tmp_suffix = f'.{os.getpid()}.tmp'
+        with open(index_file + tmp_suffix, 'wb') as f:
+            np.save(f, offsets)
+        with open(meta_file + tmp_suffix, 'w') as f:
+            json.dump(fingerprint, f)
+        os.replace(index_file + tmp_suffix, index_file)
+        os.replace(meta_file + tmp_suffix, meta_file)
+    except OSError as e:
+        logging.warning(f"Could not save the manifest index to {index_file}: {e}")
+    return offsets
+
+
+class ManifestIndex:
+    """Random access to the entries of a JSON-lines manifest through its byte-offset index.
+
+    Only the offsets are kept in memory; each entry is read and parsed when accessed, so
+    the object is cheap to create and to share with DataLoader workers.
+
+    Args:
+        manifest_file: Path to a manifest file.
+        parse_func: Function parsing a single line (and the manifest path) into an item.
+            Defaults to `json.loads`.
+        index_dir: Optional directory where the offsets index is persisted (see `get_manifest_line_offsets`).
+    """
+
+    def __init__(
+        self,
+        manifest_file: str,
+        parse_func: Optional[Callable[[str, Optional[str]], Dict[str, Any]]] = None,
+        index_dir: Optional[str] = None,
+    ):
+        self.manifest_file = manifest_file
+        self.parse_func = parse_func
+        self._local_file = expanduser(DataStoreObject(manifest_file).get())
+        self.offsets = get_manifest_line_offsets(self._local_file, index_dir=index_dir)
+        self._file = None
+        self._pid = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _read_line(self, idx: int) -> str:
+        # reopen the file in forked processes so that workers do not share the file position
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self._local_file, 'rb')
+            self._pid = os.getpid()
+        self._file.seek(int(self.offsets[idx]))
+        return self._file.readline().decode('utf-8').strip()
+
+    def __getitem__(self, idx: int) -> Dict[str, Any]:
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError(f"Index {idx} is out of range for manifest with {len(self)} entries")
+        line = self._read_line(idx)
+        if self.parse_func is None:
+            return json.loads(line)
+        return self.parse_func(line, self.manifest_file)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_pid'] = None
+        return state
+
+
+def _parse_manifest_chunk(
+    args: Tuple[str, str, int, int, Callable[[str, Optional[str]], Any]],
+) -> Tuple[List[Any], List[str]]:
+    local_file, manifest_file, start, end, parse_func = args
+    with open(local_file, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).decode('utf-8').splitlines()
+
+    items, errors = [], []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            items.append(parse_func(line, manifest_file))
+        except json.JSONDecodeError:
+            errors.append(line)
+    return items, errors
+
+
+def iter_manifest_chunks(
+    manifest_file: str,
+    parse_func: Callable[[str, Optional[str]], Any],
+    num_workers: int = 1,
+    chunks_per_worker: int = 4,
+) -> Iterator[Tuple[List[Any], List[str]]]:
+    """Parse a manifest in parallel, in contiguous chunks of lines.
+
+    The manifest is split along the byte offsets from `get_manifest_line_offsets`, so each
+    worker reads only its own byte range. Chunks are yielded in manifest order.
+
+    Args:
+        manifest_file: Path to a manifest file.
+        parse_func: Picklable function parsing a single line (and the manifest path) into an item.
+        num_workers: Number of parsing processes.
+        chunks_per_worker: Number of chunks per worker, to balance the load between them.
+
+    Yields:
+        Tuples of the parsed items of a chunk and the lines of that chunk that failed to parse as JSON.
+    """
+    local_file = expanduser(DataStoreObject(manifest_file).get())
+    offsets = get_manifest_line_offsets(local_file)
+    if len(offsets) == 0:
+        return
+
+    file_size = os.path.getsize(local_file)
+    num_chunks = min(len(offsets), max(1, num_workers * chunks_per_worker))
+    boundaries = np.linspace(0, len(offsets), num_chunks + 1).astype(np.int64)
+    chunks = [
+        (
+            local_file,
+            manifest_file,
+            int(offsets[boundaries[i]]),
+            int(offsets[boundaries[i + 1]]) if boundaries[i + 1] < len(offsets) else file_size,
+            parse_func,
+        )
+        for i in range(num_chunks)
+    ]
+
+    if num_workers <= 1:
+        for chunk in chunks:
+            yield _parse_manifest_chunk(chunk)
+        return
+
+    with multiprocessing.Pool(min(num_workers, num_chunks)) as pool:
+        yield from pool.imap(_parse_manifest_chunk, chunks)
+
+
 def __parse_item(line: str, manifest_file: str) -> Dict[str, Any]:
     item = json.loads(line)
 
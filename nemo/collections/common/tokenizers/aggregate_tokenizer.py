@@ -94,6 +94,14 @@ class AggregateTokenizer(TokenizerSpec):
         self.tokenizers_by_token_id = tokenizers_by_token_id
         self.langs_by_token_id = langs_by_token_id
 
+        # array versions of the lookup tables, so that ids can be detokenized with NumPy gathers:
+        # the token (piece) and its text (piece with '▁' replaced by a space), the index of the language
+        # in self.langs and the offset id of every token id
+        self.pieces_by_token_id, self.lang_idx_by_token_id, self.offset_ids_by_token_id = self._build_lookup_arrays()
+        self.text_pieces_by_token_id = np.array(
+            [piece.replace('▁', ' ') for piece in self.pieces_by_token_id], dtype=object
+        )
+
     def _calculate_offsets(self):
         offsets = {}
         tokenizers = {}
@@ -112,6 +120,22 @@ class AggregateTokenizer(TokenizerSpec):
 
         return offsets, tokenizers, langs
 
+    def _build_lookup_arrays(self):
+        pieces = []
+        lang_idx = []
+        offset_ids = []
+        for idx, tokenizer in enumerate(self.tokenizers_dict.values()):
+            num_tokens = len(tokenizer.vocab)
+            pieces.extend(tokenizer.ids_to_tokens(list(range(num_tokens))))
+            lang_idx.append(np.full(num_tokens, idx, dtype=np.int64))
+            offset_ids.append(np.arange(num_tokens, dtype=np.int64))
+
+        return (
+            np.array(pieces, dtype=object),
+            np.concatenate(lang_idx) if lang_idx else np.zeros(0, dtype=np.int64),
+            np.concatenate(offset_ids) if offset_ids else np.zeros(0, dtype=np.int64),
+        )
+
     def text_to_tokens(self, text, lang_id):
         """Converts text into a list of tokens using `lang_id`"""
         tokenizer = self.tokenizers_dict[lang_id]
@@ -149,14 +173,38 @@ class AggregateTokenizer(TokenizerSpec):
         if isinstance(ids, (np.ndarray, torch.Tensor)):
             ids = ids.tolist()
 
-        tokens = []
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            tokens.extend(tokenizer.ids_to_tokens([offset_id]))
-        text = ''.join(tokens).replace('▁', ' ')
+        text_pieces = self.text_pieces_by_token_id
+        return ''.join([text_pieces[id] for id in ids])
 
-        return text
+    def batch_ids_to_text(self, ids, lengths=None) -> List[str]:
+        """
+        Converts a batch of token IDs back to texts.
+
+        Args:
+            ids: padded token IDs of shape [B, T] (tensor or array), or a list of B lists of token IDs.
+            lengths: optional number of valid token IDs of every row, of shape [B]. Defaults to all of them.
+
+        Returns:
+            List of B texts, the same as calling ids_to_text on every row.
+        """
+        if isinstance(ids, torch.Tensor):
+            ids = ids.cpu().numpy()
+        if isinstance(lengths, torch.Tensor):
+            lengths = lengths.cpu().numpy()
+        if isinstance(ids, np.ndarray):
+            if len(ids) == 0:
+                return []
+            # one gather of the valid ids of the whole batch (padding may hold ids out of the vocabulary),
+            # then one join per row
+            if lengths is None:
+                lengths = np.full(ids.shape[0], ids.shape[1], dtype=np.int64)
+            lengths = np.asarray(lengths, dtype=np.int64)
+            valid = np.arange(ids.shape[1])[None, :] < lengths[:, None]
+            text_pieces = self.text_pieces_by_token_id[ids[valid]]
+            return [''.join(row) for row in np.split(text_pieces, np.cumsum(lengths)[:-1])]
+        if lengths is not None:
+            ids = [row[:length] for row, length in zip(ids, lengths)]
+        return [self.ids_to_text(row) for row in ids]
 
     def token_to_id(self, token, lang_id):
         """Converts token to id using `lang_id`"""
@@ -165,24 +213,18 @@ class AggregateTokenizer(TokenizerSpec):
 
     def ids_to_tokens(self, ids):
         """Converts a list of token IDs back to tokens."""
-        tokens = []
-
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
-            tokens.append(token)
+        if isinstance(ids, (np.ndarray, torch.Tensor)):
+            ids = ids.tolist()
 
-        return tokens
+        pieces = self.pieces_by_token_id
+        return [pieces[id] for id in ids]
 
     def ids_to_text_and_langs(self, ids):
         """Converts a list of token IDs to tokens annotated with language."""
         text_and_langs = []
 
         for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
+            token = self.pieces_by_token_id[id]
             text = token.replace('▁', ' ')
             text = text.strip()  # strip for display purposes
             lang = self.langs_by_token_id[id]
@@ -196,9 +238,7 @@ class AggregateTokenizer(TokenizerSpec):
 
         word_ids = []  # tokens belonging to the current word
         for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
+            token = self.pieces_by_token_id[id]
             if token.startswith('▁'):
                 if len(word_ids) > 0:  # if this isn't the first word
                     word = self.ids_to_text(word_ids)
@@ -24,7 +24,12 @@ import torch
 
 from nemo.collections.common.parts.utils import if_exist
 from nemo.collections.common.tokenizers.chat_template_mixin import ChatTemplateMixin
-from nemo.collections.common.tokenizers.tokenizer_spec import TokenizerSpec, TokenWithLength, VarBPERepresentation
+from nemo.collections.common.tokenizers.tokenizer_spec import (
+    TokenizerSpec,
+    TokenWithLength,
+    VarBPERepresentation,
+    batch_ids_to_lists,
+)
 from nemo.utils import logging
 
 __all__ = ['SentencePieceTokenizer', 'create_spt_model']
@@ -403,6 +408,23 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
 
         return self.tokenizer.decode_ids(ids)
 
+    def batch_ids_to_text(self, ids, lengths=None) -> List[str]:
+        """Decodes a batch of token IDs into strings, with a single call to the SentencePiece batch decoder.
+
+        Args:
+            ids: padded token IDs of shape [B, T] (tensor or array), or a list of B lists of token IDs.
+            lengths: optional number of valid token IDs of every row, of shape [B]. Defaults to all of them.
+
+        Returns:
+            List of B decoded strings.
+        """
+        rows = batch_ids_to_lists(ids, lengths)
+        if self.legacy:
+            if self.id_to_special_token:
+                return [self.ids_to_text(row) for row in rows]
+            return [text.strip() for text in self.tokenizer.decode_ids(rows)]
+        return self.tokenizer.decode_ids(rows)
+
     def token_to_id(self, token):
         """Gets the ID corresponding to a token.
 
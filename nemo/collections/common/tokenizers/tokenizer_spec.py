@@ -16,7 +16,7 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from typing import List, NamedTuple
 
-__all__ = ['TokenizerSpec']
+__all__ = ['TokenizerSpec', 'batch_ids_to_lists']
 
 
 class TokenWithLength(NamedTuple):
@@ -43,6 +43,20 @@ class VarBPERepresentation(NamedTuple):
     token_ids_with_merges: list[list[TokenWithLength]]
 
 
+def batch_ids_to_lists(ids, lengths=None) -> List[List[int]]:
+    """
+    Converts padded token IDs of shape [B, T] (tensor, array or list of lists) and optional lengths of shape [B]
+    to a list of B lists holding the valid token IDs of every row.
+    """
+    if hasattr(ids, 'tolist'):
+        ids = ids.tolist()
+    if lengths is None:
+        return ids
+    if hasattr(lengths, 'tolist'):
+        lengths = lengths.tolist()
+    return [row[:length] for row, length in zip(ids, lengths)]
+
+
 class TokenizerSpec(ABC):
     """
     Inherit this class to implement a new tokenizer.
@@ -78,6 +92,19 @@ class TokenizerSpec(ABC):
         """Converts token IDs back to text."""
         pass
 
+    def batch_ids_to_text(self, ids, lengths=None) -> List[str]:
+        """
+        Converts a batch of token IDs back to texts. Tokenizers with a faster batched path override this.
+
+        Args:
+            ids: padded token IDs of shape [B, T] (tensor or array), or a list of B lists of token IDs.
+            lengths: optional number of valid token IDs of every row, of shape [B]. Defaults to all of them.
+
+        Returns:
+            List of B texts, the same as calling ids_to_text on every row.
+        """
+        return [self.ids_to_text(row) for row in batch_ids_to_lists(ids, lengths)]
+
     def text_to_ids_var_bpe(self, text: str, *args, **kwargs):
         """Converts text to token ids using var-BPE approach"""
         raise NotImplementedError("Not yet implemented by tokenizer")
@@ -27,6 +27,14 @@ from nemo.collections.asr.parts.utils.manifest_utils import read_manifest
 from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import BaseTokenizer, IPABPETokenizer
 from nemo.collections.tts.parts.preprocessing.feature_processors import FeatureProcessor
 from nemo.collections.tts.parts.preprocessing.features import Featurizer
+from nemo.collections.tts.parts.utils.codec_code_store import CodecCodeStore
+from nemo.collections.tts.parts.utils.tokenization_cache import (
+    TokenizationCache,
+    TokenizationCacheWriter,
+    get_config_hash,
+    get_tokenization_cache_key,
+    is_deterministic_tokenizer,
+)
 from nemo.collections.tts.parts.utils.tts_dataset_utils import (
     _read_audio,
     beta_binomial_prior_distribution,
@@ -41,6 +49,8 @@ from nemo.collections.tts.parts.utils.tts_dataset_utils import (
 from nemo.core.classes import Dataset
 from nemo.utils import logging
 
+PHONEME_TOKENIZER_NAME = 'phoneme'
+
 
 @dataclass
 class DatasetMeta:
@@ -335,6 +345,8 @@ class MagpieTTSDataset(TextToSpeechDataset):
     In addition to the manifest structure for TextToSpeechDataset, we can have the following keys:
     context_audio_filepath, context_audio_duration, target_audio_codes_path, context_audio_codes_path.
     Note: target_audio_codes_path, context_audio_codes_path are absolute paths to the cached audio codes.
+    If codec_code_store_dir is given, codes whose *_codes_path is a key of the codec code store are read from it
+    instead of from the .pt files (see scripts/magpietts/build_codec_code_store.py).
     If they are not present in the manifest or if load_cached_codes_if_available=False, then the audio will be loaded
     and codes will be computed on the fly in the model class.
 
@@ -364,6 +376,9 @@ class MagpieTTSDataset(TextToSpeechDataset):
         context_duration_max: Maximum duration of context audio in seconds.
         text_context_remapping: Dict defining mapping of multiple text contexts to a single text context.
         text_context_remapping_prob: Probability of remapping the original text context to a remapped text context.
+        codec_code_store_dir: Optional directory of a packed codec code store holding the cached audio codes.
+        tokenization_cache_dir: Optional directory of a tokenization cache precomputed with
+            scripts/magpietts/build_tokenization_cache.py. Texts missing from it are tokenized on the fly.
     """
 
     def __init__(
@@ -397,6 +412,8 @@ class MagpieTTSDataset(TextToSpeechDataset):
         phoneme_text_eop_marker: str = "<eop>",
         add_language_to_context_text: bool = False,
         default_tokenizer_name: str = "english_phoneme",
+        codec_code_store_dir: Optional[str] = None,
+        tokenization_cache_dir: Optional[str] = None,
     ):
         super().__init__(
             dataset_meta=dataset_meta,
@@ -437,12 +454,132 @@ class MagpieTTSDataset(TextToSpeechDataset):
         self.phoneme_text_eop_marker = phoneme_text_eop_marker
         self.add_language_to_context_text = add_language_to_context_text
         self.default_tokenizer_name = default_tokenizer_name
+        self.codec_code_store = CodecCodeStore(codec_code_store_dir) if codec_code_store_dir else None
+        self.tokenization_cache = TokenizationCache(tokenization_cache_dir) if tokenization_cache_dir else None
+        self._tokenization_config_hashes = {}  # (namespace, tokenizer name) -> config hash, filled lazily per worker
 
     def get_num_audio_samples_to_slice(self, duration, sample_rate):
         num_codec_frames = int(duration * sample_rate / self.codec_model_samples_per_frame)
         num_audio_samples = num_codec_frames * self.codec_model_samples_per_frame
         return num_audio_samples
 
+    def _get_tokenization_config_hash(self, namespace: str, tokenizer_name: str) -> Optional[str]:
+        """Hash of everything the tokens of `namespace` depend on, or None if they cannot be cached."""
+        phoneme_tokenizer_config = getattr(self, 'phoneme_tokenizer_config', None)
+        if namespace == 'phoneme':
+            if phoneme_tokenizer_config is None or not is_deterministic_tokenizer(self.phoneme_tokenizer):
+                return None
+            return get_config_hash(phoneme_tokenizer_config)
+
+        # token ids of the aggregated tokenizer depend on all the tokenizers it is made of
+        if self.tokenizer_config is None or tokenizer_name not in self.text_tokenizer.tokenizers:
+            return None
+        if not is_deterministic_tokenizer(self.text_tokenizer.tokenizers[tokenizer_name]):
+            return None
+        if namespace == 'text' and self.enable_phoneme_text_input:
+            if self.phoneme_tokenizer is not None and not is_deterministic_tokenizer(self.phoneme_tokenizer):
+                return None
+            return get_config_hash(
+                self.tokenizer_config,
+                phoneme_tokenizer_config,
+                self.text_phoneme_token_offset,
+                self.phoneme_text_bop_marker,
+                self.phoneme_text_eop_marker,
+            )
+        return get_config_hash(self.tokenizer_config)
+
+    def _get_tokenization_cache_key(self, namespace: str, tokenizer_name: str, text: str) -> Optional[int]:
+        """Returns the tokenization cache key of `text`, or None if its tokens cannot be cached."""
+        if (namespace, tokenizer_name) not in self._tokenization_config_hashes:
+            self._tokenization_config_hashes[(namespace, tokenizer_name)] = self._get_tokenization_config_hash(
+                namespace, tokenizer_name
+            )
+        config_hash = self._tokenization_config_hashes[(namespace, tokenizer_name)]
+        if config_hash is None:
+            return None
+        return get_tokenization_cache_key(namespace, tokenizer_name, config_hash, text)
+
+    def _tokenize(self, namespace: str, tokenizer_name: str, text: str) -> List[int]:
+        """
+        Tokenizes `text`, reading the tokens from the tokenization cache when they are in it.
+
+        Args:
+            namespace: 'text' for the transcript, 'phoneme' for the phoneme tokenizer input or 'context_text' for
+                the text context.
+            tokenizer_name: name of the text tokenizer to use. Ignored for 'phoneme'.
+            text: text to tokenize.
+
+        Returns:
+            List of token ids.
+        """
+        if self.tokenization_cache is not None:
+            key = self._get_tokenization_cache_key(namespace, tokenizer_name, text)
+            tokens = self.tokenization_cache.get(key) if key is not None else None
+            if tokens is not None:
+                return tokens
+
+        if namespace == 'text':
+            return tokenize_text_with_phoneme_spans(
+                text_tokenizer=self.text_tokenizer,
+                text_str=text,
+                tokenizer_name=tokenizer_name,
+                enable_phoneme_text_input=self.enable_phoneme_text_input,
+                phoneme_tokenizer=self.phoneme_tokenizer,
+                text_phoneme_token_offset=self.text_phoneme_token_offset,
+                bop_marker=self.phoneme_text_bop_marker,
+                eop_marker=self.phoneme_text_eop_marker,
+            )
+        if namespace == 'phoneme':
+            return self.phoneme_tokenizer.encode(text)
+        return self.text_tokenizer.encode(text, tokenizer_name)
+
+    def build_tokenization_cache(self, writer: TokenizationCacheWriter) -> int:
+        """
+        Tokenizes every text the dataset can tokenize in __getitem__ and adds the results to `writer`. The tokenizers
+        must have been set up (they are assigned in worker_init_fn during training).
+
+        Args:
+            writer: writer of the tokenization cache.
+
+        Returns:
+            Number of entries added to `writer`.
+        """
+        num_entries = len(writer)
+        self._tokenization_config_hashes = {}
+
+        def _add(namespace, tokenizer_name, text):
+            key = self._get_tokenization_cache_key(namespace, tokenizer_name, text)
+            if key is not None and key not in writer:
+                writer.add(key, self._tokenize(namespace, tokenizer_name, text))
+
+        for data in self.data_samples:
+            for tokenizer_name in data.tokenizer_names or [self.default_tokenizer_name]:
+                _add('text', tokenizer_name, data.text)
+
+            language = data.language or 'en'
+            if self.phoneme_tokenizer is not None:
+                if isinstance(self.phoneme_tokenizer, IPABPETokenizer):
+                    phoneme_text = data.manifest_entry.get('ipa', '')
+                    if language in self.ignore_phoneme_languages:
+                        phoneme_text = ""
+                else:
+                    phoneme_text = data.text
+                _add('phoneme', PHONEME_TOKENIZER_NAME, phoneme_text)
+
+            if self.use_text_conditioning_tokenizer:
+                if 'context_text' in data.manifest_entry:
+                    context_texts = [data.manifest_entry['context_text']]
+                    if self.text_context_remapping is not None and context_texts[0] in self.text_context_remapping:
+                        context_texts.append(self.text_context_remapping[context_texts[0]])
+                elif self.add_language_to_context_text:
+                    context_texts = [f"[{language.upper()}]"]
+                else:
+                    context_texts = ["[NO TEXT CONTEXT]"]
+                for context_text in context_texts:
+                    _add('context_text', self.text_conditioning_tokenizer_name, context_text)
+
+        return len(writer) - num_entries
+
     def __getitem__(self, index):
         data = self.data_samples[index]
 
@@ -463,16 +600,7 @@ class MagpieTTSDataset(TextToSpeechDataset):
             language = 'en'
 
         # partial phoneme tokenization
-        tokens = tokenize_text_with_phoneme_spans(
-            text_tokenizer=self.text_tokenizer,
-            text_str=data.text,
-            tokenizer_name=tokenizer_name,
-            enable_phoneme_text_input=self.enable_phoneme_text_input,
-            phoneme_tokenizer=self.phoneme_tokenizer,
-            text_phoneme_token_offset=self.text_phoneme_token_offset,
-            bop_marker=self.phoneme_text_bop_marker,
-            eop_marker=self.phoneme_text_eop_marker,
-        )
+        tokens = self._tokenize('text', tokenizer_name, data.text)
         tokens = tokens + [self.eos_id]  # Not adding BOS id
         tokens = torch.tensor(tokens, dtype=torch.int32)
         text_len = tokens.shape[0]
@@ -503,7 +631,7 @@ class MagpieTTSDataset(TextToSpeechDataset):
                     phoneme_text = ""
             else:
                 phoneme_text = data.text
-            phoneme_tokens = self.phoneme_tokenizer.encode(phoneme_text)
+            phoneme_tokens = self._tokenize('phoneme', PHONEME_TOKENIZER_NAME, phoneme_text)
             phoneme_tokens = (
                 [self.phoneme_tokenizer.bos_token_id] + phoneme_tokens + [self.phoneme_tokenizer.eos_token_id]
             )
@@ -513,7 +641,10 @@ class MagpieTTSDataset(TextToSpeechDataset):
 
         if self.load_cached_codes_if_available and 'target_audio_codes_path' in data.manifest_entry:
             audio_codes_path = data.manifest_entry['target_audio_codes_path']
-            audio_codes = torch.load(audio_codes_path)  # (C, T)
+            if self.codec_code_store is not None and audio_codes_path in self.codec_code_store:
+                audio_codes = self.codec_code_store.get(audio_codes_path)  # (C, T)
+            else:
+                audio_codes = torch.load(audio_codes_path)  # (C, T)
             spec_len = audio_codes.shape[1] + 1  # +1 for EOS
             audio_codes_len = audio_codes.shape[1]
             example['audio_codes'] = audio_codes
@@ -545,20 +676,30 @@ class MagpieTTSDataset(TextToSpeechDataset):
 
         if self.load_cached_codes_if_available and 'context_audio_codes_path' in data.manifest_entry:
             context_audio_codes_path = data.manifest_entry['context_audio_codes_path']
-            context_audio_codes = torch.load(context_audio_codes_path)  # (8, T)
-            _available_context_duration = (
-                context_audio_codes.shape[1] * self.codec_model_samples_per_frame / self.sample_rate
-            )
+            if self.codec_code_store is not None and context_audio_codes_path in self.codec_code_store:
+                context_audio_codes = None
+                num_context_frames = self.codec_code_store.num_frames(context_audio_codes_path)
+            else:
+                context_audio_codes = torch.load(context_audio_codes_path)  # (8, T)
+                num_context_frames = context_audio_codes.shape[1]
+            _available_context_duration = num_context_frames * self.codec_model_samples_per_frame / self.sample_rate
             _context_duration_to_slice = _sample_context_duration_with_available_limit(_available_context_duration)
             _num_frames_to_slice = int(
                 _context_duration_to_slice * self.sample_rate / self.codec_model_samples_per_frame
             )
-            if _num_frames_to_slice < context_audio_codes.shape[1]:
-                start_idx = random.randint(0, context_audio_codes.shape[1] - _num_frames_to_slice)
-                context_audio_codes = context_audio_codes[:, start_idx : start_idx + _num_frames_to_slice]
+            if _num_frames_to_slice < num_context_frames:
+                start_idx = random.randint(0, num_context_frames - _num_frames_to_slice)
+                end_idx = start_idx + _num_frames_to_slice
+            else:
+                start_idx, end_idx = 0, num_context_frames
+            if context_audio_codes is None:
+                # only the selected window is read from the memory-mapped store
+                context_audio_codes = self.codec_code_store.get(context_audio_codes_path, start_idx, end_idx)
             else:
+                context_audio_codes = context_audio_codes[:, start_idx:end_idx]
+            if _num_frames_to_slice >= num_context_frames:
                 # Repeaet the audio if it is shorter than the desired duration
-                _num_repeats = int(np.ceil(_num_frames_to_slice / context_audio_codes.shape[1]))
+                _num_repeats = int(np.ceil(_num_frames_to_slice / num_context_frames))
                 # context_audio_codes is a tensor of shape (num_codebooks, T)
                 context_audio_codes_repeated = context_audio_codes.repeat(1, _num_repeats)
                 context_audio_codes = context_audio_codes_repeated[:, :_num_frames_to_slice]
@@ -644,14 +785,14 @@ class MagpieTTSDataset(TextToSpeechDataset):
                     if self.dataset_type == 'train' and random.random() < self.text_context_remapping_prob:
                         # Only remap during training. Give the exact text context during inference.
                         context_text = self.text_context_remapping[context_text]
-                context_tokens = self.text_tokenizer.encode(context_text, self.text_conditioning_tokenizer_name)
+                context_tokens = self._tokenize('context_text', self.text_conditioning_tokenizer_name, context_text)
                 example['has_text_context'] = True
             else:
                 if self.add_language_to_context_text:
                     context_text = f"[{language.upper()}]"
                 else:
                     context_text = "[NO TEXT CONTEXT]"
-                context_tokens = self.text_tokenizer.encode(context_text, self.text_conditioning_tokenizer_name)
+                context_tokens = self._tokenize('context_text', self.text_conditioning_tokenizer_name, context_text)
                 example['has_text_context'] = False
             if self.pad_context_text_to_max_duration:
                 _required_len = (
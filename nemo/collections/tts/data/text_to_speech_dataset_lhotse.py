@@ -28,6 +28,7 @@ from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import (
     IPABPETokenizer,
     resolve_versioned_tokenizer_defaults,
 )
+from nemo.collections.tts.parts.utils.codec_code_store import CodecCodeStore, get_cut_codes_key
 from nemo.collections.tts.parts.utils.tts_dataset_utils import (
     _sample_probability_range,
     beta_binomial_prior_distribution,
@@ -172,6 +173,9 @@ class MagpieTTSLhotseDataset(torch.utils.data.Dataset):
             are not set externally. Defaults to None.
         text_context_remapping: Dict defining mapping of multiple text contexts to a single text context.
         text_context_remapping_prob: Probability of remapping the original text context to a remapped text context.
+        codec_code_store_dir (Optional[str]): Directory of a packed codec code store. If given, the codes of a cut
+            are read from the store when it holds the key of the cut (its 'target_codes_key'/'context_codes_key'
+            custom fields, or the cut id with a ':context' suffix for context codes). Defaults to None.
     """
 
     def __init__(
@@ -202,6 +206,7 @@ class MagpieTTSLhotseDataset(torch.utils.data.Dataset):
         phoneme_text_bop_marker: str = "<bop>",
         phoneme_text_eop_marker: str = "<eop>",
         add_language_to_context_text: bool = False,
+        codec_code_store_dir: str = None,
     ):
         super().__init__()
         self.sample_rate = sample_rate
@@ -235,6 +240,7 @@ class MagpieTTSLhotseDataset(torch.utils.data.Dataset):
         self.phoneme_text_bop_marker = phoneme_text_bop_marker
         self.phoneme_text_eop_marker = phoneme_text_eop_marker
         self.add_language_to_context_text = add_language_to_context_text
+        self.codec_code_store = CodecCodeStore(codec_code_store_dir) if codec_code_store_dir else None
 
     def get_num_audio_samples_to_slice(self, duration, sample_rate):
         num_codec_frames = int(duration * sample_rate / self.codec_model_samples_per_frame)
@@ -316,12 +322,17 @@ class MagpieTTSLhotseDataset(torch.utils.data.Dataset):
             language_list.append(language)
 
             # target audio or target codes
-            if self.load_cached_codes_if_available and cut.has_custom("target_codes"):
-                # Note that we have segmented the audio according to offset and duration so that the audio codes should
-                # not specify start and duration again when calling TemporalArray.load(start, duration). Ensure start
-                # and duration are None to the load function.
-                audio_codes_array = cut.target_codes.load().astype(np.int32)
-                audio_codes = torch.from_numpy(audio_codes_array)  # (C, T)
+            target_codes_key = get_cut_codes_key(cut)
+            target_codes_in_store = self.codec_code_store is not None and target_codes_key in self.codec_code_store
+            if self.load_cached_codes_if_available and (target_codes_in_store or cut.has_custom("target_codes")):
+                if target_codes_in_store:
+                    audio_codes = self.codec_code_store.get(target_codes_key)  # (C, T)
+                else:
+                    # Note that we have segmented the audio according to offset and duration so that the audio codes
+                    # should not specify start and duration again when calling TemporalArray.load(start, duration).
+                    # Ensure start and duration are None to the load function.
+                    audio_codes_array = cut.target_codes.load().astype(np.int32)
+                    audio_codes = torch.from_numpy(audio_codes_array)  # (C, T)
                 audio_codes_len = audio_codes.shape[1]
                 spec_len = audio_codes_len + 1  # +1 for EOS
                 audio_codes_list.append(audio_codes.T)  # transpose to (T, C) to use collate_matrices to process batch.
@@ -344,25 +355,39 @@ class MagpieTTSLhotseDataset(torch.utils.data.Dataset):
                 audio_len_list.append(audio_len)
 
             # context audio or context codes
-            if self.load_cached_codes_if_available and cut.has_custom("context_codes"):
-                # Note that we have segmented the audio according to offset and duration so that the audio codes should
-                # not specify start and duration again when calling TemporalArray.load(start, duration). Ensure start
-                # and duration are None to the load function.
-                context_audio_codes_array = cut.context_codes.load().astype(np.int32)
-                context_audio_codes = torch.from_numpy(context_audio_codes_array)  # (C, T)
+            context_codes_key = get_cut_codes_key(cut, context=True)
+            context_codes_in_store = self.codec_code_store is not None and context_codes_key in self.codec_code_store
+            if self.load_cached_codes_if_available and (context_codes_in_store or cut.has_custom("context_codes")):
+                if context_codes_in_store:
+                    context_audio_codes = None
+                    num_context_frames = self.codec_code_store.num_frames(context_codes_key)
+                else:
+                    # Note that we have segmented the audio according to offset and duration so that the audio codes
+                    # should not specify start and duration again when calling TemporalArray.load(start, duration).
+                    # Ensure start and duration are None to the load function.
+                    context_audio_codes_array = cut.context_codes.load().astype(np.int32)
+                    context_audio_codes = torch.from_numpy(context_audio_codes_array)  # (C, T)
+                    num_context_frames = context_audio_codes.shape[1]
                 _available_context_duration = (
-                    context_audio_codes.shape[1] * self.codec_model_samples_per_frame / self.sample_rate
+                    num_context_frames * self.codec_model_samples_per_frame / self.sample_rate
                 )
                 _context_duration_to_slice = _sample_context_duration_with_available_limit(_available_context_duration)
                 _num_frames_to_slice = int(
                     _context_duration_to_slice * self.sample_rate / self.codec_model_samples_per_frame
                 )
-                if _num_frames_to_slice < context_audio_codes.shape[1]:
-                    start_idx = random.randint(0, context_audio_codes.shape[1] - _num_frames_to_slice)
-                    context_audio_codes = context_audio_codes[:, start_idx : start_idx + _num_frames_to_slice]
+                if _num_frames_to_slice < num_context_frames:
+                    start_idx = random.randint(0, num_context_frames - _num_frames_to_slice)
+                    end_idx = start_idx + _num_frames_to_slice
+                else:
+                    start_idx, end_idx = 0, num_context_frames
+                if context_audio_codes is None:
+                    # only the selected window is read from the memory-mapped store
+                    context_audio_codes = self.codec_code_store.get(context_codes_key, start_idx, end_idx)
                 else:
+                    context_audio_codes = context_audio_codes[:, start_idx:end_idx]
+                if _num_frames_to_slice >= num_context_frames:
                     # Repeat the audio if it is shorter than the desired duration
-                    _num_repeats = int(np.ceil(_num_frames_to_slice / context_audio_codes.shape[1]))
+                    _num_repeats = int(np.ceil(_num_frames_to_slice / num_context_frames))
                     # context_audio_codes is a tensor of shape (num_codebooks, T)
                     context_audio_codes_repeated = context_audio_codes.repeat(1, _num_repeats)
                     context_audio_codes = context_audio_codes_repeated[:, :_num_frames_to_slice]
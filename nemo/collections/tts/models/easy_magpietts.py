@@ -2011,6 +2011,7 @@ class EasyMagpieTTSModel(EasyMagpieTTSInferenceModel):
                 phoneme_text_bop_marker=self.phoneme_text_bop_marker,
                 phoneme_text_eop_marker=self.phoneme_text_eop_marker,
                 add_language_to_context_text=self.add_language_to_context_text,
+                codec_code_store_dir=dataset_cfg.get("codec_code_store_dir", None),
             )
 
         data_loader = get_lhotse_dataloader_from_config(
@@ -241,6 +241,8 @@ class ModelInferenceParameters:
         apply_prior_to_layers (Optional[List[int]]): Layers to apply prior to.
         start_prior_after_n_audio_steps (int): Which step to start enabling the attention prior.
         use_LT_kv_cache (bool): Whether to use KV cache for the autoregressive local transformer.
+        use_static_kv_cache (bool): Whether the decoder KV cache is preallocated for max_decoder_steps and written in
+            place every step, instead of growing by concatenation. Only used when use_kv_cache_for_inference is True.
         ignore_finished_sentence_tracking (bool): Whether to ignore finished sentence tracking.
         eos_detection_method (str): EOS detection method. See the EOSDetectionMethod class.
         min_generated_frames (int): Setting this greater than 0 prevents rare cases of first-frame termination. Any
@@ -270,6 +272,7 @@ class ModelInferenceParameters:
     apply_prior_to_layers: Optional[List[int]] = None
     start_prior_after_n_audio_steps: int = 0
     use_LT_kv_cache: bool = True
+    use_static_kv_cache: bool = False
     ignore_finished_sentence_tracking: bool = True
     eos_detection_method: str = "argmax_or_multinomial_any"
     min_generated_frames: int = 4
@@ -2909,7 +2912,7 @@ class MagpieTTSModel(ModelPT):
         eos_detection_method = EOSDetectionMethod(self.inference_parameters.eos_detection_method)
         with torch.no_grad():
             start_time = time.time()
-            self.decoder.reset_cache(use_cache=self.use_kv_cache_for_inference)
+            self.reset_decoder_cache(use_cache=self.use_kv_cache_for_inference)
 
             context_tensors = self.prepare_context_tensors(batch)
             text = context_tensors.text
@@ -3627,6 +3630,7 @@ class MagpieTTSModel(ModelPT):
             tokenizer_config=self.cfg.text_tokenizers,
             text_context_remapping=self.text_context_remapping,
             text_context_remapping_prob=self.text_context_remapping_prob,
+            codec_code_store_dir=dataset_cfg.get("codec_code_store_dir", None),
         )
         data_loader = get_lhotse_dataloader_from_config(
             config=dataset_cfg,
@@ -3831,6 +3835,8 @@ class MagpieTTSModel(ModelPT):
         num_chunks = len(chunked_tokens)
 
         with torch.no_grad():
+            # the decoder KV cache is only kept within a single chunk
+            self.reset_decoder_cache(use_cache=self.use_kv_cache_for_inference and num_chunks == 1)
             chunk_state = self.create_chunk_state(batch_size=1)
             all_codes = []
 
@@ -3869,6 +3875,19 @@ class MagpieTTSModel(ModelPT):
     def list_available_models(cls) -> List[PretrainedModelInfo]:
         return []
 
+    def reset_decoder_cache(self, use_cache: bool):
+        """
+        Clears the decoder KV cache before inference. With `inference_parameters.use_static_kv_cache`, the cache is
+        preallocated for `max_decoder_steps` and written in place (see `Transformer.reset_cache`).
+
+        Args:
+            use_cache (bool): Whether the decoder uses a KV cache.
+        """
+        max_cache_steps = None
+        if use_cache and self.inference_parameters.use_static_kv_cache:
+            max_cache_steps = self.inference_parameters.max_decoder_steps // self.frame_stacking_factor
+        self.decoder.reset_cache(use_cache=use_cache, max_cache_steps=max_cache_steps)
+
     def create_chunk_state(self, batch_size: int) -> ChunkState:
         """Create fresh state for chunked inference over a batch.
 
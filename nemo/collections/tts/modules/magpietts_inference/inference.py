@@ -514,11 +514,14 @@ class MagpieInferenceRunner(BaseInferenceRunner):
             batch_size = len(batch['chunked_tokens'])
             max_num_chunks = max(len(tokens) for tokens in batch['chunked_tokens'])
 
+            # Overwrite the model's parameters since we want to use the arguments from the commandline
+            self.model.inference_parameters = self.config.model_inference_parameters
+
             # Clear stale KV cache from prior inference calls (e.g., the previous batch or dataset
-            # may have left with populated tensors).
+            # may have left with populated tensors). The static KV cache is sized from the parameters above.
             logging.info(f"Resetting KV cache for decoder: {self.model.use_kv_cache_for_inference}")
             use_kv_cache_for_this_batch = self.model.use_kv_cache_for_inference if max_num_chunks == 1 else False
-            self.model.decoder.reset_cache(use_cache=use_kv_cache_for_this_batch)
+            self.model.reset_decoder_cache(use_cache=use_kv_cache_for_this_batch)
 
             # Create chunk state for this batch
             chunk_state = self.model.create_chunk_state(batch_size=batch_size)
@@ -527,9 +530,6 @@ class MagpieInferenceRunner(BaseInferenceRunner):
             predicted_codes_per_sample = [[] for _ in range(batch_size)]
             predicted_codes_lens = [0 for _ in range(batch_size)]
 
-            # Overwrite the model's parameters since we want to use the arguments from the commandline
-            self.model.inference_parameters = self.config.model_inference_parameters
-
             start_time = time.time()
             # Iterate over text chunks (1 for short text, N for long text)
             for chunk_idx in range(max_num_chunks):
@@ -13,7 +13,7 @@
 # limitations under the License.
 import math
 from abc import abstractmethod
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 import torch.nn.functional as F
@@ -25,6 +25,50 @@ from nemo.collections.tts.modules.moe_modules import PositionwiseConvFFMoE
 # as needed in the inference pipeline.
 
 
+def _append_to_cache(
+    cache: Dict[str, Any], key: str, value: torch.Tensor, max_cache_steps: Optional[int] = None
+) -> torch.Tensor:
+    """
+    Appends `value` to `cache[key]` along the time dimension (dim 1) and returns the full cached sequence.
+
+    If `max_cache_steps` is None, the cache grows dynamically with `torch.cat`. Otherwise, a static buffer of length
+    `T_prefill + max_cache_steps` is allocated on the first call (when batch size, dtype and device are known) and every
+    later call writes into it in place, advancing a length pointer stored in `cache['lengths'][key]`. The returned
+    tensor is a view over the filled part of the buffer, so no history is copied per step.
+
+    Args:
+        cache <dict>: Cache dictionary holding `key` and a `lengths` sub-dictionary.
+        key <str>: Name of the cached tensor.
+        value <torch tensor> (B, T, ...): New entries to append.
+        max_cache_steps <int>: Number of entries the static buffer can hold beyond the first (prefill) call.
+            None selects the dynamic cache.
+
+    Returns:
+        <torch tensor> (B, T_cached, ...): All cached entries including `value`.
+    """
+    if max_cache_steps is None:
+        if cache[key] is not None:
+            value = torch.cat([cache[key], value], dim=1)
+        cache[key] = value
+        return value
+
+    if cache[key] is None:
+        buffer_shape = (value.size(0), value.size(1) + max_cache_steps) + tuple(value.shape[2:])
+        cache[key] = value.new_empty(buffer_shape)
+        cache['lengths'][key] = 0
+
+    start = cache['lengths'][key]
+    end = start + value.size(1)
+    if end > cache[key].size(1):
+        raise ValueError(
+            f"Static cache for `{key}` overflowed: tried to store {end} steps in a buffer of size {cache[key].size(1)}. "
+            f"Increase `max_cache_steps` in `reset_cache`."
+        )
+    cache[key][:, start:end] = value
+    cache['lengths'][key] = end
+    return cache[key][:, :end]
+
+
 class Attention(torch.nn.Module):
     def __init__(
         self,
@@ -57,6 +101,7 @@ class Attention(torch.nn.Module):
         self.o_net = torch.nn.Linear(n_heads * self.d_head, d_model, bias=False)
         self.dropout = torch.nn.Dropout(p_dropout)
         self.use_cache = False
+        self.max_cache_steps = None
         self.cache = self._init_cache()
 
     @abstractmethod
@@ -70,7 +115,7 @@ class Attention(torch.nn.Module):
         pass
 
     @staticmethod
-    def _init_cache() -> Dict[str, Optional[Union[bool, torch.Tensor]]]:
+    def _init_cache() -> Dict[str, Any]:
         return {
             'is_initialized': False,
             'self_k': None,
@@ -78,10 +123,19 @@ class Attention(torch.nn.Module):
             'cross_kv': None,
             'cross_k': None,
             'cross_v': None,
+            'lengths': {},
         }
 
-    def reset_cache(self, use_cache: bool = False):
+    def reset_cache(self, use_cache: bool = False, max_cache_steps: Optional[int] = None):
+        """
+        Args:
+            use_cache (bool): Whether to cache keys and values across calls.
+            max_cache_steps (Optional[int]): If set, self-attention keys and values are stored in static buffers that
+                hold the first call's sequence plus this many additional steps, written in place on every step.
+                If None, the cache grows with `torch.cat`.
+        """
         self.use_cache = use_cache
+        self.max_cache_steps = max_cache_steps
         self.cache = self._init_cache()
 
     def attn_naive(
@@ -236,11 +290,8 @@ class SelfAttention(Attention):
         q, k, v = qkv.chunk(3, dim=2)
         q, k, v = q.squeeze(2), k.squeeze(2), v.squeeze(2)
         if self.use_cache:
-            if self.cache['self_k'] is not None:
-                k = torch.cat([self.cache['self_k'], k], dim=1)
-                v = torch.cat([self.cache['self_v'], v], dim=1)
-            self.cache['self_k'] = k
-            self.cache['self_v'] = v
+            k = _append_to_cache(self.cache, 'self_k', k, self.max_cache_steps)
+            v = _append_to_cache(self.cache, 'self_v', v, self.max_cache_steps)
 
         mask = None
         if query_mask is not None:
@@ -418,6 +469,7 @@ class TransformerLayer(torch.nn.Module):
             )
 
         self.use_cache = False
+        self.max_cache_steps = None
         self.cache = self._init_cache()
 
     @staticmethod
@@ -426,14 +478,16 @@ class TransformerLayer(torch.nn.Module):
             'self_attn_output': None,
             'cross_attn_output': None,
             'memory': None,
+            'lengths': {},
         }
 
-    def reset_cache(self, use_cache=False):
+    def reset_cache(self, use_cache=False, max_cache_steps=None):
         self.use_cache = use_cache
+        self.max_cache_steps = max_cache_steps
         self.cache = self._init_cache()
-        self.self_attention.reset_cache(use_cache)
+        self.self_attention.reset_cache(use_cache, max_cache_steps)
         if self.has_xattn:
-            self.cross_attention.reset_cache(use_cache)
+            self.cross_attention.reset_cache(use_cache, max_cache_steps)
 
     def forward(
         self,
@@ -466,9 +520,7 @@ class TransformerLayer(torch.nn.Module):
         x = x * x_mask.unsqueeze(-1)
         x_, s_attn_prob = self.self_attention(query=self.norm_self(x), query_mask=x_mask)
         if self.use_cache:
-            if self.cache['self_attn_output'] is not None:
-                x_ = torch.cat([self.cache['self_attn_output'], x_], dim=1)
-            self.cache['self_attn_output'] = x_
+            x_ = _append_to_cache(self.cache, 'self_attn_output', x_, self.max_cache_steps)
         x = x + x_
 
         x_attn_prob = None
@@ -485,9 +537,7 @@ class TransformerLayer(torch.nn.Module):
                 query=x_normed, query_mask=x_mask, memory=memory, memory_mask=cond_mask, attn_prior=attn_prior
             )
             if self.use_cache:
-                if self.cache['cross_attn_output'] is not None:
-                    x_res = torch.cat([self.cache['cross_attn_output'], x_res], dim=1)
-                self.cache['cross_attn_output'] = x_res
+                x_res = _append_to_cache(self.cache, 'cross_attn_output', x_res, self.max_cache_steps)
             x = x + x_res
 
         # mlp final projection
@@ -626,9 +676,19 @@ class Transformer(torch.nn.Module):
             if 'o_net' in name and name.endswith('weight'):
                 torch.nn.init.normal_(param, mean=0.0, std=0.02 / math.sqrt(2 * self.n_layers))
 
-    def reset_cache(self, use_cache=False):
+    def reset_cache(self, use_cache=False, max_cache_steps=None):
+        """
+        Resets the inference cache of every layer.
+
+        Args:
+            use_cache <bool>: Whether to cache intermediate results across autoregressive steps.
+            max_cache_steps <int>: If set, use static, preallocated cache buffers that fit the first (prefill) call
+                plus `max_cache_steps` decoding steps. Each step then writes in place instead of re-concatenating the
+                whole history, which keeps per-step cost and allocations constant. If None, the cache grows
+                dynamically.
+        """
         for layer in self.layers:
-            layer.reset_cache(use_cache)
+            layer.reset_cache(use_cache, max_cache_steps)
 
     @staticmethod
     def _init_weights_gpt2(module):
@@ -0,0 +1,239 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Packed store of audio codec codes.
+
+Instead of one ``.pt`` file per utterance, the codes of many utterances are concatenated along time into a few
+large shard files of ``[T, C]`` integers. An index maps every key (e.g. the ``target_audio_codes_path`` of a manifest
+entry) to its shard, frame offset and number of frames, so that any window of frames of any utterance is read from a
+memory-mapped shard without unpickling or per-file metadata lookups.
+
+Store layout::
+
+    <store_dir>/
+        index.json        # version, num_codebooks, dtype, shard filenames and keys
+        index.npy         # int64 array of shape [num_keys, 3] with (shard id, frame offset, num frames) per key
+        shard_00000.bin   # raw codes of shape [num_frames, num_codebooks]
+        ...
+"""
+
+import json
+import os
+from typing import Optional, Union
+
+import numpy as np
+import torch
+
+__all__ = ['CodecCodeStore', 'CodecCodeStoreWriter', 'get_cut_codes_key']
+
+INDEX_JSON_FILENAME = 'index.json'
+INDEX_NPY_FILENAME = 'index.npy'
+STORE_VERSION = 1
+CONTEXT_CODES_KEY_SUFFIX = ':context'
+
+
+def get_cut_codes_key(cut, context: bool = False) -> str:
+    """
+    Returns the codec code store key of the target (or context) codes of a Lhotse cut: its `target_codes_key`
+    (or `context_codes_key`) custom field if present, otherwise derived from the cut id.
+    """
+    field = 'context_codes_key' if context else 'target_codes_key'
+    if cut.has_custom(field):
+        return cut.custom[field]
+    return cut.id + CONTEXT_CODES_KEY_SUFFIX if context else cut.id
+
+
+def _shard_filename(shard_id: int) -> str:
+    return f'shard_{shard_id:05d}.bin'
+
+
+def _read_index(store_dir: str):
+    with open(os.path.join(store_dir, INDEX_JSON_FILENAME)) as f:
+        meta = json.load(f)
+    if meta['version'] != STORE_VERSION:
+        raise ValueError(f"Unsupported codec code store version {meta['version']} in {store_dir}")
+    index = np.load(os.path.join(store_dir, INDEX_NPY_FILENAME))
+    if len(index) != len(meta['keys']):
+        raise ValueError(f"Corrupted codec code store {store_dir}: {len(meta['keys'])} keys, {len(index)} entries")
+    return meta, index
+
+
+class CodecCodeStore:
+    """
+    Read-only access to a packed codec code store.
+
+    Shards are memory-mapped lazily in every process, so the store can be created in the main process and pickled
+    to dataloader workers.
+
+    Args:
+        store_dir: directory of the store, written by :class:`CodecCodeStoreWriter`.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        meta, self._index = _read_index(store_dir)
+        self.num_codebooks = meta['num_codebooks']
+        self.dtype = np.dtype(meta['dtype'])
+        self._shard_filenames = meta['shards']
+        self._key_to_row = {key: row for row, key in enumerate(meta['keys'])}
+        self._shards = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shards'] = None
+        return state
+
+    def __len__(self) -> int:
+        return len(self._key_to_row)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_to_row
+
+    def _get_shard(self, shard_id: int) -> np.ndarray:
+        if self._shards is None:
+            self._shards = [None] * len(self._shard_filenames)
+        if self._shards[shard_id] is None:
+            self._shards[shard_id] = np.memmap(
+                os.path.join(self.store_dir, self._shard_filenames[shard_id]), dtype=self.dtype, mode='r'
+            ).reshape(-1, self.num_codebooks)
+        return self._shards[shard_id]
+
+    def num_frames(self, key: str) -> int:
+        """Returns the number of frames stored for `key`."""
+        return int(self._index[self._key_to_row[key], 2])
+
+    def get(self, key: str, start: int = 0, end: Optional[int] = None) -> torch.Tensor:
+        """
+        Reads a window of frames of the codes stored for `key`.
+
+        Args:
+            key: key of the codes.
+            start: first frame to read.
+            end: end frame (exclusive). Defaults to the number of stored frames.
+
+        Returns:
+            Codes of shape `(num_codebooks, end - start)` as an int32 tensor.
+        """
+        shard_id, offset, num_frames = self._index[self._key_to_row[key]]
+        end = num_frames if end is None else min(end, num_frames)
+        start = min(max(start, 0), end)
+        if start == end:
+            return torch.zeros(self.num_codebooks, 0, dtype=torch.int32)
+        codes = self._get_shard(shard_id)[offset + start : offset + end]
+        return torch.from_numpy(codes.astype(np.int32).T)
+
+
+class CodecCodeStoreWriter:
+    """
+    Appends codes to a codec code store, creating it if needed.
+
+    Codes are appended to the current shard until it exceeds `max_shard_size_mb`, then a new shard is started. The
+    index is written by :meth:`close`, so an existing store can be extended and readers only see complete entries.
+
+    Args:
+        store_dir: directory of the store.
+        num_codebooks: number of codebooks of the codes. Must match an existing store.
+        dtype: integer dtype the codes are stored with. Codes are checked to fit in it.
+        max_shard_size_mb: shard size after which a new shard is started.
+    """
+
+    def __init__(self, store_dir: str, num_codebooks: int, dtype: str = 'int16', max_shard_size_mb: float = 1024.0):
+        self.store_dir = store_dir
+        self.max_shard_size = int(max_shard_size_mb * 1024 * 1024)
+
+        if os.path.exists(os.path.join(store_dir, INDEX_JSON_FILENAME)):
+            meta, index = _read_index(store_dir)
+            if meta['num_codebooks'] != num_codebooks or meta['dtype'] != np.dtype(dtype).name:
+                raise ValueError(
+                    f"Existing store {store_dir} has {meta['num_codebooks']} codebooks of {meta['dtype']}, "
+                    f"got {num_codebooks} codebooks of {np.dtype(dtype).name}"
+                )
+            self._shard_filenames = meta['shards']
+            self._keys = meta['keys']
+            self._index = index.tolist()
+        else:
+            os.makedirs(store_dir, exist_ok=True)
+            self._shard_filenames, self._keys, self._index = [], [], []
+
+        self.num_codebooks = num_codebooks
+        self.dtype = np.dtype(dtype)
+        self._dtype_info = np.iinfo(self.dtype)
+        self._key_set = set(self._keys)
+        self._shard_file = None
+        self._shard_frames = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_set
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_new_shard(self):
+        if self._shard_file is not None:
+            self._shard_file.close()
+        self._shard_filenames.append(_shard_filename(len(self._shard_filenames)))
+        self._shard_file = open(os.path.join(self.store_dir, self._shard_filenames[-1]), 'wb')
+        self._shard_frames = 0
+
+    def add(self, key: str, codes: Union[torch.Tensor, np.ndarray]):
+        """
+        Appends the codes of one utterance.
+
+        Args:
+            key: key of the codes, e.g. the `target_audio_codes_path` of a manifest entry. Must be new to the store.
+            codes: codes of shape `(num_codebooks, num_frames)`.
+        """
+        if key in self._key_set:
+            raise ValueError(f"Key {key} is already in the codec code store {self.store_dir}")
+        if isinstance(codes, torch.Tensor):
+            codes = codes.cpu().numpy()
+        if codes.ndim != 2 or codes.shape[0] != self.num_codebooks:
+            raise ValueError(f"Expected codes of shape ({self.num_codebooks}, T) for {key}, got {codes.shape}")
+        if codes.size > 0 and (codes.min() < self._dtype_info.min or codes.max() > self._dtype_info.max):
+            raise ValueError(f"Codes of {key} do not fit in {self.dtype.name}")
+
+        codes = np.ascontiguousarray(codes.T, dtype=self.dtype)
+        if self._shard_file is None or (self._shard_frames > 0 and self._shard_file.tell() >= self.max_shard_size):
+            self._open_new_shard()
+        self._shard_file.write(codes.tobytes())
+
+        self._index.append((len(self._shard_filenames) - 1, self._shard_frames, codes.shape[0]))
+        self._shard_frames += codes.shape[0]
+        self._keys.append(key)
+        self._key_set.add(key)
+
+    def close(self):
+        """Closes the current shard and writes the index."""
+        if self._shard_file is not None:
+            self._shard_file.close()
+            self._shard_file = None
+
+        meta = {
+            'version': STORE_VERSION,
+            'num_codebooks': self.num_codebooks,
+            'dtype': self.dtype.name,
+            'shards': self._shard_filenames,
+            'keys': self._keys,
+        }
+        index = np.asarray(self._index, dtype=np.int64).reshape(-1, 3)
+        np.save(os.path.join(self.store_dir, INDEX_NPY_FILENAME), index)
+        with open(os.path.join(self.store_dir, INDEX_JSON_FILENAME), 'w') as f:
+            json.dump(meta, f)
@@ -0,0 +1,173 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent cache of text tokenization results for TTS datasets.
+
+Every entry is keyed by a 64-bit hash of (namespace, tokenizer name, tokenizer config hash, text), so that a change of
+the tokenizer config simply turns into cache misses. The cache is precomputed offline and stored as memory-mapped
+arrays::
+
+    <cache_dir>/
+        keys.npy      # sorted uint64 keys, shape [num_entries]
+        offsets.npy   # int64 offsets of the token ids of every entry, shape [num_entries + 1]
+        tokens.npy    # int32 token ids of all entries, concatenated
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+__all__ = [
+    'TokenizationCache',
+    'TokenizationCacheWriter',
+    'get_config_hash',
+    'get_tokenization_cache_key',
+    'is_deterministic_tokenizer',
+]
+
+KEYS_FILENAME = 'keys.npy'
+OFFSETS_FILENAME = 'offsets.npy'
+TOKENS_FILENAME = 'tokens.npy'
+
+
+def get_config_hash(*configs: Any) -> str:
+    """
+    Hashes tokenizer configs (OmegaConf nodes, dicts or plain values) into a short hex string.
+    """
+    containers = [
+        OmegaConf.to_container(config, resolve=True) if isinstance(config, (DictConfig, ListConfig)) else config
+        for config in configs
+    ]
+    serialized = json.dumps(containers, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()[:16]
+
+
+def get_tokenization_cache_key(namespace: str, tokenizer_name: str, config_hash: str, text: str) -> int:
+    """
+    Returns the 64-bit cache key of a tokenization result.
+
+    Args:
+        namespace: kind of tokenization, e.g. 'text', 'phoneme' or 'context_text'.
+        tokenizer_name: name of the tokenizer.
+        config_hash: hash of the configuration of the tokenizer, see :func:`get_config_hash`.
+        text: tokenized text.
+    """
+    digest = hashlib.blake2b(
+        '\x00'.join((namespace, tokenizer_name, config_hash, text)).encode('utf-8'), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def is_deterministic_tokenizer(tokenizer) -> bool:
+    """
+    Whether a tokenizer always produces the same tokens for the same text. Tokenizers whose G2P randomly keeps words
+    as graphemes (``phoneme_probability < 1``) are not, and must not be cached.
+    """
+    phoneme_probability = getattr(getattr(tokenizer, 'g2p', None), 'phoneme_probability', None)
+    return phoneme_probability is None or phoneme_probability >= 1.0
+
+
+class TokenizationCache:
+    """
+    Read-only, memory-mapped tokenization cache written by :class:`TokenizationCacheWriter`.
+
+    The arrays are memory-mapped lazily in every process, so the cache can be pickled to dataloader workers.
+
+    Args:
+        cache_dir: directory of the cache.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._arrays = None
+        self._load()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = None
+        return state
+
+    def _load(self):
+        if self._arrays is None:
+            self._arrays = tuple(
+                np.load(os.path.join(self.cache_dir, filename), mmap_mode='r')
+                for filename in (KEYS_FILENAME, OFFSETS_FILENAME, TOKENS_FILENAME)
+            )
+        return self._arrays
+
+    def __len__(self) -> int:
+        return len(self._load()[0])
+
+    def get(self, key: int) -> Optional[List[int]]:
+        """Returns the cached token ids for `key`, or None if it is not in the cache."""
+        keys, offsets, tokens = self._load()
+        idx = int(np.searchsorted(keys, np.uint64(key)))
+        if idx == len(keys) or keys[idx] != key:
+            return None
+        return tokens[offsets[idx] : offsets[idx + 1]].tolist()
+
+
+class TokenizationCacheWriter:
+    """
+    Collects tokenization results and writes them as a :class:`TokenizationCache`. Entries of an existing cache in
+    `cache_dir` are kept.
+
+    Args:
+        cache_dir: directory of the cache.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._entries: Dict[int, np.ndarray] = {}
+        if os.path.exists(os.path.join(cache_dir, KEYS_FILENAME)):
+            keys, offsets, tokens = TokenizationCache(cache_dir)._load()
+            for idx, key in enumerate(keys.tolist()):
+                self._entries[key] = np.array(tokens[offsets[idx] : offsets[idx + 1]])
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def add(self, key: int, tokens: Sequence[int]):
+        """Adds the token ids of one tokenization result."""
+        self._entries[key] = np.asarray(tokens, dtype=np.int32)
+
+    def close(self):
+        """Writes the cache."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        keys = np.array(sorted(self._entries), dtype=np.uint64)
+        lengths = np.array([len(self._entries[key]) for key in keys.tolist()], dtype=np.int64)
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        tokens = (
+            np.concatenate([self._entries[key] for key in keys.tolist()]).astype(np.int32)
+            if len(keys)
+            else np.zeros(0, dtype=np.int32)
+        )
+        for filename, array in ((KEYS_FILENAME, keys), (OFFSETS_FILENAME, offsets), (TOKENS_FILENAME, tokens)):
+            np.save(os.path.join(self.cache_dir, filename), array)
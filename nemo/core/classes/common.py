@@ -21,7 +21,9 @@ import hashlib
 import inspect
 import os
 import shutil
+import time
 import traceback
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
@@ -53,6 +55,13 @@ __all__ = ['Typing', 'FileIO', 'Model', 'Serialization', 'typecheck', 'Pretraine
 
 _TYPECHECK_ENABLED = True
 _TYPECHECK_SEMANTIC_CHECK_ENABLED = True
+_TYPECHECK_CACHE_ENABLED = False
+_TYPECHECK_PROFILING_ENABLED = False
+
+# instance -> set of (typecheck decorator id, call signature) pairs which were already validated
+_TYPECHECK_CACHE = weakref.WeakKeyDictionary()
+# "<class name>.<method name>" -> [number of calls, number of cache hits, total typecheck time in seconds]
+_TYPECHECK_PROFILE: Dict[str, List] = {}
 
 
 # Added these for now but these should be updated based on collections
@@ -362,6 +371,34 @@ def is_semantic_typecheck_enabled():
     return _TYPECHECK_SEMANTIC_CHECK_ENABLED
 
 
+def is_typecheck_cache_enabled():
+    """
+    Getter method for the "validate once" typechecking state.
+    """
+    return _TYPECHECK_CACHE_ENABLED
+
+
+def is_typecheck_profiling_enabled():
+    """
+    Getter method for typechecking profiling state.
+    """
+    return _TYPECHECK_PROFILING_ENABLED
+
+
+def _typecheck_value_signature(value):
+    """
+    Signature of an argument used as a key of the typecheck cache: rank and dtype of tensors, and the structure of
+    containers. Values which differ only in their shape (e.g., batch size or sequence length) share the signature.
+    """
+    if isinstance(value, torch.Tensor):
+        return value.dim(), value.dtype, hasattr(value, 'neural_type')
+    if hasattr(value, 'shape'):
+        return type(value), len(value.shape)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_typecheck_value_signature(val) for val in value)
+    return type(value)
+
+
 @dataclass
 class TypecheckMetadata:
     """
@@ -1336,6 +1373,27 @@ class typecheck:
                 if depth checks are skipped entirely.
 
         """
+        if _TYPECHECK_PROFILING_ENABLED:
+            start_time = time.perf_counter()
+            outputs, call_time, cache_hit = self._typed_call(wrapped, instance, args, kwargs)
+            stats = _TYPECHECK_PROFILE.setdefault(f"{type(instance).__name__}.{wrapped.__name__}", [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += int(cache_hit)
+            stats[2] += time.perf_counter() - start_time - call_time
+            return outputs
+
+        outputs, _, _ = self._typed_call(wrapped, instance, args, kwargs)
+        return outputs
+
+    def _typed_call(self, wrapped, instance: Typing, args, kwargs):
+        """
+        Performs the type checks and calls the wrapped method.
+
+        Returns:
+            A tuple of the outputs of the wrapped method, the time spent in the wrapped method (if profiling
+            is enabled), and a flag indicating whether the checks were skipped as the call signature was
+            already validated.
+        """
         if instance is None:
             raise RuntimeError("Only classes which inherit nemo.core.Typing can use this decorator !")
 
@@ -1348,6 +1406,22 @@ class typecheck:
                 "not `input_ports() and `output_ports()`"
             )
 
+        # In "validate once" mode, skip all the checks for the signatures which were already validated
+        cache_key = None
+        if _TYPECHECK_CACHE_ENABLED:
+            cache_key = (
+                id(self),
+                len(args),
+                tuple((key, _typecheck_value_signature(value)) for key, value in kwargs.items()),
+            )
+            try:
+                validated_signatures = _TYPECHECK_CACHE.setdefault(instance, set())
+            except TypeError:
+                # instance can not be weakly referenced, always check
+                validated_signatures = set()
+            if cache_key in validated_signatures:
+                return *self._call_wrapped(wrapped, args, kwargs), True
+
         # Preserve type information
         if self.input_types is typecheck.TypeState.UNINITIALIZED:
             self.input_types = instance.input_types
@@ -1368,7 +1442,7 @@ class typecheck:
 
         # If types are not defined, skip type checks and just call the wrapped method
         if input_types is None and output_types is None:
-            return wrapped(*args, **kwargs)
+            return *self._call_wrapped(wrapped, args, kwargs), False
 
         # Check that all arguments are kwargs
         if input_types is not None and len(args) > 0:
@@ -1378,13 +1452,25 @@ class typecheck:
         instance._validate_input_types(input_types=input_types, ignore_collections=self.ignore_collections, **kwargs)
 
         # Call the method - this can be forward, or any other callable method
-        outputs = wrapped(*args, **kwargs)
+        outputs, call_time = self._call_wrapped(wrapped, args, kwargs)
 
         instance._attach_and_validate_output_types(
             output_types=output_types, ignore_collections=self.ignore_collections, out_objects=outputs
         )
 
-        return outputs
+        if cache_key is not None:
+            validated_signatures.add(cache_key)
+
+        return outputs, call_time, False
+
+    @staticmethod
+    def _call_wrapped(wrapped, args, kwargs):
+        """Calls the wrapped method, returns its outputs and the time spent in it (if profiling is enabled)"""
+        if not _TYPECHECK_PROFILING_ENABLED:
+            return wrapped(*args, **kwargs), 0.0
+        start_time = time.perf_counter()
+        outputs = wrapped(*args, **kwargs)
+        return outputs, time.perf_counter() - start_time
 
     @staticmethod
     def set_typecheck_enabled(enabled: bool = True):
@@ -1432,6 +1518,82 @@ class typecheck:
         finally:
             typecheck.set_semantic_check_enabled(enabled=True)
 
+    @staticmethod
+    def set_cache_enabled(enabled: bool = True):
+        """
+        Global method to enable/disable "validate once" typechecking.
+
+        When enabled, the first call of a typed method of each instance with a given call signature (names of the
+        arguments, rank and dtype of the tensors, structure of the containers) is fully checked, and all the checks
+        are skipped for the subsequent calls with the same signature. Neural types are not attached to the outputs
+        of the skipped calls.
+
+        Args:
+            enabled: bool, when True will enable "validate once" typechecking.
+        """
+        global _TYPECHECK_CACHE_ENABLED
+        _TYPECHECK_CACHE_ENABLED = enabled
+
+    @staticmethod
+    @contextmanager
+    def cached_checks():
+        """
+        Context manager that temporarily enables "validate once" typechecking within its context.
+        """
+        prev_enabled = is_typecheck_cache_enabled()
+        typecheck.set_cache_enabled(enabled=True)
+        try:
+            yield
+        finally:
+            typecheck.set_cache_enabled(enabled=prev_enabled)
+
+    @staticmethod
+    def clear_cache(instance: Optional[Typing] = None):
+        """
+        Forgets the validated call signatures of the instance (or of all the instances), so that the next calls
+        are checked again. Should be used when the types of a module change (e.g., after changing its export mode).
+
+        Args:
+            instance: the instance to clear the validated call signatures for, all the instances if None.
+        """
+        if instance is None:
+            _TYPECHECK_CACHE.clear()
+        else:
+            _TYPECHECK_CACHE.pop(instance, None)
+
+    @staticmethod
+    def set_profiling_enabled(enabled: bool = True):
+        """
+        Global method to enable/disable profiling of the time spent in typechecking.
+
+        Args:
+            enabled: bool, when True will enable profiling.
+        """
+        global _TYPECHECK_PROFILING_ENABLED
+        _TYPECHECK_PROFILING_ENABLED = enabled
+
+    @staticmethod
+    def get_profiling_stats() -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Returns the typechecking overhead collected while profiling was enabled.
+
+        Returns:
+            A dictionary mapping "<class name>.<method name>" to a dictionary with the number of calls (`calls`),
+            the number of calls with skipped checks (`cache_hits`), and the total time in seconds
+            spent in typechecking, excluding the wrapped method (`time`).
+        """
+        return {
+            name: {"calls": calls, "cache_hits": cache_hits, "time": total_time}
+            for name, (calls, cache_hits, total_time) in _TYPECHECK_PROFILE.items()
+        }
+
+    @staticmethod
+    def reset_profiling_stats():
+        """
+        Resets the collected typechecking profiling stats.
+        """
+        _TYPECHECK_PROFILE.clear()
+
     @staticmethod
     def enable_wrapping(enabled: bool = True):
         """Enables typechecking"""
@@ -39,16 +39,83 @@ from nemo.utils.msc_utils import import_multistorageclient, is_multistorageclien
 from nemo.utils.tar_utils import is_safe_tar_member, safe_extract
 
 
+class _NemoTarIndex:
+    """
+    Index of the members of an uncompressed .nemo tarball.
+
+    Members are read in place from the tarball, and extracted to disk only when requested,
+    so that restoring a model does not require unpacking the whole archive.
+    Raises tarfile.ReadError for compressed (legacy) tarballs.
+    """
+
+    def __init__(self, path2file: str):
+        if is_multistorageclient_url(path2file):
+            msc = import_multistorageclient()
+            self._fileobj = msc.open(path2file, "rb")
+        else:
+            if not os.path.exists(path2file):
+                raise FileNotFoundError(f"{path2file} does not exist")
+            self._fileobj = open(path2file, "rb")
+        try:
+            self._tar = tarfile.open(fileobj=self._fileobj, mode="r:")
+            self.members = {self._normalize(member.name): member for member in self._tar.getmembers()}
+        except Exception:
+            self._fileobj.close()
+            raise
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return PurePosixPath(name).as_posix()
+
+    def __contains__(self, name: str) -> bool:
+        return self._normalize(name) in self.members
+
+    def open(self, name: str):
+        """Returns a seekable binary file object reading the member in place."""
+        member = self.members.get(self._normalize(name))
+        if member is None or not member.isfile():
+            raise FileNotFoundError(f"{name} is not a file in {self._tar.name or 'the .nemo file'}")
+        return self._tar.extractfile(member)
+
+    def read_text(self, name: str) -> str:
+        with self.open(name) as f:
+            return f.read().decode("utf-8")
+
+    def extract(self, name: str, out_folder: str) -> bool:
+        """
+        Extracts a member (with all of its children if it is a directory) to out_folder.
+
+        Returns:
+            True if the member exists in the tarball, False otherwise.
+        """
+        name = self._normalize(name)
+        if name not in self.members:
+            return False
+        prefix = name + "/"
+        members = [member for key, member in self.members.items() if key == name or key.startswith(prefix)]
+        if not os.path.exists(os.path.join(out_folder, name)):
+            SaveRestoreConnector._safe_extract(self._tar, out_folder, members)
+        return True
+
+    def close(self):
+        self._tar.close()
+        self._fileobj.close()
+
+
 class SaveRestoreConnector:
     """
     Connector for saving and restoring models.
     """
 
+    # Tarball indices of the .nemo files being lazily restored, keyed by their (empty) restore folder
+    _lazy_tar_indices: dict[str, _NemoTarIndex] = {}
+
     def __init__(self) -> None:
         self._model_config_yaml = "model_config.yaml"
         self._model_weights_ckpt = "model_weights.ckpt"
         self._model_extracted_dir = None
         self._pack_nemo_file = True
+        self._lazy_restore = False
 
     def save_to(self, model: "nemo_classes.ModelPT", save_path: str):
         """
@@ -119,6 +186,10 @@ class SaveRestoreConnector:
             return_config: If set to true, will return just the underlying config of the restored
                 model as an OmegaConf DictConfig object without instantiating the model.
 
+        If `lazy_restore` is set and the .nemo file is an uncompressed tarball, the config and
+        the weights are read in place from the tarball, and artifacts are extracted only when they
+        are registered with `register_artifact`. Otherwise the tarball is fully extracted.
+
         Example:
             ```
             model = nemo.collections.asr.models.EncDecCTCModel.restore_from('asr.nemo')
@@ -146,12 +217,20 @@ class SaveRestoreConnector:
         if use_extracted_dir:
             logging.info(f"Restoration will occur within pre-extracted directory : " f"`{self.model_extracted_dir}`.")
 
+        tar_index = None
+        model_parallel = app_state.model_parallel_size is not None and app_state.model_parallel_size > 1
+        if self.lazy_restore and not use_extracted_dir and not model_parallel:
+            tar_index = self._open_nemo_tar_index(restore_path)
+
         # Use nullcontext if we have an extracted dir, otherwise create a temp directory
         dir_context = nullcontext(self.model_extracted_dir) if use_extracted_dir else tempfile.TemporaryDirectory()
 
         with dir_context as tmpdir:
             try:
-                if not use_extracted_dir:
+                if tar_index is not None:
+                    # Artifacts are extracted on demand into the temporary directory by register_artifact
+                    self._lazy_tar_indices[tmpdir] = tar_index
+                elif not use_extracted_dir:
                     # Extract the nemo file into the temporary directory
                     filter_fn = None
                     if return_config:
@@ -166,7 +245,9 @@ class SaveRestoreConnector:
                 else:
                     # can be str path or OmegaConf / DictConfig object
                     config_yaml = override_config_path
-                if not isinstance(config_yaml, (OmegaConf, DictConfig)):
+                if tar_index is not None and override_config_path is None:
+                    conf = OmegaConf.create(tar_index.read_text(config_yaml))
+                elif not isinstance(config_yaml, (OmegaConf, DictConfig)):
                     conf = OmegaConf.load(config_yaml)
                 else:
                     conf = config_yaml
@@ -195,9 +276,16 @@ class SaveRestoreConnector:
                 # add load_state_dict override
                 if app_state.model_parallel_size is not None and app_state.model_parallel_size > 1:
                     model_weights = self._inject_model_parallel_rank_for_ckpt(tmpdir, self.model_weights_ckpt)
-                state_dict = self._load_state_dict_from_disk(model_weights, map_location=map_location)
+                if tar_index is not None:
+                    with tar_index.open(self.model_weights_ckpt) as f:
+                        state_dict = self._load_state_dict_from_disk(f, map_location=map_location)
+                else:
+                    state_dict = self._load_state_dict_from_disk(model_weights, map_location=map_location)
             finally:
                 os.chdir(cwd)
+                if tar_index is not None:
+                    self._lazy_tar_indices.pop(tmpdir, None)
+                    tar_index.close()
 
         return (conf, instance, state_dict)
 
@@ -405,6 +493,11 @@ class SaveRestoreConnector:
         else:
             src_obj_path = src_obj_name
 
+        # lazy restore - extract the artifact from the .nemo file being restored only now that it is requested
+        tar_index = self._lazy_tar_indices.get(app_state.nemo_file_folder) if app_state.nemo_file_folder else None
+        if tar_index is not None and not os.path.exists(os.path.abspath(src)):
+            tar_index.extract(src[5:] if src.startswith("nemo:") else src_obj_name, app_state.nemo_file_folder)
+
         # src is a local existing path - register artifact and return exact same path for usage by the model
         if os.path.exists(os.path.abspath(src)):
             return_path = os.path.abspath(src)
@@ -740,6 +833,18 @@ class SaveRestoreConnector:
             tar.close()
         return out_folder
 
+    @staticmethod
+    def _open_nemo_tar_index(path2file: str) -> Optional[_NemoTarIndex]:
+        """
+        Indexes the members of a .nemo file for lazy restoration.
+        Returns None if the file cannot be read in place (compressed tarball).
+        """
+        try:
+            return _NemoTarIndex(path2file)
+        except tarfile.ReadError:
+            logging.info(f"{path2file} is not an uncompressed tarball, it will be fully extracted for restoration.")
+            return None
+
     @staticmethod
     def _save_state_dict_to_disk(state_dict, filepath):
         torch.save(state_dict, filepath)
@@ -807,3 +912,14 @@ class SaveRestoreConnector:
     @pack_nemo_file.setter
     def pack_nemo_file(self, save_nemo_file: bool):
         self._pack_nemo_file = save_nemo_file
+
+    @property
+    def lazy_restore(self) -> bool:
+        """
+        Get the flag for restoring without extracting the whole .nemo file.
+        """
+        return self._lazy_restore
+
+    @lazy_restore.setter
+    def lazy_restore(self, lazy: bool):
+        self._lazy_restore = lazy
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
 import re
 import shutil
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import torch
 from _weakref import proxy
@@ -78,6 +79,9 @@ class NeMoModelCheckpoint(ModelCheckpoint):
         # that `self._remove_checkpoint` adds to. Once `self._save_checkpoint`
         # is called, the last element is frozen and a new element is added.
         self.deferred_ckpts_to_remove: List[List[str]] = []
+        # Host buffers of the async EMA saves (one for the checkpoint and one for the EMA checkpoint), reused by
+        # the next save once the save that filled them has been finalized.
+        self._free_snapshot_buffers: List[Tuple['_HostSnapshotBuffers', '_HostSnapshotBuffers']] = []
 
         # `prefix` is deprecated
         if 'prefix' in kwargs:
@@ -545,18 +549,20 @@ class NeMoModelCheckpoint(ModelCheckpoint):
         self.set_checkpoint_unfinished_marker(filepath, barrier_after=True)
         ema_callback = self._ema_callback(trainer)
         if ema_callback is not None:
+            storage_options = None
             if self.async_save:
-                raise ValueError('async_save with EMA not supported')
-            with ema_callback.save_original_optimizer_state(trainer):
-                super()._save_checkpoint(trainer, filepath)
-
-            # save EMA copy of the model as well.
-            with ema_callback.save_ema_model(trainer):
-                filepath = self._ema_format_filepath(filepath)
-                if self.verbose:
-                    rank_zero_info(f"Saving EMA weights to separate checkpoint {filepath}")
-                super()._save_checkpoint(trainer, filepath)
-            self.remove_checkpoint_unfinished_marker(filepath, barrier_before=True)
+                self._save_ema_checkpoints_async(trainer, filepath, ema_callback)
+            else:
+                with ema_callback.save_original_optimizer_state(trainer):
+                    super()._save_checkpoint(trainer, filepath)
+
+                # save EMA copy of the model as well.
+                with ema_callback.save_ema_model(trainer):
+                    filepath = self._ema_format_filepath(filepath)
+                    if self.verbose:
+                        rank_zero_info(f"Saving EMA weights to separate checkpoint {filepath}")
+                    super()._save_checkpoint(trainer, filepath)
+                self.remove_checkpoint_unfinished_marker(filepath, barrier_before=True)
         else:
             # Async save passed the finalization function to checkpoint_io,
             # sync save calls the finalization function immediately after save.
@@ -580,6 +586,53 @@ class NeMoModelCheckpoint(ModelCheckpoint):
         if self.save_last_n_optim_states >= 0 and '-last' in filepath:
             self._drop_optimizer_states(trainer, filepath, storage_options)
 
+    def _save_ema_checkpoints_async(
+        self, trainer: 'lightning.pytorch.Trainer', filepath: str, ema_callback: EMA  # noqa: F821
+    ) -> None:
+        """Schedules async saves of the original and the EMA checkpoints.
+
+        The EMA weights are swapped into the model in-place only while their checkpoint is dumped, so both
+        checkpoints are snapshotted to (pinned) host memory before training continues. The two files are then
+        written by the async CheckpointIO. The finalization callback (unfinished marker removal, deferred top-k
+        removals) is attached to the EMA save, which is scheduled last, so it runs once both files are written.
+        The host buffers are then handed back for reuse by the next save, since allocating pinned memory is slow.
+        """
+        checkpoint_io = trainer.strategy.checkpoint_io
+        if not isinstance(checkpoint_io, AsyncFinalizableCheckpointIO):
+            raise ValueError('Async save requires async compatible CheckpointIO')
+
+        if self._free_snapshot_buffers:
+            snapshot_buffers = self._free_snapshot_buffers.pop()
+        else:
+            snapshot_buffers = (_HostSnapshotBuffers(), _HostSnapshotBuffers())
+        with ema_callback.save_original_optimizer_state(trainer):
+            checkpoint = _snapshot_to_host(
+                trainer._checkpoint_connector.dump_checkpoint(self.save_weights_only), buffers=snapshot_buffers[0]
+            )
+        with ema_callback.save_ema_model(trainer):
+            ema_checkpoint = _snapshot_to_host(
+                trainer._checkpoint_connector.dump_checkpoint(self.save_weights_only), buffers=snapshot_buffers[1]
+            )
+
+        ema_filepath = self._ema_format_filepath(filepath)
+        save_finalize_fn = self._get_finalize_save_checkpoint_callback(trainer, filepath, trainer.global_step)
+
+        def finalize_fn():
+            save_finalize_fn()
+            # both files are written, the buffers can be overwritten by the next save
+            self._free_snapshot_buffers.append(snapshot_buffers)
+
+        # Each upcoming ckpt removal request will be executed as part of this save finalization
+        self.deferred_ckpts_to_remove.append([])
+
+        logging.info(f'Checkpoint save for step {trainer.global_step} started at {time.time()}.')
+        trainer.strategy.save_checkpoint(checkpoint, filepath, storage_options=None)
+        if self.verbose:
+            rank_zero_info(f"Saving EMA weights to separate checkpoint {ema_filepath}")
+        trainer.strategy.save_checkpoint(ema_checkpoint, ema_filepath, storage_options=dict(finalize_fn=finalize_fn))
+        trainer.strategy.barrier("NeMoModelCheckpoint._save_ema_checkpoints_async")
+        logging.info(f'Scheduled async checkpoint save for {filepath} and {ema_filepath}')
+
     def _get_finalize_save_checkpoint_callback(
         self, trainer: 'lightning.pytorch.Trainer', filepath: str, global_step: int  # noqa: F821
     ):
@@ -738,3 +791,90 @@ class NeMoModelCheckpoint(ModelCheckpoint):
             raise ValueError(f"{self.__class__}.dirpath is None.")
         dirpath = Path(self.dirpath).absolute()
         return dirpath in previous.parents
+
+
+class _HostSnapshotBuffers:
+    """Host buffers holding the tensors of a checkpoint snapshot.
+
+    The buffers are matched to the tensors of the checkpoint in the order they are visited, so the next snapshot of a
+    checkpoint with the same structure reuses them. A buffer is only reallocated when the shape or dtype of its tensor
+    changes. Buffers of CUDA tensors are pinned.
+    """
+
+    def __init__(self):
+        self._buffers: List[torch.Tensor] = []
+        self._num_used = 0
+
+    def start(self) -> None:
+        self._num_used = 0
+
+    def finish(self) -> None:
+        # drop the buffers of tensors that are no longer in the checkpoint
+        del self._buffers[self._num_used :]
+
+    def get(self, tensor: torch.Tensor) -> torch.Tensor:
+        idx = self._num_used
+        self._num_used += 1
+        if idx < len(self._buffers):
+            buffer = self._buffers[idx]
+            if buffer.shape == tensor.shape and buffer.dtype == tensor.dtype and buffer.is_pinned() == tensor.is_cuda:
+                return buffer
+        buffer = torch.empty(tensor.shape, dtype=tensor.dtype, device='cpu', pin_memory=tensor.is_cuda)
+        if idx < len(self._buffers):
+            self._buffers[idx] = buffer
+        else:
+            self._buffers.append(buffer)
+        return buffer
+
+
+def _snapshot_to_host(
+    obj: Any, memo: Optional[Dict[int, Any]] = None, buffers: Optional[_HostSnapshotBuffers] = None
+) -> Any:
+    """Recursively copies the tensors of a checkpoint to host memory, so that it can be written asynchronously
+    while training updates the original tensors.
+
+    CUDA tensors are copied into pinned buffers with non-blocking copies, followed by a single synchronization.
+    Tensors shared between several entries of the checkpoint stay shared in the snapshot. Objects wrapping a tensor
+    in a `data` attribute (e.g. sharded tensors of distributed checkpoints) are shallow-copied with a snapshot of
+    their data. If `buffers` is given, the tensors are copied into its (reused) buffers instead of new ones; they
+    must not be in use by a previous snapshot anymore.
+    """
+    is_root = memo is None
+    if is_root:
+        memo = {}
+        if buffers is not None:
+            buffers.start()
+
+    if isinstance(obj, torch.Tensor):
+        if id(obj) not in memo:
+            tensor = obj.detach()
+            if buffers is not None:
+                snapshot = buffers.get(tensor)
+                snapshot.copy_(tensor, non_blocking=tensor.is_cuda)
+            elif tensor.is_cuda:
+                snapshot = torch.empty(tensor.shape, dtype=tensor.dtype, device='cpu', pin_memory=True)
+                snapshot.copy_(tensor, non_blocking=True)
+            else:
+                snapshot = tensor.clone()
+            memo[id(obj)] = snapshot
+        result = memo[id(obj)]
+    elif isinstance(obj, dict):
+        result = copy.copy(obj)
+        for key, value in obj.items():
+            result[key] = _snapshot_to_host(value, memo, buffers)
+    elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
+        result = type(obj)(*(_snapshot_to_host(value, memo, buffers) for value in obj))
+    elif isinstance(obj, (list, tuple)):
+        result = type(obj)(_snapshot_to_host(value, memo, buffers) for value in obj)
+    elif isinstance(getattr(obj, 'data', None), torch.Tensor):
+        result = copy.copy(obj)
+        result.data = _snapshot_to_host(obj.data, memo, buffers)
+    else:
+        result = obj
+
+    if is_root:
+        if buffers is not None:
+            buffers.finish()
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+    return result
@@ -0,0 +1,224 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming, model-agnostic averaging of PyTorch Lightning checkpoints.
+
+Checkpoints are memory-mapped and only the tensors of their ``state_dict`` are read, so optimizer states are never
+paged in. The average is accumulated one tensor at a time into a single running state dict, which keeps peak host
+memory at about one (float32) copy of the model weights regardless of the number of averaged checkpoints.
+"""
+
+import os
+import tempfile
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import torch
+from tqdm.auto import tqdm
+
+from nemo.utils import logging
+
+if TYPE_CHECKING:
+    from nemo.core.connectors.save_restore_connector import SaveRestoreConnector
+
+__all__ = [
+    'get_averaging_weights',
+    'load_checkpoint_state_dict',
+    'average_checkpoints',
+    'save_averaged_nemo',
+]
+
+
+def get_averaging_weights(
+    num_checkpoints: int, weights: Optional[Sequence[float]] = None, ema_decay: Optional[float] = None
+) -> List[float]:
+    """
+    Computes the normalized weight of every checkpoint in the average.
+
+    Args:
+        num_checkpoints: number of averaged checkpoints.
+        weights: optional non-negative per-checkpoint weights. Defaults to a uniform average.
+        ema_decay: optional decay of an exponential moving average over the checkpoints, taken in the given order,
+            i.e. ``avg = ema_decay * avg + (1 - ema_decay) * checkpoint`` starting from the first checkpoint.
+            Mutually exclusive with ``weights``.
+
+    Returns:
+        A list of ``num_checkpoints`` weights which sum to one.
+    """
+    if num_checkpoints < 1:
+        raise ValueError("At least one checkpoint is required for averaging")
+    if weights is not None and ema_decay is not None:
+        raise ValueError("`weights` and `ema_decay` are mutually exclusive")
+
+    if ema_decay is not None:
+        if not 0.0 <= ema_decay < 1.0:
+            raise ValueError(f"`ema_decay` must be in [0, 1), got {ema_decay}")
+        weights = [ema_decay ** (num_checkpoints - 1)]
+        weights += [(1.0 - ema_decay) * ema_decay ** (num_checkpoints - 1 - idx) for idx in range(1, num_checkpoints)]
+    elif weights is None:
+        weights = [1.0] * num_checkpoints
+
+    weights = [float(weight) for weight in weights]
+    if len(weights) != num_checkpoints:
+        raise ValueError(f"Expected {num_checkpoints} weights, got {len(weights)}")
+    if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+        raise ValueError(f"Averaging weights must be non-negative with a positive sum, got {weights}")
+
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def load_checkpoint_state_dict(checkpoint_path: str, mmap: bool = True) -> Dict[str, torch.Tensor]:
+    """
+    Loads the model weights of a checkpoint on CPU.
+
+    With ``mmap=True`` the tensor storages stay on disk and are only paged in when accessed, so the optimizer states
+    and other entries of a Lightning checkpoint do not take any host memory.
+
+    Args:
+        checkpoint_path: path to a Lightning checkpoint, or to a file containing a plain state dict.
+        mmap: whether to memory-map the checkpoint. Falls back to a regular load for legacy (non-zip) checkpoints.
+
+    Returns:
+        The ``state_dict`` of the checkpoint.
+    """
+    try:
+        checkpoint = torch.load(checkpoint_path, map_location='cpu', mmap=mmap, weights_only=False)
+    except RuntimeError as e:
+        if not mmap:
+            raise
+        logging.warning(f"Could not memory-map {checkpoint_path} ({e}), loading it fully into memory instead.")
+        checkpoint = torch.load(checkpoint_path, map_location='cpu', weights_only=False)
+
+    state_dict = checkpoint.get('state_dict', checkpoint) if isinstance(checkpoint, dict) else None
+    if not isinstance(state_dict, dict) or not all(isinstance(v, torch.Tensor) for v in state_dict.values()):
+        raise RuntimeError(f"Checkpoint from {checkpoint_path} does not include a state_dict.")
+    return state_dict
+
+
+def _accumulation_dtype(dtype: torch.dtype) -> torch.dtype:
+    if dtype.is_floating_point:
+        return torch.float64 if dtype == torch.float64 else torch.float32
+    return dtype
+
+
+def average_checkpoints(
+    checkpoint_paths: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+    ema_decay: Optional[float] = None,
+    mmap: bool = True,
+) -> Dict[str, torch.Tensor]:
+    """
+    Averages the weights of several checkpoints of the same model.
+
+    Floating point tensors are accumulated in (at least) float32 and cast back to their original dtype at the end.
+    Integer tensors (e.g. ``BatchNorm.num_batches_tracked``) are not averaged, but only accumulated, and boolean
+    tensors are taken from the first checkpoint.
+
+    Args:
+        checkpoint_paths: paths to the checkpoints to average.
+        weights: optional per-checkpoint weights, see :func:`get_averaging_weights`.
+        ema_decay: optional EMA decay over the checkpoints in the given order, see :func:`get_averaging_weights`.
+        mmap: whether to memory-map the checkpoints while loading.
+
+    Returns:
+        The averaged state dict.
+    """
+    weights = get_averaging_weights(len(checkpoint_paths), weights=weights, ema_decay=ema_decay)
+
+    avg_state, dtypes = {}, {}
+    for ix, (path, weight) in enumerate(
+        tqdm(zip(checkpoint_paths, weights), total=len(checkpoint_paths), desc='Averaging checkpoints')
+    ):
+        state_dict = load_checkpoint_state_dict(path, mmap=mmap)
+
+        if ix == 0:
+            for key, tensor in state_dict.items():
+                dtypes[key] = tensor.dtype
+                tensor = tensor.to(dtype=_accumulation_dtype(tensor.dtype), copy=True)
+                avg_state[key] = tensor.mul_(weight) if tensor.is_floating_point() else tensor
+            logging.info(f"Initialized average state dict with checkpoint:\n\t{path}")
+        else:
+            if state_dict.keys() != avg_state.keys():
+                missing = sorted(avg_state.keys() - state_dict.keys())
+                unexpected = sorted(state_dict.keys() - avg_state.keys())
+                raise RuntimeError(
+                    f"Checkpoint {path} does not match {checkpoint_paths[0]}: "
+                    f"missing keys {missing}, unexpected keys {unexpected}"
+                )
+            for key, tensor in state_dict.items():
+                if tensor.shape != avg_state[key].shape:
+                    raise RuntimeError(
+                        f"Shape mismatch for {key} in {path}: {tuple(tensor.shape)} vs "
+                        f"{tuple(avg_state[key].shape)}"
+                    )
+                if avg_state[key].is_floating_point():
+                    avg_state[key].add_(tensor.to(avg_state[key].dtype), alpha=weight)
+                elif avg_state[key].dtype != torch.bool:
+                    avg_state[key].add_(tensor)
+            logging.info(f"Updated average state dict with state from checkpoint:\n\t{path}")
+
+        # release the memory map before moving on to the next checkpoint
+        del state_dict
+
+    for key in avg_state:
+        avg_state[key] = avg_state[key].to(dtypes[key])
+    return avg_state
+
+
+def save_averaged_nemo(
+    state_dict: Dict[str, torch.Tensor],
+    reference_nemo_path: str,
+    save_path: str,
+    save_restore_connector: Optional["SaveRestoreConnector"] = None,
+):
+    """
+    Writes a .nemo file with averaged weights without instantiating the model.
+
+    The config and artifacts (tokenizers, etc.) are copied from a reference .nemo file of the same model and only its
+    weights are replaced, so no second copy of the model is ever built in memory.
+
+    Args:
+        state_dict: the averaged state dict. Its keys must match the weights of the reference .nemo file.
+        reference_nemo_path: a .nemo file of the same model, e.g. the one saved at the end of training.
+        save_path: path of the .nemo file to write.
+        save_restore_connector: connector used to unpack and pack the .nemo files. Defaults to
+            ``SaveRestoreConnector()``.
+    """
+    from nemo.core.connectors.save_restore_connector import SaveRestoreConnector
+
+    if save_restore_connector is None:
+        save_restore_connector = SaveRestoreConnector()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_restore_connector._unpack_nemo_file(reference_nemo_path, tmpdir)
+        model_weights = os.path.join(tmpdir, save_restore_connector.model_weights_ckpt)
+        if not os.path.isfile(model_weights):
+            raise RuntimeError(
+                f"{reference_nemo_path} does not contain {save_restore_connector.model_weights_ckpt}, "
+                "model parallel .nemo files are not supported."
+            )
+
+        # only keep the keys, the memory-mapped reference weights are overwritten below
+        reference_keys = set(load_checkpoint_state_dict(model_weights))
+        if reference_keys != state_dict.keys():
+            raise RuntimeError(
+                f"Averaged state dict does not match {reference_nemo_path}: "
+                f"missing keys {sorted(reference_keys - state_dict.keys())}, "
+                f"unexpected keys {sorted(state_dict.keys() - reference_keys)}"
+            )
+
+        save_restore_connector._save_state_dict_to_disk(state_dict, model_weights)
+        save_restore_connector._make_nemo_file_from_folder(os.path.abspath(save_path), tmpdir)
+    logging.info(f"Averaged model saved as : {save_path}")
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import collections
+import heapq
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -20,7 +21,53 @@ from tqdm import tqdm
 
 from nemo.utils import logging
 
-PACKING_ALGOS = ["first_fit_decreasing", "first_fit_shuffle"]
+PACKING_ALGOS = ["first_fit_decreasing", "first_fit_shuffle", "best_fit_decreasing"]
+
+
+class _MaxSegmentTree:
+    """
+    Max segment tree over a fixed number of integer leaves.
+
+    Supports point updates and "leftmost leaf with value >= threshold" queries, both in O(log n).
+    """
+
+    def __init__(self, num_leaves: int, init_value: int):
+        self.size = 1
+        while self.size < max(num_leaves, 1):
+            self.size *= 2
+        # leaves beyond num_leaves can never be returned by a query
+        self.tree = [-1] * (2 * self.size)
+        for i in range(num_leaves):
+            self.tree[self.size + i] = init_value
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def __getitem__(self, i: int) -> int:
+        return self.tree[self.size + i]
+
+    def update(self, i: int, value: int):
+        """Sets leaf `i` to `value`."""
+        i += self.size
+        self.tree[i] = value
+        i //= 2
+        while i >= 1:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def find_first(self, threshold: int, start: int = 0) -> int:
+        """Returns the index of the leftmost leaf at or after `start` with value >= `threshold`, or -1."""
+        return self._find_first(1, 0, self.size, threshold, start)
+
+    def _find_first(self, node: int, lo: int, hi: int, threshold: int, start: int) -> int:
+        if hi <= start or self.tree[node] < threshold:
+            return -1
+        if hi - lo == 1:
+            return lo
+        mid = (lo + hi) // 2
+        idx = self._find_first(2 * node, lo, mid, threshold, start)
+        if idx == -1:
+            idx = self._find_first(2 * node + 1, mid, hi, threshold, start)
+        return idx
 
 
 def find_first_bin_that_fits(bins: List[List[int]], s: int, bin_size: int) -> int:
@@ -45,6 +92,9 @@ def first_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
     """
     Packs sequences of varying lengths into bins using the First-Fit algorithm.
 
+    The first bin that fits each sequence is found with a max segment tree over the remaining bin capacities,
+    so packing takes O(n log n) instead of re-summing every bin for every sequence.
+
     Args:
       seqlens: A list of integers, representing the lengths of the sequences to be packed.
       pack_size: The maximum capacity of each bin.
@@ -54,12 +104,54 @@ def first_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
         of the sequences assigned to that bin.
     """
     res = []
+    # One leaf per possible bin. Bins that are not open yet have the full capacity, so the leftmost bin that fits
+    # is either an open bin or the next bin to open.
+    remaining = _MaxSegmentTree(len(seqlens), pack_size)
     for s in seqlens:
-        first_bin = find_first_bin_that_fits(res, s, pack_size)
-        if first_bin == -1:  # open a new bin
+        first_bin = remaining.find_first(s)
+        if first_bin == -1 or first_bin == len(res):  # open a new bin
+            first_bin = len(res)
             res.append([s])
         else:
             res[first_bin].append(s)
+        remaining.update(first_bin, remaining[first_bin] - s)
+    return res
+
+
+def best_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the Best-Fit algorithm.
+
+    Each sequence goes to the open bin with the smallest remaining capacity that still fits it (the lowest bin index
+    among ties), or to a new bin if none fits. Open bins are bucketed by remaining capacity, and the smallest
+    non-empty bucket that fits is found with a max segment tree, so packing takes O(n log n).
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    res = []
+    # bins_by_capacity[c] is a min-heap of the indices of open bins with remaining capacity c
+    bins_by_capacity = [[] for _ in range(pack_size + 1)]
+    # leaf c is 1 if there is an open bin with remaining capacity c, else 0
+    has_capacity = _MaxSegmentTree(pack_size + 1, 0)
+    for s in seqlens:
+        capacity = has_capacity.find_first(1, start=s) if 0 <= s <= pack_size else -1
+        if capacity == -1:  # open a new bin
+            res.append([s])
+            bin_idx, new_capacity = len(res) - 1, pack_size - s
+        else:
+            bin_idx = heapq.heappop(bins_by_capacity[capacity])
+            if not bins_by_capacity[capacity]:
+                has_capacity.update(capacity, 0)
+            res[bin_idx].append(s)
+            new_capacity = capacity - s
+        if new_capacity >= 0:
+            heapq.heappush(bins_by_capacity[new_capacity], bin_idx)
+            has_capacity.update(new_capacity, 1)
     return res
 
 
@@ -80,6 +172,23 @@ def first_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
     return first_fit(sorted_seqlens, pack_size)
 
 
+def best_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the Best-Fit Decreasing algorithm.
+
+    This is a variation of the Best-Fit algorithm where the sequences are sorted by decreasing length before packing.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    sorted_seqlens = sorted(seqlens, reverse=True)
+    return best_fit(sorted_seqlens, pack_size)
+
+
 def first_fit_shuffle(seqlens: List[int], pack_size: int) -> List[List[int]]:
     """
     Packs sequences of varying lengths into bins using the First-Fit with Shuffling algorithm.
@@ -116,25 +225,34 @@ def create_hist(dataset: np.array, truncate_seq_len: int):
     """
     logging.info("Creating histogram from tokenized dataset...")
 
+    # Minus 1 here to account for the fact that transformer input and label
+    # have one less token than the full sequence.
+    # Input is missing the last token and label is missing the first token
+    # (this way the tokens are aligned for next token prediction).
+    # We want pack size to be the length of the actual input and label, hence minus 1.
+    seq_lens = np.fromiter((len(item_dict["input_ids"]) - 1 for item_dict in dataset), dtype=np.int64)
+    if len(seq_lens) > 0 and seq_lens.min() < 0:
+        raise ValueError(
+            f"Found {int((seq_lens < 0).sum())} sequence(s) with empty input_ids (e.g. at index "
+            f"{int(np.argmax(seq_lens < 0))}), remove them from the dataset before packing"
+        )
+    if len(seq_lens) > 0 and seq_lens.max() > truncate_seq_len:
+        raise ValueError(
+            f"Found a sequence of length {seq_lens.max()} which is longer than truncate_seq_len={truncate_seq_len}"
+        )
+    counts = np.bincount(seq_lens, minlength=truncate_seq_len + 1)
+
     sequences = collections.defaultdict(list)
-    counts = [0] * (truncate_seq_len + 1)
-
-    for item_dict in dataset:
-        # Minus 1 here to account for the fact that transformer input and label
-        # have one less token than the full sequence.
-        # Input is missing the last token and label is missing the first token
-        # (this way the tokens are aligned for next token prediction).
-        # We want pack size to be the length of the actual input and label, hence minus 1.
-        seq_len = len(item_dict["input_ids"]) - 1
-        sequences[seq_len].append(item_dict)
-        counts[seq_len] += 1
+    # group the items by length with a single stable sort instead of one dict lookup per item
+    order = np.argsort(seq_lens, kind="stable")
+    boundaries = np.concatenate([[0], np.cumsum(counts)])
+    for seq_len in np.flatnonzero(counts).tolist():
+        sequences[seq_len] = [dataset[idx] for idx in order[boundaries[seq_len] : boundaries[seq_len + 1]].tolist()]
 
     logging.debug("Histogram of sequence lengths")
     logging.debug(counts)
 
-    histogram = []
-    for seq_len in range(truncate_seq_len + 1):
-        histogram.append(len(sequences[seq_len]))
+    histogram = counts.tolist()
 
     return sequences, histogram
 
@@ -152,7 +270,8 @@ def create_packing_strategy(
     Args:
           histogram: A list representing the histogram data (number of sequences for each length).
           pack_size: The maximum capacity of each bin.
-          packing_algorithm: One of the supported packing algorithms from ['first_fit_decreasing', 'first_fit_shuffle']
+          packing_algorithm: One of the supported packing algorithms from
+                             ['first_fit_decreasing', 'first_fit_shuffle', 'best_fit_decreasing']
 
     Returns:
           assignments: A list of lists, where each inner list represents a bin and contains the indices of the
@@ -162,9 +281,7 @@ def create_packing_strategy(
 
     logging.info(f"Packing sequences to length {pack_size}...")
 
-    all_seq_lens = []
-    for i, count in enumerate(histogram):
-        all_seq_lens.extend([i] * count)
+    all_seq_lens = np.repeat(np.arange(len(histogram)), histogram).tolist()
 
     packing_fn = globals()[packing_algorithm]
     assignments: List[List[int]] = packing_fn(all_seq_lens, pack_size)
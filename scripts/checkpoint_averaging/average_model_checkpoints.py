@@ -28,17 +28,19 @@
 
 """
 # Changes to script
-Change the script to import the NeMo model class you would like to load a checkpoint for,
-then update the model constructor to use this model class. This can be found by the line:
-<<< Change model class here ! >>>
-By default, this script imports and creates the `EncDecCTCModelBPE` class but it can be
-changed to any NeMo Model.
+The model class is taken from `model.target` of the config, or can be given with `+class_path=<module.Class>`.
+Alternatively, `+reference_nemo=<path to .nemo>` reuses the config and artifacts of an existing .nemo file of the same
+model, in which case no model is instantiated at all.
+Checkpoints are memory-mapped and averaged one tensor at a time, so peak memory is about one copy of the model weights.
+Use `+weights=[...]` for a weighted average, or `+ema_decay=<decay>` for an exponential moving average over the
+checkpoints in the given order.
 # Run the script
 ## Saving a .nemo model file (loaded with ModelPT.restore_from(...))
 HYDRA_FULL_ERROR=1 python average_model_checkpoints.py \
     --config-path="<path to config directory>" \
     --config-name="<config name>" \
     name=<name of the averaged checkpoint> \
+    +class_path=<OPTIONAL: e.g. nemo.collections.asr.models.EncDecCTCModelBPE> \
     +checkpoint_dir=<OPTIONAL: directory of checkpoint> \
     +checkpoint_paths=\"[/path/to/ptl_1.ckpt,/path/to/ptl_2.ckpt,/path/to/ptl_3.ckpt,...]\"
 ## Saving an averaged pytorch checkpoint (loaded with torch.load(...))
@@ -52,15 +54,15 @@ HYDRA_FULL_ERROR=1 python average_model_checkpoints.py \
 """
 
 import os
+import tempfile
 
 import lightning.pytorch as pl
 import torch
 from omegaconf import OmegaConf, open_dict
 
-# Change this import to the model you would like to average
-from nemo.collections.asr.models import EncDecCTCModelBPE
 from nemo.core.config import hydra_runner
-from nemo.utils import logging
+from nemo.utils import logging, model_utils
+from nemo.utils.checkpoint_averaging import average_checkpoints, save_averaged_nemo
 
 
 def process_config(cfg: OmegaConf):
@@ -101,6 +103,20 @@ def process_config(cfg: OmegaConf):
     return name_prefix, checkpoint_paths, save_ckpt_only
 
 
+def build_reference_nemo(cfg: OmegaConf, save_path: str):
+    """
+    Instantiates the model described by the config and saves it as the reference .nemo file for its config and
+    artifacts. The model is released before averaging starts, so it never coexists with the averaged weights.
+    """
+    class_path = cfg.get('class_path', None) or cfg.model.get('target', None)
+    if class_path is None:
+        raise ValueError("The model class must be given with `+class_path` when `model.target` is not in the config")
+
+    trainer = pl.Trainer(**cfg.trainer)
+    model = model_utils.import_class_by_path(class_path)(cfg=cfg.model, trainer=trainer)
+    model.save_to(save_path)
+
+
 @hydra_runner(config_path=None, config_name=None)
 def main(cfg):
     """
@@ -111,62 +127,28 @@ def main(cfg):
 
     name_prefix, checkpoint_paths, save_ckpt_only = process_config(cfg)
 
-    if not save_ckpt_only:
-        trainer = pl.Trainer(**cfg.trainer)
-
-        # <<< Change model class here ! >>>
-        # Model architecture which will contain the averaged checkpoints
-        # Change the model constructor to the one you would like (if needed)
-        model = EncDecCTCModelBPE(cfg=cfg.model, trainer=trainer)
-
-    """ < Checkpoint Averaging Logic > """
-    # load state dicts
-    n = len(checkpoint_paths)
-    avg_state = None
-
-    logging.info(f"Averaging {n} checkpoints ...")
-
-    for ix, path in enumerate(checkpoint_paths):
-        checkpoint = torch.load(path, map_location='cpu')
-
-        if 'state_dict' in checkpoint:
-            checkpoint = checkpoint['state_dict']
+    with open_dict(cfg):
+        weights = cfg.pop('weights', None)
+        ema_decay = cfg.pop('ema_decay', None)
+        reference_nemo = cfg.pop('reference_nemo', None)
 
-        if ix == 0:
-            # Initial state
-            avg_state = checkpoint
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if not save_ckpt_only and reference_nemo is None:
+            reference_nemo = os.path.join(tmpdir, 'reference.nemo')
+            build_reference_nemo(cfg, reference_nemo)
 
-            logging.info(f"Initialized average state dict with checkpoint : {path}")
-        else:
-            # Accumulated state
-            for k in avg_state:
-                avg_state[k] = avg_state[k] + checkpoint[k]
+        logging.info(f"Averaging {len(checkpoint_paths)} checkpoints ...")
+        avg_state = average_checkpoints(checkpoint_paths, weights=weights, ema_decay=ema_decay)
 
-            logging.info(f"Updated average state dict with state from checkpoint : {path}")
+        # Save model
+        if save_ckpt_only:
+            ckpt_name = name_prefix + '-averaged.ckpt'
+            torch.save(avg_state, ckpt_name)
 
-    for k in avg_state:
-        if str(avg_state[k].dtype).startswith("torch.int"):
-            # For int type, not averaged, but only accumulated.
-            # e.g. BatchNorm.num_batches_tracked
-            pass
+            logging.info(f"Averaged pytorch checkpoint saved as : {ckpt_name}")
         else:
-            avg_state[k] = avg_state[k] / n
-
-    # Save model
-    if save_ckpt_only:
-        ckpt_name = name_prefix + '-averaged.ckpt'
-        torch.save(avg_state, ckpt_name)
-
-        logging.info(f"Averaged pytorch checkpoint saved as : {ckpt_name}")
-    else:
-        # Set model state
-        logging.info("Loading averaged state dict in provided model")
-        model.load_state_dict(avg_state, strict=True)
-
-        ckpt_name = name_prefix + '-averaged.nemo'
-        model.save_to(ckpt_name)
-
-        logging.info(f"Averaged model saved as : {ckpt_name}")
+            ckpt_name = name_prefix + '-averaged.nemo'
+            save_averaged_nemo(avg_state, reference_nemo_path=reference_nemo, save_path=ckpt_name)
 
 
 if __name__ == '__main__':
@@ -13,6 +13,8 @@
 # limitations under the License.
 """
 Builds a .nemo file with average weights over multiple .ckpt files (assumes .ckpt files in same folder as .nemo file).
+Checkpoints are memory-mapped and averaged one tensor at a time, so peak memory is about one copy of the model weights.
+Use --weights for a weighted average, or --ema_decay for an exponential moving average of the checkpoints.
 Usage example for building *-averaged.nemo for a given .nemo file:
 NeMo/scripts/checkpoint_averaging/checkpoint_averaging.py my_model.nemo
 Usage example for building *-averaged.nemo files for all results in sub-directories under current path:
@@ -27,11 +29,8 @@ import importlib
 import os
 import sys
 
-import torch
-from tqdm.auto import tqdm
-
-from nemo.core import ModelPT
-from nemo.utils import logging, model_utils
+from nemo.utils import logging
+from nemo.utils.checkpoint_averaging import average_checkpoints, save_averaged_nemo
 
 
 def main():
@@ -61,7 +60,25 @@ def main():
         '--class_path',
         type=str,
         default='',
-        help='A path to class "module.submodule.class" (if given)',
+        help='Deprecated and ignored, the averaged weights are written without instantiating the model',
+    )
+    parser.add_argument(
+        '--weights',
+        type=float,
+        nargs='+',
+        default=None,
+        help='Optional per-checkpoint weights, in the order of checkpoint modification time (oldest first)',
+    )
+    parser.add_argument(
+        '--ema_decay',
+        type=float,
+        default=None,
+        help='Optional EMA decay over the checkpoints in the order of their modification time (oldest first)',
+    )
+    parser.add_argument(
+        '--no_mmap',
+        action='store_true',
+        help='Load checkpoints fully into memory instead of memory-mapping them',
     )
     args = parser.parse_args()
 
@@ -76,7 +93,8 @@ def main():
         sys.path.insert(0, os.path.dirname(fn))
         globals().update(importlib.import_module(os.path.splitext(os.path.basename(fn))[0]).__dict__)
 
-    device = torch.device("cpu")
+    if args.class_path:
+        logging.warning("--class_path is ignored, the averaged weights are written without instantiating the model")
 
     # loop over all folders with .nemo files (or .nemo files)
     for model_fname_i, model_fname in enumerate(args.model_fname_list):
@@ -96,62 +114,26 @@ def main():
 
         logging.info(f"\n===> [{model_fname_i+1} / {len(args.model_fname_list)}] Parsing folder {model_folder_path}\n")
 
-        # restore model from .nemo file path
-        model_cfg = ModelPT.restore_from(restore_path=model_fname, return_config=True)
-        if args.class_path:
-            classpath = args.class_path
-        else:
-            classpath = model_cfg.target  # original class path
-        imported_class = model_utils.import_class_by_path(classpath)
-        logging.info(f"Loading model {model_fname}")
-        nemo_model = imported_class.restore_from(restore_path=model_fname, map_location=device)
-
-        # search for all checkpoints (ignore -last.ckpt)
-        checkpoint_paths = [
-            os.path.join(model_folder_path, x)
-            for x in os.listdir(model_folder_path)
-            if x.endswith('.ckpt') and not x.endswith('-last.ckpt')
-        ]
-        """ < Checkpoint Averaging Logic > """
-        # load state dicts
-        n = len(checkpoint_paths)
-        avg_state = None
-
-        logging.info(f"Averaging {n} checkpoints ...")
-
-        for ix, path in enumerate(tqdm(checkpoint_paths, total=n, desc='Averaging checkpoints')):
-            checkpoint = torch.load(path, map_location=device)
-
-            if 'state_dict' in checkpoint:
-                checkpoint = checkpoint['state_dict']
-            else:
-                raise RuntimeError(f"Checkpoint from {path} does not include a state_dict.")
-
-            if ix == 0:
-                # Initial state
-                avg_state = checkpoint
-
-                logging.info(f"Initialized average state dict with checkpoint:\n\t{path}")
-            else:
-                # Accumulated state
-                for k in avg_state:
-                    avg_state[k] = avg_state[k] + checkpoint[k]
-
-                logging.info(f"Updated average state dict with state from checkpoint:\n\t{path}")
-
-        for k in avg_state:
-            if str(avg_state[k].dtype).startswith("torch.int"):
-                # For int type, not averaged, but only accumulated.
-                # e.g. BatchNorm.num_batches_tracked
-                pass
-            else:
-                avg_state[k] = avg_state[k] / n
-
-        # restore merged weights into model
-        nemo_model.load_state_dict(avg_state, strict=True)
+        # search for all checkpoints (ignore -last.ckpt), oldest first so that EMA weights the latest ones most
+        checkpoint_paths = sorted(
+            (
+                os.path.join(model_folder_path, x)
+                for x in os.listdir(model_folder_path)
+                if x.endswith('.ckpt') and not x.endswith('-last.ckpt')
+            ),
+            key=os.path.getmtime,
+        )
+        logging.info(f"Averaging {len(checkpoint_paths)} checkpoints ...")
+
+        # weights are streamed from memory-mapped checkpoints, the model itself is never instantiated
+        avg_state = average_checkpoints(
+            checkpoint_paths, weights=args.weights, ema_decay=args.ema_decay, mmap=not args.no_mmap
+        )
+
         # Save model
         logging.info(f"Saving average model to:\n\t{avg_model_fname}")
-        nemo_model.save_to(avg_model_fname)
+        save_averaged_nemo(avg_state, reference_nemo_path=model_fname, save_path=avg_model_fname)
+        del avg_state
 
 
 if __name__ == '__main__':
@@ -0,0 +1,65 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the sequence packing algorithms in `nemo.utils.sequence_packing_utils` on synthetic
+sequence lengths. Reports packing time, number of packs and packing efficiency for each algorithm.
+
+Example:
+    python benchmark_sequence_packing.py --num_sequences 1000000 --pack_size 4096 --max_seq_len 2048
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from nemo.utils.sequence_packing_utils import PACKING_ALGOS, create_packing_strategy
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark sequence packing algorithms.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--num_sequences", type=int, default=200000, help="Number of sequences to pack.")
+    parser.add_argument("--pack_size", type=int, default=4096, help="Maximum number of tokens in a pack.")
+    parser.add_argument("--max_seq_len", type=int, default=2048, help="Maximum sequence length.")
+    parser.add_argument(
+        "--algorithms", nargs="+", default=PACKING_ALGOS, choices=PACKING_ALGOS, help="Algorithms to benchmark."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+    # log-normal lengths resemble the long-tailed length distribution of SFT datasets
+    seq_lens = np.clip(rng.lognormal(mean=5.5, sigma=1.0, size=args.num_sequences), 1, args.max_seq_len).astype(int)
+    histogram = np.bincount(seq_lens, minlength=args.max_seq_len + 1).tolist()
+
+    print(f"Sequences: {args.num_sequences}, pack size: {args.pack_size}, max length: {args.max_seq_len}")
+    for algorithm in args.algorithms:
+        start = time.perf_counter()
+        assignments, metadata = create_packing_strategy(histogram, args.pack_size, algorithm)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{algorithm:<22} time: {elapsed:8.2f} s  packs: {len(assignments):8d}  "
+            f"efficiency: {metadata['packing_efficiency']:.2f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This script fills a packed codec code store (see nemo/collections/tts/parts/utils/codec_code_store.py), which replaces
+the per-utterance `.pt` code caches of MagpieTTS training with a few memory-mapped shards.
+
+The store can be filled from three sources. Running the script several times on the same store appends to it, and
+codes whose key is already in the store are skipped.
+
+1. `--source pt`: the existing `.pt` caches of a NeMo manifest. The `target_audio_codes_path` and
+   `context_audio_codes_path` values are used as keys, so the manifest can be used as is:
+    python scripts/magpietts/build_codec_code_store.py \
+        --source pt \
+        --manifest ${MANIFEST} \
+        --store-dir ${STORE_DIR}
+
+2. `--source codec`: running a codec model in batches on the audio of a NeMo manifest. The keys are the audio file
+   paths of the manifest, and a copy of the manifest pointing `target_audio_codes_path` and
+   `context_audio_codes_path` to them is written to `--output-manifest`:
+    python scripts/magpietts/build_codec_code_store.py \
+        --source codec \
+        --manifest ${MANIFEST} \
+        --audio-dir ${AUDIO_DIR} \
+        --codec-model-path ${CODEC_MODEL_PATH} \
+        --store-dir ${STORE_DIR} \
+        --output-manifest ${OUTPUT_MANIFEST}
+
+3. `--source lhotse`: the `target_codes`/`context_codes` arrays of a Lhotse cuts manifest, keyed by cut id (see
+   `get_cut_codes_key`):
+    python scripts/magpietts/build_codec_code_store.py \
+        --source lhotse \
+        --manifest ${CUTS_MANIFEST} \
+        --store-dir ${STORE_DIR}
+
+The store is then used by setting `codec_code_store_dir` in the `MagpieTTSDataset` config, or in the dataset config
+of Lhotse dataloaders.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import torch
+from tqdm import tqdm
+
+from nemo.collections.asr.parts.utils.manifest_utils import read_manifest, write_manifest
+from nemo.collections.tts.parts.utils.codec_code_store import CodecCodeStoreWriter, get_cut_codes_key
+from nemo.collections.tts.parts.utils.tts_dataset_utils import _read_audio, get_audio_filepaths, load_audio
+from nemo.utils import logging
+
+
+def get_audio_codes_key(audio_filepath: str, offset: float = 0.0) -> str:
+    """Key of the codes of an audio file (segment) computed with --source codec."""
+    return f"{audio_filepath}@{offset}" if offset else audio_filepath
+
+
+def fill_from_pt_files(writer: CodecCodeStoreWriter, manifest_path: str):
+    for entry in tqdm(read_manifest(manifest_path), desc="Copying .pt codes"):
+        for field in ('target_audio_codes_path', 'context_audio_codes_path'):
+            codes_path = entry.get(field)
+            if codes_path is not None and codes_path not in writer:
+                writer.add(codes_path, torch.load(codes_path))
+
+
+def fill_from_lhotse_cuts(writer: CodecCodeStoreWriter, manifest_path: str):
+    from lhotse import CutSet
+
+    for cut in tqdm(CutSet.from_file(manifest_path), desc="Copying Lhotse codes"):
+        for context, field in ((False, 'target_codes'), (True, 'context_codes')):
+            key = get_cut_codes_key(cut, context=context)
+            if cut.has_custom(field) and key not in writer:
+                writer.add(key, cut.custom[field].load())
+
+
+@torch.inference_mode()
+def encode_and_add(writer: CodecCodeStoreWriter, codec_model, keys, audios):
+    audio_lens = torch.tensor([len(audio) for audio in audios], dtype=torch.int32)
+    batch = torch.zeros(len(audios), int(audio_lens.max()), dtype=torch.float32)
+    for idx, audio in enumerate(audios):
+        batch[idx, : len(audio)] = torch.from_numpy(audio)
+    codes, codes_lens = codec_model.encode(
+        audio=batch.to(codec_model.device), audio_len=audio_lens.to(codec_model.device)
+    )
+    codes, codes_lens = codes.cpu(), codes_lens.cpu()
+    for key, item_codes, item_len in zip(keys, codes, codes_lens):
+        writer.add(key, item_codes[:, :item_len])
+
+
+def fill_from_codec_model(
+    writer: CodecCodeStoreWriter,
+    manifest_path: str,
+    audio_dir: str,
+    codec_model,
+    output_manifest_path: str,
+    batch_size: int,
+    volume_norm: bool,
+):
+    sample_rate = codec_model.sample_rate
+    entries = read_manifest(manifest_path)
+    pending_keys, pending_audios = [], []
+
+    def _flush():
+        if pending_keys:
+            encode_and_add(writer, codec_model, pending_keys, pending_audios)
+            pending_keys.clear()
+            pending_audios.clear()
+
+    for entry in tqdm(entries, desc="Encoding audio"):
+        # target audio is loaded like MagpieTTSDataset does when codes are not cached
+        _, audio_filepath_rel = get_audio_filepaths(manifest_entry=entry, audio_dir=Path(audio_dir))
+        key = get_audio_codes_key(str(audio_filepath_rel), entry.get('offset', 0.0))
+        if key not in writer and key not in pending_keys:
+            audio, _, _ = load_audio(
+                manifest_entry=entry, audio_dir=Path(audio_dir), sample_rate=sample_rate, volume_norm=volume_norm
+            )
+            pending_keys.append(key)
+            pending_audios.append(audio)
+        entry['target_audio_codes_path'] = key
+
+        if 'context_audio_filepath' in entry:
+            context_key = get_audio_codes_key(entry['context_audio_filepath'])
+            if context_key not in writer and context_key not in pending_keys:
+                context_audio = _read_audio(
+                    audio_filepath=os.path.join(audio_dir, entry['context_audio_filepath']),
+                    sample_rate=sample_rate,
+                    offset=0,
+                    duration=entry['context_audio_duration'],
+                ).samples
+                pending_keys.append(context_key)
+                pending_audios.append(context_audio)
+            entry['context_audio_codes_path'] = context_key
+
+        if len(pending_keys) >= batch_size:
+            _flush()
+    _flush()
+
+    write_manifest(output_manifest_path, entries)
+    logging.info(f"Manifest with codec code store keys written to {output_manifest_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill a packed codec code store for MagpieTTS training.")
+    parser.add_argument("--source", choices=["pt", "codec", "lhotse"], required=True, help="Where to take codes from.")
+    parser.add_argument("--manifest", type=str, required=True, help="NeMo manifest, or Lhotse cuts for lhotse.")
+    parser.add_argument("--store-dir", type=str, required=True, help="Directory of the codec code store.")
+    parser.add_argument("--num-codebooks", type=int, default=None, help="Number of codebooks (inferred if not set).")
+    parser.add_argument("--dtype", type=str, default="int16", help="Integer dtype the codes are stored with.")
+    parser.add_argument("--max-shard-size-mb", type=float, default=1024.0, help="Size of the store shards.")
+    parser.add_argument("--audio-dir", type=str, default="", help="Base directory of the audio for codec.")
+    parser.add_argument("--codec-model-path", type=str, default=None, help="Path to the .nemo codec model for codec.")
+    parser.add_argument("--output-manifest", type=str, default=None, help="Manifest with store keys for codec.")
+    parser.add_argument("--batch-size", type=int, default=32, help="Batch size of codec inference.")
+    parser.add_argument("--no-volume-norm", action="store_true", help="Disable volume normalization of target audio.")
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    args = parser.parse_args()
+
+    codec_model = None
+    if args.source == "codec":
+        if args.codec_model_path is None or args.output_manifest is None:
+            raise ValueError("--codec-model-path and --output-manifest are required with --source codec")
+        from nemo.collections.tts.models import AudioCodecModel
+
+        codec_model = AudioCodecModel.restore_from(restore_path=args.codec_model_path, map_location='cpu')
+        codec_model = codec_model.to(args.device).eval()
+
+    num_codebooks = args.num_codebooks
+    if num_codebooks is None:
+        if codec_model is not None:
+            num_codebooks = codec_model.num_codebooks
+        elif args.source == "pt":
+            entry = next(e for e in read_manifest(args.manifest) if 'target_audio_codes_path' in e)
+            num_codebooks = torch.load(entry['target_audio_codes_path']).shape[0]
+        else:
+            raise ValueError("--num-codebooks is required with --source lhotse")
+
+    with CodecCodeStoreWriter(
+        args.store_dir, num_codebooks=num_codebooks, dtype=args.dtype, max_shard_size_mb=args.max_shard_size_mb
+    ) as writer:
+        num_existing = len(writer)
+        if args.source == "pt":
+            fill_from_pt_files(writer, args.manifest)
+        elif args.source == "lhotse":
+            fill_from_lhotse_cuts(writer, args.manifest)
+        else:
+            fill_from_codec_model(
+                writer,
+                args.manifest,
+                args.audio_dir,
+                codec_model,
+                args.output_manifest,
+                batch_size=args.batch_size,
+                volume_norm=not args.no_volume_norm,
+            )
+        logging.info(f"Added {len(writer) - num_existing} entries to {args.store_dir}, {len(writer)} in total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This script precomputes the tokenization cache (see nemo/collections/tts/parts/utils/tokenization_cache.py) of the
+non-Lhotse MagpieTTSDataset, so that transcripts, phoneme texts and text contexts are not tokenized again by every
+dataloader worker in every epoch.
+
+It takes the same config as the training script. The model is instantiated only to resolve the tokenizer configs
+and build the datasets exactly as training does:
+    python scripts/magpietts/build_tokenization_cache.py \
+        --config-path=<repo>/examples/tts/conf/magpietts \
+        --config-name=magpietts \
+        +tokenization_cache_dir=${CACHE_DIR} \
+        train_ds_meta=... \
+        val_ds_meta=...
+
+Use `+model_class=nemo.collections.tts.models.EasyMagpieTTSModel` with the EasyMagpieTTS configs. Running the script
+again on the same cache directory, e.g. for another dataset config, adds to the cache.
+
+The cache is then used by setting `tokenization_cache_dir` in the MagpieTTSDataset config of `train_ds` and
+`validation_ds`. Texts that are not in the cache, or whose tokenizer configs changed since, are tokenized on the fly.
+Tokenizers with a stochastic G2P (`phoneme_probability < 1`) are never cached.
+"""
+
+from hydra.utils import get_class
+from omegaconf import OmegaConf, open_dict
+
+from nemo.collections.tts.data.text_to_speech_dataset_lhotse import setup_tokenizers
+from nemo.collections.tts.parts.utils.tokenization_cache import TokenizationCacheWriter
+from nemo.core.classes.common import safe_instantiate
+from nemo.core.config import hydra_runner
+from nemo.utils import logging
+
+DATASET_SPLITS = {'train_ds': 'train', 'validation_ds': 'test'}
+
+
+@hydra_runner(config_path="../../examples/tts/conf/magpietts", config_name="magpietts")
+def main(cfg):
+    cache_dir = cfg.get('tokenization_cache_dir', None)
+    if cache_dir is None:
+        raise ValueError("Set the output directory with +tokenization_cache_dir=<dir>")
+    model_class = get_class(cfg.get('model_class', 'nemo.collections.tts.models.MagpieTTSModel'))
+
+    with open_dict(cfg):
+        for split in DATASET_SPLITS:
+            if split not in cfg.model:
+                continue
+            # datasets are built below, and the cache being written must not be read while doing so
+            cfg.model[split].defer_setup = True
+            for dataset_key in ('datasets', 'dataset'):
+                if dataset_key in cfg.model[split]:
+                    cfg.model[split][dataset_key].pop('tokenization_cache_dir', None)
+    logging.info('\nConfig Params:\n%s', OmegaConf.to_yaml(cfg, resolve=True))
+
+    model = model_class(cfg=cfg.model, trainer=None)
+
+    with TokenizationCacheWriter(cache_dir) as writer:
+        for split, dataset_type in DATASET_SPLITS.items():
+            if split not in cfg.model:
+                continue
+            dataset = model.get_dataset(cfg.model[split], dataset_type=dataset_type)
+            # what worker_init_fn does in training
+            dataset.text_tokenizer = setup_tokenizers(dataset.tokenizer_config, mode=dataset.dataset_type)
+            if getattr(dataset, 'phoneme_tokenizer_config', None) is not None:
+                dataset.phoneme_tokenizer = safe_instantiate(dataset.phoneme_tokenizer_config)
+            num_added = dataset.build_tokenization_cache(writer)
+            logging.info(f"Added {num_added} tokenization results of {len(dataset)} {split} samples")
+        logging.info(f"Writing {len(writer)} tokenization results to {cache_dir}")
+
+
+if __name__ == '__main__':
+    main()  # noqa pylint: disable=no-value-parameter
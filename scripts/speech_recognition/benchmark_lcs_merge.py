@@ -0,0 +1,93 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of the per-stream `lcs_merge` against the batched `batched_lcs_merge` used by
+the buffered streaming pipelines. Both are run on the same synthetic streams, and their outputs
+are checked to be identical.
+
+Example:
+    python benchmark_lcs_merge.py --num_streams 256 --buffer_len 200 --data_len 40 --search_size 32
+"""
+
+import argparse
+import random
+import time
+
+from nemo.collections.asr.inference.utils.enums import MergingStrategy
+from nemo.collections.asr.inference.utils.lcs_merge import batched_lcs_merge, lcs_merge
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-stream and batched LCS merging of token sequences.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--num_streams", type=int, default=256, help="Number of concurrent streams.")
+    parser.add_argument("--buffer_len", type=int, default=200, help="Number of tokens in each stream buffer.")
+    parser.add_argument("--data_len", type=int, default=40, help="Number of new tokens merged into each buffer.")
+    parser.add_argument("--search_size", type=int, default=32, help="Size of the search window in the buffer.")
+    parser.add_argument("--overlap", type=int, default=8, help="Number of tokens shared by a buffer and its data.")
+    parser.add_argument("--vocab_size", type=int, default=1024, help="Token vocabulary size.")
+    parser.add_argument("--num_iters", type=int, default=20, help="Number of timed iterations.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def make_streams(args) -> tuple[list[list[int]], list[list[int]]]:
+    rng = random.Random(args.seed)
+    buffers, data = [], []
+    for _ in range(args.num_streams):
+        buffer = [rng.randrange(args.vocab_size) for _ in range(args.buffer_len)]
+        new_tokens = [rng.randrange(args.vocab_size) for _ in range(args.data_len - args.overlap)]
+        buffers.append(buffer)
+        data.append(buffer[len(buffer) - args.overlap :] + new_tokens)
+    return buffers, data
+
+
+def time_it(fn, num_iters: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(num_iters):
+        fn()
+    return (time.perf_counter() - start) / num_iters
+
+
+def main():
+    args = parse_args()
+    buffers, data = make_streams(args)
+    search_sizes = [args.search_size] * args.num_streams
+
+    def run_loop():
+        return [
+            lcs_merge(list(buffer), dat, args.search_size, merging_strategy=MergingStrategy.LCSUBSTR)
+            for buffer, dat in zip(buffers, data)
+        ]
+
+    def run_batched():
+        return batched_lcs_merge(buffers, data, search_sizes, merging_strategy=MergingStrategy.LCSUBSTR)
+
+    if run_loop() != run_batched():
+        raise RuntimeError("Batched LCS merge results differ from the per-stream implementation")
+
+    loop_time = time_it(run_loop, args.num_iters)
+    batched_time = time_it(run_batched, args.num_iters)
+    print(f"Streams: {args.num_streams}, search size: {args.search_size}, data length: {args.data_len}")
+    print(f"lcs_merge (per stream): {loop_time * 1000:.2f} ms/step")
+    print(f"batched_lcs_merge:      {batched_time * 1000:.2f} ms/step")
+    print(f"Speedup:                {loop_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the multi-session NemoStreamingASRService and StreamingASRBatchScheduler.
+
+The ASR model is replaced by a small cache-aware fake whose output depends on the features of the chunk and on the
+encoder cache of the stream, so that mixing up the states of two streams changes the results.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+from omegaconf import DictConfig
+
+pytest.importorskip("pipecat")
+
+from nemo.agents.voice_agent.pipecat.services.nemo.streaming_asr import (  # noqa: E402
+    NemoStreamingASRService,
+    StreamingASRBatchScheduler,
+)
+from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis  # noqa: E402
+
+VOCAB = ["▁a", "▁b", "c", "d", "▁e", "f"]
+NUM_CLASSES = len(VOCAB) + 1  # with blank
+NUM_FEATURES = 16
+CHUNK_NUM_SAMPLES = 1280  # 0.08 s at 16 kHz
+
+
+class FakeTokenizer:
+    vocab = VOCAB
+
+    def ids_to_tokens(self, ids):
+        return [VOCAB[i] for i in ids]
+
+
+class FakeCacheAwareEncoder(torch.nn.Module):
+    streaming_cfg = SimpleNamespace(chunk_size=[9, 16], pre_encode_cache_size=[0, 0], drop_extra_pre_encoded=0)
+
+    def __init__(self):
+        super().__init__()
+        self.proj = torch.nn.Linear(NUM_FEATURES, NUM_CLASSES)
+        generator = torch.Generator().manual_seed(0)
+        with torch.no_grad():
+            self.proj.weight.copy_(torch.randn(NUM_CLASSES, NUM_FEATURES, generator=generator))
+            self.proj.bias.copy_(torch.randn(NUM_CLASSES, generator=generator))
+
+    def setup_streaming_params(self, **kwargs):
+        pass
+
+    def get_initial_cache_state(self, batch_size):
+        return (
+            torch.zeros(1, batch_size, 1, NUM_CLASSES),
+            torch.zeros(1, batch_size, NUM_CLASSES, 1),
+            torch.zeros(batch_size, dtype=torch.long),
+        )
+
+    def cache_aware_stream_step(
+        self,
+        processed_signal,
+        processed_signal_length,
+        cache_last_channel,
+        cache_last_time,
+        cache_last_channel_len,
+        keep_all_outputs,
+        drop_extra_pre_encoded,
+    ):
+        # one output frame per chunk, from the last features and the history of the stream
+        logits = self.proj(processed_signal[:, :, -8:].mean(dim=-1)) + 0.5 * cache_last_channel[0, :, 0]
+        encoded = logits.unsqueeze(-1)
+        encoded_len = torch.ones(logits.shape[0], dtype=torch.long)
+        new_cache_last_channel = logits.detach().view(1, -1, 1, NUM_CLASSES)
+        return encoded, encoded_len, new_cache_last_channel, cache_last_time, cache_last_channel_len + 1
+
+
+class FakeCTCDecoding:
+    def ctc_decoder_predictions_tensor(self, encoded, encoded_len, return_hypotheses=True):
+        hyps = []
+        for logits, length in zip(encoded, encoded_len):
+            logits = logits[:, :length].T
+            tokens = logits.argmax(dim=-1)
+            hyps.append(Hypothesis(score=0.0, y_sequence=tokens, alignments=(logits, tokens)))
+        return hyps
+
+
+def make_fake_model():
+    preprocessor_cfg = {
+        '_target_': 'nemo.collections.asr.modules.AudioToMelSpectrogramPreprocessor',
+        'sample_rate': 16000,
+        'window_size': 0.025,
+        'window_stride': 0.01,
+        'features': NUM_FEATURES,
+        'dither': 0.0,
+        'pad_to': 0,
+        'normalize': 'NA',
+    }
+    return SimpleNamespace(
+        tokenizer=FakeTokenizer(),
+        cfg=DictConfig({'preprocessor': preprocessor_cfg, 'encoder': {'subsampling_factor': 8}}),
+        encoder=FakeCacheAwareEncoder(),
+        decoding=FakeCTCDecoding(),
+    )
+
+
+def make_service(max_sessions):
+    with patch.object(NemoStreamingASRService, '_load_model', return_value=make_fake_model()):
+        return NemoStreamingASRService(model="fake", device="cpu", decoder_type="ctc", max_sessions=max_sessions)
+
+
+def make_chunks(num_streams, num_chunks, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        f"stream{s}": [
+            (rng.standard_normal(CHUNK_NUM_SAMPLES) * 3000).astype(np.int16).tobytes() for _ in range(num_chunks)
+        ]
+        for s in range(num_streams)
+    }
+
+
+def last_logits(service, stream_id):
+    return service._streams[stream_id].previous_hypotheses[0].alignments[0]
+
+
+def run_per_stream(chunks):
+    """Reference: every stream transcribed on its own with `transcribe`, one stream after the other."""
+    service = make_service(max_sessions=1)
+    texts, logits = {}, {}
+    for stream_id, stream_chunks in chunks.items():
+        texts[stream_id], logits[stream_id] = [], []
+        for chunk in stream_chunks:
+            texts[stream_id].append(service.transcribe(chunk, stream_id=stream_id).text)
+            logits[stream_id].append(last_logits(service, stream_id))
+        service.close_stream(stream_id)
+    return texts, logits
+
+
+class TestNemoStreamingASRServiceBatching:
+    @pytest.mark.unit
+    def test_transcribe_batch_matches_per_stream(self):
+        chunks = make_chunks(num_streams=3, num_chunks=4)
+        expected_texts, expected_logits = run_per_stream(chunks)
+
+        service = make_service(max_sessions=3)
+        # streams join at different steps, so the batches mix streams at different positions
+        stream_ids = list(chunks)
+        for step in range(6):
+            batch_ids = [sid for idx, sid in enumerate(stream_ids) if 0 <= step - idx < 4]
+            audios = [chunks[sid][step - stream_ids.index(sid)] for sid in batch_ids]
+            results = service.transcribe_batch(audios, batch_ids)
+            for sid, result in zip(batch_ids, results):
+                chunk_idx = step - stream_ids.index(sid)
+                assert result.text == expected_texts[sid][chunk_idx]
+                torch.testing.assert_close(
+                    last_logits(service, sid), expected_logits[sid][chunk_idx], atol=1e-4, rtol=0
+                )
+
+    @pytest.mark.unit
+    def test_transcribe_batch_rejects_duplicate_streams(self):
+        service = make_service(max_sessions=2)
+        chunk = make_chunks(num_streams=1, num_chunks=1)["stream0"][0]
+        with pytest.raises(ValueError):
+            service.transcribe_batch([chunk, chunk], ["stream0", "stream0"])
+
+    @pytest.mark.unit
+    def test_reset_and_close_do_not_wait_for_a_running_batch(self):
+        chunks = make_chunks(num_streams=2, num_chunks=3)
+        fresh = make_service(max_sessions=1)
+        fresh.transcribe(chunks["stream0"][2], stream_id="stream0")
+        expected_logits = last_logits(fresh, "stream0")
+
+        service = make_service(max_sessions=1)
+        for chunk in chunks["stream0"][:2]:
+            service.transcribe(chunk, stream_id="stream0")
+
+        # a batch holding the lock in a worker thread, released after a timeout so that a blocking call fails
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with service._lock:
+                locked.set()
+                release.wait(timeout=5.0)
+
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        locked.wait()
+        start = time.monotonic()
+        service.reset_state(stream_id="stream0")
+        assert time.monotonic() - start < 1.0
+        release.set()
+        worker.join()
+
+        # the deferred reset is applied before the next batch, which then starts from a fresh state
+        service.transcribe(chunks["stream0"][2], stream_id="stream0")
+        torch.testing.assert_close(last_logits(service, "stream0"), expected_logits, atol=1e-4, rtol=0)
+
+        locked.clear()
+        release.clear()
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        locked.wait()
+        start = time.monotonic()
+        service.close_stream(stream_id="stream0")
+        assert time.monotonic() - start < 1.0
+        release.set()
+        worker.join()
+        # the only session was freed by the deferred close
+        service.transcribe(chunks["stream1"][0], stream_id="stream1")
+        assert list(service._streams) == ["stream1"]
+
+    @pytest.mark.unit
+    def test_transcribe_batch_over_capacity(self):
+        chunks = make_chunks(num_streams=3, num_chunks=2)
+        expected_texts, expected_logits = run_per_stream(chunks)
+
+        service = make_service(max_sessions=2)
+        service.transcribe(chunks["stream0"][0], stream_id="stream0")
+        # stream1 could get the last session, but the batch is rejected as a whole, before any session is opened
+        with pytest.raises(RuntimeError, match="sessions are in use"):
+            service.transcribe_batch(
+                [chunks["stream1"][0], chunks["stream2"][0], chunks["stream0"][1]], ["stream1", "stream2", "stream0"]
+            )
+        assert list(service._streams) == ["stream0"]
+
+        # with skip_unavailable, only the stream without a session is left out
+        results = service.transcribe_batch(
+            [chunks["stream1"][0], chunks["stream2"][0], chunks["stream0"][1]],
+            ["stream1", "stream2", "stream0"],
+            skip_unavailable=True,
+        )
+        assert results[1] is None
+        assert set(service._streams) == {"stream0", "stream1"}
+        for sid, chunk_idx, result in [("stream1", 0, results[0]), ("stream0", 1, results[2])]:
+            assert result.text == expected_texts[sid][chunk_idx]
+            torch.testing.assert_close(last_logits(service, sid), expected_logits[sid][chunk_idx], atol=1e-4, rtol=0)
+
+
+class TestStreamingASRBatchScheduler:
+    @pytest.mark.unit
+    def test_scheduler_keeps_streams_apart(self):
+        chunks = make_chunks(num_streams=3, num_chunks=4, seed=1)
+        expected_texts, expected_logits = run_per_stream(chunks)
+
+        service = make_service(max_sessions=3)
+        batches = []
+        transcribe_batch = service.transcribe_batch
+
+        def recording_transcribe_batch(audios, stream_ids, **kwargs):
+            batches.append(list(stream_ids))
+            results = transcribe_batch(audios, stream_ids, **kwargs)
+            for result, sid in zip(results, stream_ids):
+                result.logits = last_logits(service, sid)
+            return results
+
+        service.transcribe_batch = recording_transcribe_batch
+        scheduler = StreamingASRBatchScheduler(service, max_wait_in_secs=0.05)
+
+        async def run():
+            # all the chunks of every stream are submitted at once, several chunks of a stream are queued together
+            results = await asyncio.gather(
+                *[scheduler.transcribe(chunk, stream_id=sid) for sid in chunks for chunk in chunks[sid]]
+            )
+            await scheduler.stop()
+            return results
+
+        results = asyncio.run(run())
+
+        for batch in batches:
+            assert len(batch) == len(set(batch))
+        assert max(len(batch) for batch in batches) > 1
+        for idx, result in enumerate(results):
+            sid, chunk_idx = list(chunks)[idx // 4], idx % 4
+            assert result.text == expected_texts[sid][chunk_idx]
+            torch.testing.assert_close(result.logits, expected_logits[sid][chunk_idx], atol=1e-4, rtol=0)
+
+    @pytest.mark.unit
+    def test_scheduler_fails_only_streams_over_capacity(self):
+        chunks = make_chunks(num_streams=3, num_chunks=2, seed=2)
+        expected_texts, expected_logits = run_per_stream(chunks)
+
+        service = make_service(max_sessions=2)
+        service.transcribe(chunks["stream0"][0], stream_id="stream0")
+        service.transcribe(chunks["stream1"][0], stream_id="stream1")
+        batches = []
+        transcribe_batch = service.transcribe_batch
+
+        def recording_transcribe_batch(audios, stream_ids, **kwargs):
+            batches.append(list(stream_ids))
+            results = transcribe_batch(audios, stream_ids, **kwargs)
+            for result, sid in zip(results, stream_ids):
+                if result is not None:
+                    result.logits = last_logits(service, sid)
+            return results
+
+        service.transcribe_batch = recording_transcribe_batch
+        scheduler = StreamingASRBatchScheduler(service, max_batch_size=3, max_wait_in_secs=0.05)
+
+        async def run():
+            # the new stream2 is batched between the two open streams, but all the sessions are in use
+            results = await asyncio.gather(
+                scheduler.transcribe(chunks["stream0"][1], stream_id="stream0"),
+                scheduler.transcribe(chunks["stream2"][0], stream_id="stream2"),
+                scheduler.transcribe(chunks["stream1"][1], stream_id="stream1"),
+                return_exceptions=True,
+            )
+            await scheduler.stop()
+            return results
+
+        result0, result2, result1 = asyncio.run(run())
+
+        assert batches == [["stream0", "stream2", "stream1"]]
+        assert isinstance(result2, RuntimeError)
+        assert "sessions are in use" in str(result2)
+        assert set(service._streams) == {"stream0", "stream1"}
+        assert "stream2" not in service._context_manager.streamidx2slotidx
+        for sid, result in [("stream0", result0), ("stream1", result1)]:
+            assert result.text == expected_texts[sid][1]
+            torch.testing.assert_close(result.logits, expected_logits[sid][1], atol=1e-4, rtol=0)
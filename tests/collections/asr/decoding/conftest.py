@@ -17,11 +17,25 @@ import pytest
 
 from nemo.collections.asr.models import ASRModel
 from nemo.collections.asr.parts.utils.manifest_utils import read_manifest, write_manifest
+from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer, create_spt_model
 from tests.collections.asr.decoding.utils import make_preprocessor_deterministic, preserve_decoding_cfg_and_cpu_device
 
 CHECKPOINTS_PATH = Path("/home/TestData/asr")
 
 
+@pytest.fixture(scope="module")
+def spe_tokenizer(tmp_path_factory):
+    """Small SentencePiece BPE tokenizer trained on a few sentences with punctuation"""
+    tmpdir = tmp_path_factory.mktemp("spe_tokenizer")
+    text_path = tmpdir / "text.txt"
+    texts = ["hello world , this is a test .", "the quick brown fox ? jumps over the dog !"]
+    text_path.write_text("\n".join(texts * 10))
+    create_spt_model(str(text_path), vocab_size=40, sample_size=-1, do_lower_case=False, output_dir=str(tmpdir))
+    tokenizer = SentencePieceTokenizer(str(tmpdir / "tokenizer.model"))
+    tokenizer.tokenizer.vocab_size = tokenizer.vocab_size  # as set by ASRBPEMixin
+    return tokenizer
+
+
 @pytest.fixture(scope="session")
 def an4_val_manifest_corrected(tmp_path_factory, test_data_dir):
     """
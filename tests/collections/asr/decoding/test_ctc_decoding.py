@@ -33,6 +33,7 @@ from nemo.collections.asr.parts.submodules.ctc_decoding import (
 from nemo.collections.asr.parts.submodules.ngram_lm.ngram_lm_batched import NGramGPULanguageModel
 from nemo.collections.asr.parts.utils.asr_confidence_utils import ConfidenceConfig
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
+from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
 from nemo.core.utils.cuda_python_utils import skip_cuda_python_test_if_cuda_graphs_conditional_nodes_not_supported
 from tests.collections.asr.decoding.test_timestamps import BaseTimestampsTest
 
@@ -149,6 +150,28 @@ class TestCTCDecoding:
                 if timestamps:
                     BaseTimestampsTest.check_char_timestamps(hyp, decoding)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize('aggregate', [False, True])
+    def test_decode_hypothesis_batch_detokenization(self, spe_tokenizer, aggregate):
+        tokenizer = AggregateTokenizer({'en': spe_tokenizer, 'de': spe_tokenizer}) if aggregate else spe_tokenizer
+        decoding = CTCBPEDecoding(decoding_cfg=CTCBPEDecodingConfig(strategy='greedy'), tokenizer=tokenizer)
+
+        blank_id = decoding.blank_id
+        sequences = [
+            torch.tensor([3, 3, blank_id, 7, 12, 12, 5]),
+            torch.tensor([blank_id, blank_id]),
+            torch.randint(0, tokenizer.vocab_size + 1, size=[25], generator=torch.Generator().manual_seed(0)),
+        ]
+        hyps = [Hypothesis(score=0.0, y_sequence=sequence, length=len(sequence)) for sequence in sequences]
+        expected = []
+        for sequence in sequences:
+            folded = torch.unique_consecutive(sequence)
+            expected.append(decoding.decode_tokens_to_str_with_strip_punctuation(folded[folded != blank_id].tolist()))
+
+        decoded_hyps = decoding.decode_hypothesis(hyps, fold_consecutive=True)
+
+        assert [hyp.text for hyp in decoded_hyps] == expected
+
     @pytest.mark.unit
     def test_subword_decoding_greedy_forward(self, tmp_tokenizer):
         cfg = CTCBPEDecodingConfig(strategy='greedy')
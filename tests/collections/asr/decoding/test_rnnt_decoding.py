@@ -32,6 +32,7 @@ from nemo.collections.asr.parts.submodules import tdt_beam_decoding
 from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
 from nemo.collections.asr.parts.submodules.rnnt_decoding import RNNTBPEDecoding, RNNTDecoding, RNNTDecodingConfig
 from nemo.collections.asr.parts.utils import rnnt_utils
+from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
 from nemo.core.utils import numba_utils
 from nemo.core.utils.numba_utils import __NUMBA_MINIMUM_VERSION__
 from tests.collections.asr.decoding.test_timestamps import BaseTimestampsTest
@@ -229,6 +230,67 @@ class TestRNNTDecoding:
         decoding = RNNTBPEDecoding(decoding_cfg=cfg, decoder=decoder, joint=joint, tokenizer=tmp_tokenizer)
         assert decoding is not None
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("aggregate", [False, True])
+    def test_decode_hypothesis_batch_detokenization(self, spe_tokenizer, aggregate):
+        tokenizer = AggregateTokenizer({'en': spe_tokenizer, 'de': spe_tokenizer}) if aggregate else spe_tokenizer
+        decoder = get_rnnt_decoder(vocab_size=tokenizer.vocab_size)
+        joint = get_rnnt_joint(vocab_size=tokenizer.vocab_size)
+        decoding = RNNTBPEDecoding(
+            decoding_cfg=RNNTDecodingConfig(), decoder=decoder, joint=joint, tokenizer=tokenizer
+        )
+
+        blank_id = decoding.blank_id
+        sequences = [
+            [3, blank_id, 7, 12, 5],
+            [],
+            torch.tensor([tokenizer.vocab_size - 1, 2, blank_id, 9]),
+            torch.randint(0, tokenizer.vocab_size, size=[25], generator=torch.Generator().manual_seed(0)),
+        ]
+        hyps = [rnnt_utils.Hypothesis(score=0.0, y_sequence=sequence) for sequence in sequences]
+
+        decoded_hyps = decoding.decode_hypothesis(hyps)
+
+        for hyp, sequence in zip(decoded_hyps, sequences):
+            sequence = sequence.tolist() if isinstance(sequence, torch.Tensor) else sequence
+            expected = decoding.decode_tokens_to_str_with_strip_punctuation([t for t in sequence if t != blank_id])
+            assert hyp.text == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("strategy", ["greedy_batch", "greedy"])
+    def test_rnnt_decoder_predictions_columnar(self, spe_tokenizer, strategy):
+        decoder = get_rnnt_decoder(vocab_size=spe_tokenizer.vocab_size)
+        joint = get_rnnt_joint(vocab_size=spe_tokenizer.vocab_size)
+        cfg = RNNTDecodingConfig(strategy=strategy)
+        cfg.greedy.max_symbols = 5
+        decoding = RNNTBPEDecoding(decoding_cfg=cfg, decoder=decoder, joint=joint, tokenizer=spe_tokenizer)
+
+        generator = torch.Generator().manual_seed(0)
+        encoded = torch.randn(4, 4, 12, generator=generator)
+        encoded_len = torch.tensor([12, 5, 9, 1])
+
+        hyps = decoding.rnnt_decoder_predictions_tensor(encoded, encoded_len, return_hypotheses=True)
+        columnar = decoding.rnnt_decoder_predictions_columnar(encoded, encoded_len)
+
+        assert isinstance(columnar, rnnt_utils.ColumnarHypotheses)
+        assert len(columnar) == len(hyps)
+        if strategy == "greedy_batch":
+            # nothing is materialized before access
+            assert columnar._text is None
+            assert all(hyp is None for hyp in columnar._hypotheses)
+        assert columnar.text == [hyp.text for hyp in hyps]
+        assert columnar.lengths.tolist() == [len(hyp.y_sequence) for hyp in hyps]
+        for columnar_hyp, hyp in zip(columnar, hyps):
+            assert columnar_hyp.y_sequence.tolist() == hyp.y_sequence.tolist()
+            assert columnar_hyp.text == hyp.text
+            assert columnar_hyp.score == pytest.approx(float(hyp.score))
+
+        merged = rnnt_utils.ColumnarHypotheses.concatenate(
+            [decoding.rnnt_decoder_predictions_columnar(encoded[i : i + 1], encoded_len[i : i + 1]) for i in range(4)]
+        )
+        assert merged.text == columnar.text
+        assert [hyp.y_sequence.tolist() for hyp in merged] == [hyp.y_sequence.tolist() for hyp in hyps]
+
     @pytest.mark.skipif(
         not NUMBA_RNNT_LOSS_AVAILABLE,
         reason='RNNTLoss has not been compiled with appropriate numba version.',
@@ -12,9 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
+
 import pytest
 
-from nemo.collections.asr.inference.utils.lcs_merge import MergingStrategy, lcs_merge, longest_common_substring
+from nemo.collections.asr.inference.utils.lcs_merge import (
+    MergingStrategy,
+    batched_lcs_merge,
+    batched_longest_common_substring,
+    lcs_merge,
+    longest_common_substring,
+)
 
 
 class TestLCSMerge:
@@ -252,3 +260,44 @@ class TestLongestCommonSubstringEdgeCases:
         """Test when entire buffer is a substring of data."""
         start1, start2, length = longest_common_substring([3, 4, 5], [1, 2, 3, 4, 5, 6])
         assert (start1, start2, length) == (0, 2, 3)
+
+
+class TestBatchedLCSMerge:
+
+    @pytest.mark.unit
+    def test_batched_longest_common_substring_matches_reference(self):
+        rng = random.Random(0)
+        buffers, data = [], []
+        for _ in range(200):
+            vocab_size = rng.choice([2, 3, 10])
+            buffers.append([rng.randrange(vocab_size) for _ in range(rng.randrange(0, 12))])
+            data.append([rng.randrange(vocab_size) for _ in range(rng.randrange(0, 12))])
+        expected = [longest_common_substring(buffer, dat) for buffer, dat in zip(buffers, data)]
+        assert batched_longest_common_substring(buffers, data) == expected
+
+    @pytest.mark.unit
+    def test_batched_longest_common_substring_empty(self):
+        assert batched_longest_common_substring([], []) == []
+        assert batched_longest_common_substring([[], [1]], [[1], []]) == [(-1, -1, 0), (-1, -1, 0)]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("merging_strategy", [MergingStrategy.LCSUBSTR, MergingStrategy.LCS])
+    @pytest.mark.parametrize("sep_id", [None, [0]])
+    def test_batched_lcs_merge_matches_reference(self, merging_strategy, sep_id):
+        rng = random.Random(1)
+        buffers, data, search_sizes = [], [], []
+        for _ in range(100):
+            buffers.append([rng.randrange(1, 5) for _ in range(rng.randrange(0, 10))])
+            data.append([rng.randrange(1, 5) for _ in range(rng.randrange(0, 10))])
+            search_sizes.append(rng.randrange(-1, 8))
+        expected = [
+            lcs_merge(list(buffer), dat, search_size, sep_id, 2, merging_strategy)
+            for buffer, dat, search_size in zip(buffers, data, search_sizes)
+        ]
+        result = batched_lcs_merge(buffers, data, search_sizes, sep_id, 2, merging_strategy)
+        assert result == expected
+
+    @pytest.mark.unit
+    def test_batched_lcs_merge_length_mismatch(self):
+        with pytest.raises(ValueError):
+            batched_lcs_merge([[1, 2]], [[2, 3], [3]], [2])
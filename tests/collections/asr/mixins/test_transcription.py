@@ -28,7 +28,7 @@ from nemo.collections.asr.models.aed_multitask_models import MultiTaskTranscript
 from nemo.collections.asr.parts.mixins import TranscribeConfig, TranscriptionMixin
 from nemo.collections.asr.parts.mixins.transcription import GenericTranscriptionType
 from nemo.collections.asr.parts.submodules.multitask_decoding import MultiTaskDecodingConfig
-from nemo.collections.asr.parts.utils import Hypothesis
+from nemo.collections.asr.parts.utils import ColumnarHypotheses, Hypothesis
 
 
 class DummyModel(torch.nn.Module):
@@ -154,6 +154,19 @@ class TranscribableDummy(DummyModel, TranscriptionMixin):
             result = tuple(result)
             return result
 
+        if trcfg.columnar_output:
+            # hypothesis of `n` tokens `n` for output `n`
+            lengths = torch.tensor([int(res) for res in result], dtype=torch.long)
+            y_sequence = torch.zeros(len(result), int(lengths.max()), dtype=torch.long)
+            for idx, length in enumerate(lengths.tolist()):
+                y_sequence[idx, :length] = length
+            return ColumnarHypotheses(
+                y_sequence=y_sequence,
+                lengths=lengths,
+                scores=torch.tensor(result),
+                text_decoder=lambda tokens_batch: [str(len(tokens)) for tokens in tokens_batch],
+            )
+
         # Pass list of results by default
         return result
 
@@ -187,6 +200,22 @@ class TestTranscriptionMixin:
         assert outputs[1] == 2.0
         assert outputs[2] == 3.0
 
+    @pytest.mark.unit
+    def test_transcribe_columnar_output(self, dummy_model):
+        dummy_model = dummy_model.eval()
+        dummy_model.encoder.weight.data.fill_(1.0)
+        dummy_model.encoder.bias.data.fill_(0.0)
+
+        audio = ['1.0', '2.0', '3.0']
+        outputs = dummy_model.transcribe(audio, batch_size=2, columnar_output=True)
+        assert isinstance(outputs, ColumnarHypotheses)
+        assert len(outputs) == 3
+        assert outputs.y_sequence.shape == (3, 3)
+        assert outputs.lengths.tolist() == [1, 2, 3]
+        assert outputs.text == ['1', '2', '3']
+        assert outputs[2].y_sequence.tolist() == [3, 3, 3]
+        assert [hyp.score for hyp in outputs] == [1.0, 2.0, 3.0]
+
     @pytest.mark.unit
     def test_transcribe_generator(self, dummy_model):
         dummy_model = dummy_model.eval()
@@ -23,6 +23,7 @@ from omegaconf import DictConfig, ListConfig
 from nemo.collections.asr.data.audio_to_text_lhotse import LhotseSpeechToTextBpeDataset
 from nemo.collections.asr.models import EncDecHybridRNNTCTCModel
 from nemo.collections.asr.modules import RNNTDecoder, RNNTJoint, SampledRNNTJoint, StatelessTransducerDecoder
+from nemo.collections.asr.parts.mixins import TranscribeConfig
 from nemo.collections.asr.parts.submodules import rnnt_beam_decoding as beam_decode
 from nemo.collections.asr.parts.submodules import rnnt_greedy_decoding as greedy_decode
 from nemo.collections.asr.parts.submodules.ctc_decoding import CTCDecoding, CTCDecodingConfig
@@ -286,6 +287,13 @@ class TestEncDecHybridRNNTCTCModel:
         assert isinstance(hybrid_asr_model.decoding.decoding, greedy_decode.GreedyRNNTInfer)
         assert hybrid_asr_model.cur_decoder == 'rnnt'
 
+    @pytest.mark.unit
+    def test_ctc_decoder_columnar_output_raises(self, hybrid_asr_model):
+        hybrid_asr_model.change_decoding_strategy(decoder_type='ctc')
+        outputs = {'logits': torch.randn(2, 10, 29), 'encoded_len': torch.tensor([10, 8])}
+        with pytest.raises(ValueError, match="columnar_output"):
+            hybrid_asr_model._transcribe_output_processing(outputs, TranscribeConfig(columnar_output=True))
+
     @pytest.mark.unit
     def test_GreedyRNNTInferConfig(self):
         IGNORE_ARGS = [
@@ -22,6 +22,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 import torch
+from kaldialign import edit_distance
 from omegaconf import DictConfig
 
 from nemo.collections.asr.metrics.bleu import (
@@ -31,7 +32,13 @@ from nemo.collections.asr.metrics.bleu import (
     _move_dimension_to_the_front,
 )
 from nemo.collections.asr.metrics.multitask import ConstraintParser, MultiTaskMetric
-from nemo.collections.asr.metrics.wer import WER, word_error_rate, word_error_rate_detail, word_error_rate_per_utt
+from nemo.collections.asr.metrics.wer import (
+    WER,
+    batch_edit_distance,
+    word_error_rate,
+    word_error_rate_detail,
+    word_error_rate_per_utt,
+)
 from nemo.collections.asr.parts.submodules.ctc_decoding import (
     AbstractCTCDecoding,
     CTCBPEDecoding,
@@ -163,6 +170,28 @@ class TestWordErrorRate:
             hypotheses=['ducuti motorcycle', 'G P U'], references=['ducati motorcycle', 'GPU'], use_cer=True
         ) == ([1 / 17, 2 / 3], 0.15)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_cer", [False, True])
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_batch_edit_distance(self, use_cer, num_workers):
+        rng = random.Random(0)
+        words = ['a', 'b', 'cd', 'e']
+        references, hypotheses = [], []
+        for _ in range(200):
+            references.append(' '.join(rng.choice(words) for _ in range(rng.randint(0, 10))))
+            hypotheses.append(' '.join(rng.choice(words) for _ in range(rng.randint(0, 10))))
+        references.append('exact match')
+        hypotheses.append('exact match')
+
+        measures = batch_edit_distance(hypotheses, references, use_cer=use_cer, num_workers=num_workers)
+        for idx, (h, r) in enumerate(zip(hypotheses, references)):
+            expected = edit_distance(list(r) if use_cer else r.split(), list(h) if use_cer else h.split())
+            for key in ('ins', 'del', 'sub', 'total', 'ref_len'):
+                assert measures[key][idx] == expected[key]
+
+        with pytest.raises(ValueError):
+            batch_edit_distance(['a'], ['a', 'b'])
+
     @pytest.mark.unit
     @pytest.mark.parametrize("batch_dim_index", [0, 1])
     @pytest.mark.parametrize("test_wer_bpe", [False, True])
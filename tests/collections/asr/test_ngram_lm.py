@@ -207,3 +207,145 @@ class TestNGramGPULanguageModel:
         assert (n_gpu_lm_loaded.backoff_to_states == n_gpu_lm.backoff_to_states).all()
         assert torch.allclose(n_gpu_lm_loaded.backoff_weights, n_gpu_lm.backoff_weights)
         assert torch.allclose(n_gpu_lm_loaded.final_weights, n_gpu_lm.final_weights)
+
+
+def _write_synthetic_arpa(path: Path, vocab_size: int = 20, max_order: int = 3, num_sentences: int = 200, seed=0):
+    """Write a random ARPA model with all n-grams (and their prefixes/suffixes) from random sentences"""
+    rng = random.Random(seed)
+    token_offset = 100
+    ngrams = [dict() for _ in range(max_order)]
+    for _ in range(num_sentences):
+        # leave some tokens unused to test unk normalization
+        sentence = ["<s>"] + [chr(rng.randrange(vocab_size - 3) + token_offset) for _ in range(rng.randint(1, 8))]
+        sentence.append("</s>")
+        for order in range(1, max_order + 1):
+            for start in range(len(sentence) - order + 1):
+                ngrams[order - 1][tuple(sentence[start : start + order])] = None
+    ngrams[0][("<unk>",)] = None
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\\data\\\n")
+        for order in range(1, max_order + 1):
+            f.write(f"ngram {order}={len(ngrams[order - 1])}\n")
+        for order in range(1, max_order + 1):
+            f.write(f"\n\\{order}-grams:\n")
+            for symbols in ngrams[order - 1]:
+                line = f"{-rng.random() * 3:.6f}\t{' '.join(symbols)}"
+                if order < max_order and symbols[-1] != "</s>":
+                    line += f"\t{-rng.random():.6f}"
+                f.write(line + "\n")
+        f.write("\n\\end\\\n")
+
+
+def _assert_same_lm(lm1: NGramGPULanguageModel, lm2: NGramGPULanguageModel):
+    assert (lm1.num_states, lm1.num_arcs) == (lm2.num_states, lm2.num_arcs)
+    assert torch.equal(lm1.arcs_weights, lm2.arcs_weights)
+    assert torch.equal(lm1.from_states, lm2.from_states)
+    assert torch.equal(lm1.to_states, lm2.to_states)
+    assert torch.equal(lm1.ilabels, lm2.ilabels)
+    assert torch.equal(lm1.start_end_arcs, lm2.start_end_arcs)
+    assert torch.equal(lm1.state_order, lm2.state_order)
+    assert torch.equal(lm1.backoff_to_states, lm2.backoff_to_states)
+    assert torch.equal(lm1.backoff_weights, lm2.backoff_weights)
+    assert torch.equal(lm1.final_weights, lm2.final_weights)
+
+
+class TestNGramGPULanguageModelCompiler:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_order", [2, 3, 4])
+    @pytest.mark.parametrize("normalize_unk", [True, False])
+    def test_vectorized_matches_iterative(self, tmp_path, max_order, normalize_unk):
+        arpa_path = tmp_path / "lm.arpa"
+        _write_synthetic_arpa(arpa_path, max_order=max_order)
+        n_gpu_lm = NGramGPULanguageModel.from_arpa(arpa_path, vocab_size=20, normalize_unk=normalize_unk)
+        suffix_tree_np = NGramGPULanguageModel._build_suffix_tree_iterative(
+            arpa_path, vocab_size=20, normalize_unk=normalize_unk
+        )
+        _assert_same_lm(n_gpu_lm, NGramGPULanguageModel.from_suffix_tree(suffix_tree_np))
+
+    @pytest.mark.unit
+    def test_save_load_binary(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        _write_synthetic_arpa(arpa_path)
+        n_gpu_lm = NGramGPULanguageModel.from_arpa(arpa_path, vocab_size=20)
+        binary_path = tmp_path / "lm.ngram_lm.pt"
+        n_gpu_lm.save_binary(binary_path)
+        n_gpu_lm_loaded = NGramGPULanguageModel.from_file(binary_path, vocab_size=20)
+        _assert_same_lm(n_gpu_lm_loaded, n_gpu_lm)
+
+        labels = torch.randint(0, 20, [3, 7])
+        assert torch.allclose(n_gpu_lm_loaded(labels, eos=True), n_gpu_lm(labels, eos=True))
+
+    @pytest.mark.unit
+    def test_save_binary_resolves_final_weights(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        _write_synthetic_arpa(arpa_path)
+        suffix_tree_np = NGramGPULanguageModel._build_suffix_tree_iterative(arpa_path, vocab_size=20)
+        n_gpu_lm = NGramGPULanguageModel.from_suffix_tree(suffix_tree_np)
+        # a model with the final weights not resolved yet
+        n_gpu_lm_unresolved = NGramGPULanguageModel(n_gpu_lm.cfg)
+        n_gpu_lm_unresolved._init_from_suffix_tree_np(suffix_tree_np=suffix_tree_np)
+        assert not n_gpu_lm_unresolved._final_resolved
+
+        binary_path = tmp_path / "lm.ngram_lm.pt"
+        n_gpu_lm_unresolved.save_binary(binary_path)
+        _assert_same_lm(NGramGPULanguageModel.from_binary(binary_path), n_gpu_lm)
+
+    @pytest.mark.unit
+    def test_binary_cache(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        _write_synthetic_arpa(arpa_path)
+        n_gpu_lm = NGramGPULanguageModel.from_file(arpa_path, vocab_size=20, cache_binary=True)
+        cache_path = tmp_path / "lm.arpa.ngram_lm.pt"
+        assert cache_path.exists()
+        _assert_same_lm(NGramGPULanguageModel.from_file(arpa_path, vocab_size=20, cache_binary=True), n_gpu_lm)
+
+        # the cache is invalidated when the parameters change
+        n_gpu_lm_raw = NGramGPULanguageModel.from_file(
+            arpa_path, vocab_size=20, normalize_unk=False, cache_binary=True
+        )
+        assert not torch.equal(n_gpu_lm_raw.arcs_weights, n_gpu_lm.arcs_weights)
+        assert NGramGPULanguageModel.from_binary(cache_path)._final_resolved
+
+    @pytest.mark.unit
+    def test_parse_ngrams(self):
+        lines = ["-1.5\t<s> d e\t-0.25\n", "-2\te f </s>\n", "-0.75\tf d e\t-1\n"]
+        symbols, weights, backoffs = NGramGPULanguageModel._parse_ngrams_np(lines, order=3, token_offset=100)
+        ref_symbols, ref_weights, ref_backoffs = NGramGPULanguageModel._parse_ngrams_by_line(
+            lines, order=3, token_offset=100
+        )
+        assert symbols.tolist() == [[-1, 0, 1], [1, 2, -2], [2, 0, 1]]
+        assert (symbols == ref_symbols).all()
+        assert (weights == ref_weights).all()
+        assert (backoffs == ref_backoffs).all()
+
+        # tokens without separators are parsed with the line-by-line fallback
+        symbols, _, _ = NGramGPULanguageModel._parse_ngrams_np(["-1\tdef\n"], order=3, token_offset=100)
+        assert symbols.tolist() == [[0, 1, 2]]
+
+
+class TestKenLMBatchedWrapper:
+    @pytest.mark.unit
+    @pytest.mark.skipif(not KENLM_AVAILABLE, reason="KenLM is not available")
+    @pytest.mark.parametrize("transitions_cache_size", [0, 2, 1024])
+    def test_advance_matches_advance_single(self, tmp_path, transitions_cache_size, num_iterations=10):
+        arpa_path = tmp_path / "lm.arpa"
+        _write_synthetic_arpa(arpa_path)
+        kenlm_wrapper = KenLMBatchedWrapper.from_file(
+            arpa_path, vocab_size=20, transitions_cache_size=transitions_cache_size
+        )
+        rng = random.Random(0)
+        # the same state for several hypotheses, as at the start of beam search
+        states = kenlm_wrapper.get_init_states(batch_size=4, bos=True)
+        for _ in range(num_iterations):
+            scores, next_states = kenlm_wrapper.advance(states)
+            assert scores.shape == (len(states), 20)
+            for i, state in enumerate(states):
+                for label in range(20):
+                    ref_score, ref_next_state = kenlm_wrapper.advance_single(state, label)
+                    assert scores[i, label].item() == pytest.approx(ref_score, abs=1e-5)
+                    assert next_states[i][label] == ref_next_state
+            # some hypotheses keep their state (blank), the others are extended
+            states = [
+                next_states[i][rng.randrange(20)] if rng.random() < 0.5 else state for i, state in enumerate(states)
+            ]
+        assert len(kenlm_wrapper._transitions_cache) <= transitions_cache_size
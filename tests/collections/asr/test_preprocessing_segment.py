@@ -14,6 +14,7 @@
 
 import json
 import os
+import pickle
 import tempfile
 from collections import namedtuple
 from typing import List, Type, Union
@@ -22,7 +23,14 @@ import numpy as np
 import pytest
 import soundfile as sf
 
-from nemo.collections.asr.parts.preprocessing.perturb import NoisePerturbation, ShiftPerturbation, SilencePerturbation
+from nemo.collections.asr.parts.preprocessing import noise_bank
+from nemo.collections.asr.parts.preprocessing.noise_bank import NoiseBank
+from nemo.collections.asr.parts.preprocessing.perturb import (
+    NoisePerturbation,
+    NoisePerturbationWithNormalization,
+    ShiftPerturbation,
+    SilencePerturbation,
+)
 from nemo.collections.asr.parts.preprocessing.segment import AudioSegment, select_channels
 
 
@@ -530,3 +538,92 @@ class TestShiftPerturbation:
         original = segment.samples.copy()
         perturb.perturb(segment)
         np.testing.assert_array_equal(segment.samples, original, "Zero shift should not modify audio")
+
+
+class TestNoiseBank:
+    sample_rate = 16000
+
+    def _make_manifest(self, test_dir, durations, num_channels=1):
+        manifest_file = os.path.join(test_dir, 'noise_manifest.json')
+        noise = []
+        with open(manifest_file, 'w') as fout:
+            for idx, duration in enumerate(durations):
+                shape = (int(duration * self.sample_rate),) + ((num_channels,) if num_channels > 1 else ())
+                samples = np.random.uniform(-0.5, 0.5, size=shape)
+                noise_file = os.path.join(test_dir, f'noise_{idx}.wav')
+                sf.write(noise_file, samples, self.sample_rate, 'float')
+                noise.append(samples)
+                item = {'audio_filepath': noise_file, 'label': '-', 'duration': duration, 'offset': 0.0}
+                fout.write(f'{json.dumps(item)}\n')
+        return manifest_file, noise
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("dtype, atol", [('float16', 1e-3), ('int16', 1e-4)])
+    @pytest.mark.parametrize("num_channels", [1, 2])
+    def test_build_and_read(self, tmpdir, dtype, atol, num_channels):
+        manifest_file, noise = self._make_manifest(str(tmpdir), [0.5, 1.0, 0.25], num_channels=num_channels)
+        bank_dir = os.path.join(str(tmpdir), 'bank')
+        bank = NoiseBank.from_manifest(manifest_file, bank_dir, sample_rate=self.sample_rate, dtype=dtype)
+
+        assert NoiseBank.exists(bank_dir)
+        assert len(bank) == len(noise)
+        for idx, samples in enumerate(noise):
+            np.testing.assert_allclose(bank.get_samples(idx), samples, atol=atol)
+
+        # random crops are contiguous slices of the noise file
+        crop = bank.get_samples(1, duration=0.1)
+        assert len(crop) == int(0.1 * self.sample_rate)
+        windows = np.lib.stride_tricks.sliding_window_view(noise[1], crop.shape, axis=tuple(range(crop.ndim)))
+        errors = np.abs(windows.reshape(-1, crop.size) - crop.reshape(1, -1)).max(axis=-1)
+        start = np.argmin(errors)
+        np.testing.assert_allclose(crop, noise[1][start : start + len(crop)], atol=atol)
+        # files shorter than the crop are returned in full
+        assert len(bank.get_samples(2, duration=1.0)) == len(noise[2])
+
+        # the bank is pickled to the dataloader workers without the memory-mapped arrays
+        bank_copy = pickle.loads(pickle.dumps(bank))
+        np.testing.assert_array_equal(bank_copy.get_samples(0), bank.get_samples(0))
+
+        # existing bank is reused
+        assert NoiseBank.from_manifest(manifest_file, bank_dir, sample_rate=self.sample_rate, dtype=dtype) is not None
+
+    @pytest.mark.unit
+    def test_mismatched_channels(self, tmpdir):
+        manifest_file, _ = self._make_manifest(str(tmpdir), [0.5])
+        with open(manifest_file) as f:
+            item = json.loads(f.readline())
+        stereo_file = os.path.join(str(tmpdir), 'stereo.wav')
+        sf.write(stereo_file, np.zeros((100, 2)), self.sample_rate, 'float')
+        with open(manifest_file, 'a') as fout:
+            fout.write(json.dumps({**item, 'audio_filepath': stereo_file, 'duration': 100 / self.sample_rate}) + '\n')
+        with pytest.raises(ValueError):
+            NoiseBank.build(manifest_file, os.path.join(str(tmpdir), 'bank'), sample_rate=self.sample_rate)
+        # the partially written bank is removed
+        assert not any(name.startswith('.noise_bank_') for name in os.listdir(str(tmpdir)))
+
+    @pytest.mark.unit
+    def test_build_streams_in_chunks(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(noise_bank, '_COPY_CHUNK_SAMPLES', 1000)
+        manifest_file, noise = self._make_manifest(str(tmpdir), [0.3, 0.2, 0.45])
+        bank = NoiseBank.build(manifest_file, os.path.join(str(tmpdir), 'bank'), sample_rate=self.sample_rate)
+        for idx, samples in enumerate(noise):
+            np.testing.assert_allclose(bank.get_samples(idx), samples, atol=1e-3)
+        assert sorted(os.listdir(os.path.join(str(tmpdir), 'bank'))) == ['meta.json', 'offsets.npy', 'samples.npy']
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("perturbation_class", [NoisePerturbation, NoisePerturbationWithNormalization])
+    def test_perturbation_with_noise_bank(self, tmpdir, perturbation_class):
+        manifest_file, _ = self._make_manifest(str(tmpdir), [2.0, 1.5])
+        perturber = perturbation_class(
+            manifest_path=manifest_file,
+            min_snr_db=10,
+            max_snr_db=10,
+            noise_bank_dir=os.path.join(str(tmpdir), 'bank'),
+            noise_bank_sr=self.sample_rate,
+        )
+        samples = np.sin(np.linspace(0, 100, self.sample_rate // 2)).astype(np.float32)
+        for sample_rate in [self.sample_rate, 8000]:
+            data = AudioSegment(samples=samples.copy(), sample_rate=sample_rate)
+            perturber.perturb(data)
+            assert data.samples.shape == samples.shape
+            assert not np.allclose(data.samples, samples)
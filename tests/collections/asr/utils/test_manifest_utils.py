@@ -0,0 +1,158 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from nemo.collections.asr.parts.utils.manifest_utils import (
+    iter_manifest,
+    read_manifest,
+    read_manifest_columns,
+    write_manifest,
+)
+from nemo.collections.asr.parts.utils.transcribe_utils import read_and_maybe_sort_manifest, restore_transcription_order
+from nemo.collections.common.parts.preprocessing.manifest import ManifestIndex, get_manifest_line_offsets, item_iter
+
+
+@pytest.fixture()
+def manifest_items():
+    return [
+        {"audio_filepath": f"/data/audio_{idx}.wav", "duration": float(idx % 7) + 0.5, "text": f"utterance é {idx}"}
+        for idx in range(50)
+    ]
+
+
+@pytest.fixture()
+def manifest_path(tmp_path, manifest_items):
+    path = str(tmp_path / "manifest.json")
+    lines = [json.dumps(item) for item in manifest_items]
+    # blank lines are skipped by every reader
+    lines.insert(10, "")
+    lines.insert(20, "   ")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+class TestManifestReaders:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 3])
+    def test_read_manifest(self, manifest_path, manifest_items, num_workers):
+        assert read_manifest(manifest_path, num_workers=num_workers) == manifest_items
+
+    @pytest.mark.unit
+    def test_iter_manifest(self, manifest_path, manifest_items):
+        assert list(iter_manifest(manifest_path)) == manifest_items
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_read_manifest_invalid_line(self, tmp_path, num_workers):
+        path = str(tmp_path / "broken.json")
+        with open(path, "w") as f:
+            f.write('{"a": 1}\n{"a": \n{"a": 3}\n')
+        with pytest.raises(RuntimeError):
+            read_manifest(path, num_workers=num_workers)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_read_manifest_columns(self, tmp_path, num_workers):
+        path = str(tmp_path / "manifest.json")
+        write_manifest(path, [{"audio_filepath": "a.wav", "duration": 1.5}, {"audio_filepath": "b.wav"}])
+        columns = read_manifest_columns(path, keys=["audio_filepath", "duration"], num_workers=num_workers)
+        assert columns["audio_filepath"].tolist() == ["a.wav", "b.wav"]
+        assert columns["duration"].dtype == np.float64
+        assert columns["duration"][0] == 1.5 and np.isnan(columns["duration"][1])
+
+    @pytest.mark.unit
+    def test_sort_and_restore_order(self, manifest_path, manifest_items):
+        sorted_items = read_and_maybe_sort_manifest(manifest_path, try_sort=True, num_workers=2)
+        assert sorted_items == sorted(manifest_items, reverse=True, key=lambda item: item["duration"])
+
+        transcriptions = [item["text"] for item in sorted_items]
+        restored = restore_transcription_order(manifest_path, transcriptions)
+        assert restored == [item["text"] for item in manifest_items]
+
+
+class TestManifestIndex:
+    @pytest.mark.unit
+    def test_line_offsets_and_index_dir(self, manifest_path, manifest_items, tmp_path):
+        offsets = get_manifest_line_offsets(manifest_path)
+        assert len(offsets) == len(manifest_items)
+        # nothing is written next to the manifest
+        assert sorted(os.listdir(os.path.dirname(manifest_path))) == [os.path.basename(manifest_path)]
+        with open(manifest_path, "rb") as f:
+            for offset, item in zip(offsets, manifest_items):
+                f.seek(int(offset))
+                assert json.loads(f.readline()) == item
+
+        index_dir = str(tmp_path / "index")
+        np.testing.assert_array_equal(get_manifest_line_offsets(manifest_path, index_dir=index_dir), offsets)
+        assert len(os.listdir(index_dir)) == 2
+        # the stored index is reused on the next call
+        assert isinstance(get_manifest_line_offsets(manifest_path, index_dir=index_dir), np.memmap)
+
+    @pytest.mark.unit
+    def test_stale_index_is_rebuilt(self, manifest_path, manifest_items, tmp_path):
+        index_dir = str(tmp_path / "index")
+        get_manifest_line_offsets(manifest_path, index_dir=index_dir)
+        stat = os.stat(manifest_path)
+        # rewrite the manifest with a different content, keeping its modification time
+        items = manifest_items[1:]
+        with open(manifest_path, "w") as f:
+            f.writelines(json.dumps(item) + "\n" for item in items)
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        index = ManifestIndex(manifest_path, index_dir=index_dir)
+        assert len(index) == len(items)
+        assert list(index) == items
+
+    @pytest.mark.unit
+    def test_same_size_edit_in_the_middle_rebuilds_index(self, tmp_path):
+        # large enough for the edited lines to be outside the hashed first and last bytes
+        items = [{"audio_filepath": f"audio_{i:05d}.wav", "text": "ab"} for i in range(10000)]
+        manifest_path = str(tmp_path / "manifest.json")
+        write_manifest(manifest_path, items)
+        index_dir = str(tmp_path / "index")
+        get_manifest_line_offsets(manifest_path, index_dir=index_dir)
+        size, mtime_ns = os.path.getsize(manifest_path), os.stat(manifest_path).st_mtime_ns
+
+        # one line gets shorter and the next one longer, so the size of the manifest does not change
+        items[5000]["text"], items[5001]["text"] = "a", "abc"
+        write_manifest(manifest_path, items)
+        os.utime(manifest_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        assert os.path.getsize(manifest_path) == size
+
+        index = ManifestIndex(manifest_path, index_dir=index_dir)
+        assert index[5000] == items[5000]
+        assert index[5001] == items[5001]
+
+    @pytest.mark.unit
+    def test_random_access(self, manifest_path, manifest_items):
+        index = ManifestIndex(manifest_path)
+        assert len(index) == len(manifest_items)
+        assert index[17] == manifest_items[17]
+        assert index[-1] == manifest_items[-1]
+        assert list(index) == manifest_items
+        with pytest.raises(IndexError):
+            index[len(manifest_items)]
+
+    @pytest.mark.unit
+    def test_item_iter_parallel(self, manifest_path):
+        sequential = list(item_iter(manifest_path))
+        parallel = list(item_iter(manifest_path, num_workers=3))
+        assert parallel == sequential
+        assert [item["id"] for item in parallel] == list(range(len(sequential)))
@@ -14,6 +14,7 @@
 
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 import torch
 
@@ -111,3 +112,74 @@ def test_diar_view_normalization_uses_real_ragged_lengths(
 
     diar_normalization_lengths = captured_lengths[1::2]
     assert diar_normalization_lengths == list(expected_diar_normalization_lengths)
+
+
+def _make_fake_asr_model(n_feat=4, window_stride=0.01):
+    return SimpleNamespace(
+        preprocessor=SimpleNamespace(log=True),
+        _cfg=SimpleNamespace(
+            sample_rate=16000, preprocessor=SimpleNamespace(window_stride=window_stride, features=n_feat)
+        ),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_frames", [1, 7, 20])
+def test_ring_feature_frame_bufferer_matches_feature_frame_bufferer(num_frames):
+    asr_model = _make_fake_asr_model()
+    kwargs = dict(asr_model=asr_model, frame_len=0.05, batch_size=3, total_buffer=0.12)
+    generator = torch.Generator().manual_seed(0)
+    frames = [torch.randn(4, 5, generator=generator).numpy() for _ in range(num_frames)]
+
+    bufferer = streaming_utils.FeatureFrameBufferer(**kwargs)
+    ring_bufferer = streaming_utils.RingFeatureFrameBufferer(**kwargs)
+    for _ in range(2):  # second pass checks reset
+        bufferer.reset()
+        ring_bufferer.reset()
+        bufferer.set_frame_reader(iter(frames))
+        ring_bufferer.set_frame_reader(iter(frames))
+        while True:
+            buffers = bufferer.get_buffers_batch()
+            ring_buffers = ring_bufferer.get_buffers_batch()
+            assert len(buffers) == len(ring_buffers)
+            if len(buffers) == 0:
+                break
+            assert torch.allclose(torch.as_tensor(np.stack(buffers)), ring_buffers, atol=1e-4)
+
+
+@pytest.mark.unit
+def test_batched_ring_feature_frame_bufferer_matches_batched_feature_frame_bufferer():
+    asr_model = _make_fake_asr_model()
+    kwargs = dict(asr_model=asr_model, frame_len=0.05, batch_size=3, total_buffer=0.12)
+    generator = torch.Generator().manual_seed(0)
+    frames = [[torch.randn(4, 5, generator=generator).numpy() for _ in range(length)] for length in (6, 2, 4)]
+
+    bufferer = streaming_utils.BatchedFeatureFrameBufferer(**kwargs)
+    ring_bufferer = streaming_utils.BatchedRingFeatureFrameBufferer(**kwargs)
+    for idx, sample_frames in enumerate(frames):
+        bufferer.set_frame_reader(iter(sample_frames), idx)
+        ring_bufferer.set_frame_reader(iter(sample_frames), idx)
+
+    while True:
+        buffers = bufferer.get_buffers_batch()
+        ring_buffers = ring_bufferer.get_buffers_batch()
+        assert len(buffers) == len(ring_buffers)
+        if len(buffers) == 0:
+            break
+        assert bufferer.signal_end == ring_bufferer.signal_end
+        assert torch.allclose(torch.as_tensor(np.stack([buffer[0] for buffer in buffers])), ring_buffers, atol=1e-4)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("append_lengths", [[1, 2, 3], [4, 4, 1], [7], [2, 9, 5]])
+def test_feature_ring_buffer(append_lengths):
+    buffer_len = 6
+    ring = streaming_utils.FeatureRingBuffer(2, 3, buffer_len, fill_value=-1.0)
+    expected = torch.full([2, 3, buffer_len], -1.0)
+    for length in append_lengths:
+        frames = torch.randn(2, 3, length)
+        ring.append_(frames)
+        expected = torch.cat([expected, frames], dim=-1)[..., -buffer_len:]
+        assert torch.equal(ring.get_ordered(), expected)
+    ring.reset()
+    assert torch.equal(ring.get_ordered(), torch.full([2, 3, buffer_len], -1.0))
@@ -12,19 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import os
+
 import numpy as np
 import pytest
+import torch
 from lhotse import SupervisionSegment
 
 from nemo.collections.asr.parts.utils.vad_utils import (
+    _DetectionErrorRateAccumulator,
     align_labels_to_frames,
     convert_labels_to_speech_segments,
     frame_vad_construct_supervisions_per_file,
+    generate_overlap_vad_seq,
+    generate_overlap_vad_seq_batch,
+    generate_overlap_vad_seq_per_file,
+    generate_overlap_vad_seq_per_tensor,
+    generate_vad_segment_table,
+    generate_vad_segment_table_batch,
+    generate_vad_segment_table_per_file,
+    generate_vad_segment_table_per_tensor,
     get_frame_labels,
     get_nonspeech_segments,
+    iter_vad_frame_pred_batches,
     load_speech_overlap_segments_from_rttm,
     load_speech_segments_from_rttm,
+    prepare_gen_segment_table,
     read_rttm_as_supervisions,
+    vad_construct_supervisions_per_file,
+    vad_tune_threshold_on_dev,
 )
 
 
@@ -54,6 +71,15 @@ def get_simple_rttm_with_silence(rttm_file="test3.rttm"):
     return rttm_file, speech_segments, silence_segments
 
 
+def get_smooth_frame_preds(lengths, seed=0):
+    torch.manual_seed(seed)
+    preds = []
+    for length in lengths:
+        pred = torch.rand(1, 1, length)
+        preds.append(torch.nn.functional.avg_pool1d(pred, 5, 1, 2, count_include_pad=False).view(-1))
+    return preds
+
+
 class TestVADUtils:
     @pytest.mark.parametrize(["logits_len", "labels_len"], [(20, 10), (20, 11), (20, 9), (10, 21), (10, 19)])
     @pytest.mark.unit
@@ -124,6 +150,148 @@ class TestVADUtils:
         assert _annotation_equals(ref, expected)
         assert _annotation_equals(hyp, expected)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("smoothing_method", ["mean", "median"])
+    @pytest.mark.parametrize(
+        "overlap, window_length_in_sec, shift_length_in_sec", [(0.875, 0.63, 0.01), (0.5, 0.63, 0.02)]
+    )
+    def test_generate_overlap_vad_seq_batch(
+        self, smoothing_method, overlap, window_length_in_sec, shift_length_in_sec
+    ):
+        frame_preds = get_smooth_frame_preds([1, 37, 200, 513])
+        frames = torch.nn.utils.rnn.pad_sequence(frame_preds, batch_first=True)
+        lengths = torch.tensor([len(pred) for pred in frame_preds])
+        per_args = {
+            "overlap": overlap,
+            "window_length_in_sec": window_length_in_sec,
+            "shift_length_in_sec": shift_length_in_sec,
+        }
+        preds, pred_lengths = generate_overlap_vad_seq_batch(frames, lengths, per_args, smoothing_method)
+        for i, frame in enumerate(frame_preds):
+            expected = generate_overlap_vad_seq_per_tensor(frame, per_args, smoothing_method)
+            assert pred_lengths[i] == len(expected)
+            assert torch.allclose(preds[i, : len(expected)], expected, atol=1e-6)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("scale", ["absolute", "relative", "percentile"])
+    @pytest.mark.parametrize("filter_speech_first", [True, False])
+    def test_generate_vad_segment_table_batch(self, scale, filter_speech_first):
+        sequences = get_smooth_frame_preds([2, 37, 200, 1000])
+        frames = torch.nn.utils.rnn.pad_sequence(sequences, batch_first=True)
+        lengths = torch.tensor([len(sequence) for sequence in sequences])
+        for onset, offset, pad_offset, min_duration_on, min_duration_off in itertools.product(
+            [0.3, 0.7], [0.3, 0.6], [0.0, 0.1], [0.0, 0.05], [0.0, 0.1]
+        ):
+            per_args = {
+                "frame_length_in_sec": 0.01,
+                "onset": onset,
+                "offset": offset,
+                "pad_onset": 0.0,
+                "pad_offset": pad_offset,
+                "min_duration_on": min_duration_on,
+                "min_duration_off": min_duration_off,
+                "filter_speech_first": filter_speech_first,
+                "scale": scale,
+            }
+            tables = generate_vad_segment_table_batch(frames, lengths, per_args)
+            for sequence, table in zip(sequences, tables):
+                _, per_args_float = prepare_gen_segment_table(sequence, dict(per_args))
+                expected = generate_vad_segment_table_per_tensor(sequence, per_args_float)
+                if expected.numel() == 0:
+                    assert table.numel() == 0
+                else:
+                    assert torch.equal(table, expected)
+
+    @pytest.mark.unit
+    def test_iter_vad_frame_pred_batches(self):
+        frame_list = get_smooth_frame_preds([50, 10, 30, 20])
+        batches = list(iter_vad_frame_pred_batches(["a", "b", "c", "d"], frame_list, max_frames_per_batch=60))
+        assert [names for _, _, names in batches] == [["b", "d"], ["c"], ["a"]]
+        frames, lengths, _ = batches[0]
+        assert frames.shape == (2, 20)
+        assert lengths.tolist() == [10, 20]
+        assert torch.equal(frames[0, :10], frame_list[1])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("smoothing_method", ["mean", "median"])
+    def test_generate_overlap_vad_seq_matches_per_file(self, tmp_path, smoothing_method):
+        pred_dir = tmp_path / "pred"
+        pred_dir.mkdir()
+        for idx, sequence in enumerate(get_smooth_frame_preds([1, 80, 300])):
+            with open(pred_dir / f"file{idx}.frame", "w") as f:
+                f.write("".join(f"{pred:.4f}\n" for pred in sequence))
+        per_args = {"overlap": 0.875, "window_length_in_sec": 0.63, "shift_length_in_sec": 0.01}
+
+        out_dir = generate_overlap_vad_seq(
+            str(pred_dir), smoothing_method, num_workers=2, out_dir=str(tmp_path / "batch"), **per_args
+        )
+        (tmp_path / "ref").mkdir()
+        for idx in range(3):
+            generate_overlap_vad_seq_per_file(
+                str(pred_dir / f"file{idx}.frame"),
+                {**per_args, "out_dir": str(tmp_path / "ref"), "smoothing_method": smoothing_method},
+            )
+            result = np.loadtxt(os.path.join(out_dir, f"file{idx}.{smoothing_method}"), ndmin=1)
+            expected = np.loadtxt(tmp_path / "ref" / f"file{idx}.{smoothing_method}", ndmin=1)
+            assert result.shape == expected.shape
+            assert np.allclose(result, expected, atol=2e-4)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_rttm", [True, False])
+    def test_generate_vad_segment_table_matches_per_file(self, tmp_path, use_rttm):
+        pred_dir = tmp_path / "pred"
+        pred_dir.mkdir()
+        sequences = get_smooth_frame_preds([20, 300, 500]) + [torch.zeros(40)]
+        for idx, sequence in enumerate(sequences):
+            with open(pred_dir / f"file{idx}.frame", "w") as f:
+                f.write("".join(f"{pred:.4f}\n" for pred in sequence))
+        params = {"onset": 0.5, "offset": 0.4, "min_duration_on": 0.05, "min_duration_off": 0.1}
+
+        out_dir = generate_vad_segment_table(
+            str(pred_dir), dict(params), 0.01, num_workers=2, out_dir=str(tmp_path / "batch"), use_rttm=use_rttm
+        )
+        (tmp_path / "ref").mkdir()
+        ext = ".rttm" if use_rttm else ".txt"
+        for idx in range(len(sequences)):
+            ref_path = generate_vad_segment_table_per_file(
+                str(pred_dir / f"file{idx}.frame"),
+                {**params, "frame_length_in_sec": 0.01, "out_dir": str(tmp_path / "ref"), "use_rttm": use_rttm},
+            )
+            with open(os.path.join(out_dir, f"file{idx}{ext}")) as f, open(ref_path) as ref:
+                assert f.read() == ref.read()
+
+    @pytest.mark.unit
+    def test_vad_tune_threshold_on_dev(self, tmp_path):
+        pred_dir, rttm_dir = tmp_path / "pred", tmp_path / "rttm"
+        pred_dir.mkdir()
+        rttm_dir.mkdir()
+        for idx, sequence in enumerate(get_smooth_frame_preds([300, 500, 800])):
+            with open(pred_dir / f"file{idx}.frame", "w") as f:
+                f.write("".join(f"{pred:.4f}\n" for pred in sequence))
+            with open(rttm_dir / f"file{idx}.rttm", "w") as f:
+                f.write(f"SPEAKER file{idx} 1 0.5 {idx + 1.0} <NA> <NA> speech <NA> <NA>\n")
+        params = {"onset": [0.4, 0.5, 0.6], "offset": [0.4, 0.5], "min_duration_on": [0.0, 0.1]}
+
+        best_threshold, optimal_scores = vad_tune_threshold_on_dev(
+            dict(params), str(pred_dir), str(rttm_dir), result_file=str(tmp_path / "res")
+        )
+
+        # Compare with the file based post-processing of the best parameters
+        table_dir = generate_vad_segment_table(
+            str(pred_dir), dict(best_threshold), frame_length_in_sec=0.01, num_workers=1, out_dir=str(tmp_path / "tab")
+        )
+        metric = _DetectionErrorRateAccumulator()
+        for idx in range(3):
+            metric(
+                *vad_construct_supervisions_per_file(
+                    os.path.join(table_dir, f"file{idx}.txt"), str(rttm_dir / f"file{idx}.rttm")
+                )
+            )
+        expected_deter = metric.report().iloc[[-1]][('detection error rate', '%')].item()
+        assert optimal_scores['DetER (%)'] == pytest.approx(expected_deter)
+        with open(tmp_path / "res.txt") as f:
+            assert len(f.readlines()) == 12
+
 
 def _annotation_equals(annotation, expected_segments, *, atol=1e-6):
     """Compare a list of :class:`lhotse.SupervisionSegment` to expected ``(start, end, speaker)`` tuples."""
@@ -0,0 +1,111 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
+from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer, create_spt_model
+
+TEXTS = {
+    'en': ["hello world, this is a test.", "the quick brown fox jumps over the lazy dog"],
+    'es': ["hola mundo, esto es una prueba.", "el veloz zorro marrón salta sobre el perro perezoso"],
+}
+
+
+def make_spt_tokenizer(tmp_path_factory, lang):
+    tmpdir = tmp_path_factory.mktemp(f"tok_{lang}")
+    text_path = tmpdir / "text.txt"
+    text_path.write_text("\n".join(TEXTS[lang] * 10))
+    create_spt_model(
+        str(text_path), vocab_size=40, sample_size=-1, do_lower_case=False, output_dir=str(tmpdir), bos=True
+    )
+    return SentencePieceTokenizer(str(tmpdir / "tokenizer.model"))
+
+
+@pytest.fixture(scope="module")
+def spt_tokenizers(tmp_path_factory):
+    return {lang: make_spt_tokenizer(tmp_path_factory, lang) for lang in TEXTS}
+
+
+@pytest.fixture(scope="module")
+def agg_tokenizer(spt_tokenizers):
+    return AggregateTokenizer(spt_tokenizers)
+
+
+def reference_ids_to_text(agg_tokenizer, ids):
+    # detokenization with the sub-tokenizers, token by token
+    tokens = []
+    for id in ids:
+        tokenizer = agg_tokenizer.tokenizers_by_token_id[id]
+        tokens.extend(tokenizer.ids_to_tokens([agg_tokenizer.offset_token_ids_by_token_id[id]]))
+    return ''.join(tokens).replace('▁', ' ')
+
+
+def get_batch(tokenizer, texts, pad_id):
+    ids = [tokenizer.text_to_ids(text, lang) for lang, text in texts]
+    lengths = torch.tensor([len(row) for row in ids])
+    padded = torch.full((len(ids), int(lengths.max())), pad_id, dtype=torch.long)
+    for idx, row in enumerate(ids):
+        padded[idx, : len(row)] = torch.tensor(row)
+    return ids, padded, lengths
+
+
+class TestAggregateTokenizer:
+    @pytest.mark.unit
+    def test_lookup_arrays(self, agg_tokenizer):
+        assert len(agg_tokenizer.pieces_by_token_id) == agg_tokenizer.vocab_size
+        for id in range(agg_tokenizer.vocab_size):
+            tokenizer = agg_tokenizer.tokenizers_by_token_id[id]
+            offset_id = agg_tokenizer.offset_token_ids_by_token_id[id]
+            assert agg_tokenizer.pieces_by_token_id[id] == tokenizer.ids_to_tokens([offset_id])[0]
+            assert agg_tokenizer.offset_ids_by_token_id[id] == offset_id
+            assert agg_tokenizer.langs[agg_tokenizer.lang_idx_by_token_id[id]] == agg_tokenizer.langs_by_token_id[id]
+
+    @pytest.mark.unit
+    def test_ids_to_text(self, agg_tokenizer):
+        for lang, texts in TEXTS.items():
+            for text in texts:
+                ids = agg_tokenizer.text_to_ids(text, lang)
+                assert agg_tokenizer.ids_to_text(ids) == reference_ids_to_text(agg_tokenizer, ids)
+                assert agg_tokenizer.ids_to_text(torch.tensor(ids)) == agg_tokenizer.ids_to_text(ids)
+                assert len(agg_tokenizer.ids_to_tokens(ids)) == len(ids)
+
+    @pytest.mark.unit
+    def test_batch_ids_to_text(self, agg_tokenizer):
+        texts = [('en', TEXTS['en'][0]), ('es', TEXTS['es'][1]), ('en', ""), ('es', TEXTS['es'][0])]
+        # padding with an id out of the vocabulary, like the blank id of RNNT/CTC models
+        ids, padded, lengths = get_batch(agg_tokenizer, texts, pad_id=agg_tokenizer.vocab_size)
+        expected = [reference_ids_to_text(agg_tokenizer, row) for row in ids]
+
+        assert agg_tokenizer.batch_ids_to_text(padded, lengths) == expected
+        assert agg_tokenizer.batch_ids_to_text(padded.numpy(), lengths.tolist()) == expected
+        assert agg_tokenizer.batch_ids_to_text(ids) == expected
+        assert agg_tokenizer.batch_ids_to_text(padded[:1, : lengths[0]]) == expected[:1]
+        assert agg_tokenizer.batch_ids_to_text(np.zeros((0, 3), dtype=np.int64)) == []
+
+
+@pytest.mark.unit
+def test_sentencepiece_batch_ids_to_text(spt_tokenizers):
+    tokenizer = spt_tokenizers['en']
+    ids = [tokenizer.text_to_ids(text) for text in TEXTS['en']] + [[], [tokenizer.bos_id, 5, 6]]
+    lengths = torch.tensor([len(row) for row in ids])
+    padded = torch.zeros(len(ids), int(lengths.max()), dtype=torch.long)
+    for idx, row in enumerate(ids):
+        padded[idx, : len(row)] = torch.tensor(row, dtype=torch.long)
+
+    expected = [tokenizer.ids_to_text(row) for row in ids]
+    assert tokenizer.batch_ids_to_text(padded, lengths) == expected
+    assert tokenizer.batch_ids_to_text(ids) == expected
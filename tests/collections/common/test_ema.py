@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os.path
+from types import SimpleNamespace
 from typing import Any, Dict, Union
 from unittest.mock import patch
 
@@ -20,6 +21,8 @@ import lightning.pytorch as pl
 import pytest
 import torch
 from lightning.pytorch import Callback, Trainer
+from lightning.pytorch.plugins.io import TorchCheckpointIO
+from lightning.pytorch.plugins.io.wrapper import _WrappingCheckpointIO
 from lightning.pytorch.utilities.exceptions import MisconfigurationException
 from lightning.pytorch.utilities.types import STEP_OUTPUT
 from omegaconf import DictConfig, OmegaConf
@@ -27,6 +30,8 @@ from omegaconf import DictConfig, OmegaConf
 from nemo.collections.common.callbacks import EMA
 from nemo.collections.common.callbacks.ema import EMAOptimizer
 from nemo.core import ModelPT
+from nemo.utils.callbacks import NeMoModelCheckpoint
+from nemo.utils.callbacks.dist_ckpt_io import AsyncFinalizableCheckpointIO, AsyncFinalizerCallback
 from nemo.utils.exp_manager import exp_manager
 
 DEVICE_CAPABILITY = None
@@ -121,6 +126,32 @@ class ExampleModel(ModelPT):
         self.validation_step_outputs.clear()  # free memory
 
 
+class DeferredAsyncCheckpointIO(AsyncFinalizableCheckpointIO):
+    """Stand-in for the async CheckpointIO (which requires Megatron Core): saves are queued and only written when
+    finalized, so the checkpoints must not change after they are handed over."""
+
+    def __init__(self):
+        _WrappingCheckpointIO.__init__(self, TorchCheckpointIO())
+        self.pending = []
+        self.async_calls_queue = SimpleNamespace(get_num_unfinalized_calls=lambda: len(self.pending))
+
+    def save_checkpoint(self, checkpoint, path, storage_options=None):
+        finalize_fn = (storage_options or {}).pop('finalize_fn', None)
+        self.pending.append((checkpoint, path, finalize_fn))
+
+    def maybe_finalize_save_checkpoint(self, blocking: bool = False):
+        finalized = len(self.pending) > 0
+        while self.pending:
+            checkpoint, path, finalize_fn = self.pending.pop(0)
+            self.checkpoint_io.save_checkpoint(checkpoint, path)
+            if finalize_fn is not None:
+                finalize_fn()
+        return finalized
+
+    def teardown(self):
+        pass
+
+
 class TestEMAConfig:
     @pytest.mark.unit
     def test_ema_value(self):
@@ -335,6 +366,99 @@ class TestEMAConfig:
         # we save 2 checkpoints for the model, 2 accompanied EMA weights, the last checkpoint and nemo model.
         assert len(os.listdir(tmp_path / "checkpoints/")) == (save_top_k + 1) * 2 + 1
 
+    @pytest.mark.unit
+    def test_ema_async_save(self, tmpdir):
+        """Test that async saves with EMA write the same checkpoints as sync saves, and keep top-k cleanup."""
+        sync_dir, async_dir = os.path.join(tmpdir, "sync"), os.path.join(tmpdir, "async")
+        fit_with_ema_checkpoints(sync_dir)
+        fit_with_ema_checkpoints(async_dir, checkpoint_io=DeferredAsyncCheckpointIO())
+        assert_same_ema_checkpoints(sync_dir, async_dir)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("finalize_between_saves", [True, False])
+    def test_ema_async_save_reuses_host_buffers(self, tmpdir, finalize_between_saves):
+        """Test that the host buffers of a finalized async save are reused by the next one, and only then."""
+        checkpoint_io = DeferredAsyncCheckpointIO()
+        saved_tensor_ptrs = []
+        save_checkpoint = checkpoint_io.save_checkpoint
+
+        def record_save_checkpoint(checkpoint, path, storage_options=None):
+            saved_tensor_ptrs.append({value.data_ptr() for value in checkpoint["state_dict"].values()})
+            save_checkpoint(checkpoint, path, storage_options)
+
+        checkpoint_io.save_checkpoint = record_save_checkpoint
+        if not finalize_between_saves:
+            # all the saves stay pending until the end of training
+            maybe_finalize_save_checkpoint = checkpoint_io.maybe_finalize_save_checkpoint
+            checkpoint_io.maybe_finalize_save_checkpoint = lambda blocking=False: (
+                maybe_finalize_save_checkpoint(blocking) if blocking else False
+            )
+
+        sync_dir, async_dir = os.path.join(tmpdir, "sync"), os.path.join(tmpdir, "async")
+        fit_with_ema_checkpoints(sync_dir)
+        fit_with_ema_checkpoints(async_dir, checkpoint_io=checkpoint_io)
+        assert_same_ema_checkpoints(sync_dir, async_dir)
+
+        # saves at steps 2, 4 and 6, each of a checkpoint and an EMA checkpoint
+        assert len(saved_tensor_ptrs) == 6
+        for step_idx in range(1, 3):
+            for ckpt_idx in range(2):
+                reused = saved_tensor_ptrs[2 * step_idx + ckpt_idx] == saved_tensor_ptrs[ckpt_idx]
+                assert reused == finalize_between_saves
+        # the checkpoint and the EMA checkpoint of a save never share buffers
+        assert not saved_tensor_ptrs[0] & saved_tensor_ptrs[1]
+
+
+def fit_with_ema_checkpoints(dirpath, checkpoint_io=None):
+    """Trains the example model with EMA for 7 steps, saving the top-2 checkpoints every 2 steps (async if
+    `checkpoint_io` is given)."""
+    torch.manual_seed(0)
+    model = ExampleModel()
+    async_save = checkpoint_io is not None
+    callbacks = [
+        EMA(decay=0.9),
+        NeMoModelCheckpoint(
+            dirpath=dirpath,
+            filename="{step}",
+            monitor="step",
+            mode="max",
+            save_top_k=2,
+            every_n_train_steps=2,
+            save_nemo_on_train_end=False,
+            async_save=async_save,
+        ),
+    ]
+    if async_save:
+        callbacks.append(AsyncFinalizerCallback())
+    trainer = Trainer(
+        max_steps=7,
+        limit_val_batches=0,
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        accelerator='cpu',
+        devices=1,
+        callbacks=callbacks,
+        plugins=[checkpoint_io] if async_save else [],
+    )
+    trainer.fit(model)
+
+
+def assert_same_ema_checkpoints(sync_dir, async_dir):
+    expected_files = {"step=4.ckpt", "step=4-EMA.ckpt", "step=6.ckpt", "step=6-EMA.ckpt"}
+    assert set(os.listdir(sync_dir)) == expected_files
+    assert set(os.listdir(async_dir)) == expected_files
+    for filename in expected_files:
+        sync_ckpt = torch.load(os.path.join(sync_dir, filename), weights_only=False)
+        async_ckpt = torch.load(os.path.join(async_dir, filename), weights_only=False)
+        assert sync_ckpt["global_step"] == async_ckpt["global_step"]
+        for key, value in sync_ckpt["state_dict"].items():
+            assert torch.equal(value, async_ckpt["state_dict"][key])
+        sync_optim, async_optim = sync_ckpt["optimizer_states"][0], async_ckpt["optimizer_states"][0]
+        if "ema" in sync_optim:
+            for sync_ema, async_ema in zip(sync_optim["ema"], async_optim["ema"]):
+                assert torch.equal(sync_ema, async_ema)
+
 
 class TestEMATrain:
     @pytest.mark.unit
@@ -0,0 +1,74 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nemo.collections.common.parts.preprocessing import parsers
+from nemo.collections.common.parts.preprocessing.collections import AudioText
+
+
+def _make_collection(**kwargs):
+    num_items = 20
+    return AudioText(
+        ids=list(range(num_items)),
+        audio_files=[f"/data/ünïcode_{idx}.wav" for idx in range(num_items)],
+        durations=[float((idx * 7) % 5) + 0.5 for idx in range(num_items)],
+        texts=["" if idx == 3 else "hello world" + " ab" * idx for idx in range(num_items)],
+        offsets=[None if idx % 2 else 0.25 * idx for idx in range(num_items)],
+        speakers=[idx % 3 for idx in range(num_items)],
+        orig_sampling_rates=[16000 if idx % 2 else None for idx in range(num_items)],
+        token_labels=[[1, 2, idx] if idx == 5 else None for idx in range(num_items)],
+        langs=["en" if idx % 4 else None for idx in range(num_items)],
+        parser=parsers.make_parser(labels=list(" abcdefghijklmnopqrstuvwxyz"), name="en"),
+        **kwargs,
+    )
+
+
+class TestColumnarAudioText:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"min_duration": 1.0, "max_duration": 4.0},
+            {"do_sort_by_duration": True},
+            {"index_by_file_id": True, "max_number": 7},
+        ],
+    )
+    def test_same_entities_as_list_backend(self, kwargs):
+        expected = _make_collection(**kwargs)
+        columnar = _make_collection(columnar=True, **kwargs)
+
+        assert len(columnar) == len(expected)
+        assert list(columnar) == list(expected)
+        assert [columnar[idx] for idx in range(-len(expected), len(expected))] == [
+            expected[idx] for idx in range(-len(expected), len(expected))
+        ]
+        if kwargs.get("index_by_file_id"):
+            assert columnar.mapping == expected.mapping
+
+    @pytest.mark.unit
+    def test_columns_are_arrays(self):
+        columnar = _make_collection(columnar=True)
+        assert len(columnar) == 20
+        assert columnar.data.durations.dtype == np.float64
+        assert columnar[5].text_tokens == [1, 2, 5]
+        assert columnar[3].text_tokens == []
+
+    @pytest.mark.unit
+    def test_out_of_range(self):
+        columnar = _make_collection(columnar=True)
+        with pytest.raises(IndexError):
+            columnar[len(columnar)]
@@ -26,6 +26,7 @@ from onnx.reference import ReferenceEvaluator
 
 from nemo.collections.asr.models import SortformerEncLabelModel
 from nemo.collections.asr.parts.submodules.subsampling import FeatureStacking
+from nemo.collections.asr.parts.utils.sortformer_streaming_utils import ContinuousBatchedDiarizationStreamer
 from nemo.collections.asr.parts.utils.sortformer_utils import InferenceProfiler, configure_output_subsampling_factor
 
 
@@ -1174,3 +1175,76 @@ class TestSortformerEncLabelModelHighResolution:
         assert call_kwargs["cfg_vad_params"] is diarize_config.postprocessing_params
         assert call_kwargs["unit_10ms_frame_count"] == expected_frame_count
         assert call_kwargs["bypass_postprocessing"] is False
+
+
+class TestContinuousBatchedDiarizationStreamer:
+    @staticmethod
+    def _create_streaming_model():
+        model = _create_sortformer_model()
+        model.streaming_mode = True
+        model.async_streaming = True
+        modules = model.sortformer_modules
+        modules.chunk_len = 6
+        modules.chunk_left_context = 1
+        modules.chunk_right_context = 2
+        modules.fifo_len = 12
+        modules.spkcache_len = 24
+        modules.spkcache_update_period = 8
+        return model.eval()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("batch_size", [1, 2, 5])
+    def test_matches_single_stream_forward_streaming(self, batch_size):
+        model = self._create_streaming_model()
+        torch.manual_seed(0)
+        audio_signals = [torch.randn(num_samples) for num_samples in (16000, 5000, 37000, 9000, 23000)]
+        with torch.inference_mode():
+            expected = []
+            for audio_signal in audio_signals:
+                features, feature_lengths = model.process_signal(
+                    audio_signal.unsqueeze(0), torch.tensor([audio_signal.shape[0]])
+                )
+                expected.append(model.forward_streaming(features, feature_lengths)[0])
+
+        streamer = ContinuousBatchedDiarizationStreamer(model, batch_size=batch_size)
+        results = streamer.run(audio_signals)
+
+        assert [result.stream_id for result in results] == list(range(len(audio_signals)))
+        for result, expected_preds in zip(results, expected):
+            assert result.preds.shape == expected_preds.shape
+            assert torch.allclose(result.preds, expected_preds, atol=1e-5)
+            assert result.num_chunks > 0 and result.max_latency >= result.mean_latency > 0
+        stats = streamer.get_stats()
+        assert stats['num_streams'] == len(audio_signals)
+        assert stats['audio_duration'] == pytest.approx(sum(signal.shape[0] for signal in audio_signals) / 16000)
+        assert stats['rtfx'] > 0
+        assert 1 <= stats['mean_active_streams'] <= batch_size
+        assert not streamer.has_streams()
+
+    @pytest.mark.unit
+    def test_slots_are_refilled_as_streams_finish(self):
+        model = self._create_streaming_model()
+        streamer = ContinuousBatchedDiarizationStreamer(model, batch_size=2)
+        short_id = streamer.add_stream(torch.randn(4000))
+        long_id = streamer.add_stream(torch.randn(40000))
+        queued_id = streamer.add_stream(torch.randn(4000))
+
+        finished = streamer.step()
+        assert [result.stream_id for result in finished] == [short_id]
+        assert streamer.num_active_streams == 1 and streamer.num_pending_streams == 1
+
+        # the queued stream takes the free slot and, with a single chunk, finishes in the same step
+        finished = streamer.step()
+        assert [result.stream_id for result in finished] == [queued_id]
+        assert streamer.num_active_streams == 1 and streamer.num_pending_streams == 0
+        assert streamer._state.fifo.shape[0] == streamer.num_active_streams
+        while streamer.has_streams():
+            streamer.step()
+        assert sorted(streamer.results) == [short_id, long_id, queued_id]
+
+    @pytest.mark.unit
+    def test_requires_async_streaming(self):
+        model = self._create_streaming_model()
+        model.async_streaming = False
+        with pytest.raises(ValueError, match="async_streaming"):
+            ContinuousBatchedDiarizationStreamer(model, batch_size=2)
@@ -17,6 +17,7 @@ import os
 import tempfile
 from unittest import TestCase
 
+import numpy as np
 import pytest
 import torch
 from omegaconf import DictConfig
@@ -217,3 +218,78 @@ class TestEncDecSpeechLabelModel:
 
             assert pred_label == true_label
             assert gt_labels[1] == 'test'
+
+    @pytest.mark.unit
+    def test_verify_speakers_batch_embedding_cache(self, tmp_path, monkeypatch):
+        def make_model(seed):
+            torch.manual_seed(seed)
+            cfg = DictConfig(
+                {
+                    'preprocessor': {'_target_': 'nemo.collections.asr.modules.AudioToMelSpectrogramPreprocessor'},
+                    'encoder': {
+                        '_target_': 'nemo.collections.asr.modules.ConvASREncoder',
+                        'feat_in': 64,
+                        'activation': 'relu',
+                        'conv_mask': True,
+                        'jasper': [
+                            {
+                                'filters': 16,
+                                'repeat': 1,
+                                'kernel': [1],
+                                'stride': [1],
+                                'dilation': [1],
+                                'dropout': 0.0,
+                                'residual': False,
+                                'separable': False,
+                            }
+                        ],
+                    },
+                    'decoder': {
+                        '_target_': 'nemo.collections.asr.modules.SpeakerDecoder',
+                        'feat_in': 16,
+                        'num_classes': 2,
+                        'pool_mode': 'xvector',
+                        'emb_sizes': [8],
+                    },
+                }
+            )
+            return EncDecSpeakerLabelModel(cfg=cfg)
+
+        embeddings = {b'a': [1.0, 0.0], b'b': [0.9, 0.1], b'c': [0.0, 1.0]}
+
+        def fake_batch_inference(manifest_filepath, **kwargs):
+            with open(manifest_filepath) as f:
+                paths = [json.loads(line)['audio_filepath'] for line in f]
+            embs = []
+            for path in paths:
+                with open(path, 'rb') as audio:
+                    embs.append(embeddings[audio.read()])
+            return np.array(embs, dtype=np.float32), None, None, None
+
+        audio_files = []
+        for name, content in zip('abc', embeddings):
+            audio_files.append(str(tmp_path / f'{name}.wav'))
+            with open(audio_files[-1], 'wb') as f:
+                f.write(content)
+        cache_dir = str(tmp_path / 'cache')
+
+        model = make_model(seed=0)
+        monkeypatch.setattr(model, 'batch_inference', fake_batch_inference)
+        decision = model.verify_speakers_batch([(audio_files[0], audio_files[1])], embedding_cache_dir=cache_dir)
+        # a single pair gives a 0-d decision
+        assert decision.shape == ()
+        assert bool(decision)
+        decisions = model.verify_speakers_batch(
+            [(audio_files[0], audio_files[1]), (audio_files[0], audio_files[2])], embedding_cache_dir=cache_dir
+        )
+        assert decisions.tolist() == [True, False]
+
+        # the cache is tied to the model weights and to the sample rate
+        with pytest.raises(ValueError, match="model_id"):
+            model.verify_speakers_batch(
+                [(audio_files[0], audio_files[1])], sample_rate=8000, embedding_cache_dir=cache_dir
+            )
+        other_model = make_model(seed=1)
+        monkeypatch.setattr(other_model, 'batch_inference', fake_batch_inference)
+        with pytest.raises(ValueError, match="model_id"):
+            other_model.verify_speakers_batch([(audio_files[0], audio_files[1])], embedding_cache_dir=cache_dir)
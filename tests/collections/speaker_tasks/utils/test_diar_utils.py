@@ -23,9 +23,19 @@ from nemo.collections.asr.data.audio_to_label import repeat_signal
 from nemo.collections.asr.parts.utils.longform_clustering import LongFormSpeakerClustering
 from nemo.collections.asr.parts.utils.offline_clustering import (
     SpeakerClustering,
+    eigDecompose,
+    eigDecomposeSparse,
+    get_argmin_mat,
     get_scale_interpolated_embs,
+    getAffinityGraphMat,
     getCosAffinityMatrix,
+    getCosSimilarityMin,
     getKneighborsConnections,
+    getLaplacian,
+    getMultiScaleCosAffinityMatrix,
+    getMultiScaleCosAffinityRows,
+    getMultiScaleNormalizedEmbs,
+    getSparseKneighborsAffinityMat,
     split_input_data,
 )
 from nemo.collections.asr.parts.utils.online_clustering import (
@@ -708,6 +718,47 @@ class TestClusteringUtilFunctions:
         elif mask_method == 'drop':
             assert all(binarized_affinity_mat.sum(dim=0) <= float(p_value))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [2, 4])
+    @pytest.mark.parametrize("p_value, chunk_size", [(3, 7), (10, 4096)])
+    def test_sparse_kneighbors_affinity_mat(self, n_spks, p_value, chunk_size, spk_dur=5):
+        em, ts, mc, mw, spk_ts, gt = generate_toy_data(n_spks=n_spks, spk_dur=spk_dur, perturb_sigma=0.1)
+        embeddings_in_scales, timestamps_in_scales = split_input_data(em, ts, mc)
+        mapping_list = get_argmin_mat(timestamps_in_scales)
+        norm_embs = getMultiScaleNormalizedEmbs(embeddings_in_scales, device=torch.device('cpu'))
+        min_values = [getCosSimilarityMin(norm_emb, chunk_size=chunk_size) for norm_emb in norm_embs]
+        weights = mw.squeeze(0)
+        index = torch.arange(mc[-1])
+        rows = getMultiScaleCosAffinityRows(norm_embs, mapping_list, min_values, weights, index, index)
+        dense_mat = getMultiScaleCosAffinityMatrix(mw, embeddings_in_scales, timestamps_in_scales)
+        assert torch.allclose(rows, dense_mat, atol=1e-2)
+
+        sparse_affinity_mat = getSparseKneighborsAffinityMat(
+            norm_embs, mapping_list, min_values, weights, p_value=p_value, chunk_size=chunk_size
+        )
+        expected_affinity_mat = getAffinityGraphMat(rows, p_value)
+        expected_affinity_mat.fill_diagonal_(0)
+        assert torch.equal(sparse_affinity_mat.to_dense(), expected_affinity_mat)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [1, 3])
+    def test_eig_decompose_sparse(self, n_spks, p_value=8, spk_dur=10):
+        em, ts, mc, mw, spk_ts, gt = generate_toy_data(n_spks=n_spks, spk_dur=spk_dur, perturb_sigma=0.1)
+        embeddings_in_scales, timestamps_in_scales = split_input_data(em, ts, mc)
+        mapping_list = get_argmin_mat(timestamps_in_scales)
+        norm_embs = getMultiScaleNormalizedEmbs(embeddings_in_scales, device=torch.device('cpu'))
+        min_values = [getCosSimilarityMin(norm_emb) for norm_emb in norm_embs]
+        sparse_affinity_mat = getSparseKneighborsAffinityMat(
+            norm_embs, mapping_list, min_values, mw.squeeze(0), p_value=p_value
+        )
+        n_eigs = n_spks + 1
+        lambdas, diffusion_map = eigDecomposeSparse(sparse_affinity_mat, n_eigs=n_eigs)
+        dense_lambdas, _ = eigDecompose(
+            getLaplacian(sparse_affinity_mat.to_dense()), cuda=False, device=torch.device('cpu')
+        )
+        assert diffusion_map.shape == (mc[-1], n_eigs)
+        assert torch.allclose(lambdas, dense_lambdas[:n_eigs], atol=1e-2)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("Y_aggr", [torch.tensor([0, 1, 0, 1])])
     @pytest.mark.parametrize("chunk_cluster_count, embeddings_per_chunk", [(2, 50)])
@@ -802,6 +853,42 @@ class TestSpeakerClustering:
     def test_offline_speaker_clustering_cpu(self, n_spks, total_sec, SSV, perturb_sigma, seed, jit_script, cuda=False):
         self.test_offline_speaker_clustering(n_spks, total_sec, SSV, perturb_sigma, seed, jit_script, cuda=cuda)
 
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [1, 2, 4, 7])
+    @pytest.mark.parametrize("total_sec, SSV, nme_mat_size, seed", [(60, 10, 64, 0)])
+    @pytest.mark.parametrize("jit_script", [False, True])
+    def test_offline_speaker_clustering_sparse_affinity_cpu(
+        self, n_spks, total_sec, SSV, nme_mat_size, seed, jit_script
+    ):
+        spk_dur = total_sec / n_spks
+        em, ts, mc, mw, spk_ts, gt = generate_toy_data(
+            n_spks=n_spks, spk_dur=spk_dur, perturb_sigma=0.1, torch_seed=seed
+        )
+        offline_speaker_clustering = SpeakerClustering(
+            maj_vote_spk_count=False, nme_mat_size=nme_mat_size, use_sparse_affinity=True, sparse_chunk_size=50
+        )
+        if jit_script:
+            offline_speaker_clustering = torch.jit.script(offline_speaker_clustering)
+        assert mc[-1] > nme_mat_size
+
+        Y_out = offline_speaker_clustering.forward_infer(
+            embeddings_in_scales=em,
+            timestamps_in_scales=ts,
+            multiscale_segment_counts=mc,
+            multiscale_weights=mw,
+            oracle_num_speakers=-1,
+            max_num_speakers=8,
+            enhanced_count_thres=40,
+            sparse_search_volume=SSV,
+            max_rp_threshold=0.15,
+            fixed_thres=-1.0,
+        )
+        permuted_Y = stitch_cluster_labels(Y_old=gt, Y_new=Y_out)
+        assert Y_out.shape[0] == mc[-1]
+        assert len(set(permuted_Y.tolist())) == n_spks
+        assert all(permuted_Y == gt)
+
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
     @pytest.mark.parametrize("n_spks", [1])
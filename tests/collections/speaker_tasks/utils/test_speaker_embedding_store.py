@@ -0,0 +1,172 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nemo.collections.asr.parts.utils.speaker_embedding_store import (
+    IVFPQIndex,
+    SpeakerEmbeddingCache,
+    get_audio_content_hash,
+    score_embedding_pairs,
+)
+
+
+def write_files(tmp_path, contents):
+    audio_files = []
+    for idx, content in enumerate(contents):
+        audio_file = tmp_path / f"audio_{idx}.wav"
+        audio_file.write_bytes(content)
+        audio_files.append(str(audio_file))
+    return audio_files
+
+
+class FakeEmbedder:
+    """Embeds a file as a deterministic function of its content and records the files it was called with"""
+
+    def __init__(self, emb_dim=4):
+        self.emb_dim = emb_dim
+        self.calls = []
+
+    def __call__(self, audio_files):
+        self.calls.append(list(audio_files))
+        embs = []
+        for audio_file in audio_files:
+            seed = int(get_audio_content_hash(audio_file)[:8], 16)
+            embs.append(np.random.default_rng(seed).standard_normal(self.emb_dim))
+        return np.stack(embs)
+
+
+class TestSpeakerEmbeddingCache:
+    @pytest.mark.unit
+    def test_content_hash(self, tmp_path):
+        audio_files = write_files(tmp_path, [b"abc", b"abc", b"abd"])
+        hashes = [get_audio_content_hash(audio_file, chunk_size=2) for audio_file in audio_files]
+        assert hashes[0] == hashes[1]
+        assert hashes[0] != hashes[2]
+
+    @pytest.mark.unit
+    def test_get_or_compute_embeds_each_content_once(self, tmp_path):
+        audio_files = write_files(tmp_path, [b"a", b"b", b"a", b"c"])
+        embedder = FakeEmbedder()
+        cache = SpeakerEmbeddingCache(str(tmp_path / "cache"), initial_capacity=1)
+
+        rows = cache.get_or_compute(audio_files + audio_files[::-1], embedder)
+        assert embedder.calls == [[audio_files[0], audio_files[1], audio_files[3]]]
+        assert rows.tolist() == [0, 1, 0, 2, 2, 0, 1, 0]
+        assert np.allclose(cache.get(rows[:4]), embedder(audio_files))
+
+    @pytest.mark.unit
+    def test_persistence(self, tmp_path):
+        audio_files = write_files(tmp_path, [b"a", b"b", b"c"])
+        embedder = FakeEmbedder()
+        cache = SpeakerEmbeddingCache(str(tmp_path / "cache"), initial_capacity=1)
+        rows = cache.get_or_compute(audio_files[:2], embedder)
+        embs = cache.get(rows)
+
+        reloaded = SpeakerEmbeddingCache(str(tmp_path / "cache"))
+        assert len(reloaded) == 2
+        new_rows = reloaded.get_or_compute(audio_files, embedder)
+        assert embedder.calls[-1] == [audio_files[2]]
+        assert np.allclose(reloaded.get(new_rows[:2]), embs)
+        assert reloaded.lookup(["missing"]).tolist() == [-1]
+
+    @pytest.mark.unit
+    def test_model_id_mismatch(self, tmp_path):
+        audio_files = write_files(tmp_path, [b"a"])
+        cache = SpeakerEmbeddingCache(str(tmp_path / "cache"), model_id="model-a")
+        cache.get_or_compute(audio_files, FakeEmbedder())
+
+        assert len(SpeakerEmbeddingCache(str(tmp_path / "cache"), model_id="model-a")) == 1
+        with pytest.raises(ValueError, match="model_id"):
+            SpeakerEmbeddingCache(str(tmp_path / "cache"), model_id="model-b")
+
+    @pytest.mark.unit
+    def test_emb_dim_mismatch(self, tmp_path):
+        cache = SpeakerEmbeddingCache(str(tmp_path / "cache"))
+        cache.add(["a"], np.zeros((1, 4)))
+        with pytest.raises(ValueError):
+            cache.add(["b"], np.zeros((1, 3)))
+
+
+@pytest.mark.unit
+def test_score_embedding_pairs():
+    rng = np.random.default_rng(0)
+    embs = rng.standard_normal((10, 8)).astype(np.float32)
+    pairs = rng.integers(0, 10, size=(50, 2))
+
+    scores = score_embedding_pairs(embs, pairs, batch_size=7)
+
+    x, y = embs[pairs[:, 0]], embs[pairs[:, 1]]
+    expected = ((x * y).sum(1) / (np.linalg.norm(x, axis=1) * np.linalg.norm(y, axis=1)) + 1) / 2
+    assert np.allclose(scores, expected, atol=1e-6)
+
+
+class TestIVFPQIndex:
+    @pytest.mark.unit
+    def test_search_recall(self):
+        rng = np.random.default_rng(0)
+        embs = rng.standard_normal((2000, 32)).astype(np.float32)
+        ids = np.arange(2000) + 100
+        index = IVFPQIndex(num_lists=16, num_subquantizers=8, num_iters=10)
+        index.add(embs, ids)
+
+        query_rows = rng.choice(2000, size=50, replace=False)
+        queries = embs[query_rows] + 0.1 * rng.standard_normal((50, 32)).astype(np.float32)
+        scores, found_ids = index.search(queries, k=5, num_probes=16)
+
+        assert found_ids.shape == (50, 5)
+        assert np.all(np.diff(scores, axis=1) <= 0)
+        assert (found_ids[:, 0] == ids[query_rows]).mean() >= 0.9
+
+    @pytest.mark.unit
+    def test_exhaustive_probing_matches_reconstruction(self):
+        rng = np.random.default_rng(1)
+        embs = rng.standard_normal((300, 16)).astype(np.float32)
+        index = IVFPQIndex(num_lists=4, num_subquantizers=4, num_codewords=16, num_iters=5)
+        index.add(embs)
+        queries = rng.standard_normal((5, 16)).astype(np.float32)
+
+        scores, found_ids = index.search(queries, k=300, num_probes=4)
+
+        # with all lists probed, every embedding is scored against its quantized reconstruction
+        index._build_lists()
+        sub_dim = index.codebooks.shape[2]
+        reconstructed = index.coarse_centroids[index._list_ids].copy()
+        for m in range(index.num_subquantizers):
+            reconstructed[:, m * sub_dim : (m + 1) * sub_dim] += index.codebooks[m][index._codes[:, m]]
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        expected = queries @ reconstructed.T
+        for q in range(5):
+            assert np.allclose(scores[q], expected[q][np.argsort(-expected[q])], atol=1e-4)
+            assert sorted(found_ids[q].tolist()) == list(range(300))
+
+    @pytest.mark.unit
+    def test_save_load(self, tmp_path):
+        rng = np.random.default_rng(2)
+        embs = rng.standard_normal((200, 16)).astype(np.float32)
+        index = IVFPQIndex(num_lists=8, num_subquantizers=4, num_codewords=32, num_iters=5)
+        index.add(embs)
+        index.save(str(tmp_path / "index.npz"))
+        loaded = IVFPQIndex.load(str(tmp_path / "index.npz"))
+
+        queries = rng.standard_normal((10, 16)).astype(np.float32)
+        for expected, result in zip(index.search(queries, k=3), loaded.search(queries, k=3)):
+            assert np.array_equal(expected, result)
+
+    @pytest.mark.unit
+    def test_invalid_num_subquantizers(self):
+        index = IVFPQIndex(num_lists=2, num_subquantizers=3)
+        with pytest.raises(ValueError):
+            index.train(np.zeros((10, 8), dtype=np.float32))
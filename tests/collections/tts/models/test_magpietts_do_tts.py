@@ -13,7 +13,7 @@
 # limitations under the License.
 
 """
-Unit tests for MagpieTTSModel.do_tts local-transformer selection.
+Unit tests for MagpieTTSModel.do_tts local-transformer selection and decoder KV cache setup.
 
 do_tts must use local transformer iff the model has one (local_transformer_type
 != 'none'); otherwise generate_speech raises. The test drives the real do_tts with a mock self and
@@ -37,6 +37,7 @@ def _make_mock_model(local_transformer_type):
     model.local_transformer_type = local_transformer_type
     model.device = torch.device("cpu")
     model.eos_id = 0
+    model.use_kv_cache_for_inference = True
     model.tokenizer = MagicMock()
     model.tokenizer.tokenizers = {"english_phoneme": object()}
     # Zero-length predicted codes so do_tts skips codec decoding and returns silence.
@@ -79,3 +80,38 @@ class TestDoTtsLocalTransformerSelection:
         MagpieTTSModel.do_tts(model, "hello world", language="en")
 
         assert _local_transformer_flag_passed_to_generate_speech(model) is expected_use_lt
+
+
+class TestDecoderKVCacheReset:
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_chunks, expected_use_cache", [(1, True), (3, False)])
+    @patch("nemo.collections.tts.models.magpietts.chunk_text_for_inference")
+    @patch("nemo.collections.tts.models.magpietts.get_tokenizer_for_language")
+    def test_do_tts_resets_decoder_cache(self, mock_get_tok, mock_chunk, num_chunks, expected_use_cache):
+        """The decoder KV cache is reset before generation and only used for single-chunk text."""
+        mock_get_tok.return_value = "english_phoneme"
+        mock_chunk.return_value = ([torch.zeros(3, dtype=torch.long)] * num_chunks, [3] * num_chunks, None)
+        model = _make_mock_model(LocalTransformerType.NO_LT)
+
+        MagpieTTSModel.do_tts(model, "hello world", language="en")
+
+        model.reset_decoder_cache.assert_called_once_with(use_cache=expected_use_cache)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "use_cache, use_static_kv_cache, expected_max_cache_steps",
+        [(True, True, 50), (True, False, None), (False, True, None)],
+    )
+    def test_reset_decoder_cache_static_kv_cache(self, use_cache, use_static_kv_cache, expected_max_cache_steps):
+        model = MagicMock(spec=MagpieTTSModel)
+        model.decoder = MagicMock()
+        model.frame_stacking_factor = 2
+        model.inference_parameters = SimpleNamespace(max_decoder_steps=100, use_static_kv_cache=use_static_kv_cache)
+
+        MagpieTTSModel.reset_decoder_cache(model, use_cache=use_cache)
+
+        model.decoder.reset_cache.assert_called_once_with(
+            use_cache=use_cache, max_cache_steps=expected_max_cache_steps
+        )
@@ -852,6 +852,82 @@ class TestTransformerBatchedInference:
                 )
 
 
+@pytest.mark.unit
+class TestTransformerStaticKVCache:
+    @classmethod
+    def setup_class(cls):
+        cls.n_layers = 2
+        cls.d_model = 8
+        cls.d_ffn = 16
+        cls.sa_n_heads = 2
+        cls.max_length_causal_mask = 16
+        cls.prefill_length = 3
+        cls.num_steps = 5
+
+    def _decode(self, model, x, cond, cond_mask, max_cache_steps=None):
+        model.reset_cache(use_cache=True, max_cache_steps=max_cache_steps)
+        outputs = []
+        for t in range(self.prefill_length, self.prefill_length + self.num_steps + 1):
+            x_mask = torch.ones(x.size(0), t).bool()
+            out = model(x[:, :t], x_mask, cond=cond, cond_mask=cond_mask)['output']
+            outputs.append(out[:, -1])
+        model.reset_cache(use_cache=False)
+        return torch.stack(outputs, dim=1)
+
+    def test_static_cache_matches_dynamic_cache(self):
+        set_seed(0)
+        model = Transformer(
+            n_layers=self.n_layers,
+            d_model=self.d_model,
+            d_ffn=self.d_ffn,
+            sa_n_heads=self.sa_n_heads,
+            kernel_size=1,
+            has_xattn=True,
+            xa_d_memory=self.d_model,
+            xa_n_heads=2,
+            is_causal=True,
+            max_length_causal_mask=self.max_length_causal_mask,
+        ).eval()
+        x = torch.randn(2, self.prefill_length + self.num_steps, self.d_model)
+        cond = torch.randn(2, 6, self.d_model)
+        cond_mask = torch.ones(2, 6).bool()
+
+        with torch.no_grad():
+            dynamic_out = self._decode(model, x, cond, cond_mask)
+            static_out = self._decode(model, x, cond, cond_mask, max_cache_steps=self.num_steps)
+            full_out = model(x, torch.ones(2, x.size(1)).bool(), cond=cond, cond_mask=cond_mask)['output']
+
+        assert torch.allclose(static_out, dynamic_out, atol=1e-5)
+        assert torch.allclose(static_out, full_out[:, self.prefill_length - 1 :], atol=1e-5)
+
+    def test_static_cache_buffers_are_preallocated(self):
+        set_seed(0)
+        model = Transformer(
+            n_layers=1,
+            d_model=self.d_model,
+            d_ffn=self.d_ffn,
+            sa_n_heads=self.sa_n_heads,
+            kernel_size=1,
+            is_causal=True,
+            max_length_causal_mask=self.max_length_causal_mask,
+        ).eval()
+        x = torch.randn(1, self.prefill_length + 2, self.d_model)
+        attn = model.layers[0].self_attention
+
+        model.reset_cache(use_cache=True, max_cache_steps=1)
+        with torch.no_grad():
+            model(x[:, : self.prefill_length], torch.ones(1, self.prefill_length).bool())
+            buffer_ptr = attn.cache['self_k'].data_ptr()
+            assert attn.cache['self_k'].shape == (1, self.prefill_length + 1, self.sa_n_heads, self.d_model // 2)
+
+            model(x[:, : self.prefill_length + 1], torch.ones(1, self.prefill_length + 1).bool())
+            assert attn.cache['self_k'].data_ptr() == buffer_ptr
+            assert attn.cache['lengths']['self_k'] == self.prefill_length + 1
+
+            with pytest.raises(ValueError):
+                model(x, torch.ones(1, self.prefill_length + 2).bool())
+
+
 @pytest.mark.unit
 class TestMoERouter:
     """Test the MoERouter class for expert selection and auxiliary losses."""
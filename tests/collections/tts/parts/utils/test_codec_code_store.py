@@ -0,0 +1,78 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import numpy as np
+import pytest
+import torch
+
+from nemo.collections.tts.parts.utils.codec_code_store import CodecCodeStore, CodecCodeStoreWriter
+
+NUM_CODEBOOKS = 4
+
+
+def make_codes(num_frames, seed):
+    return torch.from_numpy(np.random.default_rng(seed).integers(0, 2016, size=(NUM_CODEBOOKS, num_frames)))
+
+
+class TestCodecCodeStore:
+    @pytest.mark.unit
+    def test_write_read(self, tmp_path):
+        all_codes = {f"utt_{idx}.pt": make_codes(num_frames, idx) for idx, num_frames in enumerate([5, 17, 0, 9])}
+        # tiny shards, so that the codes are spread over several of them
+        with CodecCodeStoreWriter(str(tmp_path), num_codebooks=NUM_CODEBOOKS, max_shard_size_mb=1e-4) as writer:
+            for key, codes in all_codes.items():
+                writer.add(key, codes)
+
+        store = CodecCodeStore(str(tmp_path))
+        assert len(store) == len(all_codes)
+        assert len(list(tmp_path.glob("shard_*.bin"))) > 1
+        assert "missing.pt" not in store
+        for key, codes in all_codes.items():
+            assert key in store
+            assert store.num_frames(key) == codes.shape[1]
+            loaded = store.get(key)
+            assert loaded.dtype == torch.int32
+            assert torch.equal(loaded, codes.int())
+        assert torch.equal(store.get("utt_1.pt", 3, 11), all_codes["utt_1.pt"][:, 3:11].int())
+        assert torch.equal(store.get("utt_1.pt", 10, 100), all_codes["utt_1.pt"][:, 10:].int())
+
+    @pytest.mark.unit
+    def test_append_and_pickle(self, tmp_path):
+        with CodecCodeStoreWriter(str(tmp_path), num_codebooks=NUM_CODEBOOKS) as writer:
+            writer.add("a", make_codes(3, 0))
+        with CodecCodeStoreWriter(str(tmp_path), num_codebooks=NUM_CODEBOOKS) as writer:
+            assert "a" in writer
+            writer.add("b", make_codes(4, 1))
+
+        store = CodecCodeStore(str(tmp_path))
+        store.get("a")
+        store = pickle.loads(pickle.dumps(store))
+        assert torch.equal(store.get("a"), make_codes(3, 0).int())
+        assert torch.equal(store.get("b"), make_codes(4, 1).int())
+
+    @pytest.mark.unit
+    def test_invalid_codes(self, tmp_path):
+        with CodecCodeStoreWriter(str(tmp_path), num_codebooks=NUM_CODEBOOKS) as writer:
+            writer.add("a", make_codes(3, 0))
+            with pytest.raises(ValueError):
+                writer.add("a", make_codes(3, 0))
+            with pytest.raises(ValueError):
+                writer.add("b", torch.zeros(NUM_CODEBOOKS + 1, 3, dtype=torch.long))
+            with pytest.raises(ValueError):
+                writer.add("c", torch.full((NUM_CODEBOOKS, 3), 40000))
+
+        with pytest.raises(ValueError):
+            CodecCodeStoreWriter(str(tmp_path), num_codebooks=NUM_CODEBOOKS, dtype='int32')
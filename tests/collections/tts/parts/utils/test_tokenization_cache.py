@@ -0,0 +1,83 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from types import SimpleNamespace
+
+import pytest
+from omegaconf import OmegaConf
+
+from nemo.collections.tts.parts.utils.tokenization_cache import (
+    TokenizationCache,
+    TokenizationCacheWriter,
+    get_config_hash,
+    get_tokenization_cache_key,
+    is_deterministic_tokenizer,
+)
+
+
+def make_key(text, config_hash="abc"):
+    return get_tokenization_cache_key('text', 'english_phoneme', config_hash, text)
+
+
+class TestTokenizationCache:
+    @pytest.mark.unit
+    def test_write_read(self, tmp_path):
+        entries = {make_key(f"text {idx}"): list(range(idx)) for idx in range(5)}
+        with TokenizationCacheWriter(str(tmp_path)) as writer:
+            for key, tokens in entries.items():
+                writer.add(key, tokens)
+
+        cache = TokenizationCache(str(tmp_path))
+        assert len(cache) == len(entries)
+        for key, tokens in entries.items():
+            assert cache.get(key) == tokens
+        assert cache.get(make_key("missing")) is None
+        assert cache.get(make_key("text 1", config_hash="other")) is None
+
+    @pytest.mark.unit
+    def test_append_and_pickle(self, tmp_path):
+        with TokenizationCacheWriter(str(tmp_path)) as writer:
+            writer.add(make_key("a"), [1, 2])
+        with TokenizationCacheWriter(str(tmp_path)) as writer:
+            assert make_key("a") in writer
+            writer.add(make_key("b"), [3])
+
+        cache = TokenizationCache(str(tmp_path))
+        cache.get(make_key("a"))
+        cache = pickle.loads(pickle.dumps(cache))
+        assert cache.get(make_key("a")) == [1, 2]
+        assert cache.get(make_key("b")) == [3]
+
+    @pytest.mark.unit
+    def test_empty(self, tmp_path):
+        TokenizationCacheWriter(str(tmp_path)).close()
+        assert TokenizationCache(str(tmp_path)).get(make_key("a")) is None
+
+
+@pytest.mark.unit
+def test_get_config_hash():
+    config = OmegaConf.create({'english_phoneme': {'_target_': 'IPATokenizer', 'locale': 'en-US'}})
+    assert get_config_hash(config) == get_config_hash(OmegaConf.to_container(config))
+    assert get_config_hash(config) != get_config_hash(config, None)
+    config.english_phoneme.locale = 'en-GB'
+    assert get_config_hash(config) != get_config_hash(OmegaConf.create({'english_phoneme': {'locale': 'en-US'}}))
+
+
+@pytest.mark.unit
+def test_is_deterministic_tokenizer():
+    assert is_deterministic_tokenizer(SimpleNamespace())
+    assert is_deterministic_tokenizer(SimpleNamespace(g2p=SimpleNamespace(phoneme_probability=None)))
+    assert is_deterministic_tokenizer(SimpleNamespace(g2p=SimpleNamespace(phoneme_probability=1.0)))
+    assert not is_deterministic_tokenizer(SimpleNamespace(g2p=SimpleNamespace(phoneme_probability=0.8)))
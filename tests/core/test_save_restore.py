@@ -15,6 +15,7 @@ import filecmp
 import json
 import os
 import shutil
+import tarfile
 import tempfile
 from typing import Any, Callable, Dict, Optional, Set, Union
 
@@ -1303,6 +1304,65 @@ class TestSaveRestore:
         for orig, restored in zip(original_state_dict.keys(), restored_state_dict.keys()):
             assert (original_state_dict[orig] - restored_state_dict[restored]).abs().mean() < 1e-6
 
+    @pytest.mark.unit
+    def test_lazy_restore_from(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_file = os.path.join(tmpdir, 'temp_file.txt')
+            with open(temp_file, 'w') as f:
+                f.writelines(["*****\n"])
+
+            cfg = _mock_model_config()
+            cfg.model.temp_file = temp_file
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            nemo_filepath = os.path.join(tmpdir, 'lazy.nemo')
+            model.save_to(nemo_filepath)
+
+            def fail_unpack(*args, **kwargs):
+                raise AssertionError("lazy restore must not extract the whole .nemo file")
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.lazy_restore = True
+            monkeypatch.setattr(connector, '_unpack_nemo_file', fail_unpack)
+
+            restored_cfg = MockModel.restore_from(nemo_filepath, save_restore_connector=connector, return_config=True)
+            assert restored_cfg.stub_number == model.cfg.stub_number
+
+            restored_model = MockModel.restore_from(
+                nemo_filepath, map_location='cpu', save_restore_connector=connector
+            )
+            assert restored_model.temp_data == ["*****\n"]
+            assert (model.w.weight - restored_model.w.weight).abs().max() == 0
+            assert save_restore_connector.SaveRestoreConnector._lazy_tar_indices == {}
+            monkeypatch.undo()
+
+            # artifacts registered from the lazily restored model are packed again on save
+            restored_model.save_to(os.path.join(tmpdir, 'lazy_resaved.nemo'))
+            resaved_model = MockModel.restore_from(os.path.join(tmpdir, 'lazy_resaved.nemo'), map_location='cpu')
+            assert resaved_model.temp_data == ["*****\n"]
+
+    @pytest.mark.unit
+    def test_lazy_restore_falls_back_for_compressed_tar(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = _mock_model_config()
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            model.save_to(os.path.join(tmpdir, 'model.nemo'))
+
+            extracted_dir = os.path.join(tmpdir, 'extracted')
+            save_restore_connector.SaveRestoreConnector._unpack_nemo_file(
+                os.path.join(tmpdir, 'model.nemo'), extracted_dir
+            )
+            nemo_filepath = os.path.join(tmpdir, 'compressed.nemo')
+            with tarfile.open(nemo_filepath, 'w:gz') as tar:
+                tar.add(extracted_dir, arcname='.')
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.lazy_restore = True
+            assert connector._open_nemo_tar_index(nemo_filepath) is None
+            restored_model = MockModel.restore_from(
+                nemo_filepath, map_location='cpu', save_restore_connector=connector
+            )
+            assert (model.w.weight - restored_model.w.weight).abs().max() == 0
+
     @pytest.mark.unit
     def test_hf_model_filter(self):
         filt = ModelPT.get_hf_model_filter()
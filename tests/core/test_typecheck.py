@@ -1190,3 +1190,89 @@ class TestNeuralTypeCheckSystem:
             # assert that even if semantic types are disabled, output is attached with appropriate types
             assert result.sum() == torch.tensor(10.0)
             assert result.neural_type.compare(NeuralType(('B',), LabelsType())) == NeuralTypeComparisonResult.SAME
+
+    @pytest.mark.unit
+    def test_cached_typecheck(self):
+        class InputOutputTypes(Typing):
+            num_type_queries = 0
+
+            @property
+            def input_types(self):
+                self.num_type_queries += 1
+                return {"x": NeuralType(('B', 'T'), ElementType())}
+
+            @property
+            def output_types(self):
+                return {"y": NeuralType(('B', 'T'), ElementType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1
+
+        obj = InputOutputTypes()
+        with typecheck.cached_checks():
+            # first call with a signature is checked and attaches types
+            result = obj(x=torch.zeros(2, 5))
+            assert result.neural_type.compare(NeuralType(('B', 'T'), ElementType())) == NeuralTypeComparisonResult.SAME
+            num_type_queries = obj.num_type_queries
+
+            # same rank and dtype with other shape: checks are skipped
+            result = obj(x=torch.zeros(3, 7))
+            assert result.sum() == torch.tensor(21.0)
+            assert not hasattr(result, 'neural_type')
+            assert obj.num_type_queries == num_type_queries
+
+            # new signatures are checked
+            with pytest.raises(TypeError):
+                _ = obj(x=torch.zeros(10))
+            with pytest.raises(TypeError):
+                _ = obj(a=torch.zeros(2, 5))
+            _ = obj(x=torch.zeros(2, 5, dtype=torch.int64))
+            assert obj.num_type_queries > num_type_queries
+
+            # other instances are validated separately
+            other = InputOutputTypes()
+            _ = other(x=torch.zeros(3, 7))
+            assert other.num_type_queries > 0
+
+            typecheck.clear_cache(obj)
+            result = obj(x=torch.zeros(3, 7))
+            assert hasattr(result, 'neural_type')
+
+        # cache is not used once disabled
+        assert hasattr(obj(x=torch.zeros(3, 7)), 'neural_type')
+        typecheck.clear_cache()
+
+    @pytest.mark.unit
+    def test_typecheck_profiling(self):
+        class InputOutputTypes(Typing):
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B',), ElementType())}
+
+            @property
+            def output_types(self):
+                return {"y": NeuralType(('B',), ElementType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1
+
+        obj = InputOutputTypes()
+        typecheck.set_profiling_enabled(True)
+        try:
+            for _ in range(3):
+                _ = obj(x=torch.zeros(10))
+            with typecheck.cached_checks():
+                for _ in range(2):
+                    _ = obj(x=torch.zeros(10))
+            stats = typecheck.get_profiling_stats()["InputOutputTypes.__call__"]
+            assert stats["calls"] == 5
+            assert stats["cache_hits"] == 1
+            assert stats["time"] > 0.0
+
+            typecheck.reset_profiling_stats()
+            assert typecheck.get_profiling_stats() == {}
+        finally:
+            typecheck.set_profiling_enabled(False)
+            typecheck.clear_cache()
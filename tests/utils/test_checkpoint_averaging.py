@@ -0,0 +1,132 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tarfile
+
+import pytest
+import torch
+
+from nemo.core.connectors.save_restore_connector import SaveRestoreConnector
+from nemo.utils.checkpoint_averaging import average_checkpoints, get_averaging_weights, save_averaged_nemo
+
+
+def make_state_dict(seed):
+    generator = torch.Generator().manual_seed(seed)
+    return {
+        'linear.weight': torch.randn(4, 3, generator=generator),
+        'linear.bias': torch.randn(4, generator=generator).to(torch.bfloat16),
+        'bn.num_batches_tracked': torch.tensor(seed + 1),
+    }
+
+
+def save_checkpoints(tmp_path, num_checkpoints):
+    paths, state_dicts = [], []
+    for seed in range(num_checkpoints):
+        state_dict = make_state_dict(seed)
+        path = str(tmp_path / f"step={seed}.ckpt")
+        torch.save({'state_dict': state_dict, 'optimizer_states': [{'exp_avg': torch.ones(4, 3)}]}, path)
+        paths.append(path)
+        state_dicts.append(state_dict)
+    return paths, state_dicts
+
+
+class TestGetAveragingWeights:
+    @pytest.mark.unit
+    def test_uniform_and_weighted(self):
+        assert get_averaging_weights(4) == [0.25] * 4
+        assert get_averaging_weights(2, weights=[1, 3]) == [0.25, 0.75]
+
+    @pytest.mark.unit
+    def test_ema(self):
+        decay = 0.9
+        weights = get_averaging_weights(3, ema_decay=decay)
+
+        values = [1.0, 2.0, 3.0]
+        ema = values[0]
+        for value in values[1:]:
+            ema = decay * ema + (1 - decay) * value
+        assert sum(w * v for w, v in zip(weights, values)) == pytest.approx(ema)
+
+    @pytest.mark.unit
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            get_averaging_weights(2, weights=[1.0])
+        with pytest.raises(ValueError):
+            get_averaging_weights(2, weights=[1.0, 1.0], ema_decay=0.5)
+        with pytest.raises(ValueError):
+            get_averaging_weights(2, ema_decay=1.0)
+
+
+class TestAverageCheckpoints:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_uniform_average(self, tmp_path, mmap):
+        paths, state_dicts = save_checkpoints(tmp_path, 3)
+
+        avg_state = average_checkpoints(paths, mmap=mmap)
+
+        expected = torch.stack([sd['linear.weight'] for sd in state_dicts]).mean(0)
+        assert torch.allclose(avg_state['linear.weight'], expected, atol=1e-6)
+        assert avg_state['linear.bias'].dtype == torch.bfloat16
+        expected_bias = torch.stack([sd['linear.bias'].float() for sd in state_dicts]).mean(0)
+        assert torch.allclose(avg_state['linear.bias'].float(), expected_bias, atol=1e-2)
+        # integer tensors are accumulated, not averaged
+        assert avg_state['bn.num_batches_tracked'].item() == 1 + 2 + 3
+
+    @pytest.mark.unit
+    def test_weighted_average(self, tmp_path):
+        paths, state_dicts = save_checkpoints(tmp_path, 2)
+
+        avg_state = average_checkpoints(paths, weights=[1.0, 3.0])
+
+        expected = 0.25 * state_dicts[0]['linear.weight'] + 0.75 * state_dicts[1]['linear.weight']
+        assert torch.allclose(avg_state['linear.weight'], expected, atol=1e-6)
+
+    @pytest.mark.unit
+    def test_mismatched_keys(self, tmp_path):
+        paths, state_dicts = save_checkpoints(tmp_path, 2)
+        state_dicts[1]['extra'] = torch.zeros(1)
+        torch.save(state_dicts[1], paths[1])
+
+        with pytest.raises(RuntimeError, match="unexpected keys \\['extra'\\]"):
+            average_checkpoints(paths)
+
+
+@pytest.mark.unit
+def test_save_averaged_nemo(tmp_path):
+    connector = SaveRestoreConnector()
+    reference_dir = tmp_path / "reference"
+    reference_dir.mkdir()
+    (reference_dir / connector.model_config_yaml).write_text("target: some.Model\n")
+    torch.save(make_state_dict(0), reference_dir / connector.model_weights_ckpt)
+    reference_nemo = str(tmp_path / "reference.nemo")
+    with tarfile.open(reference_nemo, "w:") as tar:
+        tar.add(reference_dir, arcname=".")
+
+    paths, _ = save_checkpoints(tmp_path, 2)
+    avg_state = average_checkpoints(paths)
+    save_path = str(tmp_path / "out" / "averaged.nemo")
+    save_averaged_nemo(avg_state, reference_nemo, save_path)
+
+    out_dir = tmp_path / "extracted"
+    connector._unpack_nemo_file(save_path, str(out_dir))
+    assert (out_dir / connector.model_config_yaml).read_text() == "target: some.Model\n"
+    saved_state = torch.load(out_dir / connector.model_weights_ckpt)
+    assert saved_state.keys() == avg_state.keys()
+    for key in avg_state:
+        assert torch.equal(saved_state[key], avg_state[key])
+
+    del avg_state['linear.weight']
+    with pytest.raises(RuntimeError, match="missing keys"):
+        save_averaged_nemo(avg_state, reference_nemo, save_path)
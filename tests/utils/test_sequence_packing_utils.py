@@ -0,0 +1,107 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import numpy as np
+import pytest
+
+from nemo.utils.sequence_packing_utils import (
+    best_fit,
+    best_fit_decreasing,
+    create_hist,
+    create_packing_strategy,
+    fill_packing_strategy,
+    find_first_bin_that_fits,
+    first_fit,
+    first_fit_decreasing,
+)
+
+
+def _naive_first_fit(seqlens, pack_size):
+    res = []
+    for s in seqlens:
+        first_bin = find_first_bin_that_fits(res, s, pack_size)
+        if first_bin == -1:
+            res.append([s])
+        else:
+            res[first_bin].append(s)
+    return res
+
+
+def _naive_best_fit(seqlens, pack_size):
+    res = []
+    for s in seqlens:
+        best_bin, best_capacity = -1, None
+        for i, bin_ in enumerate(res):
+            capacity = pack_size - sum(bin_)
+            if capacity >= s and (best_capacity is None or capacity < best_capacity):
+                best_bin, best_capacity = i, capacity
+        if best_bin == -1:
+            res.append([s])
+        else:
+            res[best_bin].append(s)
+    return res
+
+
+class TestSequencePacking:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_first_fit_matches_naive(self, seed):
+        rng = random.Random(seed)
+        seqlens = [rng.randint(1, 64) for _ in range(500)]
+        assert first_fit(seqlens, 64) == _naive_first_fit(seqlens, 64)
+        assert first_fit_decreasing(seqlens, 64) == _naive_first_fit(sorted(seqlens, reverse=True), 64)
+
+    @pytest.mark.unit
+    def test_first_fit_oversized_sequence(self):
+        seqlens = [3, 10, 2, 4, 1]
+        assert first_fit(seqlens, 8) == _naive_first_fit(seqlens, 8)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_best_fit_matches_naive(self, seed):
+        rng = random.Random(seed)
+        seqlens = [rng.randint(1, 64) for _ in range(500)]
+        assert best_fit(seqlens, 64) == _naive_best_fit(seqlens, 64)
+        assert best_fit_decreasing(seqlens, 64) == _naive_best_fit(sorted(seqlens, reverse=True), 64)
+
+    @pytest.mark.unit
+    def test_create_hist(self):
+        dataset = np.array([{"input_ids": list(range(n))} for n in [3, 5, 3, 2, 5, 5]])
+        sequences, histogram = create_hist(dataset, truncate_seq_len=6)
+        assert histogram == [0, 1, 2, 0, 3, 0, 0]
+        assert sequences[4] == [dataset[1], dataset[4], dataset[5]]
+        with pytest.raises(ValueError):
+            create_hist(dataset, truncate_seq_len=3)
+
+    @pytest.mark.unit
+    def test_create_hist_empty_input_ids(self):
+        dataset = np.array([{"input_ids": list(range(n))} for n in [3, 0, 2]])
+        with pytest.raises(ValueError, match="empty input_ids"):
+            create_hist(dataset, truncate_seq_len=6)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("packing_algorithm", ["first_fit_decreasing", "first_fit_shuffle", "best_fit_decreasing"])
+    def test_packing_strategy_roundtrip(self, packing_algorithm):
+        rng = np.random.default_rng(0)
+        dataset = np.array(
+            [{"input_ids": list(range(n)), "answer_start_idx": 1} for n in rng.integers(2, 33, size=200)]
+        )
+        sequences, histogram = create_hist(dataset, truncate_seq_len=32)
+        assignments, metadata = create_packing_strategy(histogram, 64, packing_algorithm)
+        assert all(sum(pack) <= 64 for pack in assignments)
+        assert metadata["dataset_max_seqlen"] <= 32
+        packed = fill_packing_strategy(assignments, sequences, 64, pad_id=0)
+        assert sum(len(pack["seq_start_id"]) for pack in packed) == len(dataset)
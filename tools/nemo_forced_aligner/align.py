@@ -15,18 +15,15 @@
 import copy
 import math
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, is_dataclass
 from pathlib import Path
 from typing import List, Optional
 
 import torch
 from omegaconf import OmegaConf
-from utils.data_prep import (
-    get_batch_starts_ends,
-    get_manifest_lines_batch,
-    is_entry_in_all_lines,
-    is_entry_in_any_lines,
-)
+from utils.data_prep import iter_manifest_batches, prefetch_audio_batches, validate_manifest
 from utils.make_ass_files import make_ass_files
 from utils.make_ctm_files import make_ctm_files
 from utils.make_output_manifest import write_manifest_out_line
@@ -52,6 +49,10 @@ except ImportError:
         "Or install the latest development version:\n"
         "  pip install git+https://github.com/NVIDIA-NeMo/Speech.git"
     )
+
+# maximum number of aligned batches waiting to be written when cfg.async_output_writing=True
+MAX_PENDING_OUTPUT_BATCHES = 2
+
 """
 Align the utterances in manifest_filepath. 
 Results are saved in ctm files in output_dir.
@@ -75,7 +76,16 @@ Arguments:
     viterbi_device: None, or string specifying the device that will be used for doing Viterbi decoding. 
         The string needs to be in a format recognized by torch.device(). If None, NFA will set it to 'cuda' if it is available 
         (otherwise will set it to 'cpu').
+    viterbi_checkpoint_interval: None, or int specifying the number of timesteps between checkpoints of the Viterbi
+        probabilities. If None, the Viterbi backpointers of all timesteps are kept in memory. If set, only the
+        checkpoints are kept and the backpointers are recomputed during the traceback, which bounds the memory for
+        long audio at the cost of about twice the Viterbi compute. Set to 0 to use sqrt(number of timesteps).
     batch_size: int specifying batch size that will be used for generating log-probs and doing Viterbi decoding.
+    audio_prefetch_workers: int specifying the number of threads used to decode the audio of the next batch while
+        the current batch is being aligned. If 0 (default), the audio files are read by the model's transcribe
+        method. Not supported with use_buffered_chunked_streaming or simulate_cache_aware_streaming.
+    async_output_writing: boolean flag specifying whether to write the output CTM/ASS files and output manifest
+        lines in a background thread, overlapping with the alignment of the next batch.
     use_local_attention: boolean flag specifying whether to try to use local attention for the ASR Model (will only
         work if the ASR Model is a Conformer model). If local attention is used, we will set the local attention context 
         size to [64,64].
@@ -144,7 +154,10 @@ class AlignmentConfig:
     align_using_pred_text: bool = False
     transcribe_device: Optional[str] = None
     viterbi_device: Optional[str] = None
+    viterbi_checkpoint_interval: Optional[int] = None
     batch_size: int = 1
+    audio_prefetch_workers: int = 0
+    async_output_writing: bool = True
     use_local_attention: bool = True
     additional_segment_grouping_separator: Optional[List[str]] = field(default_factory=lambda: ['.', '?', '!', '...'])
     audio_filepath_parts_in_utt_id: int = 1
@@ -164,6 +177,69 @@ class AlignmentConfig:
     ass_file_config: ASSFileConfig = field(default_factory=lambda: ASSFileConfig())
 
 
+def save_batch_outputs(cfg, utt_obj_batch, alignments_batch, output_timestep_duration, f_manifest_out):
+    """
+    Save the CTM/ASS files of a batch of aligned utterances and write their lines of the output manifest.
+    """
+    for utt_obj, alignment_utt in zip(utt_obj_batch, alignments_batch):
+
+        utt_obj = add_t_start_end_to_utt_obj(utt_obj, alignment_utt, output_timestep_duration)
+
+        if "ctm" in cfg.save_output_file_formats:
+            utt_obj = make_ctm_files(
+                utt_obj,
+                cfg.output_dir,
+                cfg.ctm_file_config,
+            )
+
+        if "ass" in cfg.save_output_file_formats:
+            utt_obj = make_ass_files(utt_obj, cfg.output_dir, cfg.ass_file_config)
+
+        write_manifest_out_line(
+            f_manifest_out,
+            utt_obj,
+        )
+
+
+class BatchOutputWriter:
+    """
+    Saves the outputs of aligned batches with `save_batch_outputs`.
+
+    If `async_output_writing` is True, the batches are written by a single background worker, so that the output
+    manifest keeps the input order, and `write` blocks while more than `max_pending_batches` batches are waiting to
+    be written, which bounds the number of batches held in memory. Otherwise every batch is written in `write`.
+    """
+
+    def __init__(self, cfg, f_manifest_out, max_pending_batches=MAX_PENDING_OUTPUT_BATCHES):
+        self.cfg = cfg
+        self.f_manifest_out = f_manifest_out
+        self.max_pending_batches = max_pending_batches
+        self.executor = ThreadPoolExecutor(max_workers=1) if cfg.async_output_writing else None
+        self.pending_outputs = deque()
+
+    def write(self, utt_obj_batch, alignments_batch, output_timestep_duration):
+        output_args = (self.cfg, utt_obj_batch, alignments_batch, output_timestep_duration, self.f_manifest_out)
+        if self.executor is None:
+            save_batch_outputs(*output_args)
+            return
+
+        self.pending_outputs.append(self.executor.submit(save_batch_outputs, *output_args))
+        while len(self.pending_outputs) > self.max_pending_batches:
+            self.pending_outputs.popleft().result()
+
+    def drain(self):
+        """
+        Wait until all the pending batches are written. Errors raised while writing a batch are re-raised here.
+        """
+        while self.pending_outputs:
+            self.pending_outputs.popleft().result()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
 @hydra_runner(config_name="AlignmentConfig", schema=AlignmentConfig)
 def main(cfg: AlignmentConfig):
 
@@ -188,6 +264,9 @@ def main(cfg: AlignmentConfig):
     if cfg.batch_size < 1:
         raise ValueError("cfg.batch_size cannot be zero or a negative number")
 
+    if cfg.viterbi_checkpoint_interval is not None and cfg.viterbi_checkpoint_interval < 0:
+        raise ValueError("cfg.viterbi_checkpoint_interval cannot be a negative number")
+
     if cfg.additional_segment_grouping_separator == "" or cfg.additional_segment_grouping_separator == " ":
         raise ValueError("cfg.additional_grouping_separator cannot be empty string or space character")
     elif cfg.additional_segment_grouping_separator is not None and cfg.additional_segment_grouping_separator != []:
@@ -216,26 +295,18 @@ def main(cfg: AlignmentConfig):
                 " exactly 3 elements."
             )
 
-    # Validate manifest contents
-    if not is_entry_in_all_lines(cfg.manifest_filepath, "audio_filepath"):
-        raise RuntimeError(
-            "At least one line in cfg.manifest_filepath does not contain an 'audio_filepath' entry. "
-            "All lines must contain an 'audio_filepath' entry."
+    if cfg.audio_prefetch_workers < 0:
+        raise ValueError("cfg.audio_prefetch_workers cannot be a negative number")
+
+    if cfg.audio_prefetch_workers > 0 and (cfg.use_buffered_chunked_streaming or cfg.simulate_cache_aware_streaming):
+        raise ValueError(
+            "cfg.audio_prefetch_workers > 0 is not supported with cfg.use_buffered_chunked_streaming or "
+            "cfg.simulate_cache_aware_streaming, which need to read the audio files themselves."
         )
 
-    if cfg.align_using_pred_text:
-        if is_entry_in_any_lines(cfg.manifest_filepath, "pred_text"):
-            raise RuntimeError(
-                "Cannot specify cfg.align_using_pred_text=True when the manifest at cfg.manifest_filepath "
-                "contains 'pred_text' entries. This is because the audio will be transcribed and may produce "
-                "a different 'pred_text'. This may cause confusion."
-            )
-    else:
-        if not is_entry_in_all_lines(cfg.manifest_filepath, "text"):
-            raise RuntimeError(
-                "At least one line in cfg.manifest_filepath does not contain a 'text' entry. "
-                "NFA requires all lines to contain a 'text' entry when cfg.align_using_pred_text=False."
-            )
+    # Validate manifest contents in a cheap pass that does not load any audio, so that a bad line is reported
+    # before the model is loaded rather than when its batch is reached
+    validate_manifest(cfg.manifest_filepath, cfg.align_using_pred_text)
 
     # init devices
     if cfg.transcribe_device is None:
@@ -316,9 +387,6 @@ def main(cfg: AlignmentConfig):
             "model_stride_in_secs": model_stride_in_secs,
             "tokens_per_chunk": tokens_per_chunk,
         }
-    # get start and end line IDs of batches
-    starts, ends = get_batch_starts_ends(cfg.manifest_filepath, cfg.batch_size)
-
     # init output_timestep_duration = None and we will calculate and update it during the first batch
     output_timestep_duration = None
 
@@ -328,57 +396,63 @@ def main(cfg: AlignmentConfig):
     tgt_manifest_filepath = str(Path(cfg.output_dir) / tgt_manifest_name)
     f_manifest_out = open(tgt_manifest_filepath, 'w')
 
-    # get alignment and save in CTM batch-by-batch
-    for start, end in zip(starts, ends):
-        manifest_lines_batch = get_manifest_lines_batch(cfg.manifest_filepath, start, end)
-
-        if not cfg.align_using_pred_text:
-            gt_text_batch = [line.get('text', '') for line in manifest_lines_batch]
-        else:
-            gt_text_batch = None
-
-        (
-            log_probs_batch,
-            y_batch,
-            T_batch,
-            U_batch,
-            utt_obj_batch,
-            output_timestep_duration,
-        ) = get_batch_variables(
-            audio=[line['audio_filepath'] for line in manifest_lines_batch],
-            model=model,
-            segment_separators=cfg.additional_segment_grouping_separator,
-            align_using_pred_text=cfg.align_using_pred_text,
-            audio_filepath_parts_in_utt_id=cfg.audio_filepath_parts_in_utt_id,
-            gt_text_batch=gt_text_batch,
-            output_timestep_duration=output_timestep_duration,
-            simulate_cache_aware_streaming=cfg.simulate_cache_aware_streaming,
-            use_buffered_chunked_streaming=cfg.use_buffered_chunked_streaming,
-            buffered_chunk_params=buffered_chunk_params,
-        )
-
-        alignments_batch = viterbi_decoding(log_probs_batch, y_batch, T_batch, U_batch, viterbi_device)
-
-        for utt_obj, alignment_utt in zip(utt_obj_batch, alignments_batch):
-
-            utt_obj = add_t_start_end_to_utt_obj(utt_obj, alignment_utt, output_timestep_duration)
+    # the manifest is read (and validated) once, line by line, while the audio of the next batch
+    # is optionally decoded in the background
+    batches = prefetch_audio_batches(
+        iter_manifest_batches(cfg.manifest_filepath, cfg.batch_size, cfg.align_using_pred_text),
+        sample_rate=model.cfg.sample_rate if cfg.audio_prefetch_workers > 0 else None,
+        num_workers=cfg.audio_prefetch_workers,
+    )
 
-            if "ctm" in cfg.save_output_file_formats:
-                utt_obj = make_ctm_files(
-                    utt_obj,
-                    cfg.output_dir,
-                    cfg.ctm_file_config,
-                )
+    # output files are optionally written in the background, overlapping with the alignment of the next batch
+    output_writer = BatchOutputWriter(cfg, f_manifest_out)
 
-            if "ass" in cfg.save_output_file_formats:
-                utt_obj = make_ass_files(utt_obj, cfg.output_dir, cfg.ass_file_config)
+    # get alignment and save in CTM batch-by-batch
+    try:
+        for manifest_lines_batch, audio_batch in batches:
+            audio_filepaths = [line['audio_filepath'] for line in manifest_lines_batch]
+
+            if not cfg.align_using_pred_text:
+                gt_text_batch = [line.get('text', '') for line in manifest_lines_batch]
+            else:
+                gt_text_batch = None
+
+            (
+                log_probs_batch,
+                y_batch,
+                T_batch,
+                U_batch,
+                utt_obj_batch,
+                output_timestep_duration,
+            ) = get_batch_variables(
+                audio=audio_batch if audio_batch is not None else audio_filepaths,
+                model=model,
+                segment_separators=cfg.additional_segment_grouping_separator,
+                align_using_pred_text=cfg.align_using_pred_text,
+                audio_filepath_parts_in_utt_id=cfg.audio_filepath_parts_in_utt_id,
+                gt_text_batch=gt_text_batch,
+                output_timestep_duration=output_timestep_duration,
+                simulate_cache_aware_streaming=cfg.simulate_cache_aware_streaming,
+                use_buffered_chunked_streaming=cfg.use_buffered_chunked_streaming,
+                buffered_chunk_params=buffered_chunk_params,
+                audio_filepaths=audio_filepaths,
+            )
 
-            write_manifest_out_line(
-                f_manifest_out,
-                utt_obj,
+            alignments_batch = viterbi_decoding(
+                log_probs_batch,
+                y_batch,
+                T_batch,
+                U_batch,
+                viterbi_device,
+                checkpoint_interval=cfg.viterbi_checkpoint_interval,
             )
 
-    f_manifest_out.close()
+            output_writer.write(utt_obj_batch, alignments_batch, output_timestep_duration)
+
+        output_writer.drain()
+    finally:
+        output_writer.close()
+        f_manifest_out.close()
 
     return None
 
@@ -26,12 +26,7 @@ from typing import List, Optional
 
 import torch
 from omegaconf import OmegaConf
-from utils.data_prep import (
-    get_batch_starts_ends,
-    get_manifest_lines_batch,
-    is_entry_in_all_lines,
-    is_entry_in_any_lines,
-)
+from utils.data_prep import iter_manifest_batches, validate_manifest
 from utils.make_ass_files import make_ass_files
 from utils.make_ctm_files import make_ctm_files
 from utils.make_output_manifest import write_manifest_out_line
@@ -86,6 +81,10 @@ Arguments:
     viterbi_device: None, or string specifying the device that will be used for doing Viterbi decoding. 
         The string needs to be in a format recognized by torch.device(). If None, NFA will set it to 'cuda' if it is available 
         (otherwise will set it to 'cpu').
+    viterbi_checkpoint_interval: None, or int specifying the number of timesteps between checkpoints of the Viterbi
+        probabilities. If None, the Viterbi backpointers of all timesteps are kept in memory. If set, only the
+        checkpoints are kept and the backpointers are recomputed during the traceback, which bounds the memory for
+        long audio at the cost of about twice the Viterbi compute. Set to 0 to use sqrt(number of timesteps).
     batch_size: int specifying batch size that will be used for generating log-probs and doing Viterbi decoding.
     use_local_attention: boolean flag specifying whether to try to use local attention for the ASR Model (will only
         work if the ASR Model is a Conformer model). If local attention is used, we will set the local attention context 
@@ -157,6 +156,7 @@ class AlignmentConfig:
     align_using_pred_text: bool = False
     transcribe_device: Optional[str] = None
     viterbi_device: Optional[str] = None
+    viterbi_checkpoint_interval: Optional[int] = None
     batch_size: int = 1
     use_local_attention: bool = True
     additional_segment_grouping_separator: Optional[str] = None
@@ -443,29 +443,8 @@ def main(cfg: AlignmentConfig):
 
 
 def process_single_manifest(cfg: AlignmentConfig, model, buffered_chunk_params, viterbi_device):
-    # Validate manifest contents
-    if not is_entry_in_all_lines(cfg.manifest_filepath, "audio_filepath"):
-        raise RuntimeError(
-            "At least one line in cfg.manifest_filepath does not contain an 'audio_filepath' entry. "
-            "All lines must contain an 'audio_filepath' entry."
-        )
-
-    if cfg.align_using_pred_text:
-        if is_entry_in_any_lines(cfg.manifest_filepath, "pred_text"):
-            raise RuntimeError(
-                "Cannot specify cfg.align_using_pred_text=True when the manifest at cfg.manifest_filepath "
-                "contains 'pred_text' entries. This is because the audio will be transcribed and may produce "
-                "a different 'pred_text'. This may cause confusion."
-            )
-    else:
-        if not is_entry_in_all_lines(cfg.manifest_filepath, "text"):
-            raise RuntimeError(
-                "At least one line in cfg.manifest_filepath does not contain a 'text' entry. "
-                "NFA requires all lines to contain a 'text' entry when cfg.align_using_pred_text=False."
-            )
-
-    # get start and end line IDs of batches
-    starts, ends = get_batch_starts_ends(cfg.manifest_filepath, cfg.batch_size)
+    # Validate manifest contents before aligning any of its lines
+    validate_manifest(cfg.manifest_filepath, cfg.align_using_pred_text)
 
     # init output_timestep_duration = None and we will calculate and update it during the first batch
     output_timestep_duration = None
@@ -479,9 +458,10 @@ def process_single_manifest(cfg: AlignmentConfig, model, buffered_chunk_params,
     tgt_manifest_filepath = str(Path(cfg.output_dir) / tgt_manifest_name)
     f_manifest_out = open(tgt_manifest_filepath, 'w')
 
-    # get alignment and save in CTM batch-by-batch
-    for start, end in zip(starts, ends):
-        manifest_lines_batch = get_manifest_lines_batch(cfg.manifest_filepath, start, end)
+    # get alignment and save in CTM batch-by-batch, reading (and validating) the manifest in a single pass
+    for manifest_lines_batch in iter_manifest_batches(
+        cfg.manifest_filepath, cfg.batch_size, cfg.align_using_pred_text
+    ):
 
         if cfg.clean_text:
             manifest_lines_batch = clean_text(manifest_lines_batch)
@@ -511,7 +491,14 @@ def process_single_manifest(cfg: AlignmentConfig, model, buffered_chunk_params,
             buffered_chunk_params=buffered_chunk_params,
         )
 
-        alignments_batch = viterbi_decoding(log_probs_batch, y_batch, T_batch, U_batch, viterbi_device)
+        alignments_batch = viterbi_decoding(
+            log_probs_batch,
+            y_batch,
+            T_batch,
+            U_batch,
+            viterbi_device,
+            checkpoint_interval=cfg.viterbi_checkpoint_interval,
+        )
 
         for utt_obj, alignment_utt in zip(utt_obj_batch, alignments_batch):
 
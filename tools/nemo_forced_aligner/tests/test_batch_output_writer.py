@@ -0,0 +1,111 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import align
+import pytest
+from align import BatchOutputWriter
+
+
+class FakeSaveBatchOutputs:
+    """Records the batches in the order they are written, optionally waiting for `release` first."""
+
+    def __init__(self, release=None):
+        self.written = []
+        self.release = release
+        self.thread_ids = set()
+
+    def __call__(self, cfg, utt_obj_batch, alignments_batch, output_timestep_duration, f_manifest_out):
+        if self.release is not None:
+            assert self.release.wait(timeout=5.0)
+        # later batches are faster to write, which must not change the order of the output manifest
+        time.sleep(0.01 * max(0, 3 - utt_obj_batch[0]))
+        self.thread_ids.add(threading.get_ident())
+        self.written.append(utt_obj_batch[0])
+        f_manifest_out.append(utt_obj_batch[0])
+
+
+def make_writer(async_output_writing, max_pending_batches=2):
+    cfg = SimpleNamespace(async_output_writing=async_output_writing)
+    return BatchOutputWriter(cfg, f_manifest_out=[], max_pending_batches=max_pending_batches)
+
+
+class TestBatchOutputWriter:
+    @pytest.mark.unit
+    def test_sync_writing(self):
+        save = FakeSaveBatchOutputs()
+        writer = make_writer(async_output_writing=False)
+        with patch.object(align, "save_batch_outputs", save):
+            for batch_idx in range(3):
+                writer.write([batch_idx], [None], 0.04)
+                assert save.written == list(range(batch_idx + 1))
+            writer.drain()
+            writer.close()
+        assert save.thread_ids == {threading.get_ident()}
+
+    @pytest.mark.unit
+    def test_async_writing_keeps_order(self):
+        save = FakeSaveBatchOutputs()
+        writer = make_writer(async_output_writing=True)
+        with patch.object(align, "save_batch_outputs", save):
+            for batch_idx in range(5):
+                writer.write([batch_idx], [None], 0.04)
+            writer.drain()
+            writer.close()
+        assert save.written == list(range(5))
+        assert writer.f_manifest_out == list(range(5))
+        assert threading.get_ident() not in save.thread_ids
+
+    @pytest.mark.unit
+    def test_write_blocks_while_too_many_batches_are_pending(self):
+        release = threading.Event()
+        save = FakeSaveBatchOutputs(release=release)
+        writer = make_writer(async_output_writing=True, max_pending_batches=2)
+        returned = []
+
+        def write_batches():
+            for batch_idx in range(4):
+                writer.write([batch_idx], [None], 0.04)
+                returned.append(batch_idx)
+
+        with patch.object(align, "save_batch_outputs", save):
+            producer = threading.Thread(target=write_batches)
+            producer.start()
+            # the third batch waits for the first one to be written
+            producer.join(timeout=0.2)
+            assert producer.is_alive()
+            assert returned == [0, 1]
+            assert save.written == []
+
+            release.set()
+            producer.join(timeout=5.0)
+            assert not producer.is_alive()
+            assert returned == [0, 1, 2, 3]
+            writer.drain()
+            writer.close()
+        assert save.written == list(range(4))
+
+    @pytest.mark.unit
+    def test_drain_raises_write_errors(self):
+        writer = make_writer(async_output_writing=True)
+        with patch.object(align, "save_batch_outputs", side_effect=OSError("disk full")):
+            writer.write([0], [None], 0.04)
+            with pytest.raises(OSError, match="disk full"):
+                writer.drain()
+            writer.close()
+        assert writer.executor is None
@@ -0,0 +1,158 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from utils import data_prep
+from utils.data_prep import iter_manifest_batches, prefetch_audio_batches, validate_manifest
+
+
+def write_manifest(tmp_path, lines, create_audio=True):
+    """
+    Write a manifest with audio filepaths relative to the manifest directory. The audio files are empty, as
+    none of the tested functions decode them.
+    """
+    manifest_filepath = tmp_path / "manifest.json"
+    with open(manifest_filepath, "w") as f:
+        for line in lines:
+            if create_audio:
+                (tmp_path / line["audio_filepath"]).touch()
+            f.write(json.dumps(line) + "\n")
+    return str(manifest_filepath)
+
+
+def make_lines(num_lines):
+    return [{"audio_filepath": f"audio_{i}.wav", "text": f"utterance  {i}…"} for i in range(num_lines)]
+
+
+class TestIterManifestBatches:
+    @pytest.mark.unit
+    def test_batches_keep_manifest_order(self, tmp_path):
+        manifest_filepath = write_manifest(tmp_path, make_lines(5))
+
+        batches = list(iter_manifest_batches(manifest_filepath, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        lines = [line for batch in batches for line in batch]
+        assert [line["audio_filepath"] for line in lines] == [str(tmp_path / f"audio_{i}.wav") for i in range(5)]
+        assert [line["text"] for line in lines] == [f"utterance {i}..." for i in range(5)]
+
+    @pytest.mark.unit
+    def test_batch_size_larger_than_manifest(self, tmp_path):
+        manifest_filepath = write_manifest(tmp_path, make_lines(3))
+        assert [len(batch) for batch in iter_manifest_batches(manifest_filepath, batch_size=8)] == [3]
+
+    @pytest.mark.unit
+    def test_missing_text(self, tmp_path):
+        lines = make_lines(3)
+        del lines[2]["text"]
+        manifest_filepath = write_manifest(tmp_path, lines)
+
+        batches = iter_manifest_batches(manifest_filepath, batch_size=2)
+        assert len(next(batches)) == 2
+        with pytest.raises(RuntimeError, match="'text' entry"):
+            next(batches)
+
+        # no text is needed when aligning to the predicted text
+        assert len(list(iter_manifest_batches(manifest_filepath, batch_size=2, align_using_pred_text=True))) == 2
+
+
+class TestValidateManifest:
+    @pytest.mark.unit
+    def test_valid_manifest(self, tmp_path):
+        manifest_filepath = write_manifest(tmp_path, make_lines(5))
+        with patch.object(data_prep, "load_audio", side_effect=AssertionError("audio must not be loaded")):
+            assert validate_manifest(manifest_filepath) == 5
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "bad_line, align_using_pred_text, error, match",
+        [
+            ({"text": "no audio"}, False, RuntimeError, "'audio_filepath' entry"),
+            ({"audio_filepath": "audio_0.wav"}, False, RuntimeError, "'text' entry"),
+            ({"audio_filepath": "audio_0.wav", "pred_text": "hi"}, True, RuntimeError, "'pred_text' entries"),
+            ({"audio_filepath": "missing.wav", "text": "hi"}, False, FileNotFoundError, "missing.wav"),
+        ],
+    )
+    def test_invalid_last_line(self, tmp_path, bad_line, align_using_pred_text, error, match):
+        manifest_filepath = write_manifest(tmp_path, make_lines(3))
+        with open(manifest_filepath, "a") as f:
+            f.write(json.dumps(bad_line) + "\n")
+
+        with pytest.raises(error, match=match):
+            validate_manifest(manifest_filepath, align_using_pred_text)
+
+
+class TestPrefetchAudioBatches:
+    @staticmethod
+    def fake_load_audio(audio_filepath, sample_rate):
+        # finish out of order, to check that the decoded audio stays with its manifest line
+        index = int(audio_filepath.rsplit("_", 1)[1].split(".")[0])
+        time.sleep(0.01 * (index % 3))
+        return np.full(4, index, dtype=np.float32)
+
+    @pytest.mark.unit
+    def test_no_workers(self, tmp_path):
+        manifest_filepath = write_manifest(tmp_path, make_lines(3))
+        with patch.object(data_prep, "load_audio", side_effect=AssertionError("audio must not be loaded")):
+            batches = list(prefetch_audio_batches(iter_manifest_batches(manifest_filepath, 2), 16000, num_workers=0))
+        assert [len(lines) for lines, _ in batches] == [2, 1]
+        assert all(audio is None for _, audio in batches)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers, num_prefetch_batches", [(1, 1), (3, 1), (2, 3)])
+    def test_audio_matches_manifest_lines(self, tmp_path, num_workers, num_prefetch_batches):
+        manifest_filepath = write_manifest(tmp_path, make_lines(7))
+        with patch.object(data_prep, "load_audio", side_effect=self.fake_load_audio):
+            batches = list(
+                prefetch_audio_batches(
+                    iter_manifest_batches(manifest_filepath, 3),
+                    16000,
+                    num_workers=num_workers,
+                    num_prefetch_batches=num_prefetch_batches,
+                )
+            )
+
+        assert [len(lines) for lines, _ in batches] == [3, 3, 1]
+        index = 0
+        for lines, audio_batch in batches:
+            assert len(audio_batch) == len(lines)
+            for line, audio in zip(lines, audio_batch):
+                assert line["audio_filepath"].endswith(f"audio_{index}.wav")
+                np.testing.assert_array_equal(audio, np.full(4, index, dtype=np.float32))
+                index += 1
+
+    @pytest.mark.unit
+    def test_next_batch_is_loaded_while_current_batch_is_used(self, tmp_path):
+        manifest_filepath = write_manifest(tmp_path, make_lines(4))
+        loaded = []
+        second_batch_loaded = threading.Event()
+
+        def load_audio(audio_filepath, sample_rate):
+            loaded.append(audio_filepath)
+            if len(loaded) == 4:
+                second_batch_loaded.set()
+            return np.zeros(4, dtype=np.float32)
+
+        with patch.object(data_prep, "load_audio", side_effect=load_audio):
+            batches = prefetch_audio_batches(iter_manifest_batches(manifest_filepath, 2), 16000, num_workers=2)
+            next(batches)
+            # the audio of the second batch is decoded before the second batch is requested
+            assert second_batch_loaded.wait(timeout=5.0)
+            assert len(list(batches)) == 1
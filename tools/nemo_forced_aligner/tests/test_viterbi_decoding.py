@@ -0,0 +1,98 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from nemo.collections.asr.parts.utils.aligner_utils import viterbi_decoding
+
+PADDING_VALUE = -3.4e38
+
+
+def get_batch(token_lists, T_list, V, seed=0):
+    """Make random log probs and blank-interleaved token IDs in the format expected by viterbi_decoding"""
+    generator = torch.Generator().manual_seed(seed)
+    blank_id = V - 1
+    y_list = []
+    for tokens in token_lists:
+        y = [blank_id]
+        for token in tokens:
+            y += [token, blank_id]
+        y_list.append(y)
+    B, T_max, U_max = len(y_list), max(T_list), max(len(y) for y in y_list)
+
+    log_probs_batch = torch.log_softmax(3 * torch.randn(B, T_max, V, generator=generator), dim=-1)
+    y_batch = V * torch.ones((B, U_max), dtype=torch.int64)
+    for b, (y, T) in enumerate(zip(y_list, T_list)):
+        log_probs_batch[b, T:] = PADDING_VALUE
+        y_batch[b, : len(y)] = torch.tensor(y)
+    return log_probs_batch, y_batch, torch.tensor(T_list), torch.tensor([len(y) for y in y_list])
+
+
+def brute_force_viterbi(log_probs, y):
+    """Reference CTC Viterbi alignment of a single utterance with an explicit trellis"""
+    T, U = log_probs.shape[0], len(y)
+    v = torch.full((T, U), float('-inf'), dtype=torch.float64)
+    bp = torch.zeros((T, U), dtype=torch.long)
+    v[0, :2] = log_probs[0, y[:2]].double()
+    for t in range(1, T):
+        for u in range(U):
+            prev_us = [u, u - 1] + ([u - 2] if u >= 2 and y[u] != y[u - 2] else [])
+            prev_us = [p for p in prev_us if p >= 0]
+            best = max(prev_us, key=lambda p: v[t - 1, p])
+            v[t, u] = v[t - 1, best] + log_probs[t, y[u]]
+            bp[t, u] = best
+    u = U - 1 if U == 1 or v[T - 1, U - 1] > v[T - 1, U - 2] else U - 2
+    alignment = [u]
+    for t in range(T - 1, 0, -1):
+        u = int(bp[t, u])
+        alignment.insert(0, u)
+    return alignment
+
+
+class TestViterbiDecoding:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("checkpoint_interval", [None, 0, 1, 4, 1000])
+    def test_viterbi_decoding_matches_brute_force(self, checkpoint_interval):
+        token_lists = [[0, 1, 2, 3], [2, 2, 1], [], [4, 0, 4, 0, 4]]
+        T_list = [30, 17, 5, 23]
+        log_probs_batch, y_batch, T_batch, U_batch = get_batch(token_lists, T_list, V=6)
+
+        alignments_batch = viterbi_decoding(
+            log_probs_batch, y_batch, T_batch, U_batch, "cpu", checkpoint_interval=checkpoint_interval
+        )
+
+        for b, alignment in enumerate(alignments_batch):
+            y = y_batch[b, : U_batch[b]].tolist()
+            assert len(alignment) == T_list[b]
+            assert alignment == brute_force_viterbi(log_probs_batch[b, : T_list[b]], y)
+
+    @pytest.mark.unit
+    def test_viterbi_decoding_checkpointing_long_input(self):
+        token_lists = [list(range(5)) * 40, [1, 1, 2] * 30]
+        T_list = [1500, 1100]
+        log_probs_batch, y_batch, T_batch, U_batch = get_batch(token_lists, T_list, V=8, seed=1)
+
+        expected = viterbi_decoding(log_probs_batch, y_batch, T_batch, U_batch, "cpu")
+        for checkpoint_interval in [0, 7, 300]:
+            alignments_batch = viterbi_decoding(
+                log_probs_batch, y_batch, T_batch, U_batch, "cpu", checkpoint_interval=checkpoint_interval
+            )
+            assert alignments_batch == expected
+
+    @pytest.mark.unit
+    def test_viterbi_decoding_negative_checkpoint_interval(self):
+        log_probs_batch, y_batch, T_batch, U_batch = get_batch([[0]], [3], V=3)
+        with pytest.raises(ValueError):
+            viterbi_decoding(log_probs_batch, y_batch, T_batch, U_batch, "cpu", checkpoint_interval=-1)
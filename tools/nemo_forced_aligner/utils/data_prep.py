@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
 from nemo.collections.common.parts.preprocessing.manifest import get_full_path
 
 
@@ -70,31 +73,140 @@ def get_manifest_lines_batch(manifest_filepath, start, end):
     with open(manifest_filepath, "r", encoding="utf-8-sig") as f:
         for line_i, line in enumerate(f):
             if line_i >= start and line_i <= end:
-                data = json.loads(line)
-                data["audio_filepath"] = get_full_path(data["audio_filepath"], manifest_filepath)
-                if "text" in data:
-                    # remove any BOM, any duplicated spaces, convert any
-                    # newline chars to spaces
-                    data["text"] = data["text"].replace("\ufeff", "")
-                    data["text"] = " ".join(data["text"].split())
-
-                    # Replace any horizontal ellipses with 3 separate periods.
-                    # The tokenizer will do this anyway. But making this replacement
-                    # now helps avoid errors when restoring punctuation when saving
-                    # the output files
-                    data["text"] = data["text"].replace("\u2026", "...")
-
-                if not Path(data['audio_filepath']).exists():
-                    extended_path = Path(Path(manifest_filepath).parent, data['audio_filepath'])
-                    if extended_path.exists():
-                        data['audio_filepath'] = str(extended_path)
-                    else:
-                        raise FileNotFoundError(
-                            f"Audio file {data['audio_filepath']} not found in {manifest_filepath}"
-                        )
-
-                manifest_lines_batch.append(data)
+                manifest_lines_batch.append(process_manifest_line(json.loads(line), manifest_filepath))
 
             if line_i == end:
                 break
     return manifest_lines_batch
+
+
+def process_manifest_line(data, manifest_filepath):
+    """
+    Resolve the audio filepath and normalize the text of a manifest line.
+    """
+    data["audio_filepath"] = get_full_path(data["audio_filepath"], manifest_filepath)
+    if "text" in data:
+        # remove any BOM, any duplicated spaces, convert any
+        # newline chars to spaces
+        data["text"] = data["text"].replace("\ufeff", "")
+        data["text"] = " ".join(data["text"].split())
+
+        # Replace any horizontal ellipses with 3 separate periods.
+        # The tokenizer will do this anyway. But making this replacement
+        # now helps avoid errors when restoring punctuation when saving
+        # the output files
+        data["text"] = data["text"].replace("\u2026", "...")
+
+    if not Path(data['audio_filepath']).exists():
+        extended_path = Path(Path(manifest_filepath).parent, data['audio_filepath'])
+        if extended_path.exists():
+            data['audio_filepath'] = str(extended_path)
+        else:
+            raise FileNotFoundError(f"Audio file {data['audio_filepath']} not found in {manifest_filepath}")
+
+    return data
+
+
+def validate_manifest_line(data, align_using_pred_text):
+    """
+    Check that a manifest line contains the entries required by NFA.
+    """
+    if "audio_filepath" not in data:
+        raise RuntimeError(
+            "At least one line in cfg.manifest_filepath does not contain an 'audio_filepath' entry. "
+            "All lines must contain an 'audio_filepath' entry."
+        )
+
+    if align_using_pred_text:
+        if "pred_text" in data:
+            raise RuntimeError(
+                "Cannot specify cfg.align_using_pred_text=True when the manifest at cfg.manifest_filepath "
+                "contains 'pred_text' entries. This is because the audio will be transcribed and may produce "
+                "a different 'pred_text'. This may cause confusion."
+            )
+    elif "text" not in data:
+        raise RuntimeError(
+            "At least one line in cfg.manifest_filepath does not contain a 'text' entry. "
+            "NFA requires all lines to contain a 'text' entry when cfg.align_using_pred_text=False."
+        )
+
+
+def validate_manifest(manifest_filepath, align_using_pred_text=False):
+    """
+    Check every line of the manifest up front, before the model is loaded: the required entries must be present
+    and the audio files must exist. The audio itself is not loaded.
+
+    Returns:
+        The number of lines in the manifest.
+    """
+    num_lines = 0
+    with open(manifest_filepath, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            data = json.loads(line)
+            validate_manifest_line(data, align_using_pred_text)
+            process_manifest_line(data, manifest_filepath)
+            num_lines += 1
+
+    return num_lines
+
+
+def iter_manifest_batches(manifest_filepath, batch_size, align_using_pred_text=False):
+    """
+    Read the manifest in a single pass and yield batches of `batch_size` validated and processed lines.
+    Unlike `get_batch_starts_ends` + `get_manifest_lines_batch`, the manifest is not re-read for every batch.
+    """
+    manifest_lines_batch = []
+    with open(manifest_filepath, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            data = json.loads(line)
+            validate_manifest_line(data, align_using_pred_text)
+            manifest_lines_batch.append(process_manifest_line(data, manifest_filepath))
+            if len(manifest_lines_batch) == batch_size:
+                yield manifest_lines_batch
+                manifest_lines_batch = []
+
+    if manifest_lines_batch:
+        yield manifest_lines_batch
+
+
+def load_audio(audio_filepath, sample_rate):
+    """
+    Decode an audio file as a mono float32 array at the sample rate of the model.
+    """
+    return AudioSegment.from_file(audio_filepath, target_sr=sample_rate).samples
+
+
+def prefetch_audio_batches(manifest_batches, sample_rate, num_workers, num_prefetch_batches=1):
+    """
+    Decode the audio of the upcoming batches in a pool of `num_workers` threads, so that audio loading overlaps
+    with the alignment of the current batch.
+
+    Args:
+        manifest_batches: iterable of batches of manifest lines, e.g. from `iter_manifest_batches`.
+        sample_rate: sample rate of the ASR model.
+        num_workers: number of audio decoding threads. If 0, no audio is loaded.
+        num_prefetch_batches: number of batches decoded ahead of the current batch.
+
+    Yields:
+        Tuples of (manifest_lines_batch, audio_batch). audio_batch is a list of numpy arrays, or None if
+        num_workers is 0.
+    """
+    if num_workers <= 0:
+        for manifest_lines_batch in manifest_batches:
+            yield manifest_lines_batch, None
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = deque()
+        for manifest_lines_batch in manifest_batches:
+            futures = [
+                executor.submit(load_audio, line["audio_filepath"], sample_rate) for line in manifest_lines_batch
+            ]
+            pending.append((manifest_lines_batch, futures))
+            if len(pending) > num_prefetch_batches:
+                manifest_lines_batch, futures = pending.popleft()
+                yield manifest_lines_batch, [future.result() for future in futures]
+
+        while pending:
+            manifest_lines_batch, futures = pending.popleft()
+            yield manifest_lines_batch, [future.result() for future in futures]